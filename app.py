@@ -5,6 +5,7 @@ import os
 import sys
 import logging
 import webbrowser
+import multiprocessing
 import time
 from threading import Timer
 from datetime import datetime # 导入 datetime 模块
@@ -169,10 +170,10 @@ def _configure_logging(app, base_path):
     logger.info("Clue folder set to: %s", app.config['CLUE_FOLDER'])
     logger.info("Case folder set to: %s", app.config['CASE_FOLDER'])
 
-def run_app():
+def build_app():
     """
-    运行 Flask 应用。
-    包括应用创建、模板路径设置、日志配置、数据库初始化、错误处理和启动服务器。
+    创建可以对外服务的 Flask 应用。
+    包括应用创建、模板路径设置、日志配置、数据库初始化和错误处理，桌面模式和 serve 模式共用。
     """
     base_path = _get_base_path()
     app = create_app()
@@ -207,6 +208,14 @@ def run_app():
         app.logger.error(f"发生异常: {str(e)}", exc_info=True)  # 记录完整堆栈信息
         return redirect(url_for('upload_case')), 500  # 返回 500 状态码
 
+    return app
+
+def run_app():
+    """
+    桌面模式：运行 Flask 开发服务器并自动打开浏览器（打包的 .exe 双击运行时使用）。
+    """
+    app = build_app()
+
     # 自动打开浏览器，仅在应用首次启动时执行一次
     if not hasattr(run_app, '_browser_opened'):
         Timer(1, _open_browser_if_not_opened).start()
@@ -216,4 +225,15 @@ def run_app():
     app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
 
 if __name__ == '__main__':
+    # 打包后的可执行文件中，输出阶段的进程池子进程需要先经过 freeze_support
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1 and sys.argv[1] == 'watch':
+        # 投递目录监听模式：python app.py watch [--inbox 目录] [--workers N]
+        from drop_folder import main as watch_main
+        sys.exit(watch_main(sys.argv[2:], upload_folder=os.path.join(_get_base_path(), 'uploads')))
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        # 多用户部署模式：python app.py serve [--host 地址] [--port 端口] [--threads N]
+        import wsgi_server
+        serve_args = wsgi_server.parse_args(sys.argv[2:])
+        sys.exit(wsgi_server.serve(build_app(), serve_args.host, serve_args.port, serve_args.threads))
     run_app()
@@ -0,0 +1,228 @@
+# batch_validate.py
+"""
+批量校验命令行工具。
+
+月底各单位集中报送的线索登记表 / 立案登记表不必逐个通过网页上传：
+按文件、目录或通配符收集工作簿，根据文件名中的 REQUIRED_FILENAME_PATTERN / CASE_FILENAME_PATTERN
+判断是线索还是立案，在进程池中并行校验，每个文件的副本和编号表写在原文件旁边或 --output-dir 指定的目录中。
+全部完成后输出吞吐量（文件/秒、行/秒），并生成汇总所有文件问题的问题索引工作簿。
+
+每个文件在一个子进程中完整处理（读取、校验、写出），子进程内不再启动校验和输出进程池。
+
+用法示例（在项目根目录执行，机关单位字典读取当前目录下的 case_management.db）:
+    python batch_validate.py 月报/
+    python batch_validate.py "月报/**/*.xlsx" --workers 4 --output-dir 校验结果
+    python batch_validate.py a区_线索登记表.xlsx b区_立案登记表.xlsx --index 问题索引.xlsx
+"""
+import argparse
+import glob
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from config import Config
+from db_utils import init_db
+from validation_api import config_dict, validate_case_workbook, validate_clue_workbook
+
+logger = logging.getLogger(__name__)
+
+# 本工具和上传页面生成的输出文件，收集输入时跳过，避免重复运行时把上次的结果当作输入
+OUTPUT_MARKERS = ('_副本', '立案编号表_', '线索编号', '批量校验问题索引')
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 问题索引中的列
+INDEX_COLUMNS = ['文件', '类型', '行号', '编码', '人员编码', '比对字段', '被比对字段', '问题描述']
+
+def detect_kind(filename, app_config):
+    """
+    根据文件名判断工作簿类型。
+
+    返回:
+        str: 'clue'、'case'，无法判断时为 None。
+    """
+    if app_config['REQUIRED_FILENAME_PATTERN'] in filename:
+        return 'clue'
+    if app_config['CASE_FILENAME_PATTERN'] in filename:
+        return 'case'
+    return None
+
+def is_input_candidate(path, app_config):
+    """
+    判断文件是否为待校验的工作簿：扩展名允许，且不是 Office 临时文件或本工具、上传页面生成的输出文件。
+    """
+    name = os.path.basename(path)
+    if name.startswith('~$') or any(marker in name for marker in OUTPUT_MARKERS):
+        return False
+    return '.' in name and name.rsplit('.', 1)[1].lower() in app_config['ALLOWED_EXTENSIONS']
+
+def collect_inputs(patterns, app_config):
+    """
+    展开文件、目录（递归）和通配符，返回 [(路径, 类型)]，按路径排序并去重。
+    文件名无法判断类型的工作簿记录警告后跳过。
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, names in os.walk(pattern):
+                paths.extend(os.path.join(root, name) for name in names)
+        elif glob.has_magic(pattern):
+            paths.extend(glob.glob(pattern, recursive=True))
+        elif os.path.isfile(pattern):
+            paths.append(pattern)
+        else:
+            logger.warning(f"输入不存在: {pattern}")
+
+    inputs = []
+    seen = set()
+    for path in sorted(os.path.abspath(path) for path in paths):
+        if path in seen or not os.path.isfile(path) or not is_input_candidate(path, app_config):
+            continue
+        seen.add(path)
+        kind = detect_kind(os.path.basename(path), app_config)
+        if kind is None:
+            logger.warning(f"文件名中没有“{app_config['REQUIRED_FILENAME_PATTERN']}”或"
+                           f"“{app_config['CASE_FILENAME_PATTERN']}”，跳过: {path}")
+            continue
+        inputs.append((path, kind))
+    return inputs
+
+def _index_record(filename, kind, issue):
+    """
+    将一条问题转换为问题索引中的一行。线索问题可能是 (行索引, 受理线索编码, 问题描述) 元组。
+    """
+    if isinstance(issue, tuple):
+        issue = {'行号': issue[0] + 2, '受理线索编码': issue[1], '问题描述': issue[2]}
+    code_key, person_key = ('案件编码', '涉案人员编码') if kind == 'case' else ('受理线索编码', '受理人员编码')
+    return [filename, '立案' if kind == 'case' else '线索', issue.get('行号', ''), issue.get(code_key, ''),
+            issue.get(person_key, ''), issue.get('比对字段', ''), issue.get('被比对字段', ''),
+            issue.get('问题描述', '')]
+
+def init_worker(log_level, quiet):
+    """
+    子进程初始化：配置日志级别；quiet 时屏蔽校验规则的 print 输出。
+    """
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    logging.getLogger().setLevel(log_level)
+    if quiet:
+        sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+
+def process_file(path, kind, output_dir, app_config):
+    """
+    在子进程中校验一个文件并写出副本和编号表。
+
+    返回:
+        dict: 文件、类型、行数、问题数、耗时、输出文件、错误消息和问题索引记录。
+    """
+    start = time.perf_counter()
+    filename = os.path.basename(path)
+    summary = {'path': path, 'kind': kind, 'rows': 0, 'issues': 0, 'outputs': [], 'errors': [], 'index': []}
+    try:
+        validate = validate_case_workbook if kind == 'case' else validate_clue_workbook
+        result = validate(path, app_config, filename, outputs=True)
+        summary['rows'] = result.rows
+        summary['errors'] = list(result.errors)
+        summary['issues'] = len(result.issues)
+        summary['index'] = [_index_record(filename, kind, issue) for issue in result.issues]
+        target_dir = output_dir or os.path.dirname(path)
+        os.makedirs(target_dir, exist_ok=True)
+        for output_name, content in result.outputs.values():
+            # 多个文件的编号表同名（按日期命名），加上原文件名前缀区分
+            if not output_name.startswith(os.path.splitext(filename)[0]):
+                output_name = f"{os.path.splitext(filename)[0]}_{output_name}"
+            output_path = os.path.join(target_dir, output_name)
+            with open(output_path, 'wb') as f:
+                f.write(content)
+            summary['outputs'].append(output_path)
+    except Exception as e:
+        logger.error(f"处理失败: {path} - {e}", exc_info=True)
+        summary['errors'].append(f"处理失败: {e}")
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+def write_issue_index(summaries, index_path):
+    """
+    写出问题索引工作簿：“问题索引”汇总所有文件的问题，“文件汇总”为每个文件的行数、问题数和处理状态。
+    """
+    issues_df = pd.DataFrame([record for summary in summaries for record in summary['index']], columns=INDEX_COLUMNS)
+    files_df = pd.DataFrame([{
+        '文件': summary['path'],
+        '类型': '立案' if summary['kind'] == 'case' else '线索',
+        '行数': summary['rows'],
+        '问题数': summary['issues'],
+        '耗时（秒）': round(summary['elapsed'], 2),
+        '状态': '；'.join(summary['errors']) or '成功',
+        '输出文件': '\n'.join(summary['outputs'])
+    } for summary in summaries])
+    with pd.ExcelWriter(index_path, engine='xlsxwriter') as writer:
+        issues_df.to_excel(writer, sheet_name='问题索引', index=False)
+        files_df.to_excel(writer, sheet_name='文件汇总', index=False)
+
+def run_batch(inputs, workers, output_dir, app_config, verbose=False):
+    """
+    在进程池中处理全部输入，按完成顺序打印进度，返回按输入顺序排列的结果。
+    verbose 为 False 时子进程中校验规则的 print 输出被屏蔽。
+    """
+    # 并行发生在文件之间，子进程内不再为校验和输出启动进程池
+    worker_config = dict(app_config, VALIDATION_WORKER_PROCESSES=0, OUTPUT_WRITER_PROCESSES=0)
+    summaries = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(logging.getLogger().level, not verbose)) as executor:
+        futures = {executor.submit(process_file, path, kind, output_dir, worker_config): path
+                   for path, kind in inputs}
+        for done, future in enumerate(as_completed(futures), 1):
+            summary = future.result()
+            summaries[futures[future]] = summary
+            status = '；'.join(summary['errors']) or f"{summary['rows']} 行，{summary['issues']} 个问题"
+            print(f"[{done}/{len(inputs)}] {os.path.basename(summary['path'])}: {status}"
+                  f"（{summary['elapsed']:.1f} 秒）")
+    return [summaries[path] for path, _ in inputs]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="批量校验线索登记表 / 立案登记表")
+    parser.add_argument('inputs', nargs='+', help="工作簿文件、目录（递归查找）或通配符")
+    parser.add_argument('--workers', type=int, default=Config.BATCH_WORKER_PROCESSES,
+                        help="并行处理的进程数，默认为 Config.BATCH_WORKER_PROCESSES（0 表示 CPU 核数）")
+    parser.add_argument('--output-dir', help="副本和编号表的输出目录，默认写在各输入文件旁边")
+    parser.add_argument('--index', help="问题索引工作簿路径，默认为 <输出目录或当前目录>/批量校验问题索引_<日期>.xlsx")
+    parser.add_argument('--verbose', action='store_true', help="输出校验过程的日志和规则的 print 输出")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR, format=LOG_FORMAT)
+    app_config = config_dict()
+    init_db()
+
+    inputs = collect_inputs(args.inputs, app_config)
+    if not inputs:
+        print("没有找到需要校验的工作簿")
+        return 1
+    workers = min(args.workers or os.cpu_count() or 1, len(inputs))
+    output_dir = os.path.abspath(args.output_dir) if args.output_dir else None
+    print(f"共 {len(inputs)} 个文件，使用 {workers} 个进程")
+
+    start = time.perf_counter()
+    summaries = run_batch(inputs, workers, output_dir, app_config, args.verbose)
+    elapsed = time.perf_counter() - start
+
+    index_path = args.index or os.path.join(output_dir or os.getcwd(),
+                                            f"批量校验问题索引_{app_config['TODAY_DATE']}.xlsx")
+    write_issue_index(summaries, index_path)
+
+    failed = [summary for summary in summaries if summary['errors']]
+    rows = sum(summary['rows'] for summary in summaries)
+    issues = sum(summary['issues'] for summary in summaries)
+    print(f"完成: {len(summaries) - len(failed)} 个成功，{len(failed)} 个失败；共 {rows} 行，{issues} 个问题")
+    print(f"耗时 {elapsed:.1f} 秒，吞吐量 {len(summaries) / elapsed:.2f} 文件/秒，{rows / elapsed:.0f} 行/秒")
+    print(f"问题索引: {index_path}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
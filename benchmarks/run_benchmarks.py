@@ -0,0 +1,396 @@
+# run_benchmarks.py
+"""
+案管系统性能基准测试。
+
+覆盖四个层次：
+    1. extractors：各类文书字段提取函数的微基准；
+    2. rules：validate_case_relationships / validate_clue_data 在不同行数下的耗时；
+    3. parallel：立案登记表逐行规则单进程与多进程执行的耗时对比，用于确定 VALIDATION_PARALLEL_MIN_ROWS；
+    4. upload：通过 Flask 测试客户端走完整的 /upload_case、/upload_clue 流程，
+       并以 validate_case_workbook / validate_clue_workbook 在内存中完成同样的校验和输出（不经过 Flask）。
+
+结果以 JSON 保存，可通过 --compare 与已保存的基线比对，超过阈值即视为性能回退。
+
+用法示例（在项目根目录执行）:
+    python benchmarks/run_benchmarks.py --output benchmarks/results/latest.json
+    python benchmarks/run_benchmarks.py --suite rules --sizes 1000 10000 50000
+    python benchmarks/run_benchmarks.py --suite parallel --workers 4 --parallel-sizes 2000 5000 10000
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/baseline.json --threshold 0.15
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+if BENCH_DIR not in sys.path:
+    sys.path.insert(0, BENCH_DIR)
+
+from config import Config
+import db_utils
+from validation.document_cache import clear_document_caches
+from sample_data import (sample_texts, build_case_dataframe, build_clue_dataframe, write_workbook)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+DEFAULT_PARALLEL_SIZES = [1000, 2000, 5000, 10000, 20000]
+DEFAULT_THRESHOLD = 0.10
+
+# 提取函数清单：(提取函数族, 模块路径, 函数名, 样例文本键, 是否需要姓名参数)
+EXTRACTORS = [
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_year_from_case_report", "case_report", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_year_from_decision_report", "decision", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_year_from_investigation_report", "investigation", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_year_from_trial_report", "trial", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_date_from_case_report", "case_report", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_date_from_decision_report", "decision", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_date_from_investigation_report", "investigation", False),
+    ("birth_info", "validation.case_validation.case_extractors_birth_info", "extract_birth_date_from_trial_report", "trial", False),
+    ("gender", "validation.case_validation.case_extractors_gender", "extract_gender_from_case_report", "case_report", False),
+    ("gender", "validation.case_validation.case_extractors_gender", "extract_gender_from_decision_report", "decision", False),
+    ("gender", "validation.case_validation.case_extractors_gender", "extract_gender_from_investigation_report", "investigation", False),
+    ("gender", "validation.case_validation.case_extractors_gender", "extract_gender_from_trial_report", "trial", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_education_from_case_report", "case_report", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_ethnicity_from_case_report", "case_report", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_ethnicity_from_decision_report", "decision", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_ethnicity_from_investigation_report", "investigation", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_ethnicity_from_trial_report", "trial", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_suspected_violation_from_case_report", "case_report", False),
+    ("demographics", "validation.case_validation.case_extractors_demographics", "extract_suspected_violation_from_decision", "decision", True),
+    ("names", "validation.case_validation.case_extractors_names", "extract_name_from_case_report", "case_report", False),
+    ("names", "validation.case_validation.case_extractors_names", "extract_name_from_decision", "decision", False),
+    ("names", "validation.case_validation.case_extractors_names", "extract_name_from_trial_report", "trial", False),
+    ("party_info", "validation.case_validation.case_extractors_party_info", "extract_party_member_from_case_report", "case_report", False),
+    ("party_info", "validation.case_validation.case_extractors_party_info", "extract_party_member_from_decision_report", "decision", False),
+    ("party_info", "validation.case_validation.case_extractors_party_info", "extract_party_joining_date_from_case_report", "case_report", False),
+    ("timestamp", "validation.case_validation.case_extractors_timestamp", "extract_timestamp_from_filing_decision", "filing_decision", False),
+    ("timestamp", "validation.case_validation.case_extractors_timestamp", "extract_filing_decision_signature_time", "filing_decision", False),
+    ("clue", "validation.clue_validation.clue_validation", "extract_name_from_report", "disposal_report", True),
+    ("clue", "validation.clue_validation.clue_validation", "extract_gender_from_report", "disposal_report", False),
+    ("clue", "validation.clue_validation.clue_validation", "extract_birth_date_from_report", "disposal_report", False),
+    ("clue", "validation.clue_validation.clue_validation", "extract_ethnicity_from_report", "disposal_report", False),
+    ("clue", "validation.clue_validation.clue_validation", "extract_education_from_report", "disposal_report", False),
+    ("clue", "validation.clue_validation.clue_validation", "extract_party_joining_date_from_report", "disposal_report", False),
+    ("clue", "validation.clue_validation.disposal_report", "parse_disposal_report", "disposal_report", False),
+]
+
+
+@contextlib.contextmanager
+def _quiet(enabled=True):
+    """
+    屏蔽被测函数中的 print 和日志输出，避免终端 I/O 干扰计时。
+    """
+    if not enabled:
+        yield
+        return
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(previous_disable)
+
+
+def _measure(func, repeat, number=1, setup=None, quiet=True):
+    """
+    重复执行 func 并统计耗时。
+
+    参数:
+        func (callable): 被测函数，无参数。
+        repeat (int): 重复测量的轮数。
+        number (int): 每轮内连续调用的次数。
+        setup (callable): 每轮测量前调用的准备函数（不计入耗时）。
+        quiet (bool): 是否屏蔽输出。
+
+    返回:
+        dict: 单次调用耗时（秒）的 min / median / mean / max 以及测量参数。
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with _quiet(quiet):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            elapsed = time.perf_counter() - start
+        samples.append(elapsed / number)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "max": max(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _app_config():
+    """
+    从 Config 类构造与 Flask app.config 等价的配置字典。
+    """
+    return {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+
+
+def bench_extractors(results, args):
+    """
+    对每个提取函数做微基准测试。
+    """
+    import importlib
+    texts = sample_texts()
+    for family, module_name, func_name, text_key, needs_name in EXTRACTORS:
+        func = getattr(importlib.import_module(module_name), func_name)
+        text = texts[text_key]
+        # 每次调用前清空文书缓存，测量的是未命中缓存时的解析耗时
+        if needs_name:
+            call = lambda f=func, t=text: (clear_document_caches(), f(t, texts["name"]))
+        else:
+            call = lambda f=func, t=text: (clear_document_caches(), f(t))
+        name = f"extractors.{family}.{func_name}"
+        results[name] = _measure(call, repeat=args.repeat, number=args.extractor_calls, quiet=not args.verbose)
+        print(f"{name}: median {results[name]['median'] * 1e6:.1f} µs")
+
+
+def bench_rules(results, args):
+    """
+    对立案与线索的整表校验函数在不同行数下做基准测试。
+    """
+    from validation.case_validation.case_validators import validate_case_relationships
+    from validation.clue_validation.clue_validation import validate_clue_data
+
+    app_config = _app_config()
+    nsl_mappings = db_utils.get_authority_agency_dict(category='NSL')
+    for size in args.sizes:
+        case_df = build_case_dataframe(size)
+        name = f"rules.validate_case_relationships.{size}"
+        results[name] = _measure(lambda: validate_case_relationships(case_df, app_config, []),
+                                 repeat=args.rules_repeat, setup=clear_document_caches, quiet=not args.verbose)
+        results[name]["rows"] = size
+        print(f"{name}: median {results[name]['median']:.3f} s ({size / results[name]['median']:.0f} 行/秒)")
+
+        clue_df = build_clue_dataframe(size)
+        name = f"rules.validate_clue_data.{size}"
+        results[name] = _measure(lambda: validate_clue_data(clue_df, app_config, nsl_mappings),
+                                 repeat=args.rules_repeat, setup=clear_document_caches, quiet=not args.verbose)
+        results[name]["rows"] = size
+        print(f"{name}: median {results[name]['median']:.3f} s ({size / results[name]['median']:.0f} 行/秒)")
+
+
+def bench_parallel(results, args):
+    """
+    在不同行数下对比立案登记表逐行规则单进程与多进程执行的耗时，并报告多进程开始更快的最小行数。
+    """
+    from validation.case_validation.case_validators import validate_case_relationships
+
+    serial_config = dict(_app_config(), VALIDATION_WORKER_PROCESSES=0)
+    # 最少行数置 0，保证每个行数都真正走进程池
+    parallel_config = dict(_app_config(), VALIDATION_WORKER_PROCESSES=args.workers, VALIDATION_PARALLEL_MIN_ROWS=0)
+    crossover = None
+    for size in args.parallel_sizes:
+        case_df = build_case_dataframe(size)
+        medians = {}
+        for mode, app_config in (("serial", serial_config), (f"workers_{args.workers}", parallel_config)):
+            name = f"parallel.validate_case_relationships.{mode}.{size}"
+            results[name] = _measure(lambda: validate_case_relationships(case_df, app_config, []),
+                                     repeat=args.rules_repeat, setup=clear_document_caches, quiet=not args.verbose)
+            results[name]["rows"] = size
+            medians[mode] = results[name]["median"]
+            print(f"{name}: median {results[name]['median']:.3f} s")
+        if crossover is None and medians[f"workers_{args.workers}"] < medians["serial"]:
+            crossover = size
+    if crossover is None:
+        print(f"{args.workers} 个进程在测试的行数内均不快于单进程执行")
+    else:
+        print(f"{args.workers} 个进程从 {crossover} 行起快于单进程执行")
+
+
+def bench_upload(results, args, work_dir):
+    """
+    通过 Flask 测试客户端对完整上传流程做端到端基准测试。
+    """
+    from app import create_app
+
+    app = create_app()
+    app.config['TESTING'] = True
+    # 所有输出（包括 UPLOAD_FOLDER/result_cache 下的结果缓存）都写在临时目录中，不写入项目的 uploads 目录
+    app.config['UPLOAD_FOLDER'] = work_dir
+    app.config['RESULT_CACHE_FOLDER'] = os.path.join(work_dir, 'result_cache')
+    app.config['CASE_FOLDER'] = os.path.join(work_dir, 'case')
+    app.config['CLUE_FOLDER'] = os.path.join(work_dir, 'clue')
+    # 重复上传同一文件时，结果缓存和行级增量校验会跳过校验，计时测量的将不再是完整的上传流程
+    app.config['RESULT_CACHE_ENABLED'] = False
+    app.config['INCREMENTAL_VALIDATION_ENABLED'] = False
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['username'] = 'benchmark'
+
+    size = args.upload_rows
+    case_path = write_workbook(build_case_dataframe(size), os.path.join(work_dir, '立案登记表_benchmark.xlsx'))
+    clue_path = write_workbook(build_clue_dataframe(size), os.path.join(work_dir, '线索登记表_benchmark.xlsx'))
+
+    def _post(url, field, path):
+        with open(path, 'rb') as f:
+            response = client.post(url, data={field: (f, os.path.basename(path))},
+                                   content_type='multipart/form-data')
+        if response.status_code != 302:
+            raise RuntimeError(f"{url} 返回异常状态码: {response.status_code}")
+
+    def _clean_outputs():
+        for folder in (app.config['CASE_FOLDER'], app.config['CLUE_FOLDER']):
+            shutil.rmtree(folder, ignore_errors=True)
+            os.makedirs(folder, exist_ok=True)
+
+    name = f"upload.process_case_upload.{size}"
+    results[name] = _measure(lambda: _post('/upload_case', 'case_file', case_path),
+                             repeat=args.rules_repeat, setup=_clean_outputs, quiet=not args.verbose)
+    results[name]["rows"] = size
+    print(f"{name}: median {results[name]['median']:.3f} s")
+
+    name = f"upload.process_clue_upload.{size}"
+    results[name] = _measure(lambda: _post('/upload_clue', 'file', clue_path),
+                             repeat=args.rules_repeat, setup=_clean_outputs, quiet=not args.verbose)
+    results[name]["rows"] = size
+    print(f"{name}: median {results[name]['median']:.3f} s")
+
+    from validation_api import validate_case_workbook, validate_clue_workbook
+
+    for api_func, path in ((validate_case_workbook, case_path), (validate_clue_workbook, clue_path)):
+        with open(path, 'rb') as f:
+            content = f.read()
+        name = f"api.{api_func.__name__}.{size}"
+        results[name] = _measure(lambda: api_func(content, app.config, outputs=True),
+                                 repeat=args.rules_repeat, quiet=not args.verbose)
+        results[name]["rows"] = size
+        print(f"{name}: median {results[name]['median']:.3f} s")
+
+
+def _git_revision():
+    """
+    获取当前代码的 git 提交号，失败时返回 None。
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(current, baseline, threshold):
+    """
+    将本次结果与基线比对。
+
+    参数:
+        current (dict): 本次运行的 results 字典。
+        baseline (dict): 基线文件中的 results 字典。
+        threshold (float): 允许的相对变慢比例，例如 0.10 表示慢 10% 以内不算回退。
+
+    返回:
+        list: 回退项列表，每项为 (名称, 基线中位数, 本次中位数, 变化比例)。
+    """
+    regressions = []
+    for name in sorted(current):
+        if name not in baseline:
+            print(f"  [新增]   {name}")
+            continue
+        old = baseline[name]["median"]
+        new = current[name]["median"]
+        change = (new - old) / old if old else 0.0
+        if change > threshold:
+            status = "回退"
+            regressions.append((name, old, new, change))
+        elif change < -threshold:
+            status = "提升"
+        else:
+            status = "持平"
+        print(f"  [{status}]   {name}: {old:.6f}s -> {new:.6f}s ({change:+.1%})")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="案管系统性能基准测试")
+    parser.add_argument('--suite', choices=['all', 'extractors', 'rules', 'parallel', 'upload'], default='all',
+                        help="要运行的基准测试组")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="整表校验基准使用的行数")
+    parser.add_argument('--parallel-sizes', type=int, nargs='+', default=DEFAULT_PARALLEL_SIZES,
+                        help="单进程 / 多进程对比基准使用的行数")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="多进程对比基准使用的校验进程数，默认 CPU 核数")
+    parser.add_argument('--upload-rows', type=int, default=1000, help="端到端上传基准使用的行数")
+    parser.add_argument('--repeat', type=int, default=5, help="微基准的测量轮数")
+    parser.add_argument('--extractor-calls', type=int, default=200, help="微基准每轮调用次数")
+    parser.add_argument('--rules-repeat', type=int, default=3, help="整表校验与上传基准的测量轮数")
+    parser.add_argument('--output', help="结果 JSON 输出路径，默认 benchmarks/results/<时间戳>.json")
+    parser.add_argument('--compare', help="用于比对的基线 JSON 文件")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="判定回退的相对阈值")
+    parser.add_argument('--verbose', action='store_true', help="不屏蔽被测函数的 print 与日志输出")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = {}
+
+    # 在临时目录中运行，数据库与上传产物都不会污染项目目录
+    work_dir = tempfile.mkdtemp(prefix='case_bench_')
+    original_cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        db_utils.init_db()
+        if args.suite in ('all', 'extractors'):
+            bench_extractors(results, args)
+        if args.suite in ('all', 'rules'):
+            bench_rules(results, args)
+        if args.suite in ('all', 'parallel'):
+            bench_parallel(results, args)
+        if args.suite in ('all', 'upload'):
+            bench_upload(results, args, work_dir)
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    payload = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec='seconds'),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "suite": args.suite,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(BENCH_DIR, 'results', f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"基准结果已保存: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+        print(f"与基线 {args.compare} 比对（阈值 {args.threshold:.0%}）:")
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"发现 {len(regressions)} 项性能回退")
+            return 1
+        print("未发现性能回退")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# sample_data.py
+"""
+性能基准测试使用的合成数据。
+按照立案登记表 / 线索登记表的真实表头和文书格式生成样例文本与 DataFrame，
+保证各提取函数和校验规则都能走到完整的解析路径。
+"""
+import random
+
+import pandas as pd
+
+from config import Config
+
+SURNAMES = ["王", "李", "张", "刘", "陈", "杨", "赵", "黄", "周", "吴"]
+GIVEN_NAMES = ["伟", "芳", "娜", "敏", "静", "磊", "洋", "勇", "军", "杰", "强", "涛"]
+ETHNICITIES = ["汉族", "回族", "满族", "蒙古族"]
+EDUCATIONS = ["大学本科", "研究生", "大学专科", "中专"]
+SL_AGENCIES = ["平度市纪委监委第一纪检监察室", "平度市纪委监委第二纪检监察室"]
+NSL_AGENCIES = ["平度市纪委监委第一纪检监察室", "平度市南村镇纪委"]
+
+
+def _person(rng):
+    """
+    随机生成一个被调查人的基本信息字典。
+    """
+    name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES) + rng.choice(GIVEN_NAMES)
+    birth_year = rng.randint(1960, 1990)
+    birth_month = rng.randint(1, 12)
+    join_year = birth_year + rng.randint(20, 30)
+    join_month = rng.randint(1, 12)
+    return {
+        "name": name,
+        "gender": rng.choice(["男", "女"]),
+        "ethnicity": rng.choice(ETHNICITIES),
+        "education": rng.choice(EDUCATIONS),
+        "birth_year": birth_year,
+        "birth_month": birth_month,
+        "join_year": join_year,
+        "join_month": join_month,
+    }
+
+
+def _basic_info(p):
+    """
+    生成“姓名，性别，民族，出生年月，籍贯，学历，入党时间”格式的基本情况段落。
+    """
+    return (f"{p['name']}，{p['gender']}，{p['ethnicity']}，{p['birth_year']}年{p['birth_month']}月生，"
+            f"山东省平度市人，{p['education']}学历，{p['join_year']}年{p['join_month']}月加入中国共产党，"
+            f"现任平度市某局科员。")
+
+
+def build_case_report(p, filler_paragraphs=3):
+    """
+    生成立案报告文本。
+    """
+    filler = "\n".join(f"经初步核实，{p['name']}同志存在违反组织纪律问题，情节较轻。" for _ in range(filler_paragraphs))
+    return (f"关于{p['name']}同志涉嫌违纪问题的立案报告\n"
+            f"一、{p['name']}同志基本情况\n{_basic_info(p)}\n"
+            f"二、涉嫌违反组织纪律的问题\n{filler}\n"
+            f"三、意见建议\n建议对{p['name']}同志立案审查。\n"
+            f"2024年1月5日")
+
+
+def build_decision(p, filler_paragraphs=3):
+    """
+    生成处分决定文本。
+    """
+    filler = "\n".join("违反了《中国共产党纪律处分条例》相关规定。" for _ in range(filler_paragraphs))
+    return (f"关于给予{p['name']}同志党内警告处分的决定\n{_basic_info(p)}\n"
+            f"经审查，{p['name']}存在以下违纪问题。{filler}\n"
+            f"{p['name']}同志身为中共党员，依据有关规定，决定给予{p['name']}同志党内警告处分。\n"
+            f"本处分决定自2024年3月1日起生效。\n"
+            f"中共平度市纪律检查委员会\n2024年3月1日")
+
+
+def build_investigation_report(p, filler_paragraphs=3):
+    """
+    生成审查调查报告文本。
+    """
+    filler = "\n".join("经审查调查查明，上述问题事实清楚。" for _ in range(filler_paragraphs))
+    return (f"关于{p['name']}同志违纪问题的审查调查报告\n"
+            f"一、{p['name']}同志基本情况\n{_basic_info(p)}\n"
+            f"二、违纪事实\n{filler}\n"
+            f"2024年2月10日")
+
+
+def build_trial_report(p, filler_paragraphs=3):
+    """
+    生成审理报告文本。
+    """
+    filler = "\n".join("审理认为，上述问题事实清楚、证据确凿。" for _ in range(filler_paragraphs))
+    return (f"关于{p['name']}同志违纪案的审理报告\n"
+            f"本室于2024年2月12日受理该案，现将具体情况报告如下\n{_basic_info(p)}\n"
+            f"{filler}\n非人大代表，非政协委员。\n"
+            f"2024年2月20日")
+
+
+def build_filing_decision(p):
+    """
+    生成立案决定书文本。
+    """
+    return (f"立案决定书\n经研究，决定对{p['name']}同志涉嫌违纪问题立案审查调查。\n"
+            f"中共平度市纪律检查委员会\n2024年1月5日")
+
+
+def build_disposal_report(p, filler_paragraphs=3):
+    """
+    生成线索处置情况报告文本，包含“核查组成员签字”落款。
+    """
+    filler = "\n".join("经初步核实，反映问题部分属实。" for _ in range(filler_paragraphs))
+    return (f"关于{p['name']}同志问题线索的处置情况报告\n"
+            f"（一）被反映人基本情况\n{_basic_info(p)}\n"
+            f"（二）反映的主要问题\n{filler}\n"
+            f"（三）处置意见\n建议对其进行谈话提醒。\n"
+            f"2024年3月1日\n核查组成员签字：")
+
+
+def sample_texts(seed=0):
+    """
+    返回一组固定的文书样例，用于提取函数的微基准测试。
+
+    返回:
+        dict: 键为文书类型（case_report、decision、investigation、trial、filing_decision、disposal_report），
+              值为对应的文本；另含 name 键表示被调查人姓名。
+    """
+    p = _person(random.Random(seed))
+    return {
+        "name": p["name"],
+        "case_report": build_case_report(p),
+        "decision": build_decision(p),
+        "investigation": build_investigation_report(p),
+        "trial": build_trial_report(p),
+        "filing_decision": build_filing_decision(p),
+        "disposal_report": build_disposal_report(p),
+    }
+
+
+def build_case_dataframe(n_rows, seed=0, mismatch_ratio=0.1):
+    """
+    生成 n_rows 行的立案登记表 DataFrame。
+
+    参数:
+        n_rows (int): 行数。
+        seed (int): 随机种子，保证多次运行数据一致。
+        mismatch_ratio (float): 故意制造字段不一致的行所占比例。
+
+    返回:
+        pd.DataFrame: 包含 validate_case_relationships 所需全部表头的数据。
+    """
+    rng = random.Random(seed)
+    cm = Config.COLUMN_MAPPINGS
+    rows = []
+    for i in range(n_rows):
+        p = _person(rng)
+        mismatch = rng.random() < mismatch_ratio
+        rows.append({
+            cm["reporting_agency"]: rng.choice(SL_AGENCIES),
+            cm["case_code"]: f"AJ{seed:02d}{i:07d}",
+            cm["investigated_person"]: p["name"],
+            cm["person_code"]: f"RY{seed:02d}{i:07d}",
+            cm["gender"]: ("女" if p["gender"] == "男" else "男") if mismatch else p["gender"],
+            cm["age"]: 2024 - p["birth_year"],
+            cm["birth_date"]: f"{p['birth_year']}/{p['birth_month']:02d}",
+            cm["education"]: p["education"],
+            cm["ethnicity"]: p["ethnicity"],
+            cm["party_member"]: "是",
+            cm["party_joining_date"]: f"{p['join_year']}/{p['join_month']:02d}",
+            cm["brief_case_details"]: f"{p['name']}同志存在违反组织纪律问题",
+            cm["filing_time"]: "2024-01-05",
+            cm["filing_decision_doc"]: build_filing_decision(p),
+            cm["disciplinary_committee_filing_time"]: "2024-01-05",
+            cm["disciplinary_committee_filing_authority"]: "中共平度市纪律检查委员会",
+            cm["supervisory_committee_filing_time"]: "",
+            cm["supervisory_committee_filing_authority"]: "",
+            cm["central_eight_provisions"]: "否",
+            cm["voluntary_confession"]: "否",
+            cm["closing_time"]: "2024-03-01",
+            cm["disciplinary_sanction"]: "警告",
+            cm["no_party_position_warning"]: "否",
+            cm["administrative_sanction"]: "",
+            cm["recovery_amount"]: "",
+            cm["trial_acceptance_time"]: "2024-02-12",
+            cm["trial_closing_time"]: "2024-02-20",
+            cm["trial_authority"]: rng.choice(SL_AGENCIES),
+            cm["confiscation_amount"]: "",
+            cm["confiscation_of_property_amount"]: "",
+            cm["compensation_amount"]: "",
+            cm["registered_handover_amount"]: "",
+            cm["case_report"]: build_case_report(p),
+            cm["disciplinary_decision"]: build_decision(p),
+            cm["investigation_report"]: build_investigation_report(p),
+            cm["trial_report"]: build_trial_report(p),
+        })
+    return pd.DataFrame(rows)
+
+
+def build_clue_dataframe(n_rows, seed=0, mismatch_ratio=0.1):
+    """
+    生成 n_rows 行的线索登记表 DataFrame。
+
+    参数:
+        n_rows (int): 行数。
+        seed (int): 随机种子。
+        mismatch_ratio (float): 故意制造字段不一致的行所占比例。
+
+    返回:
+        pd.DataFrame: 包含 validate_clue_data 所需全部表头的数据。
+    """
+    rng = random.Random(seed)
+    cm = Config.COLUMN_MAPPINGS
+    rows = []
+    for i in range(n_rows):
+        p = _person(rng)
+        mismatch = rng.random() < mismatch_ratio
+        rows.append({
+            cm["reporting_agency"]: rng.choice(NSL_AGENCIES),
+            cm["authority"]: "县市区旗纪委",
+            cm["mentioned_person"]: p["name"],
+            cm["accepted_clue_code"]: f"XS{seed:02d}{i:07d}",
+            cm["accepted_personnel_code"]: f"RY{seed:02d}{i:07d}",
+            cm["disposal_report"]: build_disposal_report(p),
+            cm["acceptance_time"]: "2024-01-10",
+            "收缴金额（万元）": "",
+            "没收金额": "",
+            "责令退赔金额": "",
+            "登记上交金额": "",
+            "追缴失职渎职滥用职权造成的损失金额": "",
+            cm["ethnicity"]: "汉族" if mismatch else p["ethnicity"],
+            cm["birth_date"]: f"{p['birth_year']}/{p['birth_month']}",
+            cm["party_joining_date"]: f"{p['join_year']}/{p['join_month']:02d}",
+            cm["completion_time"]: "2024-03-01",
+            cm["organization_measure"]: "谈话提醒",
+            cm["disposal_method_1"]: "谈话函询",
+        })
+    return pd.DataFrame(rows)
+
+
+def write_workbook(df, path):
+    """
+    将 DataFrame 写成 xlsx 文件，用于端到端上传基准。
+    """
+    df.to_excel(path, index=False, engine='xlsxwriter')
+    return path
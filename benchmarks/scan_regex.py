@@ -0,0 +1,168 @@
+# scan_regex.py
+"""
+正则回溯风险离线扫描。
+
+扫描项目源码中传给 re.search / re.match / re.compile 等函数的正则字面量（以及赋值给 *pattern 变量的字面量），
+按正则语法树检查两类风险：
+    nested      无上限的量词嵌套在另一个无上限的量词内，且至少一个是惰性量词，例如 (?:.+?，)*；
+    sequential  同一序列中两个可匹配任意字符的无上限量词相邻出现且前者为惰性，例如 一、.+?同志基本情况.*?，
+                在存在多个起始标记却没有结束标记的文本上会退化为平方级。
+
+nested 视为错误（退出码 1），sequential 默认只提示，加 --strict 时同样视为错误。
+
+用法示例（在项目根目录执行）:
+    python benchmarks/scan_regex.py
+    python benchmarks/scan_regex.py validation --strict
+"""
+import argparse
+import ast
+import os
+import sys
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python 3.10 及以下
+    import sre_parse
+    import sre_constants
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+
+REGEX_FUNCTIONS = {'search', 'match', 'fullmatch', 'compile', 'findall', 'finditer', 'sub', 'subn', 'split',
+                   'guarded_search'}
+SKIP_DIRS = {'__pycache__', '.git', 'static', 'templates'}
+
+MAXREPEAT = sre_constants.MAXREPEAT
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+def _literal_pattern(node):
+    """
+    取正则字面量文本。f-string 中的插值按 1 处理，使 rf"(.{{1,{NAME_MAX_CHARS}}}?)" 仍可解析为有界量词。
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(str(value.value))
+            else:
+                parts.append('1')
+        return ''.join(parts)
+    return None
+
+def _matches_anything(item):
+    """
+    判断量词作用的单元是否可以匹配几乎任意字符（.、[\\s\\S]、[^，] 等）。
+    """
+    op, av = item
+    if op is sre_constants.ANY:
+        return True
+    if op is sre_constants.IN:
+        return any(entry[0] is sre_constants.NEGATE for entry in av) or (
+            any(entry == (sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE) for entry in av)
+            and any(entry == (sre_constants.CATEGORY, sre_constants.CATEGORY_NOT_SPACE) for entry in av))
+    return False
+
+def _children(op, av):
+    if op is sre_constants.BRANCH:
+        return list(av[1])
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return [av[1]]
+    return []
+
+def _analyse(subpattern, findings, outer=None, previous=None):
+    """
+    遍历语法树。outer 为外层无上限量词是否惰性（None 表示没有外层无上限量词），
+    previous 为本序列中上一个可匹配任意字符的无上限量词是否惰性（None 表示没有）。
+    捕获分组对相邻关系透明，返回分组结束时的 previous。
+    """
+    for op, av in subpattern:
+        if op in REPEATS:
+            low, high, body = av
+            unbounded = high == MAXREPEAT
+            lazy = op is sre_constants.MIN_REPEAT
+            matches_anything = len(body) == 1 and _matches_anything(body[0])
+            if unbounded and outer is not None and (lazy or outer):
+                findings.add('nested')
+            if unbounded and previous and matches_anything:
+                findings.add('sequential')
+            _analyse(body, findings, (lazy or bool(outer)) if unbounded else outer)
+            if unbounded:
+                previous = lazy if matches_anything else None
+        elif op is sre_constants.SUBPATTERN:
+            previous = _analyse(av[-1], findings, outer, previous)
+        elif op not in (sre_constants.LITERAL, sre_constants.AT):
+            for child in _children(op, av):
+                _analyse(child, findings, outer)
+            previous = None
+    return previous
+
+def analyse_pattern(pattern):
+    """
+    返回正则的风险类型集合（'nested'、'sequential'），无法解析时返回 {'unparsable'}。
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return {'unparsable'}
+    findings = set()
+    _analyse(parsed, findings)
+    return findings
+
+def iter_patterns(path):
+    """
+    返回文件中的 (行号, 正则文本)。
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and node.args:
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+            if name in REGEX_FUNCTIONS:
+                pattern = _literal_pattern(node.args[0])
+                if pattern is not None:
+                    yield node.lineno, pattern
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id.endswith('pattern'):
+                pattern = _literal_pattern(node.value)
+                if pattern is not None:
+                    yield node.lineno, pattern
+
+def iter_source_files(paths):
+    for base in paths:
+        if os.path.isfile(base):
+            yield base
+            continue
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if filename.endswith('.py'):
+                    yield os.path.join(dirpath, filename)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="扫描正则中的嵌套/相邻惰性量词")
+    parser.add_argument('paths', nargs='*', default=[PROJECT_ROOT], help="要扫描的文件或目录，默认整个项目")
+    parser.add_argument('--strict', action='store_true', help="sequential 也视为错误")
+    args = parser.parse_args(argv)
+
+    errors = 0
+    warnings = 0
+    for path in iter_source_files(args.paths):
+        for lineno, pattern in iter_patterns(path):
+            findings = analyse_pattern(pattern)
+            if not findings:
+                continue
+            relative = os.path.relpath(path, PROJECT_ROOT)
+            for kind in sorted(findings):
+                is_error = kind == 'nested' or (kind == 'sequential' and args.strict)
+                errors += is_error
+                warnings += not is_error
+                print(f"{relative}:{lineno}: {'错误' if is_error else '提示'} {kind}: {pattern}")
+    print(f"扫描完成：{errors} 个错误，{warnings} 个提示")
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
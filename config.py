@@ -10,6 +10,7 @@ class Config:
 
     ALLOWED_EXTENSIONS = {'xlsx', 'xls'}
     REQUIRED_FILENAME_PATTERN = '线索登记表'
+    CASE_FILENAME_PATTERN = '立案登记表'
 
     TODAY_DATE = datetime.now().strftime('%Y%m%d')
     """
@@ -171,6 +172,187 @@ class Config:
     在生产环境中，请务必将其替换为强随机字符串。
     """
 
+    PROFILE_UPLOADS = os.environ.get('PROFILE_UPLOADS', '0').lower() in ('1', 'true', 'yes')
+    """
+    是否对所有上传请求开启 cProfile 性能分析。
+    默认关闭；关闭时管理员仍可通过在上传地址后追加 ?profile=1 对单次上传开启分析。
+    分析结果（.prof 与折叠栈文件）保存在 CASE_FOLDER / CLUE_FOLDER 中。
+    """
+
+    PROFILE_ADMIN_USERS = [u.strip() for u in os.environ.get('PROFILE_ADMIN_USERS', '').split(',') if u.strip()]
+    """
+    允许通过 ?profile=1 开启性能分析并下载分析结果的用户名列表。
+    可通过环境变量 PROFILE_ADMIN_USERS 以逗号分隔配置。
+    默认为空：注册页面对所有人开放，不能预设任何用户名，须显式配置。
+    """
+
+    RESULT_CACHE_ENABLED = True
+    """
+    是否启用上传结果缓存。
+    内容完全相同的文件（SHA-256 一致）在规则和配置未变化时直接返回已生成的副本和编号表。
+    """
+
+    RESULT_CACHE_FOLDER = None
+    """
+    结果缓存目录，为 None 时使用 UPLOAD_FOLDER/result_cache。
+    """
+
+    # 结果缓存的容量上限，超出后按最近访问时间淘汰
+    RESULT_CACHE_MAX_ENTRIES = 200
+    RESULT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+    INCREMENTAL_VALIDATION_ENABLED = True
+    """
+    是否启用行级增量校验。
+    以 案件编码+涉案人员编码（立案）或 受理线索编码+受理人员编码（线索）为主键保存每行的内容指纹和校验结果，
+    再次上传时只对内容或位置发生变化的行重新执行校验规则。
+    """
+
+    COPY_OUTPUT_ENGINE = 'rebuild'
+    """
+    副本的生成方式：
+    'rebuild' 按 DataFrame 重新生成整个工作簿（全部单元格写为文本）；
+    'patch'   复制上传的 .xlsx，只为需要标色的单元格改写样式并加入问题列表，保留原文件的格式和布局，
+              耗时取决于标色单元格的数量而不是表格大小（.xls 文件和流式分块模式仍使用 rebuild）。
+    """
+
+    STREAMING_UPLOAD_ENABLED = False
+    """
+    是否以流式分块模式处理 .xlsx 上传（适用于数万行以上的汇总表）。
+    按 STREAMING_CHUNK_ROWS 行一块只读读取、逐块校验，副本和编号表以常量内存模式逐行写出，
+    内存占用与总行数无关；该模式不使用行级增量校验。
+    """
+
+    STREAMING_CHUNK_ROWS = 5000
+    """
+    流式分块模式下每块的行数。
+    """
+
+    STREAMING_PIPELINE_QUEUE_SIZE = 2
+    """
+    流式分块模式下读取 / 校验 / 写出三个阶段之间每个队列最多缓冲的块数。
+    队列满时上游阶段等待（背压），内存中最多同时存在 STREAMING_PIPELINE_QUEUE_SIZE × 2 + 3 块数据。
+    """
+
+    VALIDATION_WORKER_PROCESSES = 0
+    """
+    立案登记表逐行规则并行执行的进程数，0 表示在当前进程中执行。
+    文书列通过共享内存传给子进程，执行计划和机关单位字典在进程池初始化时传递一次。
+    """
+
+    VALIDATION_PARALLEL_MIN_ROWS = 10000
+    """
+    并行执行逐行规则的最少行数；行数较少时启动进程池的开销大于并行的收益。
+    由 benchmarks/run_benchmarks.py --suite parallel 测得：进程池固定开销约 1 秒，每行另加约 0.15 毫秒
+    （单进程每行约 1.07 毫秒）；3 个进程在 3000 行时仍慢于单进程（4.33 秒对 3.44 秒）。
+    按此估算 3 核及以上在 10000 行时约快四成。更换部署机器后应重新运行该基准确认。
+    """
+
+    BATCH_WORKER_PROCESSES = 0
+    """
+    批量校验命令行工具（batch_validate.py）默认的并行进程数，0 表示使用 CPU 核数。
+    """
+
+    WATCH_INBOX_FOLDER = None
+    """
+    投递目录监听服务（python app.py watch）监听的目录，为 None 时使用 UPLOAD_FOLDER/inbox。
+    """
+
+    WATCH_POLL_SECONDS = 2
+    """
+    投递目录的扫描间隔（秒）。
+    """
+
+    WATCH_SETTLE_SECONDS = 5
+    """
+    文件大小和修改时间连续保持不变的秒数，达到后才认为复制完成并开始处理，避免读取写了一半的文件。
+    """
+
+    WATCH_WORKER_PROCESSES = 2
+    """
+    投递目录监听服务同时校验的文件数（进程数），其余文件在任务队列中等待。
+    """
+
+    SERVE_HOST = os.environ.get('SERVE_HOST', '0.0.0.0')
+    """
+    serve 模式（python app.py serve，使用 waitress）监听的地址，可通过环境变量 SERVE_HOST 配置。
+    """
+
+    SERVE_PORT = int(os.environ.get('SERVE_PORT', 5000))
+    """
+    serve 模式监听的端口，可通过环境变量 SERVE_PORT 配置。
+    """
+
+    SERVE_THREADS = 8
+    """
+    serve 模式处理请求的线程数，即同时处理的上传数。
+    """
+
+    SERVE_CONNECTION_LIMIT = 100
+    """
+    serve 模式同时保持的最大连接数，超出的连接在操作系统的连接队列中等待。
+    """
+
+    SERVE_MAX_REQUEST_BODY_SIZE = 200 * 1024 * 1024
+    """
+    serve 模式下单个请求体（上传文件）的大小上限（字节），超出时返回 413。
+    """
+
+    SERVE_CHANNEL_TIMEOUT = 300
+    """
+    serve 模式下连接无数据收发的最长时间（秒），超过后关闭连接。
+    """
+
+    SERVE_SHUTDOWN_TIMEOUT = 60
+    """
+    serve 模式停止时等待正在处理的请求完成的最长时间（秒）。
+    """
+
+    JOB_QUEUE_DATABASE = os.environ.get('JOB_QUEUE_DATABASE') or None
+    """
+    任务队列数据库文件，为 None 时使用 case_management.db。
+    多台机器共同处理投递目录中的文件时，指向共享目录中的同一个文件（共享目录须支持文件锁）。
+    可通过环境变量 JOB_QUEUE_DATABASE 配置。
+    """
+
+    JOB_LEASE_SECONDS = 120
+    """
+    领取任务的租约时长（秒）。处理进程或机器退出后，租约到期的任务由其他进程重新领取。
+    """
+
+    JOB_HEARTBEAT_SECONDS = 30
+    """
+    为正在校验的任务续约的间隔（秒），须明显小于 JOB_LEASE_SECONDS。
+    """
+
+    JOB_MAX_ATTEMPTS = 3
+    """
+    每个任务最多被领取的次数；租约多次过期（文件导致处理进程崩溃等）后标记为失败，不再重试。
+    """
+
+    OUTPUT_WRITER_PROCESSES = 2
+    """
+    副本和编号表并行写出时使用的进程数。两个输出同时写出（一个在当前进程，另一个在进程池中），
+    任一失败时都不写入上传目录；设为 0 时在当前进程中依次写出。
+    """
+
+    OUTPUT_PROCESS_MIN_ROWS = 2000
+    """
+    使用进程池并行写出的最少行数；行数较少时进程间传递数据的开销大于并行的收益。
+    """
+
+    EXTRACTION_WINDOW_CHARS = 20000
+    """
+    文书提取正则的搜索窗口（字符数）。
+    提取函数只在报告文本开头的这段范围内查找，防止超长或格式异常的单元格拖慢整次上传。
+    """
+
+    EXTRACTION_TIME_BUDGET_MS = 200
+    """
+    单次文书提取的时间预算（毫秒）。
+    超过预算的提取会连同行号和函数名记录到日志，便于定位异常单元格。
+    """
+
     # 确保这些文件存储目录已定义且存在，如果你的项目结构不同，请修改路径
     UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'uploads')
     CASE_FOLDER = os.path.join(UPLOAD_FOLDER, 'cases')
@@ -1,3 +1,4 @@
+import time
 import sqlite3
 import logging
 
@@ -5,6 +6,19 @@ logger = logging.getLogger(__name__)
 
 DATABASE = 'case_management.db'
 
+# 任务队列所在的数据库，多台机器共同处理时指向共享目录中的文件（见 configure_job_database）
+JOB_DATABASE = DATABASE
+
+# 数据库被其他连接锁定时的最长等待时间（秒），多个进程同时领取任务时会短暂互相等待
+BUSY_TIMEOUT = 30
+
+# 任务表中后来增加的列，旧数据库在初始化时补齐
+JOB_LEASE_COLUMNS = {
+    'claimed_by': 'TEXT',
+    'lease_expires_at': 'REAL',
+    'attempts': 'INTEGER NOT NULL DEFAULT 0'
+}
+
 def get_db():
     conn = sqlite3.connect(DATABASE)
     conn.row_factory = sqlite3.Row
@@ -30,6 +44,17 @@ def init_db():
                 agency TEXT NOT NULL
             )
         ''')
+        # 创建 row_fingerprints 表，用于增量校验时复用未变化行的校验结果
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS row_fingerprints (
+                kind TEXT NOT NULL,
+                row_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (kind, row_key)
+            )
+        ''')
         conn.commit()
 
         # 检查 authority_agency_dict 表是否已初始化
@@ -99,6 +124,8 @@ def init_db():
             logging.info(f"Initialized {len(dict_data)} records in authority_agency_dict")
             conn.commit()
 
+    init_job_db()
+
 def get_user(username):
     with get_db() as conn:
         cursor = conn.cursor()
@@ -143,4 +170,183 @@ def delete_authority_agency(id):
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute('DELETE FROM authority_agency_dict WHERE id = ?', (id,))
-        conn.commit()
\ No newline at end of file
+        conn.commit()
+
+def get_row_fingerprints(kind, row_keys):
+    """
+    批量查询行指纹记录。
+    返回 {row_key: {'fingerprint': ..., 'result': ...}}，未找到的键不出现在结果中。
+    """
+    records = {}
+    row_keys = list(row_keys)
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # SQLite 单条语句的参数个数有限，分批查询
+        for start in range(0, len(row_keys), 500):
+            batch = row_keys[start:start + 500]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(f'SELECT row_key, fingerprint, result FROM row_fingerprints '
+                           f'WHERE kind = ? AND row_key IN ({placeholders})', [kind] + batch)
+            for row in cursor.fetchall():
+                records[row['row_key']] = {'fingerprint': row['fingerprint'], 'result': row['result']}
+    return records
+
+def save_row_fingerprints(kind, records):
+    """
+    批量写入或更新行指纹记录，records 为 (row_key, fingerprint, result) 列表。
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.executemany('INSERT OR REPLACE INTO row_fingerprints (kind, row_key, fingerprint, result, updated_at) '
+                           'VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)',
+                           [(kind, row_key, fingerprint, result) for row_key, fingerprint, result in records])
+        conn.commit()
+
+def configure_job_database(path):
+    """
+    设置任务队列所在的数据库文件，path 为空时使用 DATABASE。
+    多台机器共同处理任务时，各自指向共享目录中的同一个文件；共享目录须支持文件锁（SMB 共享可以，
+    部分 NFS 挂载不支持），领取任务依赖 SQLite 的写锁保证同一任务只被一个进程领取。
+    """
+    global JOB_DATABASE
+    JOB_DATABASE = path or DATABASE
+
+def get_job_db():
+    conn = sqlite3.connect(JOB_DATABASE, timeout=BUSY_TIMEOUT)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def init_job_db():
+    """
+    创建 jobs 任务表，并为旧版本创建的任务表补齐租约相关的列。
+    """
+    with get_job_db() as conn:
+        cursor = conn.cursor()
+        # 创建 jobs 表，作为校验任务队列（投递目录中的文件等待后台进程校验）
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                path TEXT NOT NULL,  -- 相对于上传根目录的路径（旧版本记录的是绝对路径）
+                filename TEXT NOT NULL,
+                file_hash TEXT NOT NULL,
+                source TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                error TEXT,
+                result TEXT,
+                created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                started_at TEXT,
+                finished_at TEXT,
+                claimed_by TEXT,
+                lease_expires_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        existing = {row['name'] for row in cursor.execute('PRAGMA table_info(jobs)')}
+        for column, definition in JOB_LEASE_COLUMNS.items():
+            if column not in existing:
+                cursor.execute(f'ALTER TABLE jobs ADD COLUMN {column} {definition}')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_hash ON jobs (kind, file_hash)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id)')
+        conn.commit()
+
+def enqueue_job(kind, path, filename, file_hash, source):
+    """
+    将一个待校验文件加入任务队列，返回任务 id。
+    path 为相对于上传根目录的路径（以 / 分隔），各机器按自己的上传根目录解析。
+    """
+    with get_job_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('INSERT INTO jobs (kind, path, filename, file_hash, source) VALUES (?, ?, ?, ?, ?)',
+                       (kind, path, filename, file_hash, source))
+        conn.commit()
+        return cursor.lastrowid
+
+def find_job_by_hash(kind, file_hash):
+    """
+    查找内容相同（SHA-256 一致）且未失败的任务，用于去重。未找到时返回 None。
+    """
+    with get_job_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM jobs WHERE kind = ? AND file_hash = ? AND status != 'failed' "
+                       "ORDER BY id LIMIT 1", (kind, file_hash))
+        return cursor.fetchone()
+
+def claim_next_job(worker_id, lease_seconds, max_attempts):
+    """
+    领取最早的可执行任务：排队中的任务，或租约已过期（领取它的进程已退出或失联）的任务。
+    领取在 BEGIN IMMEDIATE 事务中以一条 UPDATE ... WHERE 完成，多个进程（包括其他机器上的进程）
+    同时领取时同一任务只会被一个进程领到。租约过期且已领取 max_attempts 次的任务标记为失败，不再重试。
+
+    参数:
+        worker_id (str): 领取者标识，记录在 claimed_by 中。
+        lease_seconds (float): 租约时长（秒），领取者须在到期前调用 renew_job_leases 续约。
+        max_attempts (int): 每个任务最多被领取的次数。
+
+    返回:
+        sqlite3.Row: 领到的任务，没有可执行的任务时为 None。
+    """
+    now = time.time()
+    conn = get_job_db()
+    conn.isolation_level = None
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute("UPDATE jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP "
+                       "WHERE status = 'running' AND IFNULL(lease_expires_at, 0) < ? AND attempts >= ?",
+                       (f'已领取 {max_attempts} 次仍未完成（处理进程多次退出或失联）', now, max_attempts))
+        if cursor.rowcount:
+            logger.error(f"{cursor.rowcount} 个任务租约多次过期，已标记为失败")
+        cursor.execute("UPDATE jobs SET status = 'running', claimed_by = ?, lease_expires_at = ?, "
+                       "attempts = attempts + 1, started_at = CURRENT_TIMESTAMP "
+                       "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' "
+                       "            OR (status = 'running' AND IFNULL(lease_expires_at, 0) < ?) ORDER BY id LIMIT 1) "
+                       "AND (status = 'queued' OR IFNULL(lease_expires_at, 0) < ?) "
+                       "RETURNING *", (worker_id, now + lease_seconds, now, now))
+        job = cursor.fetchone()
+        cursor.execute('COMMIT')
+    except Exception:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    if job is not None and job['attempts'] > 1:
+        logger.warning(f"任务 {job['id']} 的上一次租约已过期，重新领取（第 {job['attempts']} 次）")
+    return job
+
+def renew_job_leases(job_ids, worker_id, lease_seconds):
+    """
+    为本进程持有的任务续约（心跳）。
+
+    返回:
+        set: 续约成功的任务 id；不在其中的任务租约已过期并被其他进程领取。
+    """
+    job_ids = list(job_ids)
+    if not job_ids:
+        return set()
+    with get_job_db() as conn:
+        cursor = conn.cursor()
+        placeholders = ','.join('?' * len(job_ids))
+        cursor.execute(f"UPDATE jobs SET lease_expires_at = ? WHERE id IN ({placeholders}) "
+                       f"AND claimed_by = ? AND status = 'running' RETURNING id",
+                       [time.time() + lease_seconds] + job_ids + [worker_id])
+        renewed = {row['id'] for row in cursor.fetchall()}
+        conn.commit()
+        return renewed
+
+def finish_job(job_id, worker_id, status, error=None, result=None):
+    """
+    记录任务结束：status 为 'done' 或 'failed'，result 为 JSON 文本的处理摘要。
+    只有仍持有租约的领取者可以记录结果。
+
+    返回:
+        bool: 是否记录成功；租约已被其他进程接管时为 False。
+    """
+    with get_job_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE jobs SET status = ?, error = ?, result = ?, finished_at = CURRENT_TIMESTAMP, "
+                       "lease_expires_at = NULL WHERE id = ? AND claimed_by = ? AND status = 'running'",
+                       (status, error, result, job_id, worker_id))
+        conn.commit()
+        return cursor.rowcount == 1
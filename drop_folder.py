@@ -0,0 +1,343 @@
+# drop_folder.py
+"""
+投递目录监听服务。
+
+各单位把线索登记表 / 立案登记表复制到共享的投递目录（默认 UPLOAD_FOLDER/inbox）即可，不需要打开网页上传：
+    扫描      每 WATCH_POLL_SECONDS 秒扫描一次投递目录（只看第一层）。按间隔扫描不依赖 inotify，
+              在 Windows 和 SMB 共享目录上同样可靠，单个目录的扫描开销可以忽略；
+    防抖      文件大小和修改时间连续 WATCH_SETTLE_SECONDS 秒不变、且可以打开读取，才认为复制完成；
+    去重      按内容 SHA-256 与任务队列中未失败的任务比对，重复投递的文件移到 duplicate 目录，不再校验；
+    入队      新文件移到 UPLOAD_FOLDER/<日期>/drop/<case|clue>/ 后写入 jobs 任务队列；
+    校验      最多 WATCH_WORKER_PROCESSES 个文件同时在进程池中校验，其余任务在队列中等待，
+              副本和编号表写在归档目录中原文件旁边。
+文件名无法判断类型的工作簿移到 unrecognized 目录。停止（Ctrl+C / SIGTERM）时不再取出新任务，
+等待正在校验的文件完成；队列中剩余的任务在下次启动时继续处理。
+
+多台机器共同处理（月底报送集中时）：
+    各机器的上传根目录和任务队列数据库（--job-db / JOB_QUEUE_DATABASE）指向同一个共享目录，
+    任务队列中的文件路径相对于上传根目录记录，共享目录在各机器上的挂载路径（//fileserver/uploads、
+    Z:/uploads、/mnt/uploads）不同也可以，各机器以自己的 --upload-folder 解析；
+    一台机器监听投递目录，其他机器以 --no-inbox 只处理队列，吞吐量随机器数和进程数增加，不需要消息中间件。
+    任务以租约领取（claimed_by、lease_expires_at，见 db_utils.claim_next_job），
+    心跳线程每 JOB_HEARTBEAT_SECONDS 秒为正在校验的任务续约；进程或机器中途退出后租约在
+    JOB_LEASE_SECONDS 秒后过期，任务自动由其他进程重新领取，最多领取 JOB_MAX_ATTEMPTS 次。
+    各机器的时钟偏差须远小于 JOB_LEASE_SECONDS。
+
+用法示例（在项目根目录执行，任务队列和机关单位字典读取当前目录下的 case_management.db）:
+    python app.py watch
+    python drop_folder.py --inbox //fileserver/报送 --workers 4
+    python drop_folder.py --once
+    python drop_folder.py --no-inbox --upload-folder //fileserver/uploads --job-db //fileserver/uploads/jobs.db
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import signal
+import socket
+import hashlib
+import logging
+import argparse
+import threading
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from config import Config
+from db_utils import (init_db, configure_job_database, enqueue_job, find_job_by_hash, claim_next_job,
+                      renew_job_leases, finish_job)
+from validation_api import config_dict
+from batch_validate import LOG_FORMAT, detect_kind, is_input_candidate, init_worker, process_file
+
+logger = logging.getLogger(__name__)
+
+# 任务队列中记录的任务来源
+JOB_SOURCE = 'drop_folder'
+
+# 计算内容摘要时每次读取的字节数
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def file_sha256(path):
+    """
+    计算文件内容的 SHA-256 摘要。
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def archive_dir(upload_folder, category):
+    """
+    返回当天的归档目录 UPLOAD_FOLDER/<日期>/drop/<category>（不存在时创建）。
+    服务可能跨天运行，日期在归档时取当前日期。
+    """
+    directory = os.path.join(upload_folder, datetime.now().strftime('%Y%m%d'), 'drop', category)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+def move_to_archive(path, directory):
+    """
+    将文件移到归档目录，同名文件已存在时在文件名后加上时间和序号，返回新路径。
+    """
+    stem, ext = os.path.splitext(os.path.basename(path))
+    target = os.path.join(directory, stem + ext)
+    serial = 0
+    while os.path.exists(target):
+        serial += 1
+        target = os.path.join(directory, f"{stem}_{datetime.now().strftime('%H%M%S')}_{serial}{ext}")
+    os.replace(path, target)
+    return target
+
+def job_relative_path(path, upload_folder):
+    """
+    任务队列中记录的文件路径：相对于上传根目录，以 / 分隔，与各机器的挂载路径和操作系统无关。
+    """
+    return os.path.relpath(path, upload_folder).replace(os.sep, '/')
+
+def resolve_job_path(path, upload_folder):
+    """
+    按本机的上传根目录解析任务队列中的文件路径；旧版本记录的绝对路径原样返回。
+    """
+    if os.path.isabs(path):
+        return path
+    return os.path.join(upload_folder, *path.split('/'))
+
+def _init_watch_worker(log_level, quiet):
+    """
+    子进程初始化：忽略 Ctrl+C，由主进程决定停止时机，正在校验的文件可以完成。
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    init_worker(log_level, quiet)
+
+class DropFolderWatcher:
+    """
+    监听投递目录并通过任务队列校验新文件。
+
+    参数:
+        inbox (str): 投递目录。
+        upload_folder (str): 上传根目录，归档目录建在其下。
+        app_config (dict): 配置字典。
+        workers (int): 同时校验的文件数。
+        verbose (bool): 为 False 时子进程只输出错误日志，并屏蔽校验规则的 print 输出。
+        watch_inbox (bool): 为 False 时不扫描投递目录，只处理任务队列（其他机器上的处理节点）。
+    """
+    def __init__(self, inbox, upload_folder, app_config, workers, verbose=False, watch_inbox=True):
+        self.inbox = inbox
+        self.watch_inbox = watch_inbox
+        self.upload_folder = upload_folder
+        self.app_config = app_config
+        self.workers = max(1, workers)
+        self.verbose = verbose
+        self.poll_seconds = app_config['WATCH_POLL_SECONDS']
+        self.settle_seconds = app_config['WATCH_SETTLE_SECONDS']
+        self.lease_seconds = app_config['JOB_LEASE_SECONDS']
+        self.heartbeat_seconds = app_config['JOB_HEARTBEAT_SECONDS']
+        self.max_attempts = app_config['JOB_MAX_ATTEMPTS']
+        # 领取任务时记录的标识，区分不同机器和同一机器上先后启动的进程
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stop_event = threading.Event()
+        # 投递目录中正在等待稳定的文件: {路径: (大小, 修改时间, 开始保持不变的时间)}
+        self._settling = {}
+        # 正在校验的任务: {future: 任务}，心跳线程读取，由 _running_lock 保护
+        self._running = {}
+        self._running_lock = threading.Lock()
+        # 租约已被其他进程接管的任务 id
+        self._lost = set()
+
+    def scan(self):
+        """
+        扫描投递目录，返回已经稳定（复制完成）的文件路径。
+        """
+        now = time.monotonic()
+        seen = {}
+        try:
+            entries = list(os.scandir(self.inbox))
+        except OSError as e:
+            logger.error(f"无法读取投递目录 {self.inbox}: {e}")
+            return []
+        for entry in entries:
+            if not entry.is_file() or not is_input_candidate(entry.path, self.app_config):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            previous = self._settling.get(entry.path)
+            since = previous[2] if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns) else now
+            seen[entry.path] = (stat.st_size, stat.st_mtime_ns, since)
+        self._settling = seen
+        return [path for path, (size, _, since) in seen.items() if size > 0 and now - since >= self.settle_seconds]
+
+    def ingest(self, path):
+        """
+        对一个已稳定的文件去重、归档并加入任务队列。文件仍被占用（复制未结束）时留到下次扫描。
+        """
+        filename = os.path.basename(path)
+        try:
+            file_hash = file_sha256(path)
+        except OSError as e:
+            logger.info(f"文件暂时无法读取，稍后重试: {path} - {e}")
+            return
+
+        kind = detect_kind(filename, self.app_config)
+        try:
+            if kind is None:
+                target = move_to_archive(path, archive_dir(self.upload_folder, 'unrecognized'))
+                logger.warning(f"文件名中没有“{self.app_config['REQUIRED_FILENAME_PATTERN']}”或"
+                               f"“{self.app_config['CASE_FILENAME_PATTERN']}”，移到: {target}")
+                return
+            duplicate = find_job_by_hash(kind, file_hash)
+            if duplicate is not None:
+                target = move_to_archive(path, archive_dir(self.upload_folder, 'duplicate'))
+                logger.info(f"与任务 {duplicate['id']}（{duplicate['filename']}）内容相同，跳过: {target}")
+                return
+            target = move_to_archive(path, archive_dir(self.upload_folder, kind))
+        except OSError as e:
+            logger.info(f"文件暂时无法移动，稍后重试: {path} - {e}")
+            return
+        self._settling.pop(path, None)
+        job_id = enqueue_job(kind, job_relative_path(target, self.upload_folder), filename, file_hash, JOB_SOURCE)
+        logger.info(f"任务 {job_id} 入队: {filename} -> {target}")
+
+    def dispatch(self, executor):
+        """
+        在并发上限内从队列取出任务提交到进程池。
+        """
+        # 并行发生在文件之间，子进程内不再为校验和输出启动进程池
+        worker_config = dict(self.app_config, VALIDATION_WORKER_PROCESSES=0, OUTPUT_WRITER_PROCESSES=0)
+        while len(self._running) < self.workers and not self.stop_event.is_set():
+            job = claim_next_job(self.worker_id, self.lease_seconds, self.max_attempts)
+            if job is None:
+                return
+            path = resolve_job_path(job['path'], self.upload_folder)
+            future = executor.submit(process_file, path, job['kind'], os.path.dirname(path), worker_config)
+            with self._running_lock:
+                self._running[future] = job
+            logger.info(f"任务 {job['id']} 开始校验: {job['filename']}")
+
+    def collect(self, wait=False):
+        """
+        记录已完成任务的结果；wait 为 True 时等待全部正在校验的任务完成。
+        """
+        with self._running_lock:
+            running = list(self._running.items())
+        for future, job in running:
+            if not wait and not future.done():
+                continue
+            try:
+                summary = future.result()
+            except Exception as e:
+                logger.error(f"任务 {job['id']} 执行失败: {job['filename']} - {e}", exc_info=True)
+                self._finish(job, 'failed', error=str(e))
+            else:
+                result = json.dumps({key: summary[key] for key in ('rows', 'issues', 'outputs', 'elapsed')},
+                                    ensure_ascii=False)
+                if summary['errors']:
+                    if self._finish(job, 'failed', error='；'.join(summary['errors']), result=result):
+                        logger.error(f"任务 {job['id']} 校验失败: {job['filename']} - {'；'.join(summary['errors'])}")
+                elif self._finish(job, 'done', result=result):
+                    logger.info(f"任务 {job['id']} 完成: {job['filename']}，{summary['rows']} 行，"
+                                f"{summary['issues']} 个问题（{summary['elapsed']:.1f} 秒）")
+            with self._running_lock:
+                del self._running[future]
+
+    def _finish(self, job, status, error=None, result=None):
+        """
+        记录任务结果；租约已被其他进程接管时丢弃本次结果（以接管者的结果为准）。
+        """
+        if finish_job(job['id'], self.worker_id, status, error=error, result=result):
+            return True
+        logger.warning(f"任务 {job['id']} 的租约已被其他进程接管，丢弃本次结果: {job['filename']}")
+        return False
+
+    def _heartbeat(self, stop):
+        """
+        心跳线程：每 heartbeat_seconds 秒为正在校验的任务续约，直到 stop 被设置。
+        """
+        while not stop.wait(self.heartbeat_seconds):
+            with self._running_lock:
+                job_ids = {job['id'] for job in self._running.values()}
+            try:
+                renewed = renew_job_leases(job_ids, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                # 共享目录暂时不可用时下次心跳重试，租约未过期前不影响任务
+                logger.error(f"任务续约失败: {e}")
+                continue
+            for job_id in job_ids - renewed - self._lost:
+                logger.warning(f"任务 {job_id} 续约失败，租约已过期并被其他进程领取")
+            self._lost |= job_ids - renewed
+
+    def run(self, once=False):
+        """
+        运行监听循环，直到 stop_event 被设置；once 为 True 时投递目录和队列都处理完后退出。
+        """
+        if self.watch_inbox:
+            os.makedirs(self.inbox, exist_ok=True)
+            logger.info(f"开始监听投递目录 {self.inbox}，归档到 {self.upload_folder}")
+        logger.info(f"处理节点 {self.worker_id}，同时校验 {self.workers} 个文件，租约 {self.lease_seconds} 秒")
+
+        heartbeat_stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(heartbeat_stop,), name='job-heartbeat', daemon=True)
+        heartbeat.start()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_watch_worker,
+                                 initargs=(logging.INFO if self.verbose else logging.ERROR, not self.verbose)) as executor:
+            try:
+                while not self.stop_event.is_set():
+                    for path in (self.scan() if self.watch_inbox else []):
+                        self.ingest(path)
+                    self.collect()
+                    self.dispatch(executor)
+                    if once and not self._settling and not self._running:
+                        break
+                    self.stop_event.wait(self.poll_seconds)
+            finally:
+                if self._running:
+                    logger.info(f"正在停止，等待 {len(self._running)} 个校验中的任务完成")
+                self.collect(wait=True)
+                heartbeat_stop.set()
+                heartbeat.join()
+        logger.info("投递目录监听已停止")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="监听投递目录，自动校验放入的线索登记表 / 立案登记表")
+    parser.add_argument('--inbox', default=Config.WATCH_INBOX_FOLDER,
+                        help="投递目录，默认为 Config.WATCH_INBOX_FOLDER 或 <上传目录>/inbox")
+    parser.add_argument('--upload-folder', help="上传根目录，归档目录建在其下，默认为程序目录下的 uploads")
+    parser.add_argument('--workers', type=int, default=Config.WATCH_WORKER_PROCESSES,
+                        help="同时校验的文件数，默认为 Config.WATCH_WORKER_PROCESSES")
+    parser.add_argument('--no-inbox', action='store_true', help="不扫描投递目录，只处理任务队列（其他机器上的处理节点）")
+    parser.add_argument('--job-db', default=Config.JOB_QUEUE_DATABASE,
+                        help="任务队列数据库，多台机器共同处理时指向共享目录中的同一个文件，默认为 Config.JOB_QUEUE_DATABASE")
+    parser.add_argument('--once', action='store_true', help="处理完投递目录中现有的文件和队列中的任务后退出")
+    parser.add_argument('--verbose', action='store_true', help="输出校验过程的日志和规则的 print 输出")
+    return parser.parse_args(argv)
+
+def main(argv=None, upload_folder=None):
+    """
+    命令行入口。upload_folder 为默认的上传根目录（app.py 传入打包环境下 .exe 旁边的 uploads）。
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    app_config = config_dict()
+    configure_job_database(args.job_db)
+    init_db()
+
+    upload_folder = os.path.abspath(args.upload_folder or upload_folder or
+                                    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads'))
+    inbox = os.path.abspath(args.inbox or os.path.join(upload_folder, 'inbox'))
+    watcher = DropFolderWatcher(inbox, upload_folder, app_config, args.workers, args.verbose,
+                                watch_inbox=not args.no_inbox)
+
+    def _stop(signum, frame):
+        watcher.stop_event.set()
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    watcher.run(once=args.once)
+    return 0
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,13 +1,48 @@
+import os
 import pandas as pd
 from config import Config
 import logging
+from validation.header_map import current_header_map, letter_agnostic_pattern
+from validation.case_validation.case_result_matrix import CASE_RESULT_RULES
 
 logger = logging.getLogger(__name__)
 
+# 副本“问题列表”工作表的列（问题描述列在表中显示为“问题”）
+CASE_ISSUE_COLUMNS = ['案件编码', '涉案人员编码', '行号', '比对字段', '被比对字段', '问题描述', '列名']
+CLUE_ISSUE_COLUMNS = ['受理线索编码', '受理人员编码', '行号', '比对字段', '被比对字段', '问题描述', '列名']
+
+def copy_filename(original_filename):
+    """
+    副本文件名：原文件名去掉扩展名后加“_副本.xlsx”（.xls 文件的副本同样写为 .xlsx）。
+    """
+    return os.path.splitext(original_filename)[0] + '_副本.xlsx'
+
+def display_text(value):
+    """
+    副本单元格的显示文本：空值为 ''，整数值的浮点数不带 '.0'（与原表中的显示一致）。
+    整表读取时含空值的整数列为 float，分块读取时同一列可能是 int，统一显示后两种模式的副本相同。
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def display_frame(df):
+    """
+    按 display_text 将整张 DataFrame 转换为副本的显示文本。
+    """
+    return df.astype(object).map(display_text)
+
 def get_column_letter(df, column_name):
     """
-    Gets the Excel column letter for a given column name.
+    Gets the column position for a given column name.
+    Uses the header map activated for the current upload, so positions are resolved once per file
+    instead of once per cell.
     """
+    header_map = current_header_map()
+    if header_map is not None and header_map.columns is df.columns:
+        return header_map.position(column_name)
     if column_name in df.columns:
         return pd.Index(df.columns).get_loc(column_name)
     return None
@@ -18,10 +53,7 @@ def apply_format(worksheet, row_idx, col_idx, value, condition, cell_format):
     """
     if condition:
         # 处理空值和nan值，保持原始显示
-        if pd.isna(value) or value is None or str(value).lower() == 'nan':
-            display_value = ''
-        else:
-            display_value = str(value)
+        display_value = '' if str(value).lower() == 'nan' else display_text(value)
         worksheet.write(row_idx + 1, col_idx, display_value, cell_format)
 
 def _check_issue_condition(issues_list, idx, rule, is_case_table_issues):
@@ -30,6 +62,9 @@ def _check_issue_condition(issues_list, idx, rule, is_case_table_issues):
     
     if not issues_list:
         return False
+
+    # 问题描述中的列字母和行号按实际表头生成，规则中的列字母不参与匹配
+    pattern = letter_agnostic_pattern(rule) if rule else rule
     
     if isinstance(issues_list[0], dict):
         # 支持正则表达式匹配
@@ -38,16 +73,16 @@ def _check_issue_condition(issues_list, idx, rule, is_case_table_issues):
             if issue_row == idx:
                 issue_desc = issue_item.get('问题描述', '')
                 exact_match = issue_desc == rule
-                regex_match = re.search(rule, issue_desc) if rule else False
+                regex_match = re.search(pattern, issue_desc) if rule else False
                 if exact_match or regex_match:
                     return True
         return False
     elif isinstance(issues_list[0], tuple):
         print(f"Debug: 处理元组格式的issues_list")
         if is_case_table_issues:
-            return any(issue_desc == rule or re.search(rule, issue_desc) for i, _, _, issue_desc in issues_list if i == idx)
+            return any(issue_desc == rule or re.search(pattern, issue_desc) for i, _, _, issue_desc in issues_list if i == idx)
         else:
-            return any(issue_desc == rule or re.search(rule, issue_desc) for i, _, issue_desc in issues_list if i == idx)
+            return any(issue_desc == rule or re.search(pattern, issue_desc) for i, _, issue_desc in issues_list if i == idx)
     return False
 
 def apply_clue_table_formats(worksheet, df, row, idx, issues_list, is_case_table_issues, yellow_format, red_format):
@@ -146,166 +181,41 @@ def apply_clue_table_formats(worksheet, df, row, idx, issues_list, is_case_table
             apply_format(worksheet, idx, col_letter, row.get(Config.COLUMN_MAPPINGS["disposal_method_1"]), True, yellow_format)
 
 
-def apply_case_table_formats(worksheet, df, row, idx, mismatch_indices, issues_list, is_case_table_issues,
-                             gender_mismatch_indices, age_mismatch_indices, birth_date_mismatch_indices,
-                             education_mismatch_indices, ethnicity_mismatch_indices, party_member_mismatch_indices,
-                             party_joining_date_mismatch_indices, brief_case_details_mismatch_indices,
-                             filing_time_mismatch_indices, disciplinary_committee_filing_time_mismatch_indices,
-                             disciplinary_committee_filing_authority_mismatch_indices,
-                             supervisory_committee_filing_time_mismatch_indices,
-                             supervisory_committee_filing_authority_mismatch_indices,
-                             case_report_keyword_mismatch_indices, disposal_spirit_mismatch_indices,
-                             voluntary_confession_highlight_indices, closing_time_mismatch_indices,
-                             no_party_position_warning_mismatch_indices, recovery_amount_highlight_indices,
-                             trial_acceptance_time_mismatch_indices, trial_closing_time_mismatch_indices,
-                             trial_authority_agency_mismatch_indices, disposal_decision_keyword_mismatch_indices,
-                             trial_report_non_representative_mismatch_indices, trial_report_detention_mismatch_indices,
-                             confiscation_amount_indices, confiscation_of_property_amount_indices,
-                             compensation_amount_highlight_indices, registered_handover_amount_indices,
-                             disciplinary_sanction_mismatch_indices,
-                             administrative_sanction_mismatch_indices, # <-- 【新增】在这里添加这个参数
-                             yellow_format, red_format):
+def apply_case_table_formats(worksheet, df, row, idx, results, issues_list, is_case_table_issues,
+                             yellow_format, red_format, position=None):
     """
     Applies red and yellow formatting checks specific to the case registration table.
+    results 为 CaseResultMatrix，idx 为行位置；各规则高亮的列和颜色见 CASE_RESULT_RULES。
+    流式写出时 results 只覆盖当前数据块，position 为行在块内的位置（默认与 idx 相同）。
     """
-    # Inconsistent Investigator Name (red)
-    if "被调查人" in df.columns and idx in mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "被调查人"), row.get("被调查人"), True, red_format)
-        for report_col_name, rule_key in [
-            ("立案报告", "inconsistent_case_name_report"),
-            ("处分决定", "inconsistent_case_name_decision"),
-            ("审查调查报告", "inconsistent_case_name_investigation"),
-            ("审理报告", "inconsistent_case_name_trial")
+    rule_ids = results.rules_at(idx if position is None else position)
+    if not rule_ids:
+        return
+    formats = {'red': red_format, 'yellow': yellow_format}
+
+    # Inconsistent Investigator Name (red)：任一规则命中的行都标红被调查人，姓名与文书不一致时同时标红对应文书
+    investigated_person_col = Config.COLUMN_MAPPINGS["investigated_person"]
+    if investigated_person_col in df.columns:
+        apply_format(worksheet, idx, get_column_letter(df, investigated_person_col), row.get(investigated_person_col), True, red_format)
+        for report_key, rule_key in [
+            ("case_report", "inconsistent_case_name_report"),
+            ("disciplinary_decision", "inconsistent_case_name_decision"),
+            ("investigation_report", "inconsistent_case_name_investigation"),
+            ("trial_report", "inconsistent_case_name_trial")
         ]:
+            report_col_name = Config.COLUMN_MAPPINGS[report_key]
             if report_col_name in df.columns:
                 condition = _check_issue_condition(issues_list, idx, Config.VALIDATION_RULES[rule_key], is_case_table_issues)
                 if condition:
                     apply_format(worksheet, idx, get_column_letter(df, report_col_name), row.get(report_col_name), True, red_format)
 
-    # Inconsistent Gender (red)
-    if "性别" in df.columns and idx in gender_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "性别"), row.get("性别"), True, red_format)
-
-    # Inconsistent Age (red)
-    if "年龄" in df.columns and idx in age_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "年龄"), row.get("年龄"), True, red_format)
-
-    # Inconsistent Brief Case Details (red)
-    if "简要案情" in df.columns and idx in brief_case_details_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "简要案情"), row.get("简要案情"), True, red_format)
-
-    # Inconsistent Birth Date (red)
-    if "出生年月" in df.columns and idx in birth_date_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "出生年月"), row.get("出生年月"), True, red_format)
-
-    # Inconsistent Education (red)
-    if "学历" in df.columns and idx in education_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "学历"), row.get("学历"), True, red_format)
-
-    # Inconsistent Ethnicity (red)
-    if "民族" in df.columns and idx in ethnicity_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "民族"), row.get("民族"), True, red_format)
-
-    # Inconsistent Party Member Status (red)
-    if "是否中共党员" in df.columns and idx in party_member_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "是否中共党员"), row.get("是否中共党员"), True, red_format)
-
-    # Inconsistent Party Joining Time (red)
-    if "入党时间" in df.columns and idx in party_joining_date_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "入党时间"), row.get("入党时间"), True, red_format)
-
-    # Filing Time related (red)
-    if "立案时间" in df.columns and idx in filing_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "立案时间"), row.get("立案时间"), True, red_format)
-
-    # Disciplinary Committee Filing Time (red)
-    if "纪委立案时间" in df.columns and idx in disciplinary_committee_filing_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "纪委立案时间"), row.get("纪委立案时间"), True, red_format)
-
-    # Disciplinary Committee Filing Authority (red)
-    if "纪委立案机关" in df.columns and idx in disciplinary_committee_filing_authority_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "纪委立案机关"), row.get("纪委立案机关"), True, red_format)
-
-    # Supervisory Committee Filing Time (red)
-    if "监委立案时间" in df.columns and idx in supervisory_committee_filing_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "监委立案时间"), row.get("监委立案时间"), True, red_format)
-
-    # Supervisory Committee Filing Authority (red)
-    if "监委立案机关" in df.columns and idx in supervisory_committee_filing_authority_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "监委立案机关"), row.get("监委立案机关"), True, red_format)
-
-    # Case Report Keywords (red)
-    if "立案报告" in df.columns and idx in case_report_keyword_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "立案报告"), row.get("立案报告"), True, red_format)
-
-    # Violation of Central Eight Provisions Spirit (red)
-    if "是否违反中央八项规定精神" in df.columns and idx in disposal_spirit_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "是否违反中央八项规定精神"), row.get("是否违反中央八项规定精神"), True, red_format)
-
-    # Voluntary Confession (yellow)
-    if "是否主动交代问题" in df.columns and idx in voluntary_confession_highlight_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "是否主动交代问题"), row.get("是否主动交代问题"), True, yellow_format)
-
-    # Closing Time (red)
-    if "结案时间" in df.columns and idx in closing_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "结案时间"), row.get("结案时间"), True, red_format)
-
-    # Should have revoked party position... (red)
-    if "是否属于本应撤销党内职务，但本人没有党内职务而给予严重警告处分" in df.columns and idx in no_party_position_warning_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "是否属于本应撤销党内职务，但本人没有党内职务而给予严重警告处分"), row.get("是否属于本应撤销党内职务，但本人没有党内职务而给予严重警告处分"), True, red_format)
-
-    # Recovery amount for dereliction of duty (yellow)
-    if "追缴失职渎职滥用职权造成的损失金额" in df.columns and idx in recovery_amount_highlight_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "追缴失职渎职滥用职权造成的损失金额"), row.get("追缴失职渎职滥用职权造成的损失金额"), True, yellow_format)
-
-    # Trial Acceptance Time (red)
-    if "审理受理时间" in df.columns and idx in trial_acceptance_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "审理受理时间"), row.get("审理受理时间"), True, red_format)
-
-    # Trial Closing Time (red)
-    if "审结时间" in df.columns and idx in trial_closing_time_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "审结时间"), row.get("审结时间"), True, red_format)
-
-    # Trial Authority vs. Reporting Unit (red)
-    if "审理机关" in df.columns and "填报单位名称" in df.columns and idx in trial_authority_agency_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "审理机关"), row.get("审理机关"), True, red_format)
-        apply_format(worksheet, idx, get_column_letter(df, "填报单位名称"), row.get("填报单位名称"), True, red_format)
-
-    # Disposal Decision Keywords (red)
-    if "处分决定" in df.columns and idx in disposal_decision_keyword_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "处分决定"), row.get("处分决定"), True, red_format)
-
-    # Trial Report - Non-representative keywords (red)
-    if "审理报告" in df.columns and idx in trial_report_non_representative_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "审理报告"), row.get("审理报告"), True, red_format)
-
-    # Trial Report - "扣押" keyword (red)
-    if "审理报告" in df.columns and idx in trial_report_detention_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "审理报告"), row.get("审理报告"), True, red_format)
-
-    # Confiscation amount (yellow)
-    if "收缴金额（万元）" in df.columns and idx in confiscation_amount_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "收缴金额（万元）"), row.get("收缴金额（万元）"), True, yellow_format)
-
-    # Confiscation of property amount (yellow)
-    if "没收金额" in df.columns and idx in confiscation_of_property_amount_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "没收金额"), row.get("没收金额"), True, yellow_format)
-
-    # Compensation amount to highlight (yellow)
-    if "责令退赔金额" in df.columns and idx in compensation_amount_highlight_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "责令退赔金额"), row.get("责令退赔金额"), True, yellow_format)
-
-    # Registered handover amount to highlight (yellow)
-    if "登记上交金额" in df.columns and idx in registered_handover_amount_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "登记上交金额"), row.get("登记上交金额"), True, yellow_format)
-
-    # Party Disciplinary Sanction (red)
-    if "党纪处分" in df.columns and idx in disciplinary_sanction_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "党纪处分"), row.get("党纪处分"), True, red_format)
-
-    # Administrative Sanction (red) # <-- 【新增】在这里添加政务处分的高亮逻辑
-    if "政务处分" in df.columns and idx in administrative_sanction_mismatch_indices:
-        apply_format(worksheet, idx, get_column_letter(df, "政务处分"), row.get("政务处分"), True, red_format)
+    for rule_id in rule_ids:
+        spec = CASE_RESULT_RULES[rule_id]
+        columns = [Config.COLUMN_MAPPINGS[key] for key in spec['columns']]
+        if not columns or not all(column in df.columns for column in columns):
+            continue
+        for column in columns:
+            apply_format(worksheet, idx, get_column_letter(df, column), row.get(column), True, formats[spec['color']])
 
 
 def create_clue_issues_sheet(writer, issues_list):
@@ -315,15 +225,7 @@ def create_clue_issues_sheet(writer, issues_list):
     if issues_list:
         issues_df = pd.DataFrame(issues_list)
         # 确保列的顺序和名称与需求一致
-        issues_df = issues_df[[
-            '受理线索编码',
-            '受理人员编码',
-            '行号',
-            '比对字段',
-            '被比对字段',
-            '问题描述', # 对应 Excel 中的 '问题' 列
-            '列名'
-        ]]
+        issues_df = issues_df[CLUE_ISSUE_COLUMNS]
         issues_df.insert(0, '序号', range(1, 1 + len(issues_df)))
         issues_df.rename(columns={'问题描述': '问题'}, inplace=True)
         issues_df.to_excel(writer, sheet_name='问题列表', index=False)
@@ -369,7 +271,7 @@ def create_case_issues_sheet(writer, issues_list):
             # 字典格式: 直接使用DataFrame处理，与线索表保持一致
             issues_df = pd.DataFrame(issues_list)
             # 确保包含所有必要的列
-            required_columns = ['案件编码', '涉案人员编码', '行号', '比对字段', '被比对字段', '问题描述', '列名']
+            required_columns = CASE_ISSUE_COLUMNS
             for col in required_columns:
                 if col not in issues_df.columns:
                     issues_df[col] = ''
@@ -1,17 +1,20 @@
 # clue_file_processor.py
 import os
 import sys
-import pandas as pd
 import logging
 from flask import flash, redirect, url_for
 
 # 导入通用函数
-from .upload_utils import handle_file_upload_and_initial_checks
+from .upload_utils import save_uploaded_file, flash_errors
+from .result_cache import lookup_cached_result, restore_cached_result, store_result
+from .streaming_upload import ExcelChunkReader, stream_clue_upload
+from .output_stage import write_clue_outputs
+from validation.ingestion_schema import CLUE_SCHEMA
+from validation_api import validate_clue_workbook, clue_header_errors, empty_disposal_report_error
 
 # 导入验证规则模块和辅助函数
 try:
-    from validation.clue_validation.clue_validation import validate_clue_data
-    from excel_formatter import format_clue_excel
+    from excel_utils import copy_filename
     from db_utils import get_db, get_authority_agency_dict
 except ImportError as e:
     # 打印到标准错误输出，确保能看到
@@ -34,109 +37,90 @@ def process_clue_upload(request, app):
     返回:
         flask.redirect: 重定向到上传页面。
     """
-    # 使用通用函数处理文件上传和初步检查
-    file_path, original_filename, df, error_response = handle_file_upload_and_initial_checks(
+    # 使用通用函数处理文件上传和初步检查，保存时同步计算文件哈希
+    file_path, original_filename, file_hash, error_response = save_uploaded_file(
         request, app, 'file', 'CLUE_FOLDER', app.config['REQUIRED_FILENAME_PATTERN'], '线索登记表'
     )
     if error_response:
         return error_response
 
-    try:
-        # 检查必要的表头，使用 app.config
-        required_headers = list(app.config['CLUE_REQUIRED_HEADERS']) + [
-            app.config['COLUMN_MAPPINGS']["organization_measure"],
-            app.config['COLUMN_MAPPINGS']["acceptance_time"]
-        ]
-
-        if not all(header in df.columns for header in required_headers):
-            missing_headers = [header for header in required_headers if header not in df.columns]
-            logger.error(f"缺少必要表头: {missing_headers}")
-            flash(f'Excel文件缺少必要的表头: {", ".join(missing_headers)}', 'error')
+    # 相同内容的文件在规则未变化时直接复用缓存结果
+    cached_artifacts = lookup_cached_result(app.config, 'clue', file_hash)
+    if cached_artifacts:
+        try:
+            restore_cached_result(cached_artifacts, app.config['CLUE_FOLDER'], {'copy': copy_filename(original_filename)})
+            logger.info(f"线索登记表命中结果缓存，跳过重新校验: {original_filename}")
+            flash('文件上传处理成功！', 'success')
             return redirect(request.url)
+        except OSError as e:
+            logger.warning(f"恢复缓存结果失败，重新处理: {e}")
 
-        disposal_report_column = app.config['COLUMN_MAPPINGS'].get("disposal_report", "处置情况报告")
-        if disposal_report_column not in df.columns:
-            logger.error(f"Excel文件缺少必要表头: {disposal_report_column}")
-            flash(f'Excel文件缺少必要的表头"{disposal_report_column}"', 'error')
-            return redirect(request.url)
+    # 超大文件可配置为流式分块处理，内存占用与行数无关
+    if app.config.get('STREAMING_UPLOAD_ENABLED') and file_path.lower().endswith('.xlsx'):
+        return _process_clue_upload_streaming(request, app, file_path, original_filename, file_hash)
 
-        if df[disposal_report_column].isnull().all():
-            logger.error(f'线索登记表"{disposal_report_column}"字段为空')
-            flash(f'线索登记表"{disposal_report_column}"字段为空', 'error')
+    try:
+        # 读取、检查表头和处置情况报告并校验，只对内容变化的行重新校验
+        result = validate_clue_workbook(file_path, app.config, original_filename, incremental=True)
+        if not result.ok:
+            flash_errors(result.errors)
             return redirect(request.url)
 
-        # 获取机构映射数据
-        agency_mapping_db = get_authority_agency_dict(category='NSL')
-
-        # 调用线索数据验证函数，并传入 agency_mapping_db
-        issues_list, error_count = validate_clue_data(df, app.config, agency_mapping_db)
-        logger.info(f"validate_clue_data 返回了 {len(issues_list)} 个问题和 {error_count} 个错误。")
-
-        # 处理并生成问题报告文件
-        if issues_list:
-            # 将问题分为两类：填报单位名称相关的问题和其他问题
-            reporting_agency_issues = []
-            other_issues = []
-            
-            for issue_item in issues_list:
-                # 确保 issue_item 是字典，并处理可能的元组格式
-                if isinstance(issue_item, tuple):
-                    # 假设元组格式为 (行号, 受理线索编码, 问题描述)
-                    issue_dict = {
-                        "行号": issue_item[0] + 2, # 调整行号，因为Excel从1开始，且有表头
-                        "受理线索编码": issue_item[1],
-                        "问题描述": issue_item[2]
-                    }
-                elif isinstance(issue_item, dict):
-                    issue_dict = issue_item
-                else:
-                    logger.warning(f"issues_list 中发现未知类型项: {type(issue_item)}. 跳过处理。")
-                    continue
-                
-                # 检查问题描述是否与填报单位名称相关
-                if "填报单位名称" in issue_dict.get('问题描述', '') or \
-                   (issue_dict.get('比对字段', '') and "填报单位名称" in issue_dict.get('比对字段', '')):
-                    reporting_agency_issues.append(issue_dict)
-                else:
-                    other_issues.append(issue_dict)
-            
-            # 合并两个列表，确保填报单位名称相关的问题排在前面
-            sorted_issues = reporting_agency_issues + other_issues
-            
-            data_for_issues_df = []
-            seen_issues = set() # 用于去重
-            
-            for issue_dict in sorted_issues:
-                # 使用 frozenset 来判断字典是否重复
-                issue_hashable = frozenset(issue_dict.items())
-                if issue_hashable not in seen_issues:
-                    data_for_issues_df.append({
-                        '序号': len(data_for_issues_df) + 1, # 动态生成序号
-                        '受理线索编码': issue_dict.get('受理线索编码', 'N/A'),
-                        '受理人员编码': issue_dict.get('受理人员编码', ''),
-                        '行号': issue_dict.get('行号', ''),
-                        '比对字段': issue_dict.get('比对字段', ''),
-                        '被比对字段': issue_dict.get('被比对字段', ''),
-                        '问题': issue_dict.get('问题描述', '无描述')
-                    })
-                    seen_issues.add(issue_hashable)
-
-            issues_df = pd.DataFrame(data_for_issues_df)
-
-            issue_filename = f"线索编号{app.config['TODAY_DATE']}.xlsx" # 使用 app.config['TODAY_DATE']
-            issue_path = os.path.join(app.config['CLUE_FOLDER'], issue_filename) # 直接使用 app.config
-            issues_df.to_excel(issue_path, index=False)
+        # 副本和线索编号文件（有问题时）并行写出，任一失败时都不写入（抛出 OutputStageError）
+        copy_path, issue_path = write_clue_outputs(
+            result.df,
+            original_filename,
+            app.config['CLUE_FOLDER'], # 直接使用 app.config
+            result.issues,
+            file_path,
+            app.config
+        )
+        if issue_path:
             logger.info(f"生成线索编号文件: {issue_path}")
 
-        # 生成带有高亮和问题的副本文件
-        original_filename_copy = original_filename.replace('.xlsx', '_副本.xlsx').replace('.xls', '_副本.xlsx')
-        original_path_copy = os.path.join(app.config['CLUE_FOLDER'], original_filename_copy) # 直接使用 app.config
+        store_result(app.config, 'clue', file_hash,
+                     {'copy': copy_path, 'number_table': issue_path})
+
+        logger.info("线索登记表处理成功")
+        flash('文件上传处理成功！', 'success')
+        return redirect(request.url)
+    except Exception as e:
+        logger.error(f"线索登记表处理失败: {str(e)}", exc_info=True)
+        flash(f'文件处理失败: {str(e)}', 'error')
+        return redirect(request.url)
+
+def _process_clue_upload_streaming(request, app, file_path, original_filename, file_hash):
+    """
+    以流式分块模式校验已保存的线索登记表，逐块写出副本和线索编号文件。
+    参数同 process_clue_upload，另加已保存的文件路径、原始文件名和文件哈希。
+
+    返回:
+        flask.redirect: 重定向到上传页面。
+    """
+    try:
+        with ExcelChunkReader(file_path, app.config['STREAMING_CHUNK_ROWS'],
+                              app.config['COLUMN_MAPPINGS'], CLUE_SCHEMA) as reader:
+            header_errors = clue_header_errors(reader.columns, app.config)
+            if header_errors:
+                flash_errors(header_errors)
+                return redirect(request.url)
+
+            # 获取机构映射数据
+            agency_mapping_db = get_authority_agency_dict(category='NSL')
+            copy_path, issue_path, summary = stream_clue_upload(
+                reader, original_filename, app.config['CLUE_FOLDER'], app.config, agency_mapping_db
+            )
+
+        # 处置情况报告整列为空只有读完才能确定，此时丢弃已写出的结果
+        if not summary['disposal_reports']:
+            for path in (copy_path, issue_path):
+                if path and os.path.exists(path):
+                    os.remove(path)
+            flash_errors([empty_disposal_report_error(app.config)])
+            return redirect(request.url)
+        logger.info(f"线索登记表流式校验完成: 共 {summary['rows']} 行，{summary['issues']} 个问题和 {summary['errors']} 个错误。")
 
-        # 由于 clue_file_processor 中的 format_excel 不使用 case_file_processor 中的大量高亮参数
-        format_clue_excel(df,
-                          issues_list=issues_list,
-                          output_path=original_path_copy
-                     )
+        store_result(app.config, 'clue', file_hash, {'copy': copy_path, 'number_table': issue_path})
 
         logger.info("线索登记表处理成功")
         flash('文件上传处理成功！', 'success')
@@ -144,4 +128,4 @@ def process_clue_upload(request, app):
     except Exception as e:
         logger.error(f"线索登记表处理失败: {str(e)}", exc_info=True)
         flash(f'文件处理失败: {str(e)}', 'error')
-        return redirect(request.url)
\ No newline at end of file
+        return redirect(request.url)
@@ -0,0 +1,213 @@
+# incremental_validation.py
+import json
+import hashlib
+import logging
+import pandas as pd
+
+from db_utils import get_row_fingerprints, save_row_fingerprints
+from validation.case_validation.case_validators import validate_case_relationships
+from validation.case_validation.case_result_matrix import CaseResultMatrix
+from validation.clue_validation.clue_validation import validate_clue_data
+from validation.issue_order import issue_row_index
+from .result_cache import compute_rules_fingerprint
+
+logger = logging.getLogger(__name__)
+
+def _row_keys(df, key_columns):
+    """
+    为每一行生成业务主键（例如 案件编码|涉案人员编码）。
+    主键为空或在本表中重复的行返回 None，这些行总是重新校验。
+
+    返回:
+        dict: {行索引: 主键或 None}；缺少主键列时返回 None。
+    """
+    if not all(col in df.columns for col in key_columns):
+        return None
+    key_series = df[key_columns[0]].fillna('').astype(str).str.strip()
+    for col in key_columns[1:]:
+        key_series = key_series + '|' + df[col].fillna('').astype(str).str.strip()
+    duplicated = key_series.duplicated(keep=False)
+    keys = {}
+    for index, key, is_duplicate in zip(df.index, key_series, duplicated):
+        empty = not key.replace('|', '')
+        keys[index] = None if empty or is_duplicate else key
+    return keys
+
+def _row_fingerprints(df, rules_fingerprint):
+    """
+    计算每一行的内容指纹。
+    指纹包含规则指纹、表头、行位置和该行全部单元格的值：
+    问题描述中带有行号，因此行位置变化也需要重新校验。
+    """
+    header = json.dumps([str(c) for c in df.columns], ensure_ascii=False)
+    fingerprints = {}
+    for index, values in zip(df.index, df.itertuples(index=False, name=None)):
+        sha256 = hashlib.sha256()
+        sha256.update(f"{rules_fingerprint}|{index}|{header}|".encode('utf-8'))
+        sha256.update(json.dumps(['' if pd.isna(v) else str(v) for v in values], ensure_ascii=False).encode('utf-8'))
+        fingerprints[index] = sha256.hexdigest()
+    return fingerprints
+
+def _json_default(value):
+    """
+    序列化 numpy 标量等非标准类型。
+    """
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+def _dump_issues(issues):
+    """
+    将问题列表序列化，保留元组与字典两种格式的区别。
+    """
+    return [{'t': list(issue)} if isinstance(issue, tuple) else {'d': issue} for issue in issues]
+
+def _load_issues(serialized):
+    """
+    反序列化 _dump_issues 的结果。
+    """
+    return [tuple(item['t']) if 't' in item else item['d'] for item in serialized]
+
+def _split_reusable_rows(df, kind, key_columns, app_config):
+    """
+    比对行指纹，划分出可复用存储结果的行和需要重新校验的行。
+
+    返回:
+        tuple: (keys, fingerprints, reused, changed_index)
+               reused 为 {行索引: 存储的结果字典}；keys 为 None 表示无法增量校验。
+    """
+    keys = _row_keys(df, key_columns)
+    if keys is None:
+        return None, None, {}, list(df.index)
+    fingerprints = _row_fingerprints(df, compute_rules_fingerprint(app_config))
+    stored = get_row_fingerprints(kind, [key for key in keys.values() if key])
+    reused = {}
+    for index, key in keys.items():
+        record = stored.get(key) if key else None
+        if record and record['fingerprint'] == fingerprints[index]:
+            reused[index] = json.loads(record['result'])
+    changed_index = [index for index in df.index if index not in reused]
+    logger.info(f"增量校验({kind}): 共 {len(df)} 行，复用 {len(reused)} 行，重新校验 {len(changed_index)} 行")
+    return keys, fingerprints, reused, changed_index
+
+def _save_changed_rows(kind, keys, fingerprints, changed_index, row_results):
+    """
+    将重新校验的行结果写回指纹表。
+    """
+    records = []
+    for index in changed_index:
+        key = keys.get(index)
+        if key:
+            records.append((key, fingerprints[index],
+                            json.dumps(row_results.get(index, {}), ensure_ascii=False, default=_json_default)))
+    if records:
+        save_row_fingerprints(kind, records)
+
+def validate_case_incrementally(df, app_config, issues_list):
+    """
+    增量版本的 validate_case_relationships。
+    以 案件编码+涉案人员编码 为主键比对行指纹，只对内容变化的行重新执行校验规则，
+    未变化的行直接复用上次存储的问题和高亮索引。
+
+    参数:
+        df (pd.DataFrame): 包含立案登记表数据的DataFrame。
+        app_config (dict): Flask 应用的配置字典。
+        issues_list (list): 用于收集所有发现问题的列表。
+
+    返回:
+        tuple: 与 validate_case_relationships 相同的 (results, issues_list)。
+    """
+    if not app_config.get('INCREMENTAL_VALIDATION_ENABLED'):
+        return validate_case_relationships(df, app_config, issues_list)
+
+    key_columns = [app_config['COLUMN_MAPPINGS']['case_code'], app_config['COLUMN_MAPPINGS']['person_code']]
+    keys, fingerprints, reused, changed_index = _split_reusable_rows(df, 'case', key_columns, app_config)
+    if keys is None or not reused:
+        results, issues_list = validate_case_relationships(df, app_config, issues_list)
+        if keys is not None:
+            _save_changed_rows('case', keys, fingerprints, changed_index, _case_row_results(results, issues_list))
+        return results, issues_list
+
+    fresh_results, fresh_issues = validate_case_relationships(df.loc[changed_index], app_config, [])
+    row_results = _case_row_results(fresh_results, fresh_issues)
+    _save_changed_rows('case', keys, fingerprints, changed_index, row_results)
+
+    # 按行合并复用行与重新校验行的结果，与整表校验的问题顺序（按行，同一行内按规则顺序）一致
+    merged = CaseResultMatrix(df.index)
+    for index in df.index:
+        row_result = reused.get(index) or row_results.get(index)
+        if not row_result:
+            continue
+        merged.mark_row(index, row_result['sets'])
+        issues_list.extend(_load_issues(row_result['issues']))
+    # 无法归属到具体行的问题（如缺少表头）放在最后
+    issues_list.extend(issue for issue in fresh_issues if issue_row_index(issue) is None)
+    return merged, issues_list
+
+def _case_row_results(results, issues):
+    """
+    将 validate_case_relationships 的返回值按行拆分为 {行索引: {'sets': [规则 ID...], 'issues': [...]}}。
+    """
+    row_results = {}
+    for position in range(len(results)):
+        rule_ids = results.rules_at(position)
+        if rule_ids:
+            row_results.setdefault(results.labels[position], {'sets': [], 'issues': []})['sets'] = rule_ids
+    grouped_issues = {}
+    for issue in issues:
+        index = issue_row_index(issue)
+        if index is not None:
+            grouped_issues.setdefault(index, []).append(issue)
+    for index, row_issues in grouped_issues.items():
+        row_results.setdefault(index, {'sets': [], 'issues': []})['issues'] = _dump_issues(row_issues)
+    return row_results
+
+def validate_clue_incrementally(df, app_config, agency_mapping_db):
+    """
+    增量版本的 validate_clue_data。
+    以 受理线索编码+受理人员编码 为主键比对行指纹，只对内容变化的行重新校验。
+
+    参数:
+        df (pd.DataFrame): 包含线索登记表数据的DataFrame。
+        app_config (dict): Flask 应用的配置字典。
+        agency_mapping_db (list): NSL 类别的机关单位映射。
+
+    返回:
+        tuple: (issues_list, error_count)，与 validate_clue_data 相同。
+    """
+    if not app_config.get('INCREMENTAL_VALIDATION_ENABLED'):
+        return validate_clue_data(df, app_config, agency_mapping_db)
+
+    key_columns = [app_config['COLUMN_MAPPINGS']['accepted_clue_code'],
+                   app_config['COLUMN_MAPPINGS']['accepted_personnel_code']]
+    keys, fingerprints, reused, changed_index = _split_reusable_rows(df, 'clue', key_columns, app_config)
+    if keys is None or not reused:
+        issues_list, error_count = validate_clue_data(df, app_config, agency_mapping_db)
+        if keys is not None:
+            _save_changed_rows('clue', keys, fingerprints, changed_index, _clue_row_results(issues_list))
+        return issues_list, error_count
+
+    fresh_issues, _ = validate_clue_data(df.loc[changed_index], app_config, agency_mapping_db)
+    row_results = _clue_row_results(fresh_issues)
+    _save_changed_rows('clue', keys, fingerprints, changed_index, row_results)
+
+    # 按行合并，与整表校验的问题顺序一致
+    issues_list = []
+    for index in df.index:
+        row_result = reused.get(index) or row_results.get(index)
+        if row_result:
+            issues_list.extend(_load_issues(row_result['issues']))
+    issues_list.extend(issue for issue in fresh_issues if issue_row_index(issue) is None)
+    # validate_clue_data 每记录一个问题 error_count 加一，因此合并后的错误数等于问题数
+    return issues_list, len(issues_list)
+
+def _clue_row_results(issues_list):
+    """
+    将线索问题列表按行拆分为 {行索引: {'issues': [...]}}。
+    """
+    grouped_issues = {}
+    for issue in issues_list:
+        index = issue_row_index(issue)
+        if index is not None:
+            grouped_issues.setdefault(index, []).append(issue)
+    return {index: {'issues': _dump_issues(issues)} for index, issues in grouped_issues.items()}
@@ -0,0 +1,222 @@
+# output_stage.py
+"""
+校验结束后的输出阶段：副本和编号表并行写出。
+
+两个输出互不依赖，且都是纯 Python 的 XML/zip 序列化（被调查人编号表还要重新执行被调查人规则），
+在线程中并行受 GIL 限制，因此第一个输出在当前进程中写出，其余输出同时提交到进程池。
+所有输出先写入上传目录下的临时目录，全部成功后才移动到上传目录；任一输出失败时删除全部临时文件并抛出
+OutputStageError，不会留下只有一半的结果。
+
+行数少于 OUTPUT_PROCESS_MIN_ROWS 或 OUTPUT_WRITER_PROCESSES 为 0 时在当前进程中依次写出，失败处理相同。
+"""
+import os
+import shutil
+import logging
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from excel_utils import copy_filename
+from excel_formatter import format_clue_excel
+from validation.case_validation.case_generators import generate_case_files
+from validation.case_validation.case_excel_generator import generate_investigatee_number_file
+from .upload_utils import split_clue_issues, clue_number_record
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_workers = 0
+# serve 模式下多个请求线程可能同时写出，进程池的创建和重建需要加锁
+_executor_lock = threading.Lock()
+
+class OutputStageError(Exception):
+    """
+    任一输出写出失败。已写出的其他输出同时被丢弃。
+    """
+
+def _get_executor(workers):
+    """
+    返回进程池，整个进程共用一个；进程数配置变化或进程池损坏后重新创建。
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _executor_workers = workers
+        return _executor
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+
+def _run_writer(func, output_dir, args):
+    """
+    执行一个输出函数，返回生成的文件路径；输出函数返回 None 视为失败。
+    """
+    path = func(output_dir, *args)
+    if not path:
+        raise OutputStageError(f"{func.__name__} 未生成文件")
+    return path
+
+def run_output_writers(writers, upload_dir, app_config, rows):
+    """
+    并行执行各输出函数，全部成功后把生成的文件移动到 upload_dir。
+
+    参数:
+        writers (dict): {输出名称: (func, args)}，func(output_dir, *args) 在 output_dir 中写出文件并返回路径，
+                        失败时返回 None 或抛出异常。func 和 args 须可以 pickle（在子进程中执行）。
+        upload_dir (str): 最终输出目录。
+        app_config (dict): Flask 应用的配置字典。
+        rows (int): 上传数据的行数，决定是否使用进程池。
+
+    返回:
+        dict: {输出名称: 最终文件路径}。
+
+    异常:
+        OutputStageError: 任一输出失败。
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    staging = {name: tempfile.mkdtemp(prefix='.output-', dir=upload_dir) for name in writers}
+    workers = app_config.get('OUTPUT_WRITER_PROCESSES', 0)
+    parallel = len(writers) > 1 and workers > 0 and rows >= app_config.get('OUTPUT_PROCESS_MIN_ROWS', 0)
+    try:
+        produced = {}
+        names = list(writers)
+        if parallel:
+            executor = _get_executor(workers)
+            futures = {}
+            try:
+                for name in names[1:]:
+                    func, args = writers[name]
+                    futures[name] = executor.submit(_run_writer, func, staging[name], args)
+            except BrokenProcessPool:
+                _reset_executor()
+                raise
+            # 第一个输出在当前进程中与子进程同时写出
+            first = names[0]
+            func, args = writers[first]
+            errors = []
+            try:
+                produced[first] = _run_writer(func, staging[first], args)
+            except Exception as e:
+                errors.append((first, e))
+            for name, future in futures.items():
+                try:
+                    produced[name] = future.result()
+                except BrokenProcessPool as e:
+                    _reset_executor()
+                    errors.append((name, e))
+                except Exception as e:
+                    errors.append((name, e))
+            if errors:
+                name, error = errors[0]
+                raise OutputStageError(f"{name} 写出失败: {error}") from error
+        else:
+            for name in names:
+                func, args = writers[name]
+                try:
+                    produced[name] = _run_writer(func, staging[name], args)
+                except Exception as e:
+                    raise OutputStageError(f"{name} 写出失败: {e}") from e
+
+        final_paths = {}
+        for name, path in produced.items():
+            final_path = os.path.join(upload_dir, os.path.basename(path))
+            os.replace(path, final_path)
+            final_paths[name] = final_path
+        logger.info(f"输出阶段完成（{'进程池并行' if parallel else '当前进程依次'}写出）: {final_paths}")
+        return final_paths
+    finally:
+        for path in staging.values():
+            shutil.rmtree(path, ignore_errors=True)
+
+def _case_copy_writer(output_dir, df, original_filename, results, issues_list, source_path, copy_engine):
+    copy_path, _ = generate_case_files(df, original_filename, output_dir, results, issues_list, source_path, copy_engine)
+    return copy_path
+
+def _investigatee_number_writer(output_dir, df, original_filename, app_config):
+    return generate_investigatee_number_file(df, original_filename, output_dir, app_config)
+
+def _clue_copy_writer(output_dir, df, original_filename, issues_list, source_path, copy_engine):
+    output_path = os.path.join(output_dir, copy_filename(original_filename))
+    return output_path if format_clue_excel(df, output_path, issues_list, source_path, copy_engine) else None
+
+def _clue_number_writer(output_dir, issues_list, today_date):
+    # 将问题分为两类：填报单位名称相关的问题和其他问题
+    reporting_agency_issues, other_issues = split_clue_issues(issues_list)
+
+    # 合并两个列表，确保填报单位名称相关的问题排在前面
+    sorted_issues = reporting_agency_issues + other_issues
+
+    data_for_issues_df = []
+    seen_issues = set() # 用于去重
+
+    for issue_dict in sorted_issues:
+        # 使用 frozenset 来判断字典是否重复
+        issue_hashable = frozenset(issue_dict.items())
+        if issue_hashable not in seen_issues:
+            data_for_issues_df.append(clue_number_record(len(data_for_issues_df) + 1, issue_dict)) # 动态生成序号
+            seen_issues.add(issue_hashable)
+
+    issue_path = os.path.join(output_dir, f"线索编号{today_date}.xlsx")
+    pd.DataFrame(data_for_issues_df).to_excel(issue_path, index=False)
+    return issue_path
+
+def write_case_outputs(df, original_filename, upload_dir, results, issues_list, source_path, app_config):
+    """
+    并行写出立案登记表的副本和被调查人立案编号表。
+
+    参数:
+        df (pd.DataFrame): 立案登记表数据。
+        original_filename (str): 原始上传的文件名。
+        upload_dir (str): 输出目录。
+        results (CaseResultMatrix): 行 × 规则的命中矩阵。
+        issues_list (list): 去重后的问题字典列表。
+        source_path (str): 上传的原文件路径（patch 引擎使用）。
+        app_config (dict): Flask 应用的配置字典。
+
+    返回:
+        tuple: (copy_path, investigatee_num_path)。
+
+    异常:
+        OutputStageError: 任一输出失败，此时两个文件都不会写入 upload_dir。
+    """
+    paths = run_output_writers({
+        'number_table': (_investigatee_number_writer, (df, original_filename, dict(app_config))),
+        'copy': (_case_copy_writer, (df, original_filename, results, issues_list, source_path,
+                                     app_config.get('COPY_OUTPUT_ENGINE'))),
+    }, upload_dir, app_config, len(df))
+    return paths['copy'], paths['number_table']
+
+def write_clue_outputs(df, original_filename, upload_dir, issues_list, source_path, app_config):
+    """
+    并行写出线索登记表的副本和线索编号文件（没有问题时不生成编号文件）。
+
+    参数:
+        df (pd.DataFrame): 线索登记表数据。
+        original_filename (str): 原始上传的文件名。
+        upload_dir (str): 输出目录。
+        issues_list (list): 校验返回的问题列表。
+        source_path (str): 上传的原文件路径（patch 引擎使用）。
+        app_config (dict): Flask 应用的配置字典。
+
+    返回:
+        tuple: (copy_path, issue_path)，没有问题时 issue_path 为 None。
+
+    异常:
+        OutputStageError: 任一输出失败，此时两个文件都不会写入 upload_dir。
+    """
+    writers = {'copy': (_clue_copy_writer, (df, original_filename, issues_list, source_path,
+                                            app_config.get('COPY_OUTPUT_ENGINE')))}
+    if issues_list:
+        writers = {'number_table': (_clue_number_writer, (issues_list, app_config['TODAY_DATE'])), **writers}
+    paths = run_output_writers(writers, upload_dir, app_config, len(df))
+    return paths['copy'], paths.get('number_table')
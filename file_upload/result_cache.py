@@ -0,0 +1,230 @@
+# result_cache.py
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+
+from db_utils import get_authority_agency_dict
+
+logger = logging.getLogger(__name__)
+
+# 参与规则指纹计算的配置项，任一项变化都会使已有缓存失效
+FINGERPRINT_CONFIG_KEYS = [
+    'TODAY_DATE', 'COLUMN_MAPPINGS', 'VALIDATION_RULES', 'FORMATS',
+    'ORGANIZATION_MEASURE_KEYWORDS', 'DISPOSAL_DECISION_KEYWORDS',
+    'DISCIPLINARY_SANCTION_KEYWORDS', 'ADMINISTRATIVE_SANCTION_KEYWORDS',
+    'CLUE_REQUIRED_HEADERS', 'CASE_REQUIRED_HEADERS', 'EXTRACTION_WINDOW_CHARS', 'COPY_OUTPUT_ENGINE'
+]
+
+# 参与代码指纹计算的目录和文件（相对于项目根目录）
+FINGERPRINT_SOURCE_PATHS = ['validation', 'file_upload', 'excel_formatter.py', 'excel_utils.py', 'xlsx_patcher.py', 'config.py']
+
+META_FILENAME = 'meta.json'
+
+_code_fingerprint = None
+
+def _project_root():
+    """
+    获取项目根目录，兼容 PyInstaller 打包环境。
+    """
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _compute_code_fingerprint():
+    """
+    计算校验与输出相关源码的摘要，进程内只计算一次。
+    打包环境中没有源码，改用可执行文件的路径、大小和修改时间。
+    """
+    global _code_fingerprint
+    if _code_fingerprint is not None:
+        return _code_fingerprint
+
+    sha256 = hashlib.sha256()
+    if getattr(sys, 'frozen', False):
+        stat = os.stat(sys.executable)
+        sha256.update(f"{sys.executable}|{stat.st_size}|{stat.st_mtime}".encode('utf-8'))
+    else:
+        root = _project_root()
+        source_files = []
+        for rel_path in FINGERPRINT_SOURCE_PATHS:
+            full_path = os.path.join(root, rel_path)
+            if os.path.isfile(full_path):
+                source_files.append(full_path)
+            for dirpath, _, filenames in os.walk(full_path):
+                source_files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith('.py'))
+        for path in sorted(source_files):
+            sha256.update(os.path.relpath(path, root).encode('utf-8'))
+            with open(path, 'rb') as f:
+                sha256.update(f.read())
+    _code_fingerprint = sha256.hexdigest()
+    return _code_fingerprint
+
+def compute_rules_fingerprint(app_config):
+    """
+    计算当前配置、规则代码和机关单位字典的联合指纹。
+    指纹与文件哈希一起组成缓存键，任何会影响校验结果的变化都会产生新的键。
+
+    参数:
+        app_config (dict): Flask 应用的配置字典。
+
+    返回:
+        str: 指纹的十六进制摘要（前 16 位）。
+    """
+    config_snapshot = {key: app_config.get(key) for key in FINGERPRINT_CONFIG_KEYS}
+    agency_snapshot = sorted((r['authority'], r['category'], r['agency']) for r in get_authority_agency_dict())
+    sha256 = hashlib.sha256()
+    sha256.update(_compute_code_fingerprint().encode('utf-8'))
+    sha256.update(json.dumps(config_snapshot, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'))
+    sha256.update(json.dumps(agency_snapshot, ensure_ascii=False).encode('utf-8'))
+    return sha256.hexdigest()[:16]
+
+def _cache_root(app_config):
+    """
+    获取结果缓存根目录，默认为 UPLOAD_FOLDER/result_cache。
+    """
+    return app_config.get('RESULT_CACHE_FOLDER') or os.path.join(app_config['UPLOAD_FOLDER'], 'result_cache')
+
+def _entry_dir(app_config, kind, file_hash):
+    """
+    获取某个缓存条目的目录: <缓存根目录>/<kind>/<文件哈希>_<规则指纹>。
+    """
+    return os.path.join(_cache_root(app_config), kind, f"{file_hash}_{compute_rules_fingerprint(app_config)}")
+
+def lookup_cached_result(app_config, kind, file_hash):
+    """
+    查找与上传文件内容和当前规则指纹都匹配的缓存结果。
+
+    参数:
+        app_config (dict): Flask 应用的配置字典。
+        kind (str): 结果类型，'case' 或 'clue'。
+        file_hash (str): 上传文件内容的 SHA-256 摘要。
+
+    返回:
+        dict: {角色: 缓存文件路径}，未命中或缓存损坏时返回 None。
+    """
+    if not app_config.get('RESULT_CACHE_ENABLED') or not file_hash:
+        return None
+    entry_dir = _entry_dir(app_config, kind, file_hash)
+    meta_path = os.path.join(entry_dir, META_FILENAME)
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        artifacts = {role: os.path.join(entry_dir, name) for role, name in meta['artifacts'].items()}
+        if not all(os.path.exists(path) for path in artifacts.values()):
+            logger.warning(f"结果缓存条目不完整，忽略: {entry_dir}")
+            return None
+        # 更新访问时间，用于 LRU 淘汰
+        os.utime(meta_path, None)
+        logger.info(f"命中结果缓存: {entry_dir}")
+        return artifacts
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"读取结果缓存失败，忽略: {entry_dir} - {e}")
+        return None
+
+def restore_cached_result(artifacts, output_folder, target_names=None):
+    """
+    将缓存结果复制到本次上传的输出目录。
+
+    参数:
+        artifacts (dict): lookup_cached_result 返回的 {角色: 缓存文件路径}。
+        output_folder (str): 输出目录，例如 CASE_FOLDER 或 CLUE_FOLDER。
+        target_names (dict): 可选，{角色: 目标文件名}，用于按本次上传的文件名命名副本。
+
+    返回:
+        dict: {角色: 复制后的文件路径}。
+    """
+    target_names = target_names or {}
+    os.makedirs(output_folder, exist_ok=True)
+    restored = {}
+    for role, cached_path in artifacts.items():
+        target_path = os.path.join(output_folder, target_names.get(role, os.path.basename(cached_path)))
+        shutil.copyfile(cached_path, target_path)
+        restored[role] = target_path
+    return restored
+
+def store_result(app_config, kind, file_hash, artifacts):
+    """
+    将本次生成的结果文件存入缓存，并按容量上限淘汰最久未使用的条目。
+    写入先在临时目录完成再整体改名，避免并发上传读到不完整的条目。
+
+    参数:
+        app_config (dict): Flask 应用的配置字典。
+        kind (str): 结果类型，'case' 或 'clue'。
+        file_hash (str): 上传文件内容的 SHA-256 摘要。
+        artifacts (dict): {角色: 生成的文件路径}，值为 None 的角色会被忽略。
+    """
+    if not app_config.get('RESULT_CACHE_ENABLED') or not file_hash:
+        return
+    artifacts = {role: path for role, path in artifacts.items() if path and os.path.exists(path)}
+    if not artifacts:
+        return
+    entry_dir = _entry_dir(app_config, kind, file_hash)
+    parent_dir = os.path.dirname(entry_dir)
+    try:
+        os.makedirs(parent_dir, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix='.staging_', dir=parent_dir)
+        names = {}
+        for role, path in artifacts.items():
+            name = os.path.basename(path)
+            shutil.copyfile(path, os.path.join(staging_dir, name))
+            names[role] = name
+        with open(os.path.join(staging_dir, META_FILENAME), 'w', encoding='utf-8') as f:
+            json.dump({'artifacts': names, 'created_at': time.time()}, f, ensure_ascii=False)
+        if os.path.exists(entry_dir):
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(staging_dir, entry_dir)
+        logger.info(f"结果已写入缓存: {entry_dir}")
+    except OSError as e:
+        logger.warning(f"写入结果缓存失败: {entry_dir} - {e}")
+        return
+    evict_cache(app_config)
+
+def _dir_size(path):
+    """
+    计算目录下所有文件的总字节数。
+    """
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+def evict_cache(app_config):
+    """
+    按最近访问时间淘汰缓存条目，直到条目数和总大小都不超过配置上限
+    (RESULT_CACHE_MAX_ENTRIES / RESULT_CACHE_MAX_BYTES)。
+    """
+    root = _cache_root(app_config)
+    if not os.path.isdir(root):
+        return
+    entries = []
+    for kind in os.listdir(root):
+        kind_dir = os.path.join(root, kind)
+        if not os.path.isdir(kind_dir):
+            continue
+        for name in os.listdir(kind_dir):
+            entry_dir = os.path.join(kind_dir, name)
+            meta_path = os.path.join(entry_dir, META_FILENAME)
+            if name.startswith('.staging_') or not os.path.exists(meta_path):
+                continue
+            entries.append((os.path.getmtime(meta_path), entry_dir, _dir_size(entry_dir)))
+
+    max_entries = app_config.get('RESULT_CACHE_MAX_ENTRIES', 200)
+    max_bytes = app_config.get('RESULT_CACHE_MAX_BYTES', 500 * 1024 * 1024)
+    total_bytes = sum(size for _, _, size in entries)
+    entries.sort()
+    while entries and (len(entries) > max_entries or total_bytes > max_bytes):
+        _, entry_dir, size = entries.pop(0)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total_bytes -= size
+        logger.info(f"淘汰结果缓存条目: {entry_dir}")
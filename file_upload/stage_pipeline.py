@@ -0,0 +1,189 @@
+# stage_pipeline.py
+"""
+流式分块处理的读取 / 校验 / 写出流水线。
+
+三个阶段各占一个线程，阶段之间用有界队列连接：第 N+1 块在读取的同时第 N 块在校验、第 N-1 块在写出。
+    背压      队列满时上游阶段阻塞等待，内存中最多同时存在 queue_size × 2 + 3 块；
+    错误传递  任一阶段抛出异常后其他阶段在下一次取放数据时停止，run() 等全部线程退出后重新抛出第一个异常；
+    耗时统计  每个阶段分别记录处理耗时、等待上游（输入为空）和等待下游（输出已满）的耗时，
+              处理耗时最长的阶段即瓶颈。
+openpyxl 解析、xlsxwriter 写出中的 zip 解压/压缩和文件读写会释放 GIL，阶段之间可以部分重叠。
+"""
+import time
+import queue
+import logging
+import threading
+import contextvars
+
+logger = logging.getLogger(__name__)
+
+# 队列结束标记
+_DONE = object()
+
+# 取放数据时检查其他阶段是否出错的间隔（秒）
+_POLL_INTERVAL = 0.1
+
+class PipelineAborted(Exception):
+    """
+    其他阶段出错，本阶段停止。
+    """
+
+class StageTiming:
+    """
+    一个阶段的耗时统计。
+    busy 为处理耗时，wait_input 为等待上游的耗时，wait_output 为等待下游（背压）的耗时，items 为处理的块数。
+    """
+    def __init__(self, name):
+        self.name = name
+        self.busy = 0.0
+        self.wait_input = 0.0
+        self.wait_output = 0.0
+        self.items = 0
+
+    def as_dict(self):
+        return {
+            'busy': round(self.busy, 3),
+            'wait_input': round(self.wait_input, 3),
+            'wait_output': round(self.wait_output, 3),
+            'items': self.items
+        }
+
+class StagePipeline:
+    """
+    三阶段流水线：source 迭代产生数据块，validate(chunk) 的返回值交给 write(payload)。
+    source 在读取线程中迭代，validate 在校验线程中执行，write 在调用 run() 的线程中执行。
+    各线程在调用方的 contextvars 上下文副本中运行，表头映射等上下文变量与调用方一致。
+    """
+    def __init__(self, source, validate, write, queue_size=2):
+        self.source = source
+        self.validate = validate
+        self.write = write
+        self.queue_size = max(1, int(queue_size))
+        self.timings = {name: StageTiming(name) for name in ('read', 'validate', 'write')}
+        self._stop = threading.Event()
+        self._errors = []
+        self._errors_lock = threading.Lock()
+
+    def _fail(self, error):
+        with self._errors_lock:
+            self._errors.append(error)
+        self._stop.set()
+
+    def _put(self, q, item, timing):
+        start = time.perf_counter()
+        try:
+            while True:
+                if self._stop.is_set():
+                    raise PipelineAborted()
+                try:
+                    q.put(item, timeout=_POLL_INTERVAL)
+                    return
+                except queue.Full:
+                    continue
+        finally:
+            timing.wait_output += time.perf_counter() - start
+
+    def _get(self, q, timing):
+        start = time.perf_counter()
+        try:
+            while True:
+                if self._stop.is_set():
+                    raise PipelineAborted()
+                try:
+                    return q.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+        finally:
+            timing.wait_input += time.perf_counter() - start
+
+    def _read_stage(self, out_q):
+        timing = self.timings['read']
+        try:
+            iterator = iter(self.source)
+            while True:
+                start = time.perf_counter()
+                chunk = next(iterator, _DONE)
+                if chunk is _DONE:
+                    break
+                timing.busy += time.perf_counter() - start
+                timing.items += 1
+                self._put(out_q, chunk, timing)
+            self._put(out_q, _DONE, timing)
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+    def _validate_stage(self, in_q, out_q):
+        timing = self.timings['validate']
+        try:
+            while True:
+                chunk = self._get(in_q, timing)
+                if chunk is _DONE:
+                    break
+                start = time.perf_counter()
+                payload = self.validate(chunk)
+                timing.busy += time.perf_counter() - start
+                timing.items += 1
+                self._put(out_q, payload, timing)
+            self._put(out_q, _DONE, timing)
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+    def _write_stage(self, in_q):
+        timing = self.timings['write']
+        try:
+            while True:
+                payload = self._get(in_q, timing)
+                if payload is _DONE:
+                    break
+                start = time.perf_counter()
+                self.write(payload)
+                timing.busy += time.perf_counter() - start
+                timing.items += 1
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+    def run(self):
+        """
+        运行流水线直到 source 耗尽。
+
+        返回:
+            dict: 各阶段的耗时统计（见 StageTiming.as_dict），另含 bottleneck（处理耗时最长的阶段）和 elapsed（总耗时）。
+
+        异常:
+            任一阶段抛出的第一个异常。
+        """
+        start = time.perf_counter()
+        read_q = queue.Queue(maxsize=self.queue_size)
+        write_q = queue.Queue(maxsize=self.queue_size)
+        threads = [
+            threading.Thread(target=contextvars.copy_context().run, args=(self._read_stage, read_q),
+                             name='pipeline-read', daemon=True),
+            threading.Thread(target=contextvars.copy_context().run, args=(self._validate_stage, read_q, write_q),
+                             name='pipeline-validate', daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            self._write_stage(write_q)
+        finally:
+            # 写出阶段异常退出时通知上游停止；正常结束时上游已经退出
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        if self._errors:
+            raise self._errors[0]
+
+        timings = {name: timing.as_dict() for name, timing in self.timings.items()}
+        timings['bottleneck'] = max(self.timings.values(), key=lambda timing: timing.busy).name
+        timings['elapsed'] = round(time.perf_counter() - start, 3)
+        logger.info("流水线各阶段耗时（秒）: " + "，".join(
+            f"{name} 处理 {t['busy']} / 等待上游 {t['wait_input']} / 等待下游 {t['wait_output']}"
+            for name, t in timings.items() if isinstance(t, dict)
+        ) + f"；瓶颈: {timings['bottleneck']}，总耗时 {timings['elapsed']}")
+        return timings
@@ -0,0 +1,414 @@
+# streaming_upload.py
+"""
+超大上传文件的流式分块处理（Config.STREAMING_UPLOAD_ENABLED）。
+
+整表模式同时在内存中保存整张 DataFrame、astype(str) 的副本、全部问题和 xlsxwriter 的单元格，
+内存占用随行数线性增长。流式模式下：
+    读取    openpyxl 只读模式逐行迭代，每 STREAMING_CHUNK_ROWS 行组成一块 DataFrame，
+            索引为整表行位置，问题中的行号（索引 + 2）与整表模式一致；
+    校验    每块调用与整表模式相同的逐行规则（validate_case_relationships、collect_investigatee_issues、
+            validate_clue_data），立案时间规则之外没有跨行规则，分块不影响结果；
+            各块的问题按行排列，依次写出后问题列表的顺序和序号与整表模式相同；
+    写出    副本和编号表使用 xlsxwriter 的 constant_memory 模式，每行写完即落盘；
+            线索编号文件中填报单位名称相关的问题须排在前面，两类问题先写入溢出到磁盘的临时文件，最后按序写出。
+三个阶段由 StagePipeline 以有界队列连接并行执行（读取第 N+1 块的同时校验第 N 块、写出第 N-1 块），
+内存中最多同时存在 STREAMING_PIPELINE_QUEUE_SIZE × 2 + 3 块数据，峰值内存与总行数无关；
+各阶段耗时记录在返回的 summary['stage_timings'] 中。
+该模式不使用行级增量校验，只支持 .xlsx 文件。
+"""
+import os
+import json
+import logging
+import tempfile
+
+import pandas as pd
+import xlsxwriter
+from openpyxl import load_workbook
+
+from config import Config
+from excel_utils import (
+    apply_case_table_formats, apply_clue_table_formats, copy_filename, display_text, CASE_ISSUE_COLUMNS, CLUE_ISSUE_COLUMNS
+)
+from validation.document_cache import intern_texts
+from validation.ingestion_schema import optimize_dtypes
+from validation.header_map import use_header_map
+from validation.case_validation.case_validators import validate_case_relationships
+from validation.case_validation.case_excel_generator import (
+    collect_investigatee_issues, load_authority_agency_lookup, investigatee_number_filename,
+    investigatee_issue_record, INVESTIGATEE_ISSUE_COLUMNS, NO_INVESTIGATEE_ISSUES_HINT
+)
+from validation.clue_validation.clue_validation import validate_clue_data
+from .upload_utils import unique_case_issues, split_clue_issues, clue_number_record
+from .stage_pipeline import StagePipeline
+
+logger = logging.getLogger(__name__)
+
+# 线索编号文件的问题在内存中缓冲的字节数，超过后溢出到磁盘
+ISSUE_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+CLUE_NUMBER_COLUMNS = ['序号', '受理线索编码', '受理人员编码', '行号', '比对字段', '被比对字段', '问题']
+
+# 与 pandas to_excel 写出的表头样式一致
+HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+def _unique_columns(header):
+    """
+    按 pd.read_excel 的规则生成列名：空表头为 'Unnamed: 列位置'，重复表头依次加 .1、.2 后缀。
+    """
+    columns = []
+    seen = {}
+    for position, name in enumerate(header):
+        name = f"Unnamed: {position}" if name is None else name
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+class ExcelChunkReader:
+    """
+    以只读模式逐块读取工作簿的第一个工作表。
+    columns 为表头（与 pd.read_excel 的列名一致），迭代得到的每块 DataFrame 已合并重复长文本并按 schema 调整存储类型。
+    与 pd.read_excel 一致，中间的空行保留，末尾的空行丢弃。
+    """
+    def __init__(self, file_path, chunk_rows, column_mappings=None, schema=None):
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.column_mappings = column_mappings
+        self.schema = schema
+        self.rows_read = 0
+        self._workbook = load_workbook(file_path, read_only=True, data_only=True)
+        self._rows = self._workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(self._rows, None) or ()
+        # 去掉表头末尾的空单元格
+        while header and header[-1] is None:
+            header = header[:-1]
+        self.columns = pd.Index(_unique_columns(header))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._workbook.close()
+
+    def _chunk(self, rows):
+        # 各块保持 openpyxl 读出的原值（dtype=object），不按块推断类型：
+        # 否则某块的年龄列恰好全为数字和空值时会变为 float，副本显示为 '49.0'
+        chunk = pd.DataFrame(rows, columns=self.columns, dtype=object,
+                             index=pd.RangeIndex(self.rows_read, self.rows_read + len(rows)))
+        self.rows_read += len(rows)
+        intern_texts(chunk)
+        if self.schema is not None:
+            optimize_dtypes(chunk, self.column_mappings, self.schema)
+        return chunk
+
+    def __iter__(self):
+        width = len(self.columns)
+        rows = []
+        blank_rows = 0
+        for values in self._rows:
+            values = tuple(values[:width]) + (None,) * (width - len(values))
+            if all(value is None for value in values):
+                blank_rows += 1
+                continue
+            # 空行后面还有数据时才保留
+            for _ in range(blank_rows):
+                rows.append((None,) * width)
+                if len(rows) >= self.chunk_rows:
+                    yield self._chunk(rows)
+                    rows = []
+            blank_rows = 0
+            rows.append(values)
+            if len(rows) >= self.chunk_rows:
+                yield self._chunk(rows)
+                rows = []
+        if rows:
+            yield self._chunk(rows)
+
+def _cell_value(value):
+    """
+    问题表单元格的取值，缺失值写为空单元格。
+    """
+    return None if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+class StreamingSheet:
+    """
+    常量内存工作簿中的一个工作表，按行顺序写出。表头在写第一行时写入，未写入任何行时不创建工作表。
+    """
+    def __init__(self, workbook, name, columns, header_format):
+        self.workbook = workbook
+        self.name = name
+        self.columns = list(columns)
+        self.header_format = header_format
+        self.worksheet = None
+        self.rows = 0
+
+    def open(self):
+        if self.worksheet is None:
+            self.worksheet = self.workbook.add_worksheet(self.name)
+            for col, name in enumerate(self.columns):
+                self.worksheet.write(0, col, name, self.header_format)
+        return self.worksheet
+
+    def write(self, values):
+        worksheet = self.open()
+        self.rows += 1
+        for col, value in enumerate(values):
+            worksheet.write(self.rows, col, _cell_value(value))
+
+class StreamingCopyWriter:
+    """
+    以常量内存模式逐块写出带高亮的副本：Sheet1 为原始数据（文本格式），问题列表为各块的问题。
+    问题列表与整表模式的 create_case_issues_sheet / create_clue_issues_sheet 列一致。
+    """
+    def __init__(self, output_path, columns, issue_columns):
+        self.output_path = output_path
+        self.columns = columns
+        self.workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'nan_inf_to_errors': True})
+        self.header_format = self.workbook.add_format(HEADER_FORMAT)
+        self.red_format = self.workbook.add_format({'bg_color': Config.FORMATS["red"]})
+        self.yellow_format = self.workbook.add_format({'bg_color': Config.FORMATS["yellow"]})
+        self.worksheet = self.workbook.add_worksheet('Sheet1')
+        text_format = self.workbook.add_format({'num_format': '@'})
+        for col, name in enumerate(columns):
+            self.worksheet.set_column(col, col, None, text_format)
+            self.worksheet.write(0, col, name, self.header_format)
+        # 问题列表中“问题描述”列显示为“问题”
+        headers = ['序号'] + ['问题' if name == '问题描述' else name for name in issue_columns]
+        self.issue_columns = issue_columns
+        self.issues = StreamingSheet(self.workbook, '问题列表', headers, self.header_format)
+
+    def write_row(self, idx, row_values):
+        for col, value in enumerate(row_values):
+            self.worksheet.write(idx + 1, col, display_text(value))
+
+    def write_issues(self, issues):
+        for issue in issues:
+            self.issues.write([self.issues.rows + 1] + [issue.get(name) for name in self.issue_columns])
+
+    def close(self, empty_hint=None):
+        """
+        关闭工作簿。没有任何问题且 empty_hint 不为空时，问题列表只写一行提示。
+        """
+        if self.issues.rows == 0 and empty_hint:
+            StreamingSheet(self.workbook, '问题列表', ['提示'], self.header_format).write([empty_hint])
+        self.workbook.close()
+
+    def abort(self):
+        """
+        处理失败时关闭工作簿并删除写了一半的文件。
+        """
+        _abort_workbook(self.workbook, self.output_path)
+
+def _abort_workbook(workbook, output_path):
+    try:
+        workbook.close()
+    finally:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
+def _write_chunk_rows(writer, chunk, highlight):
+    """
+    逐行写出一块数据。constant_memory 模式只保留当前行，高亮须在写下一行之前完成。
+    highlight(position, idx) 对需要高亮的行重写单元格，position 为块内位置，idx 为整表行位置。
+    """
+    values = chunk.to_numpy(dtype=object)
+    for position, idx in enumerate(chunk.index):
+        writer.write_row(idx, values[position])
+        highlight(position, idx)
+
+def stream_case_upload(reader, original_filename, upload_dir, app_config):
+    """
+    逐块校验立案登记表并写出副本和被调查人立案编号表。
+
+    参数:
+        reader (ExcelChunkReader): 已打开的分块读取器（表头已检查）。
+        original_filename (str): 原始上传的文件名。
+        upload_dir (str): 输出目录。
+        app_config (dict): Flask 应用的配置字典。
+
+    返回:
+        tuple: (copy_path, investigatee_num_path, summary)，summary 为行数、问题行数和各规则命中行数。
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    copy_path = os.path.join(upload_dir, copy_filename(original_filename))
+    case_num_path = os.path.join(upload_dir, investigatee_number_filename())
+
+    copy_writer = StreamingCopyWriter(copy_path, reader.columns, CASE_ISSUE_COLUMNS)
+    number_writer = _InvestigateeNumberWriter(case_num_path)
+    authority_agency_lookup = load_authority_agency_lookup()
+    hit_counts = {}
+    flagged_rows = 0
+
+    def validate(chunk):
+        results, issues_list = validate_case_relationships(chunk, app_config, [])
+        investigatee_issues = collect_investigatee_issues(chunk, app_config, authority_agency_lookup)
+        return chunk, results, unique_case_issues(issues_list), investigatee_issues
+
+    def write(payload):
+        nonlocal flagged_rows
+        chunk, results, issues_list, investigatee_issues = payload
+        for rule_id, count in results.counts().items():
+            hit_counts[rule_id] = hit_counts.get(rule_id, 0) + count
+        flagged = results.flagged()
+        flagged_rows += int(flagged.sum())
+
+        def highlight(position, idx):
+            if flagged[position]:
+                apply_case_table_formats(copy_writer.worksheet, chunk, chunk.iloc[position], idx, results,
+                                         issues_list, True, copy_writer.yellow_format, copy_writer.red_format,
+                                         position=position)
+
+        with use_header_map(chunk.columns, Config.COLUMN_MAPPINGS, 'case'):
+            _write_chunk_rows(copy_writer, chunk, highlight)
+        copy_writer.write_issues(issues_list)
+        number_writer.write(investigatee_issues)
+        logger.info(f"立案登记表流式处理: 已处理 {chunk.index[-1] + 1} 行")
+
+    try:
+        stage_timings = StagePipeline(reader, validate, write, app_config.get('STREAMING_PIPELINE_QUEUE_SIZE', 2)).run()
+    except Exception:
+        copy_writer.abort()
+        number_writer.abort()
+        raise
+    copy_writer.close(empty_hint='未发现任何问题。')
+    number_writer.close()
+
+    summary = {
+        'rows': reader.rows_read,
+        'flagged_rows': flagged_rows,
+        'hit_counts': {rule_id: count for rule_id, count in hit_counts.items() if count},
+        'stage_timings': stage_timings
+    }
+    logger.info(f"Case Excel file formatted and saved successfully: {copy_path}")
+    logger.info(f"成功生成被调查人立案编号表: {case_num_path}")
+    return copy_path, case_num_path, summary
+
+class _InvestigateeNumberWriter:
+    """
+    以常量内存模式逐块写出被调查人立案编号表，格式与 generate_investigatee_number_file 一致。
+    """
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+        header_format = self.workbook.add_format(HEADER_FORMAT)
+        self.sheet = StreamingSheet(self.workbook, '被调查人问题列表', INVESTIGATEE_ISSUE_COLUMNS, header_format)
+        self.sheet.open()
+        # 各列最长取值，用于最后设置列宽
+        self.widths = [len(name) for name in INVESTIGATEE_ISSUE_COLUMNS]
+
+    def _write_record(self, record):
+        values = [record[name] for name in INVESTIGATEE_ISSUE_COLUMNS]
+        for col, value in enumerate(values):
+            self.widths[col] = max(self.widths[col], len(str(value)))
+        self.sheet.write(values)
+
+    def write(self, issues_list):
+        for issue_item in issues_list:
+            self._write_record(investigatee_issue_record(self.sheet.rows + 1, issue_item))
+
+    def close(self):
+        if self.sheet.rows == 0:
+            self._write_record(investigatee_issue_record(1, {'问题描述': NO_INVESTIGATEE_ISSUES_HINT}))
+        for col, width in enumerate(self.widths):
+            self.sheet.worksheet.set_column(col, col, width + 2)
+        self.workbook.close()
+
+    def abort(self):
+        _abort_workbook(self.workbook, self.output_path)
+
+def stream_clue_upload(reader, original_filename, upload_dir, app_config, agency_mapping_db):
+    """
+    逐块校验线索登记表并写出副本和线索编号文件。
+
+    参数:
+        reader (ExcelChunkReader): 已打开的分块读取器（表头已检查）。
+        original_filename (str): 原始上传的文件名。
+        upload_dir (str): 输出目录。
+        app_config (dict): Flask 应用的配置字典。
+        agency_mapping_db (list): 机关单位对应表（NSL 类）。
+
+    返回:
+        tuple: (copy_path, issue_path, summary)。没有问题时 issue_path 为 None（与整表模式一致，不生成编号文件）；
+               summary 中 disposal_reports 为处置情况报告非空的行数，为 0 时调用方按整列为空处理。
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    copy_path = os.path.join(upload_dir, copy_filename(original_filename))
+
+    copy_writer = StreamingCopyWriter(copy_path, reader.columns, CLUE_ISSUE_COLUMNS)
+    agency_spool = tempfile.SpooledTemporaryFile(max_size=ISSUE_SPOOL_MAX_BYTES, mode='w+', encoding='utf-8')
+    other_spool = tempfile.SpooledTemporaryFile(max_size=ISSUE_SPOOL_MAX_BYTES, mode='w+', encoding='utf-8')
+    disposal_report_column = app_config['COLUMN_MAPPINGS'].get("disposal_report", "处置情况报告")
+    counts = {'disposal_reports': 0, 'issues': 0, 'errors': 0}
+
+    def validate(chunk):
+        issues_list, chunk_errors = validate_clue_data(chunk, app_config, agency_mapping_db)
+        return chunk, issues_list, chunk_errors
+
+    def write(payload):
+        chunk, issues_list, chunk_errors = payload
+        counts['disposal_reports'] += int(chunk[disposal_report_column].notna().sum())
+        counts['errors'] += chunk_errors
+        counts['issues'] += len(issues_list)
+
+        def highlight(position, idx):
+            apply_clue_table_formats(copy_writer.worksheet, chunk, chunk.iloc[position], idx, issues_list,
+                                     False, copy_writer.yellow_format, copy_writer.red_format)
+
+        with use_header_map(chunk.columns, Config.COLUMN_MAPPINGS, 'clue'):
+            _write_chunk_rows(copy_writer, chunk, highlight)
+        copy_writer.write_issues(issues_list)
+
+        # 问题中的行号不同块之间不会重复，按块去重即与整表去重一致
+        reporting_agency_issues, other_issues = split_clue_issues(issues_list)
+        seen_issues = set()
+        for spool, issues in ((agency_spool, reporting_agency_issues), (other_spool, other_issues)):
+            for issue_dict in issues:
+                issue_hashable = frozenset(issue_dict.items())
+                if issue_hashable not in seen_issues:
+                    seen_issues.add(issue_hashable)
+                    spool.write(json.dumps(clue_number_record(None, issue_dict), ensure_ascii=False, default=str) + '\n')
+        logger.info(f"线索登记表流式处理: 已处理 {chunk.index[-1] + 1} 行")
+
+    try:
+        stage_timings = StagePipeline(reader, validate, write, app_config.get('STREAMING_PIPELINE_QUEUE_SIZE', 2)).run()
+    except Exception:
+        copy_writer.abort()
+        agency_spool.close()
+        other_spool.close()
+        raise
+    copy_writer.close()
+
+    issue_path = None
+    try:
+        if counts['issues']:
+            issue_path = os.path.join(upload_dir, f"线索编号{app_config['TODAY_DATE']}.xlsx")
+            _write_clue_number_file(issue_path, (agency_spool, other_spool))
+            logger.info(f"生成线索编号文件: {issue_path}")
+    finally:
+        agency_spool.close()
+        other_spool.close()
+
+    summary = dict(counts, rows=reader.rows_read, stage_timings=stage_timings)
+    logger.info(f"Clue Excel file formatted and saved successfully: {copy_path}")
+    return copy_path, issue_path, summary
+
+def _write_clue_number_file(output_path, spools):
+    """
+    按顺序读出各临时文件中的问题，写出线索编号文件（列同整表模式的 to_excel 输出）。
+    """
+    workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    try:
+        sheet = StreamingSheet(workbook, 'Sheet1', CLUE_NUMBER_COLUMNS, workbook.add_format(HEADER_FORMAT))
+        for spool in spools:
+            spool.seek(0)
+            for line in spool:
+                record = json.loads(line)
+                record['序号'] = sheet.rows + 1
+                sheet.write([record[name] for name in CLUE_NUMBER_COLUMNS])
+    finally:
+        workbook.close()
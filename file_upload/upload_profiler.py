@@ -0,0 +1,130 @@
+# upload_profiler.py
+import os
+import cProfile
+import pstats
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 折叠栈输出时的最大调用深度，防止递归或稠密调用图导致路径爆炸
+MAX_STACK_DEPTH = 64
+# 低于该耗时（秒）的调用路径不再展开
+MIN_PATH_SECONDS = 1e-5
+
+def is_profiling_requested(request, app, username):
+    """
+    判断本次上传是否需要开启性能分析。
+    配置项 PROFILE_UPLOADS 为 True 时对所有上传开启；
+    否则仅当请求带有 ?profile=1 且当前用户在 PROFILE_ADMIN_USERS 中时开启。
+
+    参数:
+        request (flask.request): Flask 请求对象。
+        app (flask.Flask): Flask 应用实例，用于访问 app.config。
+        username (str): 当前登录用户名。
+
+    返回:
+        bool: 是否开启性能分析。
+    """
+    if app.config.get('PROFILE_UPLOADS'):
+        return True
+    flag = request.args.get('profile', '').strip().lower()
+    return flag in ('1', 'true', 'yes') and is_profile_admin(app, username)
+
+def is_profile_admin(app, username):
+    """
+    判断用户是否有权限开启性能分析和下载分析结果。
+    """
+    return bool(username) and username in app.config.get('PROFILE_ADMIN_USERS', [])
+
+def run_with_profiler(func, output_folder, label, *args, **kwargs):
+    """
+    在 cProfile 下执行 func，并将结果保存为 .prof 文件和火焰图可用的折叠栈文件。
+
+    参数:
+        func (callable): 需要分析的处理函数，例如 process_case_upload。
+        output_folder (str): 分析结果保存目录，通常为 CASE_FOLDER 或 CLUE_FOLDER。
+        label (str): 文件名前缀，例如 'case' 或 'clue'。
+        *args, **kwargs: 透传给 func 的参数。
+
+    返回:
+        tuple: (func 的返回值, prof 文件路径, 折叠栈文件路径)。
+               如果分析结果保存失败，两个路径为 None，但 func 的返回值不受影响。
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    prof_path = os.path.join(output_folder, f"profile_{label}_{timestamp}.prof")
+    collapsed_path = os.path.join(output_folder, f"profile_{label}_{timestamp}.collapsed.txt")
+    try:
+        os.makedirs(output_folder, exist_ok=True)
+        profiler.dump_stats(prof_path)
+        write_collapsed_stacks(pstats.Stats(profiler), collapsed_path)
+        logger.info(f"性能分析结果已保存: {prof_path}, {collapsed_path}")
+    except Exception as e:
+        logger.error(f"保存性能分析结果失败: {e}", exc_info=True)
+        return result, None, None
+    return result, prof_path, collapsed_path
+
+def _frame_label(func):
+    """
+    将 pstats 的函数键 (文件名, 行号, 函数名) 转换为折叠栈中的帧名称。
+    """
+    filename, lineno, name = func
+    if filename == '~':
+        return name
+    return f"{os.path.basename(filename)}:{name}:{lineno}"
+
+def write_collapsed_stacks(stats, output_path):
+    """
+    根据 cProfile 的调用关系图生成 Brendan Gregg 格式的折叠栈文件（每行 "a;b;c 微秒数"），
+    可直接用于 flamegraph.pl 或 speedscope。
+    cProfile 只记录调用边而非完整调用栈，因此每个函数的自身耗时按各调用方的调用次数比例分摊到调用路径上。
+
+    参数:
+        stats (pstats.Stats): 性能分析统计对象。
+        output_path (str): 折叠栈文件输出路径。
+    """
+    raw = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+    roots = [func for func, (_, _, _, _, callers) in raw.items() if not callers]
+
+    folded = {}
+
+    def _walk(func, path, fraction):
+        tottime = raw[func][2]
+        frames = path + [_frame_label(func)]
+        weight = tottime * fraction
+        if weight > 0:
+            key = ';'.join(frames)
+            folded[key] = folded.get(key, 0.0) + weight
+        if len(frames) >= MAX_STACK_DEPTH:
+            return
+        for callee in callees.get(func, []):
+            callee_label = _frame_label(callee)
+            if callee_label in frames:
+                continue
+            # 使用原始调用次数（不含递归调用），使递归函数的耗时按外部调用方分摊
+            callee_calls = raw[callee][0] or 1
+            edge_calls = raw[callee][4][func][0]
+            callee_fraction = fraction * edge_calls / callee_calls
+            if raw[callee][3] * callee_fraction < MIN_PATH_SECONDS:
+                continue
+            _walk(callee, frames, callee_fraction)
+
+    for root in roots:
+        _walk(root, [], 1.0)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for key, seconds in sorted(folded.items()):
+            microseconds = int(seconds * 1e6)
+            if microseconds > 0:
+                f.write(f"{key} {microseconds}\n")
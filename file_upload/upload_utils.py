@@ -1,12 +1,15 @@
 # upload_utils.py
 import os
-import pandas as pd
+import hashlib
 import logging
 from flask import flash, redirect, url_for
 from werkzeug.utils import secure_filename
 
 logger = logging.getLogger(__name__)
 
+# 保存上传文件时每次读取的字节数
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 def allowed_file(filename, allowed_extensions):
     """
     检查文件扩展名是否在允许的列表中。
@@ -24,9 +27,32 @@ def allowed_file(filename, allowed_extensions):
     file_extension = filename.rsplit('.', 1)[1].lower()
     return file_extension in allowed_extensions
 
-def handle_file_upload_and_initial_checks(request, app, file_key, folder_config_key, filename_pattern, file_type_chinese):
+def save_file_with_sha256(file_storage, file_path, chunk_size=UPLOAD_CHUNK_SIZE):
+    """
+    分块保存上传文件，并在写盘的同时计算 SHA-256，避免保存后再次完整读取文件。
+
+    参数:
+        file_storage (werkzeug.datastructures.FileStorage): 上传的文件对象。
+        file_path (str): 保存路径。
+        chunk_size (int): 每次读取的字节数。
+
+    返回:
+        str: 文件内容的 SHA-256 十六进制摘要。
+    """
+    sha256 = hashlib.sha256()
+    stream = file_storage.stream
+    with open(file_path, 'wb') as f:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            sha256.update(chunk)
+            f.write(chunk)
+    return sha256.hexdigest()
+
+def save_uploaded_file(request, app, file_key, folder_config_key, filename_pattern, file_type_chinese):
     """
-    处理文件上传、保存和初步检查（扩展名、文件名模式）。
+    处理文件上传、保存和初步检查（扩展名、文件名模式），保存时同步计算文件内容哈希。
 
     参数:
         request (flask.request): Flask 请求对象，包含上传的文件。
@@ -37,9 +63,9 @@ def handle_file_upload_and_initial_checks(request, app, file_key, folder_config_
         file_type_chinese (str): 文件类型的中文描述，用于错误消息，例如 '立案登记表' 或 '线索登记表'。
 
     返回:
-        tuple: (file_path, original_filename, df, error_response)
+        tuple: (file_path, original_filename, file_hash, error_response)
                其中 error_response 是一个 flask.redirect 对象，如果发生错误，则非 None。
-               成功时，df 是一个 pandas DataFrame。
+               成功时，file_hash 是上传文件内容的 SHA-256 摘要。
     """
     logger.info(f"开始处理 {file_type_chinese} 上传请求")
 
@@ -73,7 +99,7 @@ def handle_file_upload_and_initial_checks(request, app, file_key, folder_config_
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
     try:
-        file.save(file_path)
+        file_hash = save_file_with_sha256(file, file_path)
     except Exception as e:
         logger.error(f"文件保存失败: {file_path} - {e}", exc_info=True)
         flash(f'文件保存失败: {e}', 'error')
@@ -83,12 +109,97 @@ def handle_file_upload_and_initial_checks(request, app, file_key, folder_config_
         logger.error(f"{file_type_chinese} 文件保存失败: {file_path} 不存在")
         flash(f'文件保存失败: {file_path} 不存在', 'error')
         return None, None, None, redirect(request.url)
-    logger.info(f"{file_type_chinese} 文件保存成功: {file_path}")
+    logger.info(f"{file_type_chinese} 文件保存成功: {file_path} (sha256: {file_hash})")
+    return file_path, original_filename, file_hash, None
 
-    try:
-        df = pd.read_excel(file_path)
-        return file_path, original_filename, df, None
-    except Exception as e:
-        logger.error(f"读取 {file_type_chinese} 文件失败: {str(e)}", exc_info=True)
-        flash(f'读取文件内容失败，请确保它是有效的Excel文件: {str(e)}', 'error')
-        return None, None, None, redirect(request.url)
\ No newline at end of file
+def flash_errors(messages):
+    """
+    将校验接口返回的错误消息逐条闪现。
+    """
+    for message in messages:
+        flash(message, 'error')
+
+def unique_case_issues(issues_list):
+    """
+    将立案校验返回的问题统一为字典并去重，保持原有顺序。
+
+    参数:
+        issues_list (list): 校验返回的问题，元素为字典或 (行索引, 案件编码, 涉案人员编码, 问题描述, 风险等级) 元组。
+
+    返回:
+        list: 去重后的问题字典列表。
+    """
+    issues_list_unique = []
+    seen_issues = set()
+    for issue_dict_or_tuple in issues_list:
+        if isinstance(issue_dict_or_tuple, tuple):
+            # 假设元组格式为 (行号, 案件编码, 涉案人员编码, 问题描述, 风险等级)
+            issue_dict_converted = {
+                "行号": issue_dict_or_tuple[0] + 2, # 调整行号，因为Excel从1开始，且有表头
+                "案件编码": issue_dict_or_tuple[1],
+                "涉案人员编码": issue_dict_or_tuple[2],
+                "问题描述": issue_dict_or_tuple[3],
+                "风险等级": issue_dict_or_tuple[4] if len(issue_dict_or_tuple) > 4 else "中"
+            }
+            issue_hashable = frozenset(issue_dict_converted.items())
+            if issue_hashable not in seen_issues:
+                issues_list_unique.append(issue_dict_converted)
+                seen_issues.add(issue_hashable)
+        elif isinstance(issue_dict_or_tuple, dict):
+            issue_hashable = frozenset(issue_dict_or_tuple.items())
+            if issue_hashable not in seen_issues:
+                issues_list_unique.append(issue_dict_or_tuple)
+                seen_issues.add(issue_hashable)
+        else:
+            logger.warning(f"issues_list 中发现未知类型项: {type(issue_dict_or_tuple)}. 跳过去重。")
+    return issues_list_unique
+
+def split_clue_issues(issues_list):
+    """
+    将线索校验返回的问题统一为字典，并分为填报单位名称相关的问题和其他问题（编号文件中前者排在前面）。
+
+    参数:
+        issues_list (list): 校验返回的问题，元素为字典或 (行索引, 受理线索编码, 问题描述) 元组。
+
+    返回:
+        tuple: (reporting_agency_issues, other_issues)。
+    """
+    reporting_agency_issues = []
+    other_issues = []
+
+    for issue_item in issues_list:
+        # 确保 issue_item 是字典，并处理可能的元组格式
+        if isinstance(issue_item, tuple):
+            # 假设元组格式为 (行号, 受理线索编码, 问题描述)
+            issue_dict = {
+                "行号": issue_item[0] + 2, # 调整行号，因为Excel从1开始，且有表头
+                "受理线索编码": issue_item[1],
+                "问题描述": issue_item[2]
+            }
+        elif isinstance(issue_item, dict):
+            issue_dict = issue_item
+        else:
+            logger.warning(f"issues_list 中发现未知类型项: {type(issue_item)}. 跳过处理。")
+            continue
+
+        # 检查问题描述是否与填报单位名称相关
+        if "填报单位名称" in issue_dict.get('问题描述', '') or \
+           (issue_dict.get('比对字段', '') and "填报单位名称" in issue_dict.get('比对字段', '')):
+            reporting_agency_issues.append(issue_dict)
+        else:
+            other_issues.append(issue_dict)
+    return reporting_agency_issues, other_issues
+
+def clue_number_record(serial, issue_dict):
+    """
+    将一条线索问题转换为线索编号文件中的一行。
+    """
+    return {
+        '序号': serial,
+        '受理线索编码': issue_dict.get('受理线索编码', 'N/A'),
+        '受理人员编码': issue_dict.get('受理人员编码', ''),
+        '行号': issue_dict.get('行号', ''),
+        '比对字段': issue_dict.get('比对字段', ''),
+        '被比对字段': issue_dict.get('被比对字段', ''),
+        '问题': issue_dict.get('问题描述', '无描述')
+    }
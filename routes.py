@@ -1,11 +1,13 @@
 from functools import wraps
-from flask import render_template, request, redirect, url_for, flash, session, current_app
+import os
+from flask import render_template, request, redirect, url_for, flash, session, current_app, send_from_directory, abort
 from db_utils import get_user, create_user, get_authority_agency_dict, add_authority_agency, \
                      update_authority_agency, delete_authority_agency, get_db
 
 # 从新的文件中导入处理逻辑
 from file_upload.clue_upload import process_clue_upload
 from file_upload.case_upload import process_case_upload
+from file_upload.upload_profiler import is_profiling_requested, is_profile_admin, run_with_profiler
 
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -21,6 +23,33 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def _process_upload(process_func, folder_config_key, label):
+    """
+    执行上传处理函数；如果本次请求开启了性能分析，则在 cProfile 下执行，
+    并通过 flash 消息提供分析结果的下载链接（仅管理员可见）。
+
+    参数:
+        process_func (callable): process_case_upload 或 process_clue_upload。
+        folder_config_key (str): 分析结果保存目录在 app.config 中的键名。
+        label (str): 分析结果文件名前缀，同时作为下载路由中的目录标识。
+
+    返回:
+        flask.Response: 上传处理函数的返回值。
+    """
+    app = current_app._get_current_object()
+    username = session.get('username')
+    if not is_profiling_requested(request, app, username):
+        return process_func(request, app)
+
+    response, prof_path, collapsed_path = run_with_profiler(
+        process_func, app.config[folder_config_key], label, request, app
+    )
+    if prof_path and is_profile_admin(app, username):
+        links = [url_for('download_profile', label=label, filename=os.path.basename(path))
+                 for path in (prof_path, collapsed_path)]
+        flash('|'.join(links), 'profile')
+    return response
+
 def init_routes(app):
     """
     初始化 Flask 应用的所有路由。
@@ -100,7 +129,7 @@ def init_routes(app):
         """
         if request.method == 'POST':
             # 将 app 实例传递给 process_clue_upload，以便其可以访问 app.config
-            return process_clue_upload(request, current_app._get_current_object())
+            return _process_upload(process_clue_upload, 'CLUE_FOLDER', 'clue')
         return render_template('upload_clue.html', title='上传')
 
     @app.route('/authority_agency')
@@ -194,5 +223,20 @@ def init_routes(app):
         """
         if request.method == 'POST':
             # 将 app 实例传递给 process_case_upload，以便其可以访问 app.config
-            return process_case_upload(request, current_app._get_current_object())
-        return render_template('upload_case.html', title='上传立案登记表')
\ No newline at end of file
+            return _process_upload(process_case_upload, 'CASE_FOLDER', 'case')
+        return render_template('upload_case.html', title='上传立案登记表')
+
+    @app.route('/profile/<label>/<path:filename>')
+    @login_required
+    def download_profile(label, filename):
+        """
+        性能分析结果下载路由。
+        仅 PROFILE_ADMIN_USERS 中的用户可以下载，且只允许下载 profile_ 前缀的分析文件。
+        """
+        app_obj = current_app._get_current_object()
+        if not is_profile_admin(app_obj, session.get('username')):
+            abort(403)
+        folder_config_key = {'case': 'CASE_FOLDER', 'clue': 'CLUE_FOLDER'}.get(label)
+        if not folder_config_key or not os.path.basename(filename).startswith('profile_'):
+            abort(404)
+        return send_from_directory(app_obj.config[folder_config_key], os.path.basename(filename), as_attachment=True)
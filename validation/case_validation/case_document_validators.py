@@ -3,36 +3,13 @@ import pandas as pd
 from datetime import datetime
 import re
 # from config import Config  # 导入Config，因为某些验证规则需要用到其中的配置，但现在通过 app_config 传递
+# 日期解析统一由 date_normalization 提供，parse_chinese_date 保留在此处导出以兼容已有导入
+from validation.date_normalization import parse_chinese_date, parse_date_value
+from validation.document_sections import segment_document
 
 logger = logging.getLogger(__name__)
 
-def parse_chinese_date(date_str):
-    """
-    Parses a Chinese date string (e.g., '2025年3月20日') into a datetime.date object.
-
-    Args:
-        date_str (str): 中文日期字符串。
-
-    Returns:
-        datetime.date or None: 解析后的日期对象，如果无法解析则为None。
-    """
-    if not isinstance(date_str, str):
-        return None
-    
-    # Remove any extra characters after the date, like "，"
-    date_str = date_str.split('，')[0].strip()
-
-    # Regex to capture year, month, day
-    match = re.match(r'(\d{4})年(\d{1,2})月(\d{1,2})日', date_str)
-    if match:
-        try:
-            year, month, day = map(int, match.groups())
-            return datetime(year, month, day).date()
-        except ValueError:
-            return None
-    return None
-
-def validate_trial_acceptance_time_vs_report(row, index, excel_case_code, excel_person_code, issues_list, trial_acceptance_time_mismatch_indices, app_config):
+def validate_trial_acceptance_time_vs_report(row, index, excel_case_code, excel_person_code, issues_list, trial_acceptance_time_mismatch_indices, excel_trial_acceptance_time, trial_text_raw, app_config):
     """
     验证 '审理受理时间' 与 '审理报告' 开头时间内容的一致性。
 
@@ -43,19 +20,17 @@ def validate_trial_acceptance_time_vs_report(row, index, excel_case_code, excel_
         excel_person_code (str): Excel 中的涉案人员编码。
         issues_list (list): 用于收集所有发现问题的列表。
         trial_acceptance_time_mismatch_indices (set): 用于收集审理受理时间不匹配的行索引。
+        excel_trial_acceptance_time: 预先解析的审理受理时间单元格值。
+        trial_text_raw (str): 审理报告文本，空单元格为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
-    excel_trial_acceptance_time = row.get(app_config['COLUMN_MAPPINGS']['trial_acceptance_time'])
-    trial_text_raw = row.get(app_config['COLUMN_MAPPINGS']['trial_report'], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']['trial_report'])) else ''
-
-    if pd.notna(excel_trial_acceptance_time) and pd.notna(trial_text_raw):
+    if pd.notna(excel_trial_acceptance_time) and trial_text_raw != '':
         excel_date_obj = None
         if isinstance(excel_trial_acceptance_time, datetime):
             excel_date_obj = excel_trial_acceptance_time.date()
         elif isinstance(excel_trial_acceptance_time, str):
-            try:
-                excel_date_obj = pd.to_datetime(excel_trial_acceptance_time).date()
-            except ValueError:
+            excel_date_obj = parse_date_value(excel_trial_acceptance_time)
+            if excel_date_obj is None:
                 logger.warning(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}' 字段 '{excel_trial_acceptance_time}' 无法解析为日期。")
                 trial_acceptance_time_mismatch_indices.add(index)
                 issues_list.append((index, excel_case_code, excel_person_code, app_config['VALIDATION_RULES'].get("confirm_acceptance_time", "审理受理时间格式不正确"), "中")) # 增加风险等级
@@ -86,16 +61,16 @@ def validate_trial_acceptance_time_vs_report(row, index, excel_case_code, excel_
                 logger.info(f"行 {index + 1} - 审理报告中未找到匹配的日期字符串。")
                 trial_acceptance_time_mismatch_indices.add(index)
                 issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_report']}中未找到审理受理时间相关内容", "中")) # 增加风险等级
-    elif pd.notna(excel_trial_acceptance_time) and pd.isna(trial_text_raw):
+    elif pd.notna(excel_trial_acceptance_time) and trial_text_raw == '':
         logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}' 有值但 '{app_config['COLUMN_MAPPINGS']['trial_report']}' 为空，无法比对。")
         trial_acceptance_time_mismatch_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}有值但{app_config['COLUMN_MAPPINGS']['trial_report']}为空，无法比对", "中")) # 增加风险等级
-    elif pd.isna(excel_trial_acceptance_time) and pd.notna(trial_text_raw):
+    elif pd.isna(excel_trial_acceptance_time) and trial_text_raw != '':
         logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}' 为空但 '{app_config['COLUMN_MAPPINGS']['trial_report']}' 有值，无法比对。")
         trial_acceptance_time_mismatch_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}为空但{app_config['COLUMN_MAPPINGS']['trial_report']}有值，无法比对", "中")) # 增加风险等级
 
-def validate_trial_closing_time_vs_report(row, index, excel_case_code, excel_person_code, issues_list, trial_closing_time_mismatch_indices, app_config):
+def validate_trial_closing_time_vs_report(row, index, excel_case_code, excel_person_code, issues_list, trial_closing_time_mismatch_indices, excel_trial_closing_time, trial_text_raw, app_config):
     """
     验证 '审结时间' 与 '审理报告' 落款时间的一致性。
 
@@ -106,27 +81,25 @@ def validate_trial_closing_time_vs_report(row, index, excel_case_code, excel_per
         excel_person_code (str): Excel 中的涉案人员编码。
         issues_list (list): 用于收集所有发现问题的列表。
         trial_closing_time_mismatch_indices (set): 用于收集审结时间不匹配的行索引。
+        excel_trial_closing_time: 预先解析的审结时间单元格值。
+        trial_text_raw (str): 审理报告文本，空单元格为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
-    excel_trial_closing_time = row.get(app_config['COLUMN_MAPPINGS']['trial_closing_time'])
-    trial_text_raw = row.get(app_config['COLUMN_MAPPINGS']['trial_report'], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']['trial_report'])) else ''
-
-    if pd.notna(excel_trial_closing_time) and pd.notna(trial_text_raw):
+    if pd.notna(excel_trial_closing_time) and trial_text_raw != '':
         excel_closing_date_obj = None
         if isinstance(excel_trial_closing_time, datetime):
             excel_closing_date_obj = excel_trial_closing_time.date()
         elif isinstance(excel_trial_closing_time, str):
-            try:
-                excel_closing_date_obj = pd.to_datetime(excel_trial_closing_time).date()
-            except ValueError:
+            excel_closing_date_obj = parse_date_value(excel_trial_closing_time)
+            if excel_closing_date_obj is None:
                 logger.warning(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_closing_time']}' 字段 '{excel_trial_closing_time}' 无法解析为日期。")
                 trial_closing_time_mismatch_indices.add(index)
                 issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_closing_time']}格式不正确", "中")) # 增加风险等级
         
         if excel_closing_date_obj:
-            lines = trial_text_raw.strip().split('\n')
-            if lines:
-                last_line = lines[-1].strip()
+            # 落款时间取审理报告最后一行非空文本
+            last_line = segment_document(trial_text_raw).last_line()
+            if last_line is not None:
                 date_match = re.search(r'(\d{4}年\d{1,2}月\d{1,2}日)', last_line)
                 if date_match:
                     extracted_closing_date_str = date_match.group(1)
@@ -151,16 +124,16 @@ def validate_trial_closing_time_vs_report(row, index, excel_case_code, excel_per
                 logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_report']}' 为空，无法提取落款时间。")
                 trial_closing_time_mismatch_indices.add(index)
                 issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_report']}为空，无法比对审结时间", "中")) # 增加风险等级
-    elif pd.notna(excel_trial_closing_time) and pd.isna(trial_text_raw):
+    elif pd.notna(excel_trial_closing_time) and trial_text_raw == '':
         logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_closing_time']}' 有值但 '{app_config['COLUMN_MAPPINGS']['trial_report']}' 为空，无法比对。")
         trial_closing_time_mismatch_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_closing_time']}有值但{app_config['COLUMN_MAPPINGS']['trial_report']}为空，无法比对", "中")) # 增加风险等级
-    elif pd.isna(excel_trial_closing_time) and pd.notna(trial_text_raw):
+    elif pd.isna(excel_trial_closing_time) and trial_text_raw != '':
         logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['trial_closing_time']}' 为空但 '{app_config['COLUMN_MAPPINGS']['trial_report']}' 有值，无法比对。")
         trial_closing_time_mismatch_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_closing_time']}为空但{app_config['COLUMN_MAPPINGS']['trial_report']}有值，无法比对", "中")) # 增加风险等级
 
-def validate_trial_authority_vs_reporting_agency(row, index, excel_case_code, excel_person_code, issues_list, trial_authority_agency_mismatch_indices, sl_authority_agency_mappings, app_config):
+def validate_trial_authority_vs_reporting_agency(row, index, excel_case_code, excel_person_code, issues_list, trial_authority_agency_mismatch_indices, sl_authority_agency_mappings, excel_trial_authority, excel_reporting_agency, app_config):
     """
     验证 '审理机关' 与 '填报单位名称' 是否与 SL 类别的机关单位字典数据匹配。
 
@@ -172,10 +145,10 @@ def validate_trial_authority_vs_reporting_agency(row, index, excel_case_code, ex
         issues_list (list): 用于收集所有发现问题的列表。
         trial_authority_agency_mismatch_indices (set): 用于收集审理机关与填报单位名称不匹配的行索引。
         sl_authority_agency_mappings (list): 从数据库获取的 SL 类别的机关单位映射列表。
+        excel_trial_authority (str): 清洗后的审理机关，空单元格为 ''。
+        excel_reporting_agency (str): 清洗后的填报单位名称，空单元格为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
-    excel_trial_authority = str(row.get(app_config['COLUMN_MAPPINGS']['trial_authority'], "")).strip()
-    excel_reporting_agency = str(row.get(app_config['COLUMN_MAPPINGS']['reporting_agency'], "")).strip()
 
     if excel_trial_authority and excel_reporting_agency:
         found_match = False
@@ -200,7 +173,8 @@ def validate_trial_authority_vs_reporting_agency(row, index, excel_case_code, ex
         trial_authority_agency_mismatch_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, f"{app_config['COLUMN_MAPPINGS']['trial_authority']}或{app_config['COLUMN_MAPPINGS']['reporting_agency']}为空，无法比对", "中")) # 增加风险等级
 
-def validate_disposal_decision_keywords(row, index, excel_case_code, excel_person_code, issues_list, disposal_decision_keyword_mismatch_indices, app_config):
+def validate_disposal_decision_keywords(row, index, excel_case_code, excel_person_code, issues_list, disposal_decision_keyword_mismatch_indices,
+                                        decision_text_raw, app_config):
     """
     检查 '处分决定' 字段是否包含禁用关键词 (Config.DISPOSAL_DECISION_KEYWORDS)。
 
@@ -211,11 +185,10 @@ def validate_disposal_decision_keywords(row, index, excel_case_code, excel_perso
         excel_person_code (str): Excel 中的涉案人员编码。
         issues_list (list): 用于收集所有发现问题的列表。
         disposal_decision_keyword_mismatch_indices (set): 用于收集处分决定包含禁用关键词的行索引。
+        decision_text_raw (str): 处分决定的原始文本，空值为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
-    decision_text_raw = row.get(app_config['COLUMN_MAPPINGS']['disciplinary_decision'], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']['disciplinary_decision'])) else ''
-    
-    if app_config['COLUMN_MAPPINGS']['disciplinary_decision'] in row.index and pd.notna(decision_text_raw) and decision_text_raw.strip() != '':
+    if decision_text_raw.strip() != '':
         found_disposal_keyword = False
         for keyword in app_config['DISPOSAL_DECISION_KEYWORDS']: # 从 app_config 获取关键词
             if keyword in decision_text_raw:
@@ -230,7 +203,7 @@ def validate_disposal_decision_keywords(row, index, excel_case_code, excel_perso
 def validate_trial_report_keywords(row, index, excel_case_code, excel_person_code, issues_list, 
                                    trial_report_non_representative_mismatch_indices, 
                                    trial_report_detention_mismatch_indices, 
-                                   compensation_amount_highlight_indices, app_config):
+                                   compensation_amount_highlight_indices, trial_text_raw, app_config):
     """
     检查 '审理报告' 字段是否包含特定关键词（如非代表人等字样，和扣押字样），
     并检查是否包含“责令退赔”字样。
@@ -244,16 +217,16 @@ def validate_trial_report_keywords(row, index, excel_case_code, excel_person_cod
         trial_report_non_representative_mismatch_indices (set): 用于收集审理报告中包含非代表关键词的行索引。
         trial_report_detention_mismatch_indices (set): 用于收集审理报告中包含“扣押”关键词的行索引。
         compensation_amount_highlight_indices (set): 用于收集审理报告中包含“责令退赔”关键词的行索引。
+        trial_text_raw (str): 审理报告的原始文本，空值为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
-    trial_text_raw = row.get(app_config['COLUMN_MAPPINGS']['trial_report'], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']['trial_report'])) else ''
     
     # New keywords for "审理报告" - 从 app_config 获取
     trial_report_non_representative_keywords = app_config['DISPOSAL_DECISION_KEYWORDS'] # 这里的关键词与处分决定关键词相同
     trial_report_detention_keyword = "扣押"
     compensation_keyword = "责令退赔"
 
-    if app_config['COLUMN_MAPPINGS']['trial_report'] in row.index and pd.notna(trial_text_raw) and trial_text_raw.strip() != '':
+    if trial_text_raw.strip() != '':
         # Check for non-representative keywords
         for keyword in trial_report_non_representative_keywords:
             if keyword in trial_text_raw:
@@ -275,7 +248,7 @@ def validate_trial_report_keywords(row, index, excel_case_code, excel_person_cod
         else:
             logger.info(f"行 {index + 1} (案件编码: {excel_case_code}, 涉案人员编码: {excel_person_code})：审理报告中未出现“责令退赔”字样。")
 
-def highlight_recovery_amount(row, index, excel_case_code, excel_person_code, issues_list, recovery_amount_highlight_indices, app_config):
+def highlight_recovery_amount(row, index, excel_case_code, excel_person_code, issues_list, recovery_amount_highlight_indices, excel_recovery_amount, app_config):
     """
     标记 '追缴失职渎职滥用职权造成的损失金额' 字段有值的行。
 
@@ -286,10 +259,11 @@ def highlight_recovery_amount(row, index, excel_case_code, excel_person_code, is
         excel_person_code (str): Excel 中的涉案人员编码。
         issues_list (list): 用于收集所有发现问题的列表。
         recovery_amount_highlight_indices (set): 用于收集追缴金额有值的行索引。
+        excel_recovery_amount (str): 清洗后的追缴金额文本，空单元格为 ''。
         app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
     """
     recovery_amount_col = app_config['COLUMN_MAPPINGS']['recovery_amount']
-    if pd.notna(row.get(recovery_amount_col)) and str(row.get(recovery_amount_col, "")).strip() != '':
+    if excel_recovery_amount != '':
         recovery_amount_highlight_indices.add(index)
         issues_list.append((index, excel_case_code, excel_person_code, app_config['VALIDATION_RULES'].get("highlight_recovery_amount", "追缴失职渎职滥用职权造成的损失金额请再次确认"), "低")) # 增加风险等级
         logger.info(f"行 {index + 1} - '{recovery_amount_col}' 字段有值，已标记。")
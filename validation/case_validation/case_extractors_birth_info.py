@@ -2,10 +2,15 @@
 
 import re
 import logging
+from validation.document_sections import text_after_keyword
 from datetime import datetime # Required for current_year in original logic, though not directly used in extractors
+from validation.regex_guard import NAME_MAX_CHARS, watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_birth_year_from_case_report(report_text):
     """
     从立案报告中提取出生年份。
@@ -18,12 +23,9 @@ def extract_birth_year_from_case_report(report_text):
         print(msg)
         return None
 
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, report_text, re.DOTALL)
+    search_area = text_after_keyword(report_text, '一', '同志基本情况', 300)
 
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = report_text[start_pos : start_pos + 300]
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         
         if len(parts) > 3:
@@ -51,6 +53,8 @@ def extract_birth_year_from_case_report(report_text):
         print(msg)
         return None
 
+@memoize_document('decision')
+@watch_extraction
 def extract_birth_year_from_decision_report(decision_text):
     """
     从处分决定中提取出生年份。
@@ -64,7 +68,7 @@ def extract_birth_year_from_decision_report(decision_text):
         print(msg)
         return None
     
-    title_pattern = r"关于给予.+?同志党内警告处分的决定"
+    title_pattern = rf"关于给予.{{1,{NAME_MAX_CHARS}}}?同志党内警告处分的决定"
     title_match = re.search(title_pattern, decision_text, re.DOTALL)
 
     if title_match:
@@ -97,6 +101,8 @@ def extract_birth_year_from_decision_report(decision_text):
         print(msg)
         return None
 
+@memoize_document('investigation_report')
+@watch_extraction
 def extract_birth_year_from_investigation_report(investigation_text):
     """
     从审查调查报告中提取出生年份。
@@ -109,12 +115,9 @@ def extract_birth_year_from_investigation_report(investigation_text):
         print(msg)
         return None
 
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, investigation_text, re.DOTALL)
+    search_area = text_after_keyword(investigation_text, '一', '同志基本情况', 300)
 
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = investigation_text[start_pos : start_pos + 300]
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         
         if len(parts) > 3:
@@ -142,6 +145,8 @@ def extract_birth_year_from_investigation_report(investigation_text):
         print(msg)
         return None
 
+@memoize_document('trial_report')
+@watch_extraction
 def extract_birth_year_from_trial_report(trial_text):
     """
     从审理报告中提取出生年份。
@@ -187,6 +192,8 @@ def extract_birth_year_from_trial_report(trial_text):
         print(msg)
         return None
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_birth_date_from_case_report(report_text):
     """
     从立案报告中提取出生年月，并格式化为“YYYY/MM”。
@@ -199,12 +206,9 @@ def extract_birth_date_from_case_report(report_text):
         print(msg)
         return None
 
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, report_text, re.DOTALL)
+    search_area = text_after_keyword(report_text, '一', '同志基本情况', 300)
 
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = report_text[start_pos : start_pos + 300] 
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         
         if len(parts) > 3:
@@ -234,6 +238,8 @@ def extract_birth_date_from_case_report(report_text):
         print(msg)
         return None
 
+@memoize_document('decision')
+@watch_extraction
 def extract_birth_date_from_decision_report(decision_text):
     """
     从处分决定中提取出生年月，并格式化为“YYYY/MM”。
@@ -247,7 +253,7 @@ def extract_birth_date_from_decision_report(decision_text):
         print(msg)
         return None
 
-    title_pattern = r"关于给予.+?同志党内警告处分的决定"
+    title_pattern = rf"关于给予.{{1,{NAME_MAX_CHARS}}}?同志党内警告处分的决定"
     title_match = re.search(title_pattern, decision_text, re.DOTALL)
 
     if title_match:
@@ -282,6 +288,8 @@ def extract_birth_date_from_decision_report(decision_text):
         print(msg)
         return None
 
+@memoize_document('investigation_report')
+@watch_extraction
 def extract_birth_date_from_investigation_report(investigation_text):
     """
     从审查调查报告中提取出生年月，并格式化为“YYYY/MM”。
@@ -295,12 +303,9 @@ def extract_birth_date_from_investigation_report(investigation_text):
         print(msg)
         return None
 
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, investigation_text, re.DOTALL)
+    search_area = text_after_keyword(investigation_text, '一', '同志基本情况', 300)
 
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = investigation_text[start_pos : start_pos + 300]
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         
         if len(parts) > 3:
@@ -330,6 +335,8 @@ def extract_birth_date_from_investigation_report(investigation_text):
         print(msg)
         return None
 
+@memoize_document('trial_report')
+@watch_extraction
 def extract_birth_date_from_trial_report(trial_text):
     """
     从审理报告中提取出生年月，并格式化为“YYYY/MM”。
@@ -1,8 +1,13 @@
 import re
 import logging
+from validation.document_sections import segment_document, text_after_keyword
+from validation.regex_guard import NAME_MAX_CHARS, HEADING_MAX_CHARS, watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_education_from_case_report(report_text):
     """
     从立案报告中提取学历。
@@ -14,11 +19,9 @@ def extract_education_from_case_report(report_text):
         logger.info(msg)
         print(msg)
         return None
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, report_text, re.DOTALL)
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = report_text[start_pos : start_pos + 1000].lower()
+    search_area = text_after_keyword(report_text, '一', '同志基本情况', 1000)
+    if search_area is not None:
+        search_area = search_area.lower()
         education_mappings = {
             "大学本科": "大学本科", "本科": "本科", "研究生": "研究生",
             "硕士": "硕士", "博士": "博士", "大专": "大专",
@@ -40,6 +43,8 @@ def extract_education_from_case_report(report_text):
         logger.warning(msg)
         print(msg)
         return None
+@memoize_document('case_report')
+@watch_extraction
 def extract_ethnicity_from_case_report(report_text):
     """
     从立案报告中提取民族。
@@ -51,11 +56,8 @@ def extract_ethnicity_from_case_report(report_text):
         logger.info(msg)
         print(msg)
         return None
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, report_text, re.DOTALL)
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = report_text[start_pos : start_pos + 300]
+    search_area = text_after_keyword(report_text, '一', '同志基本情况', 300)
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         if len(parts) > 2:
             ethnicity = parts[2]
@@ -73,6 +75,8 @@ def extract_ethnicity_from_case_report(report_text):
         logger.warning(msg)
         print(msg)
         return None
+@memoize_document('decision')
+@watch_extraction
 def extract_ethnicity_from_decision_report(decision_text):
     """
     从处分决定中提取民族。
@@ -85,7 +89,7 @@ def extract_ethnicity_from_decision_report(decision_text):
         logger.info(msg)
         print(msg)
         return None
-    title_pattern = r"关于给予.+?同志党内警告处分的决定"
+    title_pattern = rf"关于给予.{{1,{NAME_MAX_CHARS}}}?同志党内警告处分的决定"
     title_match = re.search(title_pattern, decision_text, re.DOTALL)
     if title_match:
         start_pos = title_match.end()
@@ -107,6 +111,8 @@ def extract_ethnicity_from_decision_report(decision_text):
         logger.warning(msg)
         print(msg)
         return None
+@memoize_document('investigation_report')
+@watch_extraction
 def extract_ethnicity_from_investigation_report(investigation_text):
     """
     从审查调查报告中提取民族。
@@ -119,11 +125,8 @@ def extract_ethnicity_from_investigation_report(investigation_text):
         logger.info(msg)
         print(msg)
         return None
-    marker_pattern = r"一、.+?同志基本情况"
-    marker_match = re.search(marker_pattern, investigation_text, re.DOTALL)
-    if marker_match:
-        start_pos = marker_match.end()
-        search_area = investigation_text[start_pos : start_pos + 300]
+    search_area = text_after_keyword(investigation_text, '一', '同志基本情况', 300)
+    if search_area is not None:
         parts = [p.strip() for p in search_area.split('，')]
         if len(parts) > 2:
             ethnicity = parts[2]
@@ -141,6 +144,8 @@ def extract_ethnicity_from_investigation_report(investigation_text):
         logger.warning(msg)
         print(msg)
         return None
+@memoize_document('trial_report')
+@watch_extraction
 def extract_ethnicity_from_trial_report(trial_text):
     """
     从审理报告中提取民族。
@@ -176,6 +181,25 @@ def extract_ethnicity_from_trial_report(trial_text):
         print(msg)
         return None
 
+def _suspected_violation_section(report_text):
+    """
+    返回立案报告中“二、涉嫌违反…的问题”标题之后到“三、意见建议”之前的文本，找不到时返回 None。
+    """
+    document = segment_document(report_text)
+    violation = document.find('二', '涉嫌违反')
+    suggestion = document.find('三', '意见建议')
+    if violation is not None and suggestion is not None and suggestion.start > violation.start:
+        keyword_pos = report_text.find('涉嫌违反', violation.marker_end, suggestion.start)
+        title_end = report_text.find('的问题', keyword_pos + len('涉嫌违反') + 1, suggestion.start)
+        if title_end != -1:
+            return report_text[title_end + len('的问题'):suggestion.start]
+        return None
+    # 编号不在行首时按原有的正则语义查找
+    match = re.search(rf"二、涉嫌违反[\s\S]{{1,{HEADING_MAX_CHARS}}}?的问题([\s\S]*?)三、意见建议", report_text)
+    return match.group(1) if match else None
+
+@memoize_document('case_report')
+@watch_extraction
 def extract_suspected_violation_from_case_report(report_text):
     """
     从立案报告中提取“涉嫌违纪问题”段落。
@@ -187,13 +211,11 @@ def extract_suspected_violation_from_case_report(report_text):
         print(msg)
         return None
 
-    # 匹配开始和结束标记，使用 re.DOTALL 确保 . 匹配换行符
-    # 匹配 "二、涉嫌违反工作纪律的问题" 或类似开头，到 "三、意见建议" 之间的内容
-    pattern = r"二、涉嫌违反[\s\S]+?的问题([\s\S]*?)三、意见建议"
-    match = re.search(pattern, report_text, re.DOTALL)
+    # 取 "二、涉嫌违反工作纪律的问题" 或类似开头的段落，到 "三、意见建议" 之前的内容
+    extracted_text = _suspected_violation_section(report_text)
 
-    if match:
-        extracted_text = match.group(1).strip()
+    if extracted_text is not None:
+        extracted_text = extracted_text.strip()
         # 清理多余的空白符，包括换行符和制表符
         cleaned_text = re.sub(r'\s+', '', extracted_text)
         msg = f"提取涉嫌违纪问题 (立案报告): '{cleaned_text[:100]}...' from case report"
@@ -206,6 +228,8 @@ def extract_suspected_violation_from_case_report(report_text):
         print(msg)
         return None
 
+@memoize_document('decision')
+@watch_extraction
 def extract_suspected_violation_from_decision(decision_text, investigated_person_name_from_excel=None):
     """
     从处分决定中提取“涉嫌违纪问题”段落。
@@ -219,8 +243,8 @@ def extract_suspected_violation_from_decision(decision_text, investigated_person
         return None
 
     # 第一步：尝试从“经审查，XXX存在以下违纪问题。”中提取出实际使用的姓名
-    # 这里的 .+? 会匹配任何字符直到“存在以下违纪问题”
-    start_name_pattern = r"经审查，(.+?)存在以下违纪问题。"
+    # 姓名部分最多匹配 NAME_MAX_CHARS 个字符，直到“存在以下违纪问题”
+    start_name_pattern = rf"经审查，(.{{1,{NAME_MAX_CHARS}}}?)存在以下违纪问题。"
     start_name_match = re.search(start_name_pattern, decision_text)
 
     actual_violation_name = None
@@ -2,9 +2,14 @@
 
 import re
 import logging
+from validation.document_sections import text_after_keyword
+from validation.regex_guard import NAME_MAX_CHARS, watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_gender_from_case_report(report_text):
     """
     从立案报告中提取性别。
@@ -17,8 +22,8 @@ def extract_gender_from_case_report(report_text):
         print(msg)
         return None
     
-    pattern = r"一、.+?同志基本情况.*?，([^，]+)，"
-    match = re.search(pattern, report_text, re.DOTALL)
+    search_area = text_after_keyword(report_text, '一', '同志基本情况')
+    match = re.search(r"，([^，]+)，", search_area) if search_area is not None else None
     if match:
         gender = match.group(1).strip()
         msg = f"提取性别 (立案报告): {gender} from case report"
@@ -31,6 +36,8 @@ def extract_gender_from_case_report(report_text):
         print(msg)
         return None
 
+@memoize_document('decision')
+@watch_extraction
 def extract_gender_from_decision_report(decision_text):
     """
     从处分决定中提取性别。
@@ -43,12 +50,12 @@ def extract_gender_from_decision_report(decision_text):
         print(msg)
         return None
     
-    title_pattern = r"关于给予.+?同志党内警告处分的决定"
+    title_pattern = rf"关于给予.{{1,{NAME_MAX_CHARS}}}?同志党内警告处分的决定"
     title_match = re.search(title_pattern, decision_text, re.DOTALL)
 
     if title_match:
         start_pos = title_match.end()
-        gender_pattern = r".*?，([^，]+)，"
+        gender_pattern = r"，([^，]+)，"
         search_area = decision_text[start_pos : start_pos + 200] 
         gender_match = re.search(gender_pattern, search_area, re.DOTALL)
 
@@ -69,6 +76,8 @@ def extract_gender_from_decision_report(decision_text):
         print(msg)
         return None
 
+@memoize_document('investigation_report')
+@watch_extraction
 def extract_gender_from_investigation_report(investigation_text):
     """
     从审查调查报告中提取性别。
@@ -81,8 +90,8 @@ def extract_gender_from_investigation_report(investigation_text):
         print(msg)
         return None
     
-    pattern = r"一、.+?同志基本情况.*?，([^，]+)，"
-    match = re.search(pattern, investigation_text, re.DOTALL)
+    search_area = text_after_keyword(investigation_text, '一', '同志基本情况')
+    match = re.search(r"，([^，]+)，", search_area) if search_area is not None else None
     if match:
         gender = match.group(1).strip()
         msg = f"提取性别 (审查调查报告): {gender} from investigation report"
@@ -95,6 +104,8 @@ def extract_gender_from_investigation_report(investigation_text):
         print(msg)
         return None
 
+@memoize_document('trial_report')
+@watch_extraction
 def extract_gender_from_trial_report(trial_text):
     """
     从审理报告中提取性别。
@@ -112,7 +123,7 @@ def extract_gender_from_trial_report(trial_text):
 
     if marker_pos != -1:
         start_pos = marker_pos + len(title_marker)
-        gender_pattern = r".*?，([^，]+)，"
+        gender_pattern = r"，([^，]+)，"
         search_area = trial_text[start_pos : start_pos + 200]
         gender_match = re.search(gender_pattern, search_area, re.DOTALL)
 
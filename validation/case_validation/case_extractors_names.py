@@ -2,11 +2,16 @@
 
 import re
 import logging
+from validation.document_sections import heading_before_keyword
+from validation.regex_guard import NAME_MAX_CHARS, watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
 # This placeholder should eventually be replaced by actual implementation in case_name_extraction.py
 # based on your project structure.
+@memoize_document('case_report')
+@watch_extraction
 def extract_name_from_case_report(report_text):
     """
     这是一个占位函数，您需要根据实际情况实现它。
@@ -15,11 +20,13 @@ def extract_name_from_case_report(report_text):
     if not report_text or not isinstance(report_text, str):
         return None
     # Example: Assume the name is in "一、XXX同志基本情况"
-    match = re.search(r"一、(.+?)同志基本情况", report_text)
-    if match:
-        return match.group(1).strip()
+    name = heading_before_keyword(report_text, '一', '同志基本情况')
+    if name is not None:
+        return name.strip()
     return None
 
+@memoize_document('decision')
+@watch_extraction
 def extract_name_from_decision(decision_text):
     """从处分决定中提取姓名，基于'关于给予...同志党内警告处分的决定'标记。"""
     if not decision_text or not isinstance(decision_text, str):
@@ -28,7 +35,7 @@ def extract_name_from_decision(decision_text):
         print(msg)
         return None
     
-    pattern = r"关于给予(.+?)同志党内警告处分的决定"
+    pattern = rf"关于给予(.{{1,{NAME_MAX_CHARS}}}?)同志党内警告处分的决定"
     match = re.search(pattern, decision_text)
     if match:
         name = match.group(1).strip()
@@ -42,6 +49,8 @@ def extract_name_from_decision(decision_text):
         print(msg)
         return None
 
+@memoize_document('trial_report')
+@watch_extraction
 def extract_name_from_trial_report(trial_text):
     """从审理报告中提取姓名，基于'关于...同志违纪案的审理报告'标记。"""
     if not trial_text or not isinstance(trial_text, str):
@@ -50,7 +59,7 @@ def extract_name_from_trial_report(trial_text):
         print(msg)
         return None
     
-    pattern = r"关于(.+?)同志违纪案的审理报告"
+    pattern = rf"关于(.{{1,{NAME_MAX_CHARS}}}?)同志违纪案的审理报告"
     match = re.search(pattern, trial_text)
     if match:
         name = match.group(1).strip()
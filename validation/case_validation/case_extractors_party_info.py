@@ -2,9 +2,13 @@
 
 import re
 import logging
+from validation.regex_guard import watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_party_member_from_case_report(report_text):
     """
     从立案报告中提取是否为中共党员。
@@ -27,6 +31,8 @@ def extract_party_member_from_case_report(report_text):
         print(msg)
         return "否"
 
+@memoize_document('decision')
+@watch_extraction
 def extract_party_member_from_decision_report(decision_text):
     """
     从处分决定中提取是否为中共党员。
@@ -54,6 +60,8 @@ def extract_party_member_from_decision_report(decision_text):
         print(msg)
         return None
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_party_joining_date_from_case_report(report_text):
     """
     从立案报告中提取入党时间，并格式化为“YYYY/MM”。
@@ -1,9 +1,13 @@
 import re
 import logging
 import re
+from validation.regex_guard import watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 
+@memoize_document('filing_decision')
+@watch_extraction
 def extract_timestamp_from_filing_decision(decision_text):
     """
     从立案决定书内容中提取落款时间，并标准化为“YYYY-MM-DD”格式。
@@ -40,6 +44,8 @@ def extract_timestamp_from_filing_decision(decision_text):
         print(msg) # Added print statement
         return None, None # 返回两个None
 
+@memoize_document('filing_decision')
+@watch_extraction
 def extract_filing_decision_signature_time(decision_text):
     """
     从立案决定书内容中提取落款时间，返回标准化的日期格式用于与Excel中的立案时间比对。
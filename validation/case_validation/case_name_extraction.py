@@ -1,9 +1,13 @@
 import logging
-import re
+from validation.document_sections import heading_before_keyword
+from validation.regex_guard import watch_extraction
+from validation.document_cache import memoize_document
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+@memoize_document('case_report')
+@watch_extraction
 def extract_name_from_case_report(report_text):
     """Extract name from case report based on '一、王xx同志基本情况' marker."""
     if not report_text or not isinstance(report_text, str):
@@ -12,10 +16,9 @@ def extract_name_from_case_report(report_text):
         return None
     
     # 定义姓名的正则表达式，匹配“一、王xx同志基本情况”后的姓名
-    pattern = r"一、(.+?)同志基本情况"
-    match = re.search(pattern, report_text)
-    if match:
-        name = match.group(1).strip()
+    name = heading_before_keyword(report_text, '一', '同志基本情况')
+    if name is not None:
+        name = name.strip()
         msg = f"提取姓名: {name} from report: {report_text}"
         logger.info(msg)
         return name
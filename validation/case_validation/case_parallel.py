@@ -0,0 +1,123 @@
+# case_parallel.py
+"""
+立案登记表逐行规则的多进程执行（Config.VALIDATION_WORKER_PROCESSES）。
+
+按行位置把 DataFrame 切成连续的分区，每个分区在进程池中执行与 run_case_rule_plan 相同的逐行规则：
+    文书列    计划需要的文书（立案报告、处分决定等）由 pack_text_columns 一次性放入共享内存，
+              子进程零拷贝连接，只解码本分区的行；
+    其他列    体积很小，随任务一起 pickle；
+    一次传递  执行计划（规则名称 + 文书字段 + 日期列）、整次上传共用的数据（机关单位字典等）、
+              配置和共享内存描述在进程池初始化时传给每个子进程一次，任务本身只有分区范围和小列。
+子进程中的规则函数从本进程的 CASE_RULES 按名称取得，规则本身不需要 pickle。
+各分区返回的问题和结果索引集合按分区顺序合并，顺序与单进程执行一致：
+类型转换问题排在最前，按字段（schema 顺序）、再按行排列；其后是逐行规则的问题，按行排列。
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from validation.header_map import use_header_map
+from validation.regex_guard import use_extraction_guard
+from validation.shared_text import packable_text_columns, pack_text_columns, attach_text_columns
+from validation.ingestion_schema import CASE_SCHEMA
+from .case_rule_registry import CASE_RULES, run_case_rule_plan
+
+logger = logging.getLogger(__name__)
+
+# 每个子进程分到的分区数，分区多一些可以平衡各行文书长度不同造成的耗时差异
+PARTITIONS_PER_WORKER = 4
+
+# 子进程状态，由 _init_worker 在进程池初始化时设置
+_worker = {}
+
+def plan_snapshot(plan):
+    """
+    将执行计划转换为可 pickle 的形式：规则以名称表示。
+    """
+    return dict(plan, rules=[rule['name'] for rule in plan['rules']])
+
+def restore_plan(snapshot):
+    """
+    按名称从 CASE_RULES 还原 plan_snapshot 生成的执行计划。
+    """
+    rules_by_name = {rule['name']: rule for rule in CASE_RULES}
+    return dict(snapshot, rules=[rules_by_name[name] for name in snapshot['rules']])
+
+def _init_worker(app_config, snapshot, shared, columns, text_descriptor):
+    _worker['app_config'] = app_config
+    _worker['plan'] = restore_plan(snapshot)
+    _worker['shared'] = shared
+    _worker['columns'] = columns
+    _worker['texts'] = attach_text_columns(text_descriptor)
+
+def _validate_partition(start, stop, small_df):
+    """
+    在子进程中校验 [start, stop) 行。small_df 为该分区除共享内存文本列以外的列（索引为原 DataFrame 的索引）。
+
+    返回:
+        tuple: (issues_list, 各类型转换问题所属的字段, result_sets)，类型转换问题位于 issues_list 最前面。
+    """
+    texts = _worker['texts']
+    app_config = _worker['app_config']
+    data = {column: texts.column(column, start, stop, small_df.index) if column in texts.dtypes else small_df[column]
+            for column in _worker['columns']}
+    df = pd.DataFrame(data, index=small_df.index, columns=_worker['columns'])
+
+    issues_list = []
+    result_sets = {}
+    coercion_fields = []
+    with use_header_map(df.columns, app_config['COLUMN_MAPPINGS'], 'case'), use_extraction_guard(app_config, 'case'):
+        run_case_rule_plan(df, _worker['plan'], app_config, issues_list, result_sets, _worker['shared'],
+                           coercion_fields)
+    return issues_list, coercion_fields, result_sets
+
+def run_case_rule_plan_parallel(df, plan, app_config, issues_list, result_sets, shared):
+    """
+    在进程池中执行计划内的全部逐行规则，参数和结果与 run_case_rule_plan 相同。
+
+    参数:
+        df (pd.DataFrame): 立案登记表数据（列名须唯一）。
+        plan (dict): build_case_rule_plan 的返回值。
+        app_config (dict): Flask 应用的配置字典，包含 VALIDATION_WORKER_PROCESSES。
+        issues_list (list): 用于收集所有发现问题的列表。
+        result_sets (dict): {结果名称: 行索引集合}。
+        shared (dict): default_shared_data 的返回值。
+
+    返回:
+        int: 类型转换问题的数量（位于本次追加的问题最前面）。
+    """
+    workers = app_config['VALIDATION_WORKER_PROCESSES']
+    mappings = app_config['COLUMN_MAPPINGS']
+    columns = list(df.columns)
+    text_columns = packable_text_columns(df, [mappings[key] for key in plan['documents']])
+    small_df = df.drop(columns=text_columns)
+
+    partitions = min(len(df), workers * PARTITIONS_PER_WORKER)
+    bounds = [len(df) * part // partitions for part in range(partitions + 1)]
+    ranges = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+    logger.info(f"<立案 - 规则计划> - {workers} 个进程并行校验 {len(df)} 行（{len(ranges)} 个分区），"
+                f"共享内存传输 {len(text_columns)} 列文书")
+
+    with pack_text_columns(df, text_columns) as shared_texts:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(dict(app_config), plan_snapshot(plan), shared, columns,
+                                           shared_texts.descriptor)) as executor:
+            futures = [executor.submit(_validate_partition, start, stop, small_df.iloc[start:stop])
+                       for start, stop in ranges]
+            partition_results = [future.result() for future in futures]
+
+    # 与单进程执行的顺序一致：先是全部类型转换问题（按字段、再按行），再是逐行规则的问题。
+    # 各分区内的类型转换问题已按字段、行排列，分区又按行排列，按字段顺序稳定排序即可
+    field_rank = {field: rank for rank, field in enumerate(CASE_SCHEMA)}
+    coercion_issues = []
+    for partition_issues, coercion_fields, _ in partition_results:
+        coercion_issues.extend(zip(coercion_fields, partition_issues))
+    coercion_issues.sort(key=lambda item: field_rank[item[0]])
+    issues_list.extend(issue for _, issue in coercion_issues)
+    for partition_issues, coercion_fields, _ in partition_results:
+        issues_list.extend(partition_issues[len(coercion_fields):])
+    for _, _, partition_sets in partition_results:
+        for name, indices in partition_sets.items():
+            result_sets.setdefault(name, set()).update(indices)
+    return len(coercion_issues)
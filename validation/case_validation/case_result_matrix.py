@@ -0,0 +1,133 @@
+# case_result_matrix.py
+"""
+立案校验结果的 行 × 规则 布尔矩阵。
+逐行规则仍把命中的行索引写入各自的集合，整次校验结束后一次性打包为 CaseResultMatrix：
+每个结果（规则 ID）占一列，合并所有规则、统计各规则命中数、找出有问题的行都是矩阵上的整列运算，
+校验、增量复用、副本生成和高亮之间只传递这一个对象，不再按位置传递三十多个集合。
+
+新增一类高亮结果时只需在 CASE_RESULT_RULES 中登记规则 ID、颜色和高亮列。
+"""
+import numpy as np
+
+def _result(color, columns=()):
+    """
+    声明一个结果列。
+
+    参数:
+        color (str): 高亮颜色，Config.FORMATS 中的键（'red' 或 'yellow'）。
+        columns (tuple): 命中时高亮的列（COLUMN_MAPPINGS 的键），多列时须全部存在才高亮。
+    """
+    return {'color': color, 'columns': tuple(columns)}
+
+# 规则 ID → 高亮方式，顺序即矩阵的列顺序和副本中的高亮顺序。
+# mismatch_indices（姓名不一致）不单独高亮：任一规则命中的行都会标红被调查人，见 apply_case_table_formats。
+CASE_RESULT_RULES = {
+    'mismatch_indices': _result('red'),
+    'gender_mismatch_indices': _result('red', ('gender',)),
+    'age_mismatch_indices': _result('red', ('age',)),
+    'brief_case_details_mismatch_indices': _result('red', ('brief_case_details',)),
+    'birth_date_mismatch_indices': _result('red', ('birth_date',)),
+    'education_mismatch_indices': _result('red', ('education',)),
+    'ethnicity_mismatch_indices': _result('red', ('ethnicity',)),
+    'party_member_mismatch_indices': _result('red', ('party_member',)),
+    'party_joining_date_mismatch_indices': _result('red', ('party_joining_date',)),
+    'filing_time_mismatch_indices': _result('red', ('filing_time',)),
+    'disciplinary_committee_filing_time_mismatch_indices': _result('red', ('disciplinary_committee_filing_time',)),
+    'disciplinary_committee_filing_authority_mismatch_indices': _result('red', ('disciplinary_committee_filing_authority',)),
+    'supervisory_committee_filing_time_mismatch_indices': _result('red', ('supervisory_committee_filing_time',)),
+    'supervisory_committee_filing_authority_mismatch_indices': _result('red', ('supervisory_committee_filing_authority',)),
+    'case_report_keyword_mismatch_indices': _result('red', ('case_report',)),
+    'disposal_spirit_mismatch_indices': _result('red', ('central_eight_provisions',)),
+    'voluntary_confession_highlight_indices': _result('yellow', ('voluntary_confession',)),
+    'closing_time_mismatch_indices': _result('red', ('closing_time',)),
+    'no_party_position_warning_mismatch_indices': _result('red', ('no_party_position_warning',)),
+    'recovery_amount_highlight_indices': _result('yellow', ('recovery_amount',)),
+    'trial_acceptance_time_mismatch_indices': _result('red', ('trial_acceptance_time',)),
+    'trial_closing_time_mismatch_indices': _result('red', ('trial_closing_time',)),
+    'trial_authority_agency_mismatch_indices': _result('red', ('trial_authority', 'reporting_agency')),
+    'disposal_decision_keyword_mismatch_indices': _result('red', ('disciplinary_decision',)),
+    'trial_report_non_representative_mismatch_indices': _result('red', ('trial_report',)),
+    'trial_report_detention_mismatch_indices': _result('red', ('trial_report',)),
+    'confiscation_amount_indices': _result('yellow', ('confiscation_amount',)),
+    'confiscation_of_property_amount_indices': _result('yellow', ('confiscation_of_property_amount',)),
+    'compensation_amount_highlight_indices': _result('yellow', ('compensation_amount',)),
+    'registered_handover_amount_indices': _result('yellow', ('registered_handover_amount',)),
+    'disciplinary_sanction_mismatch_indices': _result('red', ('disciplinary_sanction',)),
+    'administrative_sanction_mismatch_indices': _result('red', ('administrative_sanction',))
+}
+
+CASE_RULE_IDS = tuple(CASE_RESULT_RULES)
+
+class CaseResultMatrix:
+    """
+    行 × 规则 的布尔矩阵。行按 DataFrame 的行顺序排列（labels 为对应的行索引），列按 rule_ids 排列。
+    """
+    __slots__ = ('labels', 'rule_ids', 'bits', '_positions', '_columns')
+
+    def __init__(self, labels, rule_ids=CASE_RULE_IDS):
+        self.labels = list(labels)
+        self.rule_ids = tuple(rule_ids)
+        self.bits = np.zeros((len(self.labels), len(self.rule_ids)), dtype=bool)
+        self._positions = {label: position for position, label in enumerate(self.labels)}
+        self._columns = {rule_id: column for column, rule_id in enumerate(self.rule_ids)}
+
+    @classmethod
+    def from_sets(cls, labels, result_sets):
+        """
+        由规则写入的 {规则 ID: 行索引集合} 生成矩阵，未登记的规则 ID 和不在 labels 中的行索引被忽略。
+        """
+        matrix = cls(labels)
+        for rule_id in matrix.rule_ids:
+            matrix.mark(rule_id, result_sets.get(rule_id, ()))
+        return matrix
+
+    def mark(self, rule_id, labels):
+        """
+        将 labels 中的行标记为命中 rule_id。
+        """
+        positions = [self._positions[label] for label in labels if label in self._positions]
+        if positions:
+            self.bits[positions, self._columns[rule_id]] = True
+
+    def mark_row(self, label, rule_ids):
+        """
+        将一行标记为命中 rule_ids 中的各规则（增量校验复用存储结果时使用），未登记的规则 ID 被忽略。
+        """
+        position = self._positions.get(label)
+        if position is None:
+            return
+        columns = [self._columns[rule_id] for rule_id in rule_ids if rule_id in self._columns]
+        self.bits[position, columns] = True
+
+    def rows(self, rule_id):
+        """
+        命中 rule_id 的行索引集合。
+        """
+        return {self.labels[position] for position in np.flatnonzero(self.bits[:, self._columns[rule_id]])}
+
+    def rules_at(self, position):
+        """
+        第 position 行命中的规则 ID 列表（按 rule_ids 的顺序）。
+        """
+        return [self.rule_ids[column] for column in np.flatnonzero(self.bits[position])]
+
+    def flagged(self):
+        """
+        每行是否命中任一规则的布尔数组。
+        """
+        return self.bits.any(axis=1)
+
+    def flagged_rows(self):
+        """
+        命中任一规则的行索引列表。
+        """
+        return [self.labels[position] for position in np.flatnonzero(self.flagged())]
+
+    def counts(self):
+        """
+        各规则命中的行数 {规则 ID: 行数}。
+        """
+        return dict(zip(self.rule_ids, self.bits.sum(axis=0).tolist()))
+
+    def __len__(self):
+        return len(self.labels)
@@ -0,0 +1,397 @@
+# case_rule_registry.py
+"""
+立案登记表校验规则注册表与执行计划。
+
+每条规则声明：需要的 Excel 列、需要的文书字段（立案报告、处分决定等）、需要预先解析的日期列、
+覆盖的检查项（checks）以及结果写入的索引集合。build_case_rule_plan 根据上传表的表头生成执行计划：
+- 缺少所需列的规则直接跳过；
+- 检查项已被前面的规则覆盖的规则视为重复，不再执行（例如结案时间与处分决定的比对）；
+- 汇总计划需要的文书字段和日期列，文书文本每行只读取一次，日期列每次上传只解析一次。
+run_case_rule_plan 在一次遍历中对每行依次执行计划内的全部规则；被调查人为空的行只执行标记为 all_rows 的规则。
+"""
+import logging
+from datetime import datetime
+
+import pandas as pd
+
+from validation.date_normalization import coerce_date_columns
+from validation.header_map import case_col
+from validation.ingestion_schema import CASE_SCHEMA, build_typed_table, failure_description
+from validation.regex_guard import set_current_row
+from validation.row_view import iter_rows
+from .case_validation_additional import (
+    validate_education_rules,
+    validate_ethnicity_rules,
+    validate_party_member_rules,
+    validate_name_rules,
+    validate_gender_rules,
+    validate_age_rules,
+    validate_birth_date_rules,
+    validate_party_joining_date_rules,
+    validate_brief_case_details_rules,
+    validate_case_report_keywords_rules,
+    validate_voluntary_confession_rules,
+    validate_disciplinary_sanction_rules,
+    validate_case_closing_time_rules,
+    validate_no_party_position_warning_rules
+)
+from .case_timestamp_rules import validate_registered_handover_amount_single_row
+from .case_disposal_amount_rules import (
+    validate_spirit_violation_single_row,
+    validate_closing_time_vs_decision_single_row
+)
+from .case_document_validators import validate_disposal_decision_keywords, validate_trial_report_keywords
+from .case_validation_confiscation_amount import validate_confiscation_amount_rules
+from .case_validation_confiscation_of_property_amount import validate_confiscation_of_property_amount_rules
+from .case_validation_trial_acceptance_time import validate_trial_acceptance_time_rules
+from .case_validation_recovery_amount import validate_recovery_amount_rules
+from .case_validation_trial_closing_time import validate_trial_closing_time_rules
+from .case_validation_trial_authority import validate_trial_authority_rules
+from .case_validation_trial_report import validate_trial_report_rules
+from .case_validation_disciplinary_decision import validate_disciplinary_decision_rules
+from .case_validation_administrative_sanction import validate_administrative_sanction_rules
+
+logger = logging.getLogger(__name__)
+
+# 四类文书，均为 COLUMN_MAPPINGS 中的键
+ALL_REPORTS = ('case_report', 'disciplinary_decision', 'investigation_report', 'trial_report')
+
+def _rule(name, func, results, columns=(), documents=(), dates=(), checks=None, all_rows=False):
+    """
+    定义一条规则。
+
+    参数:
+        name (str): 规则名称，用于日志。
+        func (callable): func(ctx, base_args, result_sets)，base_args 为
+                         (row, index, 案件编码, 涉案人员编码, issues_list)，result_sets 为 results 对应的集合列表。
+        results (tuple): 结果写入的索引集合名称（规则 ID），未在 CASE_RESULT_RULES 中登记的集合不会返回给调用方。
+        columns (tuple): 需要的 Excel 列（COLUMN_MAPPINGS 的键）。
+        documents (tuple): 需要的文书字段（COLUMN_MAPPINGS 的键）。
+        dates (tuple): 需要预先整列解析的日期列（COLUMN_MAPPINGS 的键）。
+        checks (tuple): 规则覆盖的检查项，默认为规则名称本身；检查项相同的规则只执行先注册的一条。
+        all_rows (bool): 为 True 时被调查人为空的行也执行（原整表遍历的规则对每一行都检查）。
+    """
+    return {
+        'name': name,
+        'func': func,
+        'results': tuple(results),
+        'columns': tuple(columns),
+        'documents': tuple(documents),
+        'dates': tuple(dates),
+        'checks': tuple(checks) if checks else (name,),
+        'all_rows': all_rows
+    }
+
+def _text(ctx, key):
+    """
+    读取上传时整列清洗的文本（去除首尾空白，空单元格为 ''）。
+    """
+    return ctx['typed'].cell_text(key, ctx['position'])
+
+def _flag(ctx, key):
+    """
+    读取是/否字段按上传时整列转换结果给出的标准写法 '是' / '否'，空单元格和无法识别的写法为 ''。
+    """
+    return ctx['typed'].flag_text(key, ctx['position'])
+
+def _value(ctx, key):
+    """
+    读取单元格原始值，列不存在时返回 None。
+    """
+    return ctx['row'].get(ctx['app_config']['COLUMN_MAPPINGS'][key])
+
+def _docs(ctx, keys):
+    """
+    返回文书原始文本，空值视为 ''。同一行内每种文书只读取一次。
+    """
+    documents = ctx['documents']
+    texts = []
+    for key in keys:
+        if key not in documents:
+            value = _value(ctx, key)
+            documents[key] = value if pd.notna(value) else ''
+        texts.append(documents[key])
+    return tuple(texts)
+
+def _date(ctx, key):
+    """
+    返回预先解析的日期单元格值。
+    """
+    column = ctx['app_config']['COLUMN_MAPPINGS'][key]
+    series = ctx['date_columns'].get(column)
+    return _value(ctx, key) if series is None else series[ctx['index']]
+
+def _run_age_rules(ctx, base, out):
+    """
+    年龄在上传时已整列转换为整数，格式错误的单元格由 _emit_coercion_issues 统一记录，此处为 None。
+    """
+    excel_age = ctx['typed'].value('age')[ctx['position']]
+    validate_age_rules(*base, *out, excel_age, ctx['shared']['current_year'], *_docs(ctx, ALL_REPORTS), ctx['app_config'])
+
+# 规则注册表，注册顺序即执行顺序（也决定同一行内问题的先后顺序）
+CASE_RULES = [
+    _rule('gender', lambda ctx, base, out: validate_gender_rules(
+              *base, *out, _text(ctx, 'gender'), *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('gender_mismatch_indices',), columns=('gender',), documents=ALL_REPORTS),
+    _rule('age', _run_age_rules,
+          results=('age_mismatch_indices',), columns=('age',), documents=ALL_REPORTS),
+    _rule('brief_case_details', lambda ctx, base, out: validate_brief_case_details_rules(
+              *base, *out, _text(ctx, 'brief_case_details'), ctx['investigated_person'],
+              *_docs(ctx, ('case_report', 'disciplinary_decision')), ctx['app_config']),
+          results=('brief_case_details_mismatch_indices',), columns=('brief_case_details',),
+          documents=('case_report', 'disciplinary_decision')),
+    _rule('birth_date', lambda ctx, base, out: validate_birth_date_rules(
+              *base, *out, _text(ctx, 'birth_date'), *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('birth_date_mismatch_indices',), columns=('birth_date',), documents=ALL_REPORTS),
+    _rule('education', lambda ctx, base, out: validate_education_rules(
+              *base, *out, _text(ctx, 'education'), *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('education_mismatch_indices',), columns=('education',), documents=ALL_REPORTS),
+    _rule('ethnicity', lambda ctx, base, out: validate_ethnicity_rules(
+              *base, *out, _text(ctx, 'ethnicity'), *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('ethnicity_mismatch_indices',), columns=('ethnicity',), documents=ALL_REPORTS),
+    _rule('party_member', lambda ctx, base, out: validate_party_member_rules(
+              *base, *out, _flag(ctx, 'party_member'),
+              *_docs(ctx, ('case_report', 'disciplinary_decision')), ctx['app_config']),
+          results=('party_member_mismatch_indices',), columns=('party_member',),
+          documents=('case_report', 'disciplinary_decision')),
+    _rule('party_joining_date', lambda ctx, base, out: validate_party_joining_date_rules(
+              *base, *out, _flag(ctx, 'party_member'), _text(ctx, 'party_joining_date'),
+              *_docs(ctx, ('case_report',)), ctx['app_config']),
+          results=('party_joining_date_mismatch_indices',), columns=('party_member', 'party_joining_date'),
+          documents=('case_report',)),
+    _rule('name', lambda ctx, base, out: validate_name_rules(
+              *base, *out, ctx['investigated_person'], *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('mismatch_indices',), documents=ALL_REPORTS),
+    _rule('case_report_keywords', lambda ctx, base, out: validate_case_report_keywords_rules(
+              *base, *out, ctx['shared']['case_report_keywords'], *_docs(ctx, ALL_REPORTS), ctx['app_config']),
+          results=('case_report_keyword_mismatch_indices',), documents=ALL_REPORTS),
+    _rule('voluntary_confession', lambda ctx, base, out: validate_voluntary_confession_rules(
+              *base, *out, _flag(ctx, 'voluntary_confession'), *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('voluntary_confession_highlight_indices',), columns=('voluntary_confession',),
+          documents=('trial_report',)),
+    _rule('closing_time', lambda ctx, base, out: validate_case_closing_time_rules(
+              *base, *out, _date(ctx, 'closing_time'), *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('closing_time_mismatch_indices',), columns=('closing_time',),
+          documents=('disciplinary_decision',), dates=('closing_time',), checks=('closing_time_vs_decision',),
+          all_rows=True),
+    _rule('disciplinary_sanction', lambda ctx, base, out: validate_disciplinary_sanction_rules(
+              *base, *out, _text(ctx, 'disciplinary_sanction'), *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('disciplinary_sanction_mismatch_indices',), columns=('disciplinary_sanction',),
+          documents=('disciplinary_decision',)),
+    _rule('no_party_position_warning', lambda ctx, base, out: validate_no_party_position_warning_rules(
+              *base, *out, _flag(ctx, 'no_party_position_warning'), *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('no_party_position_warning_mismatch_indices',), columns=('no_party_position_warning',),
+          documents=('disciplinary_decision',)),
+    _rule('disposal_decision_keywords', lambda ctx, base, out: validate_disposal_decision_keywords(
+              *base, *out, *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('disposal_decision_keyword_mismatch_indices',), documents=('disciplinary_decision',)),
+    _rule('trial_report_keywords', lambda ctx, base, out: validate_trial_report_keywords(
+              *base, *out, *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('trial_report_non_representative_mismatch_indices', 'trial_report_detention_mismatch_indices',
+                   'compensation_amount_highlight_indices'),
+          documents=('trial_report',),
+          checks=('trial_report_non_representative', 'trial_report_detention', 'trial_report_compensation')),
+    _rule('disciplinary_decision', lambda ctx, base, out: validate_disciplinary_decision_rules(
+              *base, *out, _text(ctx, 'disciplinary_decision'), ctx['app_config']),
+          results=('disciplinary_decision_mismatch_indices',), documents=('disciplinary_decision',)),
+    _rule('confiscation_amount', lambda ctx, base, out: validate_confiscation_amount_rules(
+              *base, *out, _text(ctx, 'confiscation_amount'), *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('confiscation_amount_indices',), columns=('confiscation_amount',), documents=('trial_report',)),
+    _rule('confiscation_of_property_amount', lambda ctx, base, out: validate_confiscation_of_property_amount_rules(
+              *base, *out, _text(ctx, 'confiscation_of_property_amount'), *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('confiscation_of_property_amount_indices',), columns=('confiscation_of_property_amount',),
+          documents=('trial_report',)),
+    _rule('recovery_amount', lambda ctx, base, out: validate_recovery_amount_rules(
+              *base, *out, _value(ctx, 'recovery_amount'), ctx['app_config']),
+          results=('recovery_amount_highlight_indices',), columns=('recovery_amount',)),
+    _rule('trial_acceptance_time', lambda ctx, base, out: validate_trial_acceptance_time_rules(
+              *base, *out, _date(ctx, 'trial_acceptance_time'), *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('trial_acceptance_time_mismatch_indices',), columns=('trial_acceptance_time',),
+          documents=('trial_report',), dates=('trial_acceptance_time',)),
+    _rule('trial_authority', lambda ctx, base, out: validate_trial_authority_rules(
+              *base, *out, _text(ctx, 'trial_authority'), _text(ctx, 'reporting_agency'),
+              ctx['typed'].pairs_in('trial_authority', 'reporting_agency', ctx['shared']['sl_authority_agency_pairs'])[ctx['position']],
+              ctx['app_config']),
+          results=('trial_authority_mismatch_indices',), columns=('trial_authority', 'reporting_agency')),
+    _rule('trial_closing_time', lambda ctx, base, out: validate_trial_closing_time_rules(
+              *base, *out, _date(ctx, 'trial_closing_time'), *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('trial_closing_time_mismatch_indices',), columns=('trial_closing_time',),
+          documents=('trial_report',), dates=('trial_closing_time',)),
+    _rule('trial_report', lambda ctx, base, out: validate_trial_report_rules(
+              *base, *out, *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('trial_report_mismatch_indices',), documents=('trial_report',)),
+    _rule('registered_handover_amount', lambda ctx, base, out: validate_registered_handover_amount_single_row(
+              *base, *out, *_docs(ctx, ('trial_report',)), ctx['app_config']),
+          results=('registered_handover_amount_indices',), columns=('registered_handover_amount',),
+          documents=('trial_report',)),
+    _rule('administrative_sanction', lambda ctx, base, out: validate_administrative_sanction_rules(
+              *base, *out, _text(ctx, 'administrative_sanction'), *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('administrative_sanction_mismatch_indices',), columns=('administrative_sanction',),
+          documents=('disciplinary_decision',)),
+    # 原整表校验的处分和金额相关规则，改为逐行执行；原整表遍历对每一行都检查，
+    # 因此与结案时间规则（同一检查项）一样标记为 all_rows，被调查人为空的行也执行
+    _rule('spirit_violation', lambda ctx, base, out: validate_spirit_violation_single_row(
+              *base, *out, _flag(ctx, 'central_eight_provisions'), *_docs(ctx, ('disciplinary_decision',)),
+              ctx['app_config']),
+          results=('disposal_spirit_mismatch_indices',), columns=('central_eight_provisions',),
+          documents=('disciplinary_decision',), all_rows=True),
+    _rule('disposal_closing_time', lambda ctx, base, out: validate_closing_time_vs_decision_single_row(
+              *base, *out, _date(ctx, 'closing_time'), *_docs(ctx, ('disciplinary_decision',)), ctx['app_config']),
+          results=('closing_time_mismatch_indices',), columns=('closing_time',),
+          documents=('disciplinary_decision',), dates=('closing_time',), checks=('closing_time_vs_decision',)),
+]
+
+def build_case_rule_plan(columns, app_config, rules=None):
+    """
+    根据表头生成执行计划。
+
+    参数:
+        columns (iterable): 上传表的列名。
+        app_config (dict): Flask 应用的配置字典。
+        rules (list): 可选，参与计划的规则，默认为 CASE_RULES。
+
+    返回:
+        dict: {'rules': 执行的规则列表, 'documents': 需要的文书字段, 'dates': 需要预先解析的日期列,
+               'skipped': 因缺列跳过的规则名称, 'duplicates': 因检查项重复跳过的规则名称}
+    """
+    mappings = app_config['COLUMN_MAPPINGS']
+    available = set(columns)
+    plan = {'rules': [], 'documents': [], 'dates': [], 'skipped': [], 'duplicates': []}
+    covered_checks = set()
+
+    for rule in (rules if rules is not None else CASE_RULES):
+        needed = [mappings[key] for key in rule['columns'] + rule['documents']]
+        missing = [col for col in needed if col not in available]
+        if missing:
+            plan['skipped'].append(rule['name'])
+            logger.warning(f"<立案 - 规则计划> - 规则 '{rule['name']}' 缺少列 {missing}，跳过")
+            continue
+        if covered_checks.issuperset(rule['checks']):
+            plan['duplicates'].append(rule['name'])
+            logger.info(f"<立案 - 规则计划> - 规则 '{rule['name']}' 的检查项 {list(rule['checks'])} 已由其他规则执行，跳过重复检查")
+            continue
+        covered_checks.update(rule['checks'])
+        plan['rules'].append(rule)
+        # 按首次使用的顺序汇总共享的文书字段和日期列
+        for key in rule['documents']:
+            if key not in plan['documents']:
+                plan['documents'].append(key)
+        for key in rule['dates']:
+            if key not in plan['dates']:
+                plan['dates'].append(key)
+
+    logger.info(f"<立案 - 规则计划> - 执行 {len(plan['rules'])} 条规则，缺列跳过 {len(plan['skipped'])} 条，"
+                f"重复跳过 {len(plan['duplicates'])} 条")
+    return plan
+
+def _emit_coercion_issues(typed, active, issues_list, result_sets, coercion_fields=None):
+    """
+    将上传时无法转换类型的单元格（年龄、金额、是/否字段）一次性记录为问题，
+    并写入字段声明的结果索引集合用于副本高亮。只记录会参与校验的行（被调查人不为空）。
+    问题按字段（schema 顺序）、再按行排列；传入 coercion_fields 时依次记录每个问题所属的字段。
+    """
+    labels = typed.df.index
+    case_codes = typed.text('case_code')
+    person_codes = typed.text('person_code')
+    for field, positions in typed.failures.items():
+        spec = typed.schema[field]
+        column = typed.column_mappings[field]
+        result_set = result_sets.setdefault(spec['result'], set()) if spec['result'] else None
+        for position in positions:
+            if not active[position]:
+                continue
+            index = labels[position]
+            if result_set is not None:
+                result_set.add(index)
+            issues_list.append((index,
+                                case_codes[position] if case_codes is not None else "",
+                                person_codes[position] if person_codes is not None else "",
+                                failure_description(spec, column, index + 2, case_col(field)),
+                                spec['risk']))
+            if coercion_fields is not None:
+                coercion_fields.append(field)
+
+def run_case_rule_plan(df, plan, app_config, issues_list, result_sets, shared, coercion_fields=None):
+    """
+    在一次遍历中对每行执行计划内的全部规则。
+
+    参数:
+        df (pd.DataFrame): 立案登记表数据。
+        plan (dict): build_case_rule_plan 的返回值。
+        app_config (dict): Flask 应用的配置字典。
+        issues_list (list): 用于收集所有发现问题的列表。
+        result_sets (dict): {结果名称: 行索引集合}，规则用到但不存在的集合会自动创建。
+        shared (dict): 整次上传共用的数据，例如 current_year、case_report_keywords、sl_authority_agency_pairs。
+        coercion_fields (list, optional): 传入时依次追加每个类型转换问题所属的字段，
+            多进程执行时据此把各分区的类型转换问题按单进程的顺序（字段、行）合并。
+
+    返回:
+        int: 类型转换问题的数量（位于本次追加的问题最前面）。
+    """
+    mappings = app_config['COLUMN_MAPPINGS']
+    # 日期列转换为 {行索引: 值} 字典，逐行按索引查找比 Series 取值快得多
+    date_columns = {column: series.to_dict()
+                    for column, series in coerce_date_columns(df, [mappings[key] for key in plan['dates']]).items()}
+    rule_outputs = [(rule, [result_sets.setdefault(name, set()) for name in rule['results']]) for rule in plan['rules']]
+    all_row_outputs = [(rule, outputs) for rule, outputs in rule_outputs if rule['all_rows']]
+
+    # 各字段整列转换一次，类型错误集中记录
+    typed = build_typed_table(df, mappings, CASE_SCHEMA)
+    investigated_persons = [typed.cell_text('investigated_person', position) for position in range(len(df))]
+    issues_before = len(issues_list)
+    _emit_coercion_issues(typed, investigated_persons, issues_list, result_sets, coercion_fields)
+    coercion_count = len(issues_list) - issues_before
+
+    for position, (index, row) in enumerate(iter_rows(df)):
+        logger.debug(f"Processing row {index + 1}")
+        set_current_row(index)
+
+        investigated_person = investigated_persons[position]
+        row_outputs = rule_outputs
+        if not investigated_person:
+            logger.info(f"行 {index + 1} - '{mappings['investigated_person']}' 字段为空，只执行对每一行都检查的规则。")
+            if not all_row_outputs:
+                continue
+            row_outputs = all_row_outputs
+
+        excel_case_code = typed.cell_text('case_code', position)
+        excel_person_code = typed.cell_text('person_code', position)
+        ctx = {
+            'row': row,
+            'index': index,
+            'position': position,
+            'typed': typed,
+            'investigated_person': investigated_person,
+            'issues_list': issues_list,
+            'app_config': app_config,
+            'shared': shared,
+            'date_columns': date_columns,
+            'documents': {}
+        }
+        # 本行需要的文书只读取一次，供所有规则共享
+        _docs(ctx, plan['documents'])
+        base = (row, index, excel_case_code, excel_person_code, issues_list)
+        for rule, outputs in row_outputs:
+            rule['func'](ctx, base, outputs)
+    return coercion_count
+
+def default_shared_data(app_config, authority_agency_db_data):
+    """
+    生成整次上传共用的数据。
+
+    参数:
+        app_config (dict): Flask 应用的配置字典。
+        authority_agency_db_data (list): get_authority_agency_dict() 的结果。
+
+    返回:
+        dict: current_year、case_report_keywords 和 SL 类别的 (机关, 单位) 组合。
+    """
+    return {
+        'current_year': datetime.now().year,
+        # 立案报告关键词与 DISPOSAL_DECISION_KEYWORDS 相同，从 app_config 获取以保持一致
+        'case_report_keywords': app_config['DISPOSAL_DECISION_KEYWORDS'],
+        'sl_authority_agency_pairs': frozenset(
+            (record['authority'], record['agency'])
+            for record in authority_agency_db_data if record['category'] == 'SL'
+        )
+    }
@@ -1,6 +1,8 @@
 import pandas as pd
 import logging
 from datetime import datetime
+from validation.row_view import iter_rows
+from validation.header_map import case_col
 
 # 配置日志记录器
 logger = logging.getLogger(__name__)
@@ -51,7 +53,7 @@ def validate_order_for_reparations_amount(df, issues_list, order_for_reparations
         logger.warning(msg)
         return
 
-    for index, row in df.iterrows():
+    for index, row in iter_rows(df):
         trial_report_text = str(row.get(col_trial_report, "")).strip() if pd.notna(row.get(col_trial_report)) else ''
         case_code = str(row.get(col_case_code, "")).strip()
         person_code = str(row.get(col_person_code, "")).strip()
@@ -64,7 +66,7 @@ def validate_order_for_reparations_amount(df, issues_list, order_for_reparations
     logger.info("责令退赔金额相关规则验证完成。")
 
 
-def validate_registered_handover_amount_single_row(row, index, excel_case_code, excel_person_code, issues_list, registered_handover_amount_indices, app_config):
+def validate_registered_handover_amount_single_row(row, index, excel_case_code, excel_person_code, issues_list, registered_handover_amount_indices, trial_report_text, app_config):
     """
     CG.登记上交金额规则（单行验证）：与"审理报告"字段内容进行对比，查找字符串"登记上交金额"，
     若出现"登记上交金额"这6个字，将副本文件"登记上交金额"字段标黄。
@@ -77,18 +79,16 @@ def validate_registered_handover_amount_single_row(row, index, excel_case_code,
     excel_person_code (str): Excel 中的涉案人员编码。
     issues_list (list): 包含所有问题的列表，每个问题是一个(索引, 案件编码, 涉案人员编码, 问题描述)元组。
     registered_handover_amount_indices (set): 收集所有"登记上交金额"需要标黄的行索引。
+    trial_report_text (str): 审理报告文本，空单元格为 ''。
     app_config (dict): Flask 应用的配置字典，包含Config类中的配置。
 
     返回:
     None (issues_list 和 registered_handover_amount_indices 会在函数内部被修改)。
     """
-    col_trial_report = app_config['COLUMN_MAPPINGS']['trial_report']
     col_registered_handover_amount = app_config['COLUMN_MAPPINGS']['registered_handover_amount']
 
-    trial_report_text = str(row.get(col_trial_report, "")).strip() if pd.notna(row.get(col_trial_report)) else ''
-    
     # 获取配置中的问题描述
-    issue_description = app_config['VALIDATION_RULES'].get("highlight_case_registered_handover_amount", "CY审理报告中含有登记上交金额字样，请人工再次确认CG登记上交金额")
+    issue_description = app_config['VALIDATION_RULES'].get("highlight_case_registered_handover_amount", f"{case_col('trial_report')}审理报告中含有登记上交金额字样，请人工再次确认{case_col('registered_handover_amount')}登记上交金额")
 
     if "登记上交金额" in trial_report_text:
         # 添加字典格式的问题记录，与generate_investigatee_number_file函数兼容
@@ -96,10 +96,10 @@ def validate_registered_handover_amount_single_row(row, index, excel_case_code,
             '行号': index + 2,  # Excel行号从1开始，且有表头
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
-            '问题描述': f"CG{index + 2}{col_registered_handover_amount}与CY{index + 2}审理报告不一致",
+            '问题描述': f"{case_col('registered_handover_amount')}{index + 2}{col_registered_handover_amount}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '风险等级': '中',
-            '比对字段': f"CG{col_registered_handover_amount}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '比对字段': f"{case_col('registered_handover_amount')}{col_registered_handover_amount}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
             '列名': col_registered_handover_amount
         }
         issues_list.append(issue_dict)
@@ -132,12 +132,12 @@ def validate_registered_handover_amount(df, issues_list, registered_handover_amo
         logger.warning(msg)
         return
 
-    for index, row in df.iterrows():
+    for index, row in iter_rows(df):
         case_code = row.get(app_config['COLUMN_MAPPINGS']['case_code'], '')
         person_code = row.get(app_config['COLUMN_MAPPINGS']['person_code'], '')
         trial_report_text = str(row.get(col_trial_report, "")).strip() if pd.notna(row.get(col_trial_report)) else ''
 
         if "登记上交金额" in trial_report_text:
-            issues_list.append((index, case_code, person_code, app_config['VALIDATION_RULES'].get("highlight_case_registered_handover_amount", "CY审理报告中含有登记上交金额字样，请人工再次确认CG登记上交金额"), "中")) # 增加风险等级
+            issues_list.append((index, case_code, person_code, app_config['VALIDATION_RULES'].get("highlight_case_registered_handover_amount", f"{case_col('trial_report')}审理报告中含有登记上交金额字样，请人工再次确认{case_col('registered_handover_amount')}登记上交金额"), "中")) # 增加风险等级
             registered_handover_amount_indices.add(index)
-            logger.warning(f"<立案 - (CG.登记上交金额)> - 行 {index + 2} - CY审理报告中含有登记上交金额字样，请人工再次确认CG登记上交金额")
+            logger.warning(f"<立案 - (CG.登记上交金额)> - 行 {index + 2} - {case_col('trial_report')}审理报告中含有登记上交金额字样，请人工再次确认{case_col('registered_handover_amount')}登记上交金额")
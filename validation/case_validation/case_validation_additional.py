@@ -1,6 +1,8 @@
 import logging
 import pandas as pd
 import re
+from validation.date_normalization import parse_chinese_date, parse_date_value
+from validation.header_map import case_col
 from .case_extractors_names import (
     extract_name_from_case_report,
     extract_name_from_decision,
@@ -23,9 +25,9 @@ def validate_name_rules(row, index, excel_case_code, excel_person_code, issues_l
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': "C被调查人",
-            '被比对字段': "BF立案报告",
-            '问题描述': f"C{index + 2}被调查人与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('investigated_person')}被调查人",
+            '被比对字段': f"{case_col('case_report')}立案报告",
+            '问题描述': f"{case_col('investigated_person')}{index + 2}被调查人与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': "被调查人"
         })
         logger.warning(f"<立案 - （1.被调查人与立案报告）> - 行 {index + 2} - 被调查人 '{investigated_person}' 与立案报告姓名 '{report_name}' 不一致")
@@ -38,9 +40,9 @@ def validate_name_rules(row, index, excel_case_code, excel_person_code, issues_l
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': "C被调查人",
-            '被比对字段': "CU处分决定",
-            '问题描述': f"C{index + 2}被调查人与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('investigated_person')}被调查人",
+            '被比对字段': f"{case_col('disciplinary_decision')}处分决定",
+            '问题描述': f"{case_col('investigated_person')}{index + 2}被调查人与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': "被调查人"
         })
         logger.warning(f"<立案 - （2.被调查人与处分决定）> - 行 {index + 2} - 被调查人 '{investigated_person}' 与处分决定姓名 '{decision_name}' 不一致")
@@ -53,9 +55,9 @@ def validate_name_rules(row, index, excel_case_code, excel_person_code, issues_l
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': "C被调查人",
-            '被比对字段': "CX审查调查报告",
-            '问题描述': f"C{index + 2}被调查人与CX{index + 2}审查调查报告不一致",
+            '比对字段': f"{case_col('investigated_person')}被调查人",
+            '被比对字段': f"{case_col('investigation_report')}审查调查报告",
+            '问题描述': f"{case_col('investigated_person')}{index + 2}被调查人与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
             '列名': "被调查人"
         })
         logger.warning(f"<立案 - （3.被调查人与审查调查报告）> - 行 {index + 2} - 被调查人 '{investigated_person}' 与审查调查报告姓名 '{investigation_name}' 不一致")
@@ -68,9 +70,9 @@ def validate_name_rules(row, index, excel_case_code, excel_person_code, issues_l
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': "C被调查人",
-            '被比对字段': "CY审理报告",
-            '问题描述': f"C{index + 2}被调查人与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('investigated_person')}被调查人",
+            '被比对字段': f"{case_col('trial_report')}审理报告",
+            '问题描述': f"{case_col('investigated_person')}{index + 2}被调查人与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': "被调查人"
         })
         logger.warning(f"<立案 - （4.被调查人与审理报告）> - 行 {index + 2} - 被调查人 '{investigated_person}' 与审理报告姓名 '{trial_name}' 不一致")
@@ -90,9 +92,9 @@ def validate_gender_rules(row, index, excel_case_code, excel_person_code, issues
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"M{app_config['COLUMN_MAPPINGS']['gender']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"M{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('gender')}{app_config['COLUMN_MAPPINGS']['gender']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('gender')}{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['gender']
         })
         logger.warning(f"<立案 - （1.性别与立案报告）> - 行 {index + 2} - 性别 '{excel_gender}' 与立案报告性别 '{extracted_gender_from_report}' 不一致")
@@ -106,9 +108,9 @@ def validate_gender_rules(row, index, excel_case_code, excel_person_code, issues
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"M{app_config['COLUMN_MAPPINGS']['gender']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"M{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('gender')}{app_config['COLUMN_MAPPINGS']['gender']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('gender')}{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['gender']
         })
         logger.warning(f"<立案 - （2.性别与处分决定）> - 行 {index + 2} - 性别 '{excel_gender}' 与处分决定性别 '{extracted_gender_from_decision}' 不一致")
@@ -122,9 +124,9 @@ def validate_gender_rules(row, index, excel_case_code, excel_person_code, issues
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"M{app_config['COLUMN_MAPPINGS']['gender']}",
-            '被比对字段': f"CX{app_config['COLUMN_MAPPINGS']['investigation_report']}",
-            '问题描述': f"M{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与CX{index + 2}审查调查报告不一致",
+            '比对字段': f"{case_col('gender')}{app_config['COLUMN_MAPPINGS']['gender']}",
+            '被比对字段': f"{case_col('investigation_report')}{app_config['COLUMN_MAPPINGS']['investigation_report']}",
+            '问题描述': f"{case_col('gender')}{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['gender']
         })
         logger.warning(f"<立案 - （3.性别与审查调查报告）> - 行 {index + 2} - 性别 '{excel_gender}' 与审查调查报告性别 '{extracted_gender_from_investigation}' 不一致")
@@ -138,9 +140,9 @@ def validate_gender_rules(row, index, excel_case_code, excel_person_code, issues
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"M{app_config['COLUMN_MAPPINGS']['gender']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"M{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('gender')}{app_config['COLUMN_MAPPINGS']['gender']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('gender')}{index + 2}{app_config['COLUMN_MAPPINGS']['gender']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['gender']
         })
         logger.warning(f"<立案 - （4.性别与审理报告）> - 行 {index + 2} - 性别 '{excel_gender}' 与审理报告性别 '{extracted_gender_from_trial}' 不一致")
@@ -180,9 +182,9 @@ def validate_age_rules(row, index, excel_case_code, excel_person_code, issues_li
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"N{app_config['COLUMN_MAPPINGS']['age']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"N{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('age')}{app_config['COLUMN_MAPPINGS']['age']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('age')}{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['age']
         })
         logger.warning(f"<立案 - （1.年龄与立案报告）> - 行 {index + 2} - 年龄 '{excel_age}' 与立案报告计算年龄 '{calculated_age_from_report}' 不一致")
@@ -200,9 +202,9 @@ def validate_age_rules(row, index, excel_case_code, excel_person_code, issues_li
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"N{app_config['COLUMN_MAPPINGS']['age']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"N{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('age')}{app_config['COLUMN_MAPPINGS']['age']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('age')}{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['age']
         })
         logger.warning(f"<立案 - （2.年龄与处分决定）> - 行 {index + 2} - 年龄 '{excel_age}' 与处分决定计算年龄 '{calculated_age_from_decision}' 不一致")
@@ -220,9 +222,9 @@ def validate_age_rules(row, index, excel_case_code, excel_person_code, issues_li
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"N{app_config['COLUMN_MAPPINGS']['age']}",
-            '被比对字段': f"CX{app_config['COLUMN_MAPPINGS']['investigation_report']}",
-            '问题描述': f"N{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与CX{index + 2}审查调查报告不一致",
+            '比对字段': f"{case_col('age')}{app_config['COLUMN_MAPPINGS']['age']}",
+            '被比对字段': f"{case_col('investigation_report')}{app_config['COLUMN_MAPPINGS']['investigation_report']}",
+            '问题描述': f"{case_col('age')}{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['age']
         })
         logger.warning(f"<立案 - （3.年龄与审查调查报告）> - 行 {index + 2} - 年龄 '{excel_age}' 与审查调查报告计算年龄 '{calculated_age_from_investigation}' 不一致")
@@ -240,9 +242,9 @@ def validate_age_rules(row, index, excel_case_code, excel_person_code, issues_li
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"N{app_config['COLUMN_MAPPINGS']['age']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"N{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('age')}{app_config['COLUMN_MAPPINGS']['age']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('age')}{index + 2}{app_config['COLUMN_MAPPINGS']['age']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['age']
         })
         logger.warning(f"<立案 - （4.年龄与审理报告）> - 行 {index + 2} - 年龄 '{excel_age}' 与审理报告计算年龄 '{calculated_age_from_trial}' 不一致")
@@ -278,9 +280,9 @@ def validate_birth_date_rules(row, index, excel_case_code, excel_person_code, is
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"O{app_config['COLUMN_MAPPINGS']['birth_date']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"O{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('birth_date')}{app_config['COLUMN_MAPPINGS']['birth_date']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('birth_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['birth_date']
         })
         logger.warning(f"<立案 - （1.出生年月与立案报告）> - 行 {index + 2} - 出生年月 '{excel_birth_date}' 与立案报告提取出生年月 '{extracted_birth_date_from_report}' 不一致")
@@ -295,9 +297,9 @@ def validate_birth_date_rules(row, index, excel_case_code, excel_person_code, is
              '案件编码': excel_case_code,
              '涉案人员编码': excel_person_code,
              '行号': index + 2,
-             '比对字段': f"O{app_config['COLUMN_MAPPINGS']['birth_date']}",
-             '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-             '问题描述': f"O{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与CU{index + 2}处分决定不一致",
+             '比对字段': f"{case_col('birth_date')}{app_config['COLUMN_MAPPINGS']['birth_date']}",
+             '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+             '问题描述': f"{case_col('birth_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
              '列名': app_config['COLUMN_MAPPINGS']['birth_date']
          })
          logger.warning(f"<立案 - （2.出生年月与处分决定）> - 行 {index + 2} - 出生年月 '{excel_birth_date}' 与处分决定提取出生年月 '{extracted_birth_date_from_decision}' 不一致")
@@ -312,9 +314,9 @@ def validate_birth_date_rules(row, index, excel_case_code, excel_person_code, is
              '案件编码': excel_case_code,
              '涉案人员编码': excel_person_code,
              '行号': index + 2,
-             '比对字段': f"O{app_config['COLUMN_MAPPINGS']['birth_date']}",
-             '被比对字段': f"CX{app_config['COLUMN_MAPPINGS']['investigation_report']}",
-             '问题描述': f"O{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与CX{index + 2}审查调查报告不一致",
+             '比对字段': f"{case_col('birth_date')}{app_config['COLUMN_MAPPINGS']['birth_date']}",
+             '被比对字段': f"{case_col('investigation_report')}{app_config['COLUMN_MAPPINGS']['investigation_report']}",
+             '问题描述': f"{case_col('birth_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
              '列名': app_config['COLUMN_MAPPINGS']['birth_date']
          })
          logger.warning(f"<立案 - （3.出生年月与审查调查报告）> - 行 {index + 2} - 出生年月 '{excel_birth_date}' 与审查调查报告提取出生年月 '{extracted_birth_date_from_investigation}' 不一致")
@@ -329,9 +331,9 @@ def validate_birth_date_rules(row, index, excel_case_code, excel_person_code, is
              '案件编码': excel_case_code,
              '涉案人员编码': excel_person_code,
              '行号': index + 2,
-             '比对字段': f"O{app_config['COLUMN_MAPPINGS']['birth_date']}",
-             '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-             '问题描述': f"O{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与CY{index + 2}审理报告不一致",
+             '比对字段': f"{case_col('birth_date')}{app_config['COLUMN_MAPPINGS']['birth_date']}",
+             '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+             '问题描述': f"{case_col('birth_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['birth_date']}与{case_col('trial_report')}{index + 2}审理报告不一致",
              '列名': app_config['COLUMN_MAPPINGS']['birth_date']
          })
          logger.warning(f"<立案 - （4.出生年月与审理报告）> - 行 {index + 2} - 出生年月 '{excel_birth_date}' 与审理报告提取出生年月 '{extracted_birth_date_from_trial}' 不一致")
@@ -375,9 +377,9 @@ def validate_education_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"P{app_config['COLUMN_MAPPINGS']['education']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"P{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('education')}{app_config['COLUMN_MAPPINGS']['education']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('education')}{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['education']
         })
         logger.warning(f"<立案 - （1.学历与立案报告）> - 行 {index + 2} - 学历 '{excel_education}' 与立案报告提取学历 '{extracted_education_from_report}' 不一致")
@@ -396,9 +398,9 @@ def validate_education_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"P{app_config['COLUMN_MAPPINGS']['education']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"P{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('education')}{app_config['COLUMN_MAPPINGS']['education']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('education')}{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['education']
         })
         logger.warning(f"<立案 - （2.学历与处分决定）> - 行 {index + 2} - 学历 '{excel_education}' 与处分决定提取学历 '{extracted_education_from_decision}' 不一致")
@@ -416,9 +418,9 @@ def validate_education_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"P{app_config['COLUMN_MAPPINGS']['education']}",
-            '被比对字段': f"CX{app_config['COLUMN_MAPPINGS']['investigation_report']}",
-            '问题描述': f"P{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与CX{index + 2}审查调查报告不一致",
+            '比对字段': f"{case_col('education')}{app_config['COLUMN_MAPPINGS']['education']}",
+            '被比对字段': f"{case_col('investigation_report')}{app_config['COLUMN_MAPPINGS']['investigation_report']}",
+            '问题描述': f"{case_col('education')}{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['education']
         })
         logger.warning(f"<立案 - （3.学历与审查调查报告）> - 行 {index + 2} - 学历 '{excel_education}' 与审查调查报告提取学历 '{extracted_education_from_investigation}' 不一致")
@@ -436,9 +438,9 @@ def validate_education_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"P{app_config['COLUMN_MAPPINGS']['education']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"P{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('education')}{app_config['COLUMN_MAPPINGS']['education']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('education')}{index + 2}{app_config['COLUMN_MAPPINGS']['education']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['education']
         })
         logger.warning(f"<立案 - （4.学历与审理报告）> - 行 {index + 2} - 学历 '{excel_education}' 与审理报告提取学历 '{extracted_education_from_trial}' 不一致")
@@ -474,9 +476,9 @@ def validate_ethnicity_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"Q{app_config['COLUMN_MAPPINGS']['ethnicity']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"Q{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('ethnicity')}{app_config['COLUMN_MAPPINGS']['ethnicity']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('ethnicity')}{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['ethnicity']
         })
         logger.warning(f"<立案 - （1.民族与立案报告）> - 行 {index + 2} - 民族 '{excel_ethnicity}' 与立案报告提取民族 '{extracted_ethnicity_from_report}' 不一致")
@@ -492,9 +494,9 @@ def validate_ethnicity_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"Q{app_config['COLUMN_MAPPINGS']['ethnicity']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"Q{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('ethnicity')}{app_config['COLUMN_MAPPINGS']['ethnicity']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('ethnicity')}{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['ethnicity']
         })
         logger.warning(f"<立案 - （2.民族与处分决定）> - 行 {index + 2} - 民族 '{excel_ethnicity}' 与处分决定提取民族 '{extracted_ethnicity_from_decision}' 不一致")
@@ -510,9 +512,9 @@ def validate_ethnicity_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"Q{app_config['COLUMN_MAPPINGS']['ethnicity']}",
-            '被比对字段': f"CX{app_config['COLUMN_MAPPINGS']['investigation_report']}",
-            '问题描述': f"Q{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与CX{index + 2}审查调查报告不一致",
+            '比对字段': f"{case_col('ethnicity')}{app_config['COLUMN_MAPPINGS']['ethnicity']}",
+            '被比对字段': f"{case_col('investigation_report')}{app_config['COLUMN_MAPPINGS']['investigation_report']}",
+            '问题描述': f"{case_col('ethnicity')}{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与{case_col('investigation_report')}{index + 2}审查调查报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['ethnicity']
         })
         logger.warning(f"<立案 - （3.民族与审查调查报告）> - 行 {index + 2} - 民族 '{excel_ethnicity}' 与审查调查报告提取民族 '{extracted_ethnicity_from_investigation}' 不一致")
@@ -528,9 +530,9 @@ def validate_ethnicity_rules(row, index, excel_case_code, excel_person_code, iss
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"Q{app_config['COLUMN_MAPPINGS']['ethnicity']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"Q{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('ethnicity')}{app_config['COLUMN_MAPPINGS']['ethnicity']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('ethnicity')}{index + 2}{app_config['COLUMN_MAPPINGS']['ethnicity']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['ethnicity']
         })
         logger.warning(f"<立案 - （4.民族与审理报告）> - 行 {index + 2} - 民族 '{excel_ethnicity}' 与审理报告提取民族 '{extracted_ethnicity_from_trial}' 不一致")
@@ -551,9 +553,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-                '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与BF{index + 2}立案报告不一致",
+                '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+                '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('case_report')}{index + 2}立案报告不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['party_member']
             })
             logger.warning(f"<立案 - （1.是否中共党员与立案报告）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与立案报告提取党员信息 '是' 不一致")
@@ -563,9 +565,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['party_member']
         })
         logger.warning(f"<立案 - （1.是否中共党员与立案报告）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与立案报告提取党员信息 '未明确' 不一致")
@@ -575,9 +577,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-            '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-            '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与BF{index + 2}立案报告不一致",
+            '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+            '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+            '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('case_report')}{index + 2}立案报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['party_member']
         })
         logger.warning(f"<立案 - （1.是否中共党员与立案报告）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与立案报告提取党员信息 '{extracted_party_member_from_report}' 不一致")
@@ -594,9 +596,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-                '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与CU{index + 2}处分决定不一致",
+                '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+                '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['party_member']
             })
             logger.warning(f"<立案 - （2.是否中共党员与处分决定）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与处分决定提取党员信息 '是' 不一致")
@@ -608,9 +610,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['party_member']
         })
         logger.warning(f"<立案 - （2.是否中共党员与处分决定）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与处分决定提取党员信息 '未明确' 不一致")
@@ -620,9 +622,9 @@ def validate_party_member_rules(row, index, excel_case_code, excel_person_code,
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"T{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('party_member')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_member']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['party_member']
         })
         logger.warning(f"<立案 - （2.是否中共党员与处分决定）> - 行 {index + 2} - 是否中共党员 '{excel_party_member}' 与处分决定提取党员信息 '{extracted_party_member_from_decision}' 不一致")
@@ -645,9 +647,9 @@ def validate_party_joining_date_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"AC{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
-                    '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                    '问题描述': f"AC{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与BF{index + 2}立案报告不一致",
+                    '比对字段': f"{case_col('party_joining_date')}{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
+                    '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                    '问题描述': f"{case_col('party_joining_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与{case_col('case_report')}{index + 2}立案报告不一致",
                     '列名': app_config['COLUMN_MAPPINGS']['party_joining_date']
                 })
                 logger.warning(f"<立案 - （1.入党时间与立案报告）> - 行 {index + 2} - 入党时间 '{excel_party_joining_date}' 与立案报告提取入党时间 '{extracted_party_joining_date_from_report}' 不一致")
@@ -657,9 +659,9 @@ def validate_party_joining_date_rules(row, index, excel_case_code, excel_person_
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"AC{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
-                '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                '问题描述': f"AC{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与BF{index + 2}立案报告不一致",
+                '比对字段': f"{case_col('party_joining_date')}{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
+                '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                '问题描述': f"{case_col('party_joining_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与{case_col('case_report')}{index + 2}立案报告不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['party_joining_date']
             })
             logger.warning(f"<立案 - （1.入党时间与立案报告）> - 行 {index + 2} - 入党时间 '{excel_party_joining_date}' 与立案报告提取入党时间 '未提取到' 不一致")
@@ -669,9 +671,9 @@ def validate_party_joining_date_rules(row, index, excel_case_code, excel_person_
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"AC{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
-                '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                '问题描述': f"AC{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与BF{index + 2}立案报告不一致",
+                '比对字段': f"{case_col('party_joining_date')}{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
+                '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                '问题描述': f"{case_col('party_joining_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与{case_col('case_report')}{index + 2}立案报告不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['party_joining_date']
             })
             logger.warning(f"<立案 - （1.入党时间与立案报告）> - 行 {index + 2} - 入党时间 '{excel_party_joining_date}' 与立案报告提取入党时间 '{extracted_party_joining_date_from_report}' 不一致")
@@ -682,9 +684,9 @@ def validate_party_joining_date_rules(row, index, excel_case_code, excel_person_
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"AC{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
-                '被比对字段': f"T{app_config['COLUMN_MAPPINGS']['party_member']}",
-                '问题描述': f"AC{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与T{index + 2}是否中共党员不一致",
+                '比对字段': f"{case_col('party_joining_date')}{app_config['COLUMN_MAPPINGS']['party_joining_date']}",
+                '被比对字段': f"{case_col('party_member')}{app_config['COLUMN_MAPPINGS']['party_member']}",
+                '问题描述': f"{case_col('party_joining_date')}{index + 2}{app_config['COLUMN_MAPPINGS']['party_joining_date']}与{case_col('party_member')}{index + 2}是否中共党员不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['party_joining_date']
             })
             logger.warning(f"<立案 - （2.入党时间与党员身份）> - 行 {index + 2} - 入党时间 '{excel_party_joining_date}' 与是否中共党员 '否' 不一致")
@@ -729,9 +731,9 @@ def validate_brief_case_details_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"BE{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
-                    '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                    '问题描述': f"BE{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与BF{index + 2}立案报告不一致（未能提取到内容）",
+                    '比对字段': f"{case_col('brief_case_details')}{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
+                    '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                    '问题描述': f"{case_col('brief_case_details')}{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与{case_col('case_report')}{index + 2}立案报告不一致（未能提取到内容）",
                     '列名': app_config['COLUMN_MAPPINGS']['brief_case_details']
                 })
                 logger.warning(f"<立案 - （1.简要案情与立案报告）> - 行 {index + 2} - 简要案情 '{excel_brief_case_details}' 与立案报告提取简要案情 '未提取到' 不一致")
@@ -744,9 +746,9 @@ def validate_brief_case_details_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"BE{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
-                    '被比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                    '问题描述': f"BE{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与BF{index + 2}立案报告不一致",
+                    '比对字段': f"{case_col('brief_case_details')}{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
+                    '被比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                    '问题描述': f"{case_col('brief_case_details')}{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与{case_col('case_report')}{index + 2}立案报告不一致",
                     '列名': app_config['COLUMN_MAPPINGS']['brief_case_details']
                 })
                 logger.warning(f"<立案 - （1.简要案情与立案报告）> - 行 {index + 2} - 简要案情 '{cleaned_excel_brief_case_details}' 与立案报告提取简要案情 '{extracted_brief_case_details}' 不一致")
@@ -761,9 +763,9 @@ def validate_brief_case_details_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"BE{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
-                    '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                    '问题描述': f"BE{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与CU{index + 2}处分决定不一致（未能提取到内容）",
+                    '比对字段': f"{case_col('brief_case_details')}{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
+                    '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                    '问题描述': f"{case_col('brief_case_details')}{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致（未能提取到内容）",
                     '列名': app_config['COLUMN_MAPPINGS']['brief_case_details']
                 })
                 logger.warning(f"<立案 - （2.简要案情与处分决定）> - 行 {index + 2} - 简要案情 '{excel_brief_case_details}' 与处分决定提取简要案情 '未提取到' 不一致")
@@ -776,9 +778,9 @@ def validate_brief_case_details_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"BE{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
-                    '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                    '问题描述': f"BE{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与CU{index + 2}处分决定不一致",
+                    '比对字段': f"{case_col('brief_case_details')}{app_config['COLUMN_MAPPINGS']['brief_case_details']}",
+                    '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                    '问题描述': f"{case_col('brief_case_details')}{index + 2}{app_config['COLUMN_MAPPINGS']['brief_case_details']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
                     '列名': app_config['COLUMN_MAPPINGS']['brief_case_details']
                 })
                 logger.warning(f"<立案 - （2.简要案情与处分决定）> - 行 {index + 2} - 简要案情 '{cleaned_excel_brief_case_details}' 与处分决定提取简要案情 '{extracted_brief_case_details}' 不一致")
@@ -812,9 +814,9 @@ def validate_filing_time_rules(row, index, excel_case_code, excel_person_code, i
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"AR{app_config['COLUMN_MAPPINGS']['filing_time']}",
-            '被比对字段': f"BG{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
-            '问题描述': f"AR{index + 2}{app_config['COLUMN_MAPPINGS']['filing_time']}与BG{index + 2}立案决定书落款时间不一致",
+            '比对字段': f"{case_col('filing_time')}{app_config['COLUMN_MAPPINGS']['filing_time']}",
+            '被比对字段': f"{case_col('filing_decision_doc')}{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
+            '问题描述': f"{case_col('filing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['filing_time']}与{case_col('filing_decision_doc')}{index + 2}立案决定书落款时间不一致",
             '列名': app_config['COLUMN_MAPPINGS']['filing_time']
         })
         logger.warning(f"<立案 - （1.立案时间与立案决定书）> - 行 {index + 2} - 立案时间 '{excel_filing_time}' 与立案决定书落款时间 '{extracted_signature_time}' 不一致")
@@ -848,9 +850,9 @@ def validate_disciplinary_committee_filing_time_rules(row, index, excel_case_cod
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"AW{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_time']}",
-            '被比对字段': f"BG{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
-            '问题描述': f"AW{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_time']}与BG{index + 2}立案决定书落款时间不一致",
+            '比对字段': f"{case_col('disciplinary_committee_filing_time')}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_time']}",
+            '被比对字段': f"{case_col('filing_decision_doc')}{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
+            '问题描述': f"{case_col('disciplinary_committee_filing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_time']}与{case_col('filing_decision_doc')}{index + 2}立案决定书落款时间不一致",
             '列名': app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_time']
         })
         logger.warning(f"<立案 - （1.纪委立案时间与立案决定书）> - 行 {index + 2} - 纪委立案时间 '{excel_disciplinary_committee_filing_time}' 与立案决定书落款时间 '{extracted_signature_time}' 不一致")
@@ -884,9 +886,9 @@ def validate_supervisory_committee_filing_time_rules(row, index, excel_case_code
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"AZ{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_time']}",
-            '被比对字段': f"BG{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
-            '问题描述': f"AZ{index + 2}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_time']}与BG{index + 2}立案决定书落款时间不一致",
+            '比对字段': f"{case_col('supervisory_committee_filing_time')}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_time']}",
+            '被比对字段': f"{case_col('filing_decision_doc')}{app_config['COLUMN_MAPPINGS']['filing_decision_doc']}",
+            '问题描述': f"{case_col('supervisory_committee_filing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_time']}与{case_col('filing_decision_doc')}{index + 2}立案决定书落款时间不一致",
             '列名': app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_time']
         })
         logger.warning(f"<立案 - （1.监委立案时间与立案决定书）> - 行 {index + 2} - 监委立案时间 '{excel_supervisory_committee_filing_time}' 与立案决定书落款时间 '{extracted_signature_time}' 不一致")
@@ -921,9 +923,9 @@ def validate_disciplinary_committee_filing_authority_rules(row, index, excel_cas
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"AV{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_authority']}",
-            '被比对字段': f"A{app_config['COLUMN_MAPPINGS']['reporting_agency']}",
-            '问题描述': f"AV{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_authority']}与A{index + 2}填报单位名称不一致",
+            '比对字段': f"{case_col('disciplinary_committee_filing_authority')}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_authority']}",
+            '被比对字段': f"{case_col('reporting_agency')}{app_config['COLUMN_MAPPINGS']['reporting_agency']}",
+            '问题描述': f"{case_col('disciplinary_committee_filing_authority')}{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_authority']}与{case_col('reporting_agency')}{index + 2}填报单位名称不一致",
             '列名': app_config['COLUMN_MAPPINGS']['disciplinary_committee_filing_authority']
         })
         logger.warning(f"<立案 - （1.纪委立案机关与填报单位名称）> - 行 {index + 2} - 纪委立案机关 '{excel_disciplinary_committee_filing_authority}' 与填报单位名称 '{excel_reporting_unit_name}' 不匹配")
@@ -958,9 +960,9 @@ def validate_supervisory_committee_filing_authority_rules(row, index, excel_case
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"AY{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_authority']}",
-            '被比对字段': f"A{app_config['COLUMN_MAPPINGS']['reporting_agency']}",
-            '问题描述': f"AY{index + 2}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_authority']}与A{index + 2}填报单位名称不一致",
+            '比对字段': f"{case_col('supervisory_committee_filing_authority')}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_authority']}",
+            '被比对字段': f"{case_col('reporting_agency')}{app_config['COLUMN_MAPPINGS']['reporting_agency']}",
+            '问题描述': f"{case_col('supervisory_committee_filing_authority')}{index + 2}{app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_authority']}与{case_col('reporting_agency')}{index + 2}填报单位名称不一致",
             '列名': app_config['COLUMN_MAPPINGS']['supervisory_committee_filing_authority']
         })
         logger.warning(f"<立案 - （1.监委立案机关与填报单位名称）> - 行 {index + 2} - 监委立案机关 '{excel_supervisory_committee_filing_authority}' 与填报单位名称 '{excel_reporting_unit_name}' 不匹配")
@@ -1002,9 +1004,9 @@ def validate_case_report_rules(row, index, excel_case_code, excel_person_code, i
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"BF{app_config['COLUMN_MAPPINGS']['case_report']}",
-                '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                '问题描述': f"BF{index + 2}{app_config['COLUMN_MAPPINGS']['case_report']}与CU{index + 2}处分决定、CY{index + 2}审理报告、CX{index + 2}审查调查报告不一致",
+                '比对字段': f"{case_col('case_report')}{app_config['COLUMN_MAPPINGS']['case_report']}",
+                '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                '问题描述': f"{case_col('case_report')}{index + 2}{app_config['COLUMN_MAPPINGS']['case_report']}与{case_col('disciplinary_decision')}{index + 2}处分决定、{case_col('trial_report')}{index + 2}审理报告、{case_col('investigation_report')}{index + 2}审查调查报告不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['case_report']
             })
             logger.warning(f"<立案 - （1.立案报告与其他报告）> - 行 {index + 2} - 立案报告中关键字与处分决定、审理报告、审查调查报告不一致")
@@ -1041,9 +1043,9 @@ def validate_central_eight_provisions_rules(row, index, excel_case_code, excel_p
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"BI{app_config['COLUMN_MAPPINGS']['central_eight_provisions']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"BI{index + 2}{app_config['COLUMN_MAPPINGS']['central_eight_provisions']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('central_eight_provisions')}{app_config['COLUMN_MAPPINGS']['central_eight_provisions']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('central_eight_provisions')}{index + 2}{app_config['COLUMN_MAPPINGS']['central_eight_provisions']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['central_eight_provisions']
         })
         logger.warning(f"<立案 - （1.是否违反中央八项规定精神与处分决定）> - 行 {index + 2} - 是否违反中央八项规定精神 '{excel_central_eight_provisions}' 与处分决定内容不一致，预期为 '{expected_central_eight_provisions}'")
@@ -1070,7 +1072,7 @@ def validate_case_report_keywords_rules(row, index, excel_case_code, excel_perso
 
         if keyword_mismatch_in_other_reports:
             case_report_keyword_mismatch_indices.add(index)
-            issues_list.append((index, excel_case_code, excel_person_code, "BF立案报告与CU处分决定、CY审理报告、CX审查调查报告不一致"))
+            issues_list.append((index, excel_case_code, excel_person_code, f"{case_col('case_report')}立案报告与{case_col('disciplinary_decision')}处分决定、{case_col('trial_report')}审理报告、{case_col('investigation_report')}审查调查报告不一致"))
             logger.warning(f"行 {index + 1} - 规则违规: 立案报告中关键字与处分决定、审理报告、审查调查报告不一致。")
             print(f"行 {index + 1} - 规则违规: 立案报告中关键字与处分决定、审理报告、审查调查报告不一致。")
         else:
@@ -1096,9 +1098,9 @@ def validate_voluntary_confession_rules(row, index, excel_case_code, excel_perso
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"BK{app_config['COLUMN_MAPPINGS']['voluntary_confession']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"BK{index + 2}{app_config['COLUMN_MAPPINGS']['voluntary_confession']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('voluntary_confession')}{app_config['COLUMN_MAPPINGS']['voluntary_confession']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('voluntary_confession')}{index + 2}{app_config['COLUMN_MAPPINGS']['voluntary_confession']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['voluntary_confession']
         })
         logger.warning(f"<立案 - （1.是否主动交代问题与审理报告）> - 行 {index + 2} - 审理报告中发现'主动交代'关键字，需要人工确认是否主动交代问题字段")
@@ -1133,9 +1135,9 @@ def validate_disciplinary_sanction_rules(row, index, excel_case_code, excel_pers
              '案件编码': excel_case_code,
              '涉案人员编码': excel_person_code,
              '行号': index + 2,
-             '比对字段': f"BO{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}",
-             '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-             '问题描述': f"BO{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}与CU{index + 2}处分决定不一致",
+             '比对字段': f"{case_col('disciplinary_sanction')}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}",
+             '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+             '问题描述': f"{case_col('disciplinary_sanction')}{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
              '列名': app_config['COLUMN_MAPPINGS']['disciplinary_sanction']
          })
         return
@@ -1168,9 +1170,9 @@ def validate_disciplinary_sanction_rules(row, index, excel_case_code, excel_pers
              '案件编码': excel_case_code,
              '涉案人员编码': excel_person_code,
              '行号': index + 2,
-             '比对字段': f"BO{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}",
-             '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-             '问题描述': f"BO{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}与CU{index + 2}处分决定不一致",
+             '比对字段': f"{case_col('disciplinary_sanction')}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}",
+             '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+             '问题描述': f"{case_col('disciplinary_sanction')}{index + 2}{app_config['COLUMN_MAPPINGS']['disciplinary_sanction']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
              '列名': app_config['COLUMN_MAPPINGS']['disciplinary_sanction']
          })
 
@@ -1191,7 +1193,6 @@ def validate_case_closing_time_rules(row, index, excel_case_code, excel_person_c
         app_config (dict): Flask 应用的配置字典。
     """
     import re
-    from datetime import datetime
     import pandas as pd
     
     logger.info(f"开始结案时间验证 - 行{index+1}: excel_closing_time='{excel_closing_time}', decision_text_raw长度={len(decision_text_raw)}")
@@ -1199,23 +1200,18 @@ def validate_case_closing_time_rules(row, index, excel_case_code, excel_person_c
     # 规则1: 结案时间与处分决定比对
     excel_closing_time_obj = None
     if pd.notna(excel_closing_time) and excel_closing_time:
-        try:
-            # 尝试将Excel中的结案时间转换为日期对象，忽略时间部分
-            if isinstance(excel_closing_time, datetime):
-                excel_closing_time_obj = excel_closing_time.date()
-            else:
-                # pd.to_datetime 可以很好地处理多种日期格式
-                excel_closing_time_obj = pd.to_datetime(excel_closing_time).date()
-        except Exception as e:
-            logger.warning(f"<立案 - （1.结案时间格式）> - 行 {index + 2} - 无法解析结案时间字段 '{excel_closing_time}': {e}")
+        # 将Excel中的结案时间转换为日期对象，忽略时间部分
+        excel_closing_time_obj = parse_date_value(excel_closing_time)
+        if excel_closing_time_obj is None:
+            logger.warning(f"<立案 - （1.结案时间格式）> - 行 {index + 2} - 无法解析结案时间字段 '{excel_closing_time}'")
             closing_time_mismatch_indices.add(index)
             issues_list.append({
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"BN{app_config['COLUMN_MAPPINGS']['closing_time']}",
-                '被比对字段': f"BN{app_config['COLUMN_MAPPINGS']['closing_time']}",
-                '问题描述': f"BN{index + 2}{app_config['COLUMN_MAPPINGS']['closing_time']}格式不正确",
+                '比对字段': f"{case_col('closing_time')}{app_config['COLUMN_MAPPINGS']['closing_time']}",
+                '被比对字段': f"{case_col('closing_time')}{app_config['COLUMN_MAPPINGS']['closing_time']}",
+                '问题描述': f"{case_col('closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['closing_time']}格式不正确",
                 '列名': app_config['COLUMN_MAPPINGS']['closing_time']
             })
             return
@@ -1226,13 +1222,12 @@ def validate_case_closing_time_rules(row, index, excel_case_code, excel_person_c
     
     if match:
         date_str = match.group(1)
-        try:
-            # 转换提取到的日期字符串为 datetime.date 对象
-            formatted_date_str = date_str.replace('年', '-').replace('月', '-').replace('日', '')
-            extracted_disposal_date = datetime.strptime(formatted_date_str, "%Y-%m-%d").date()
+        # 转换提取到的日期字符串为 datetime.date 对象
+        extracted_disposal_date = parse_chinese_date(date_str)
+        if extracted_disposal_date:
             logger.info(f"行 {index + 2} - 从处分决定中提取的生效日期: '{date_str}' (格式化后: {extracted_disposal_date})")
-        except ValueError as ve:
-            logger.warning(f"行 {index + 2} - 无法解析处分决定中提取的日期 '{date_str}': {ve}")
+        else:
+            logger.warning(f"行 {index + 2} - 无法解析处分决定中提取的日期 '{date_str}'")
     else:
         logger.info(f"行 {index + 2} - 处分决定中未找到匹配的生效日期模式")
     
@@ -1244,9 +1239,9 @@ def validate_case_closing_time_rules(row, index, excel_case_code, excel_person_c
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"BN{app_config['COLUMN_MAPPINGS']['closing_time']}",
-                '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                '问题描述': f"BN{index + 2}{app_config['COLUMN_MAPPINGS']['closing_time']}与CU{index + 2}处分决定不一致",
+                '比对字段': f"{case_col('closing_time')}{app_config['COLUMN_MAPPINGS']['closing_time']}",
+                '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                '问题描述': f"{case_col('closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['closing_time']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['closing_time']
             })
             logger.warning(f"<立案 - （1.结案时间与处分决定）> - 行 {index + 2} - 结案时间 '{excel_closing_time_obj}' 与处分决定中提取的生效日期 '{extracted_disposal_date}' 不一致")
@@ -1279,9 +1274,8 @@ def validate_no_party_position_warning_rules(row, index, excel_case_code, excel_
     decision_contains_warning = target_string in decision_text_raw
     extracted_no_party_position_warning = "是" if decision_contains_warning else "否"
     
-    # 处理 Excel 值，确保空值、NaN 或 'nan' 视为"否"
-    excel_value = str(excel_no_party_position_warning or "").strip()
-    excel_no_party_position_warning = "否" if not excel_value or excel_value.lower() == 'nan' else excel_value
+    # 空单元格（上传时已整列清洗为 ''）视为"否"
+    excel_no_party_position_warning = excel_no_party_position_warning or "否"
 
     if excel_no_party_position_warning != extracted_no_party_position_warning:
         no_party_position_warning_mismatch_indices.add(index)
@@ -1289,9 +1283,9 @@ def validate_no_party_position_warning_rules(row, index, excel_case_code, excel_
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"BP{app_config['COLUMN_MAPPINGS']['no_party_position_warning']}",
-            '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-            '问题描述': f"BP{index + 2}{app_config['COLUMN_MAPPINGS']['no_party_position_warning']}与CU{index + 2}处分决定不一致",
+            '比对字段': f"{case_col('no_party_position_warning')}{app_config['COLUMN_MAPPINGS']['no_party_position_warning']}",
+            '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+            '问题描述': f"{case_col('no_party_position_warning')}{index + 2}{app_config['COLUMN_MAPPINGS']['no_party_position_warning']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
             '列名': app_config['COLUMN_MAPPINGS']['no_party_position_warning']
         })
         logger.warning(f"<立案 - （1.BP字段与处分决定）> - 行 {index + 2} - BP字段 '{excel_no_party_position_warning}' 与处分决定提取值 '{extracted_no_party_position_warning}' 不一致")
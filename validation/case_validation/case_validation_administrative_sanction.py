@@ -1,5 +1,6 @@
 import logging
 import pandas as pd
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +34,9 @@ def validate_administrative_sanction_rules(row, index, excel_case_code, excel_pe
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"BR{app_config['COLUMN_MAPPINGS']['administrative_sanction']}",
-                '被比对字段': f"CU{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
-                '问题描述': f"BR{index + 2}{app_config['COLUMN_MAPPINGS']['administrative_sanction']}与CU{index + 2}处分决定不一致",
+                '比对字段': f"{case_col('administrative_sanction')}{app_config['COLUMN_MAPPINGS']['administrative_sanction']}",
+                '被比对字段': f"{case_col('disciplinary_decision')}{app_config['COLUMN_MAPPINGS']['disciplinary_decision']}",
+                '问题描述': f"{case_col('administrative_sanction')}{index + 2}{app_config['COLUMN_MAPPINGS']['administrative_sanction']}与{case_col('disciplinary_decision')}{index + 2}处分决定不一致",
                 '列名': app_config['COLUMN_MAPPINGS']['administrative_sanction']
             })
             logger.warning(f"<立案 - （1.政务处分验证）> - 行 {index + 2} - 政务处分 '{excel_administrative_sanction}' 与处分决定内容不一致")
\ No newline at end of file
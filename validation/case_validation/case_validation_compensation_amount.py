@@ -1,5 +1,6 @@
 import pandas as pd
 import logging
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +33,9 @@ def validate_compensation_amount_rules(row, index, excel_case_code, excel_person
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CH{app_config['COLUMN_MAPPINGS']['compensation_amount']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"CH{index + 2}{app_config['COLUMN_MAPPINGS']['compensation_amount']}与CY{index + 2}审理报告不一致",
+            '比对字段': f"{case_col('compensation_amount')}{app_config['COLUMN_MAPPINGS']['compensation_amount']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('compensation_amount')}{index + 2}{app_config['COLUMN_MAPPINGS']['compensation_amount']}与{case_col('trial_report')}{index + 2}审理报告不一致",
             '列名': app_config['COLUMN_MAPPINGS']['compensation_amount']
         })
         logger.warning(f"<立案 - （1.责令退赔金额与审理报告）> - 行 {index + 2} - 审理报告中含有责令退赔关键词，请人工再次确认责令退赔金额 '{excel_compensation_amount}'")
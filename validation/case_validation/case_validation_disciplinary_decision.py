@@ -1,5 +1,6 @@
 import logging
 import pandas as pd
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +41,9 @@ def validate_disciplinary_decision_rules(row, index, excel_case_code, excel_pers
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"CU处分决定",
-                '被比对字段': f"CU处分决定",
-                '问题描述': f"CU{index + 2}处分决定包含关键字'{keyword}'",
+                '比对字段': f"{case_col('disciplinary_decision')}处分决定",
+                '被比对字段': f"{case_col('disciplinary_decision')}处分决定",
+                '问题描述': f"{case_col('disciplinary_decision')}{index + 2}处分决定包含关键字'{keyword}'",
                 '列名': app_config['COLUMN_MAPPINGS']['disciplinary_decision']
             })
             
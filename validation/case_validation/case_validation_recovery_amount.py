@@ -1,5 +1,6 @@
 import logging
 import pandas as pd
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +28,9 @@ def validate_recovery_amount_rules(row, index, excel_case_code, excel_person_cod
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CJ{app_config['COLUMN_MAPPINGS']['recovery_amount']}",
-            '被比对字段': f"CJ{app_config['COLUMN_MAPPINGS']['recovery_amount']}",
-            '问题描述': f"CJ{index + 2}{app_config['COLUMN_MAPPINGS']['recovery_amount']}请再次确认",
+            '比对字段': f"{case_col('recovery_amount')}{app_config['COLUMN_MAPPINGS']['recovery_amount']}",
+            '被比对字段': f"{case_col('recovery_amount')}{app_config['COLUMN_MAPPINGS']['recovery_amount']}",
+            '问题描述': f"{case_col('recovery_amount')}{index + 2}{app_config['COLUMN_MAPPINGS']['recovery_amount']}请再次确认",
             '列名': app_config['COLUMN_MAPPINGS']['recovery_amount']
         })
         logger.warning(f"<立案 - （1.追缴失职渎职滥用职权造成的损失金额）> - 行 {index + 2} - 追缴失职渎职滥用职权造成的损失金额有值，请再次确认")
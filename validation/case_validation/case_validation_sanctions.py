@@ -1,7 +1,8 @@
 import logging
 import pandas as pd
 import re
-from datetime import datetime # 新增导入
+from validation.date_normalization import coerce_date_column, parse_chinese_date, parse_date_value
+from validation.row_view import iter_rows
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +51,10 @@ def validate_disposal_and_amount_rules(df, issues_list, disposal_spirit_mismatch
         logger.error(f"获取处分和金额相关列失败: {e}")
         return
 
-    for index, row in df.iterrows():
+    # 结案时间整列只解析一次
+    closing_times = coerce_date_column(df[col_closing_time]).to_dict()
+
+    for index, row in iter_rows(df):
         case_code = str(row.get(col_case_code, "")).strip()
         person_code = str(row.get(col_person_code, "")).strip()
 
@@ -79,16 +83,11 @@ def validate_disposal_and_amount_rules(df, issues_list, disposal_spirit_mismatch
 
         # --- 规则2 (新增): “结案时间”与“处分决定”中的生效日期比对 ---
         excel_closing_time_obj = None
-        if pd.notna(row.get(col_closing_time)):
-            try:
-                # 尝试将Excel中的结案时间转换为日期对象，忽略时间部分
-                if isinstance(row[col_closing_time], datetime):
-                    excel_closing_time_obj = row[col_closing_time].date()
-                else:
-                    # pd.to_datetime 可以很好地处理多种日期格式
-                    excel_closing_time_obj = pd.to_datetime(row[col_closing_time]).date()
-            except Exception as e:
-                logger.warning(f"行 {index + 1} - 无法解析 '{col_closing_time}' 字段 '{row[col_closing_time]}': {e}")
+        if pd.notna(closing_times[index]):
+            # 结案时间已在循环前整列解析，忽略时间部分
+            excel_closing_time_obj = parse_date_value(closing_times[index])
+            if excel_closing_time_obj is None:
+                logger.warning(f"行 {index + 1} - 无法解析 '{col_closing_time}' 字段 '{row[col_closing_time]}'")
 
 
         # 使用正则表达式查找并提取日期
@@ -101,14 +100,12 @@ def validate_disposal_and_amount_rules(df, issues_list, disposal_spirit_mismatch
 
         if match:
             date_str = match.group(1)
-            try:
-                # 转换提取到的日期字符串为 datetime.date 对象
-                # 替换“年”、“月”、“日”以便于datetime解析
-                formatted_date_str = date_str.replace('年', '-').replace('月', '-').replace('日', '')
-                extracted_disposal_date = datetime.strptime(formatted_date_str, "%Y-%m-%d").date()
+            # 转换提取到的日期字符串为 datetime.date 对象
+            extracted_disposal_date = parse_chinese_date(date_str)
+            if extracted_disposal_date:
                 logger.info(f"行 {index + 1} - 从处分决定中提取的生效日期: '{date_str}' (格式化后: {extracted_disposal_date})")
-            except ValueError as ve:
-                logger.warning(f"行 {index + 1} - 无法解析处分决定中提取的日期 '{date_str}': {ve}")
+            else:
+                logger.warning(f"行 {index + 1} - 无法解析处分决定中提取的日期 '{date_str}'")
         else:
             logger.info(f"行 {index + 1} - 处分决定中未找到匹配的生效日期模式。")
 
@@ -165,7 +162,7 @@ def validate_disciplinary_sanction(df, issues_list, app_config):
         logger.warning(f"DataFrame 中缺少必需字段 {missing_cols}，跳过党纪处分校验。")
         return disciplinary_sanction_mismatch_indices
 
-    for index, row in df.iterrows():
+    for index, row in iter_rows(df):
         disciplinary_sanction = str(row.get(disciplinary_sanction_col, "")).strip() if pd.notna(row.get(disciplinary_sanction_col)) else ""
         disposal_decision = str(row.get(disposal_decision_col, "")).strip() if pd.notna(row.get(disposal_decision_col)) else ""
         party_member_status = str(row.get(party_member_col, "")).strip() if pd.notna(row.get(party_member_col)) else ""
@@ -247,7 +244,7 @@ def validate_administrative_sanction(df, issues_list, app_config):
         logger.warning(f"DataFrame 中缺少必需字段 {missing_cols}，跳过政务处分校验。")
         return administrative_sanction_mismatch_indices
 
-    for index, row in df.iterrows():
+    for index, row in iter_rows(df):
         administrative_sanction = str(row.get(administrative_sanction_col, "")).strip() if pd.notna(row.get(administrative_sanction_col)) else ""
         disposal_decision = str(row.get(disposal_decision_col, "")).strip() if pd.notna(row.get(disposal_decision_col)) else ""
         
@@ -2,7 +2,8 @@ import logging
 import pandas as pd
 from datetime import datetime
 import re
-from .case_document_validators import parse_chinese_date
+from validation.date_normalization import parse_chinese_date, parse_date_value
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +34,16 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
         if isinstance(excel_trial_acceptance_time, datetime):
             excel_date_obj = excel_trial_acceptance_time.date()
         elif isinstance(excel_trial_acceptance_time, str):
-            try:
-                excel_date_obj = pd.to_datetime(excel_trial_acceptance_time).date()
-            except ValueError:
+            excel_date_obj = parse_date_value(excel_trial_acceptance_time)
+            if excel_date_obj is None:
                 trial_acceptance_time_mismatch_indices.add(index)
                 issues_list.append({
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-                    '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                    '问题描述': f"CP{index + 2}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}格式不正确",
+                    '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+                    '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                    '问题描述': f"{case_col('trial_acceptance_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}格式不正确",
                     '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
                 })
                 logger.warning(f"<立案 - （1.审理受理时间格式）> - 行 {index + 2} - 审理受理时间 '{excel_trial_acceptance_time}' 格式不正确")
@@ -65,9 +65,9 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
                             '案件编码': excel_case_code,
                             '涉案人员编码': excel_person_code,
                             '行号': index + 2,
-                            '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-                    '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                    '问题描述': f"CP{index + 2}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}与CY{index + 2}审理报告不一致",
+                            '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+                    '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                    '问题描述': f"{case_col('trial_acceptance_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}与{case_col('trial_report')}{index + 2}审理报告不一致",
                             '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
                         })
                         logger.warning(f"<立案 - （1.审理受理时间与审理报告）> - 行 {index + 2} - 审理受理时间 '{excel_date_obj}' 与审理报告时间 '{extracted_date_obj}' 不一致")
@@ -79,9 +79,9 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
                         '案件编码': excel_case_code,
                         '涉案人员编码': excel_person_code,
                         '行号': index + 2,
-                        '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-                        '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                        '问题描述': f"CY{index + 2}审理报告中审理受理时间格式不正确或未找到",
+                        '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+                        '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                        '问题描述': f"{case_col('trial_report')}{index + 2}审理报告中审理受理时间格式不正确或未找到",
                         '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
                     })
                     logger.warning(f"<立案 - （1.审理受理时间与审理报告）> - 行 {index + 2} - 审理报告中提取的日期 '{extracted_date_str}' 无法解析")
@@ -91,9 +91,9 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-                    '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                    '问题描述': f"CY{index + 2}审理报告中未找到审理受理时间相关内容",
+                    '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+                    '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                    '问题描述': f"{case_col('trial_report')}{index + 2}审理报告中未找到审理受理时间相关内容",
                     '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
                 })
                 logger.warning(f"<立案 - （1.审理受理时间与审理报告）> - 行 {index + 2} - 审理报告中未找到匹配的日期字符串")
@@ -103,9 +103,9 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"CP{index + 2}审理受理时间有值但CY{index + 2}审理报告为空，无法比对",
+            '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('trial_acceptance_time')}{index + 2}审理受理时间有值但{case_col('trial_report')}{index + 2}审理报告为空，无法比对",
             '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
         })
         logger.warning(f"<立案 - （1.审理受理时间与审理报告）> - 行 {index + 2} - 审理受理时间有值但审理报告为空，无法比对")
@@ -115,9 +115,9 @@ def validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_pers
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CP{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"CP{index + 2}审理受理时间为空但CY{index + 2}审理报告有值，无法比对",
+            '比对字段': f"{case_col('trial_acceptance_time')}{app_config['COLUMN_MAPPINGS']['trial_acceptance_time']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('trial_acceptance_time')}{index + 2}审理受理时间为空但{case_col('trial_report')}{index + 2}审理报告有值，无法比对",
             '列名': app_config['COLUMN_MAPPINGS']['trial_acceptance_time']
         })
         logger.warning(f"<立案 - （1.审理受理时间与审理报告）> - 行 {index + 2} - 审理受理时间为空但审理报告有值，无法比对")
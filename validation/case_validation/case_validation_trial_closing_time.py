@@ -2,7 +2,9 @@ import logging
 import pandas as pd
 import re
 from datetime import datetime
-from .case_document_validators import parse_chinese_date
+from validation.date_normalization import parse_chinese_date, parse_date_value
+from validation.document_sections import segment_document
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +35,16 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
         if isinstance(excel_trial_closing_time, datetime):
             excel_closing_date_obj = excel_trial_closing_time.date()
         elif isinstance(excel_trial_closing_time, str):
-            try:
-                excel_closing_date_obj = pd.to_datetime(excel_trial_closing_time).date()
-            except ValueError:
+            excel_closing_date_obj = parse_date_value(excel_trial_closing_time)
+            if excel_closing_date_obj is None:
                 trial_closing_time_mismatch_indices.add(index)
                 issues_list.append({
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-                    '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                    '问题描述': f"CS{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}格式不正确",
+                    '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+                    '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                    '问题描述': f"{case_col('trial_closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}格式不正确",
                     '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
                 })
                 logger.warning(f"<立案 - （审结时间格式）> - 行 {index + 2} - 审结时间 '{excel_trial_closing_time}' 格式不正确")
@@ -51,9 +52,8 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
         
         if excel_closing_date_obj:
             # 从审理报告最后一行提取落款时间
-            lines = trial_text_raw.strip().split('\n')
-            if lines:
-                last_line = lines[-1].strip()
+            last_line = segment_document(trial_text_raw).last_line()
+            if last_line is not None:
                 date_match = re.search(r'(\d{4}年\d{1,2}月\d{1,2}日)', last_line)
                 if date_match:
                     extracted_closing_date_str = date_match.group(1)
@@ -66,9 +66,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
                                 '案件编码': excel_case_code,
                                 '涉案人员编码': excel_person_code,
                                 '行号': index + 2,
-                                '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-                                '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                                '问题描述': f"CS{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}与CY{index + 2}审理报告不一致",
+                                '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+                                '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                                '问题描述': f"{case_col('trial_closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}与{case_col('trial_report')}{index + 2}审理报告不一致",
                                 '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
                             })
                             logger.warning(f"<立案 - （审结时间与审理报告）> - 行 {index + 2} - 审结时间 '{excel_closing_date_obj}' 与审理报告落款时间 '{extracted_closing_date_obj}' 不一致")
@@ -80,9 +80,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
                             '案件编码': excel_case_code,
                             '涉案人员编码': excel_person_code,
                             '行号': index + 2,
-                            '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-                            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                            '问题描述': f"CY{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}落款时间格式不正确或未找到",
+                            '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+                            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                            '问题描述': f"{case_col('trial_report')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}落款时间格式不正确或未找到",
                             '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
                         })
                         logger.warning(f"<立案 - （审理报告落款时间格式）> - 行 {index + 2} - 从审理报告最后一行 '{last_line}' 中提取的日期 '{extracted_closing_date_str}' 无法解析")
@@ -92,9 +92,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
                         '案件编码': excel_case_code,
                         '涉案人员编码': excel_person_code,
                         '行号': index + 2,
-                        '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-                        '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                        '问题描述': f"CY{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}落款时间未找到",
+                        '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+                        '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                        '问题描述': f"{case_col('trial_report')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}落款时间未找到",
                         '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
                     })
                     logger.warning(f"<立案 - （审理报告落款时间未找到）> - 行 {index + 2} - 审理报告最后一行 '{last_line}' 未找到日期格式")
@@ -104,9 +104,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
                     '案件编码': excel_case_code,
                     '涉案人员编码': excel_person_code,
                     '行号': index + 2,
-                    '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-                    '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                    '问题描述': f"CY{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}为空，无法比对审结时间",
+                    '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+                    '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                    '问题描述': f"{case_col('trial_report')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}为空，无法比对审结时间",
                     '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
                 })
                 logger.warning(f"<立案 - （审理报告为空）> - 行 {index + 2} - 审理报告为空，无法提取落款时间")
@@ -117,9 +117,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"CS{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}有值但CY{index + 2}审理报告为空，无法比对",
+            '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('trial_closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}有值但{case_col('trial_report')}{index + 2}审理报告为空，无法比对",
             '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
         })
         logger.warning(f"<立案 - （审结时间有值但审理报告为空）> - 行 {index + 2} - 审结时间有值但审理报告为空，无法比对")
@@ -130,9 +130,9 @@ def validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_
             '案件编码': excel_case_code,
             '涉案人员编码': excel_person_code,
             '行号': index + 2,
-            '比对字段': f"CS{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
-            '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-            '问题描述': f"CS{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}为空但CY{index + 2}审理报告有值，无法比对",
+            '比对字段': f"{case_col('trial_closing_time')}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}",
+            '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+            '问题描述': f"{case_col('trial_closing_time')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_closing_time']}为空但{case_col('trial_report')}{index + 2}审理报告有值，无法比对",
             '列名': app_config['COLUMN_MAPPINGS']['trial_closing_time']
         })
         logger.warning(f"<立案 - （审结时间为空但审理报告有值）> - 行 {index + 2} - 审结时间为空但审理报告有值，无法比对")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+from validation.header_map import case_col
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +39,9 @@ def validate_trial_report_rules(row, index, excel_case_code, excel_person_code,
                 '案件编码': excel_case_code,
                 '涉案人员编码': excel_person_code,
                 '行号': index + 2,
-                '比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                '被比对字段': f"CY{app_config['COLUMN_MAPPINGS']['trial_report']}",
-                '问题描述': f"CY{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}审理报告包含关键词",
+                '比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                '被比对字段': f"{case_col('trial_report')}{app_config['COLUMN_MAPPINGS']['trial_report']}",
+                '问题描述': f"{case_col('trial_report')}{index + 2}{app_config['COLUMN_MAPPINGS']['trial_report']}审理报告包含关键词",
                 '列名': app_config['COLUMN_MAPPINGS']['trial_report']
             })
             logger.warning(f"<立案 - （1.审理报告关键词检查）> - 行 {index + 2} - 审理报告中包含关键词: {', '.join(found_keywords)}")
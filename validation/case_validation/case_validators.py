@@ -1,68 +1,20 @@
 import logging
-import pandas as pd
-from datetime import datetime
-from config import Config # 导入Config
-import re
-import logging
 from db_utils import get_authority_agency_dict
-
-# 从 case_validation_helpers 导入核心验证函数
-# from .case_validation_helpers import ()  # 当前无需导入
-
-# 从 case_validation_extended 导入扩展验证函数
-# from .case_validation_extended import ()  # 当前无需导入
-
-# 从 case_validation_additional 导入额外验证函数
-from .case_validation_additional import (
-    validate_education_rules,
-    validate_ethnicity_rules,
-    validate_party_member_rules,
-    validate_name_rules,
-    validate_gender_rules,
-    validate_age_rules,
-    validate_birth_date_rules,
-    validate_party_joining_date_rules,
-    validate_brief_case_details_rules,
-    validate_case_report_keywords_rules,
-    validate_voluntary_confession_rules,
-    validate_disciplinary_sanction_rules,
-    validate_case_closing_time_rules,
-    validate_no_party_position_warning_rules
-)
+from validation.header_map import use_header_map
+from validation.regex_guard import use_extraction_guard
+from validation.issue_order import sort_issues_by_row
 
 # 导入立案时间规则
-from .case_timestamp_rules import (
-    validate_filing_time,
-    validate_registered_handover_amount,
-    validate_registered_handover_amount_single_row
-)
-# 导入处分和金额相关规则
-from .case_disposal_amount_rules import validate_disposal_and_amount_rules
-
-# 【党纪处分功能新增】: 导入党纪处分验证函数
-from .case_validation_sanctions import validate_disciplinary_sanction
+from .case_timestamp_rules import validate_filing_time
 
-# 导入新拆分的文件中的验证函数
-from .case_document_validators import (
-    # validate_trial_acceptance_time_vs_report,  # 已被新的审理受理时间验证规则替代
-    # validate_trial_closing_time_vs_report,  # 已被新的审结时间验证规则替代
-    # validate_trial_authority_vs_reporting_agency, # 已被新的审理机关验证规则替代
-    validate_disposal_decision_keywords,
-    validate_trial_report_keywords,
-    # highlight_recovery_amount  # 已被新的追缴失职渎职滥用职权造成的损失金额验证规则替代
+# 逐行规则统一在规则注册表中声明，由执行计划去重、跳过缺列规则并在一次遍历中执行
+from .case_rule_registry import (
+    build_case_rule_plan,
+    run_case_rule_plan,
+    default_shared_data
 )
-
-# 导入金额验证函数
-from .case_validation_confiscation_amount import validate_confiscation_amount_rules
-from .case_validation_confiscation_of_property_amount import validate_confiscation_of_property_amount_rules
-from .case_validation_compensation_amount import validate_compensation_amount_rules
-from .case_validation_trial_acceptance_time import validate_trial_acceptance_time_rules
-from .case_validation_recovery_amount import validate_recovery_amount_rules
-from .case_validation_trial_closing_time import validate_trial_closing_time_rules
-from .case_validation_trial_authority import validate_trial_authority_rules
-from .case_validation_trial_report import validate_trial_report_rules
-from .case_validation_disciplinary_decision import validate_disciplinary_decision_rules
-from .case_validation_administrative_sanction import validate_administrative_sanction_rules
+from .case_parallel import run_case_rule_plan_parallel
+from .case_result_matrix import CASE_RULE_IDS, CaseResultMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -76,46 +28,9 @@ def validate_case_relationships(df, app_config, issues_list):
         issues_list (list): 用于收集所有发现问题的列表，每个问题是一个字典或元组。
 
     返回:
-        tuple: 包含多个不一致索引集合和更新后的 issues_list。
-               返回顺序与 file_processor.py 中接收的顺序一致。
+        tuple: (results, issues_list)，results 为 CaseResultMatrix（行 × 规则的命中矩阵）。
     """
-    mismatch_indices = set()
-    gender_mismatch_indices = set()
-    age_mismatch_indices = set()
-    brief_case_details_mismatch_indices = set()
-    birth_date_mismatch_indices = set()
-    education_mismatch_indices = set()
-    ethnicity_mismatch_indices = set()
-    party_member_mismatch_indices = set()
-    party_joining_date_mismatch_indices = set()
-    filing_time_mismatch_indices = set()
-    disciplinary_committee_filing_time_mismatch_indices = set()
-    disciplinary_committee_filing_authority_mismatch_indices = set()
-    supervisory_committee_filing_time_mismatch_indices = set()
-    supervisory_committee_filing_authority_mismatch_indices = set()
-    case_report_keyword_mismatch_indices = set()
-    disposal_spirit_mismatch_indices = set()
-    voluntary_confession_highlight_indices = set()
-    closing_time_mismatch_indices = set()
-    no_party_position_warning_mismatch_indices = set()
-    recovery_amount_highlight_indices = set()
-    trial_acceptance_time_mismatch_indices = set()
-    trial_closing_time_mismatch_indices = set()
-    trial_authority_agency_mismatch_indices = set()
-    disposal_decision_keyword_mismatch_indices = set()
-    
-    # --- START OF NEW RULE ADDITION ---
-    # New sets for trial report validation
-    trial_report_non_representative_mismatch_indices = set()
-    trial_report_detention_mismatch_indices = set()
-    confiscation_amount_indices = set()
-    confiscation_of_property_amount_indices = set()
-    compensation_amount_highlight_indices = set()
-    registered_handover_amount_indices = set()
-    # 【党纪处分功能新增】: 初始化党纪处分相关的索引集合
-    disciplinary_sanction_mismatch_indices = set()
-    administrative_sanction_mismatch_indices = set() # 初始化政务处分不匹配索引
-    # --- END OF NEW RULE ADDITION ---
+    result_sets = {rule_id: set() for rule_id in CASE_RULE_IDS}
 
     # issues_list 不再在这里初始化，而是作为参数传入并直接修改
 
@@ -147,237 +62,41 @@ def validate_case_relationships(df, app_config, issues_list):
     # 过滤掉 None 值，因为 get() 可能返回 None
     required_headers = [h for h in required_headers if h is not None]
 
-    if not all(header in df.columns for header in required_headers):
-        missing_headers = [header for header in required_headers if header not in df.columns]
+    missing_headers = [header for header in required_headers if header not in df.columns]
+    core_headers = [app_config['COLUMN_MAPPINGS'][key] for key in ("investigated_person", "case_code", "person_code")]
+    if any(header in missing_headers for header in core_headers):
         msg = f"缺少必要的表头: {missing_headers}"
         logger.error(msg)
-        # Ensure all new sets are returned even if headers are missing
-        return (mismatch_indices, gender_mismatch_indices, age_mismatch_indices, brief_case_details_mismatch_indices, issues_list,
-                        birth_date_mismatch_indices, education_mismatch_indices, ethnicity_mismatch_indices,
-                        party_member_mismatch_indices, party_joining_date_mismatch_indices, filing_time_mismatch_indices,
-                        disciplinary_committee_filing_time_mismatch_indices, disciplinary_committee_filing_authority_mismatch_indices,
-                        supervisory_committee_filing_time_mismatch_indices, supervisory_committee_filing_authority_mismatch_indices,
-                        case_report_keyword_mismatch_indices, disposal_spirit_mismatch_indices, voluntary_confession_highlight_indices,
-                        closing_time_mismatch_indices, no_party_position_warning_mismatch_indices,
-                        recovery_amount_highlight_indices, trial_acceptance_time_mismatch_indices,
-                        trial_closing_time_mismatch_indices, trial_authority_agency_mismatch_indices,
-                        disposal_decision_keyword_mismatch_indices,
-                        trial_report_non_representative_mismatch_indices,
-                        trial_report_detention_mismatch_indices,
-                        confiscation_amount_indices,
-                        confiscation_of_property_amount_indices,
-                        compensation_amount_highlight_indices,
-                        registered_handover_amount_indices,
-                        disciplinary_sanction_mismatch_indices,
-                        administrative_sanction_mismatch_indices) # 确保这里也返回 administrative_sanction_mismatch_indices
-
-    current_year = datetime.now().year
-
-    # 使用 app_config 获取配置，而不是直接使用 Config
-    # 原始代码中 case_report_keywords_to_check 是硬编码的，但其内容与 Config.DISPOSAL_DECISION_KEYWORDS 相同。
-    # 因此，这里改为从 app_config 获取，以保持一致性。
-    case_report_keywords_to_check = app_config['DISPOSAL_DECISION_KEYWORDS']
-    
-    # 从数据库获取机关单位字典数据
-    authority_agency_db_data = get_authority_agency_dict()
-    # 将数据库查询结果转换为更易于查找的列表，只包含SL类别的
-    sl_authority_agency_mappings = []
-    for record_raw in authority_agency_db_data:
-        record = record_raw # record_raw 已经是字典
-        if record['category'] == 'SL':
-            sl_authority_agency_mappings.append({
-                'authority': record['authority'],
-                'agency': record['agency']
-            })
-
-    # 遍历DataFrame的每一行
-    for index, row in df.iterrows():
-        logger.debug(f"Processing row {index + 1}")
-
-        investigated_person = str(row.get(app_config['COLUMN_MAPPINGS']["investigated_person"], "")).strip()
-        if not investigated_person:
-            logger.info(f"行 {index + 1} - '{app_config['COLUMN_MAPPINGS']['investigated_person']}' 字段为空，跳过此行验证。")
-            continue
-
-        excel_voluntary_confession = str(row.get(app_config['COLUMN_MAPPINGS']["voluntary_confession"], "")).strip()
-        excel_gender = str(row.get(app_config['COLUMN_MAPPINGS']["gender"], "")).strip()
-        
-        excel_age = None
-        if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["age"])):
-            try:
-                excel_age = int(row.get(app_config['COLUMN_MAPPINGS']["age"]))
-            except ValueError:
-                logger.warning(f"行 {index + 1} - Excel '{app_config['COLUMN_MAPPINGS']['age']}' 字段 '{row.get(app_config['COLUMN_MAPPINGS']['age'])}' 不是有效数字。")
-                age_mismatch_indices.add(index)
-                issues_list.append((index, row.get(app_config['COLUMN_MAPPINGS']["case_code"], ""), row.get(app_config['COLUMN_MAPPINGS']["person_code"], ""), "N2年龄字段格式不正确", "高")) # 增加风险等级
-
-        excel_brief_case_details = str(row.get(app_config['COLUMN_MAPPINGS']["brief_case_details"], "")).strip()
-        excel_birth_date = str(row.get(app_config['COLUMN_MAPPINGS']["birth_date"], "")).strip()
-        excel_education = str(row.get(app_config['COLUMN_MAPPINGS']["education"], "")).strip()
-        excel_ethnicity = str(row.get(app_config['COLUMN_MAPPINGS']["ethnicity"], "")).strip()
-        excel_party_member = str(row.get(app_config['COLUMN_MAPPINGS']["party_member"], "")).strip()
-        excel_party_joining_date = str(row.get(app_config['COLUMN_MAPPINGS']["party_joining_date"], "")).strip()
-        excel_no_party_position_warning = str(row.get(app_config['COLUMN_MAPPINGS']["no_party_position_warning"], "")).strip()
-        
-        # 将原始数据传递给新的验证函数，而不是在这里处理逻辑
-        excel_trial_acceptance_time = row.get(app_config['COLUMN_MAPPINGS']["trial_acceptance_time"])
-        excel_trial_closing_time = row.get(app_config['COLUMN_MAPPINGS']["trial_closing_time"])
-        excel_trial_authority = str(row.get(app_config['COLUMN_MAPPINGS']["trial_authority"], "")).strip()
-        excel_reporting_agency = str(row.get(app_config['COLUMN_MAPPINGS']["reporting_agency"], "")).strip()
-
-        excel_case_code = str(row.get(app_config['COLUMN_MAPPINGS']["case_code"], "")).strip()
-        excel_person_code = str(row.get(app_config['COLUMN_MAPPINGS']["person_code"], "")).strip()
-
-        report_text_raw = row.get(app_config['COLUMN_MAPPINGS']["case_report"], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["case_report"])) else ''
-        decision_text_raw = row.get(app_config['COLUMN_MAPPINGS']["disciplinary_decision"], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["disciplinary_decision"])) else ''
-        investigation_text_raw = row.get(app_config['COLUMN_MAPPINGS']["investigation_report"], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["investigation_report"])) else ''
-        trial_text_raw = row.get(app_config['COLUMN_MAPPINGS']["trial_report"], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["trial_report"])) else ''
-        filing_decision_doc_raw = row.get(app_config['COLUMN_MAPPINGS']["filing_decision_doc"], "") if pd.notna(row.get(app_config['COLUMN_MAPPINGS']["filing_decision_doc"])) else ''
-        
-        # --- 调用辅助函数进行验证 ---
-        # 传递 app_config 给可能需要它的辅助函数
-        validate_gender_rules(row, index, excel_case_code, excel_person_code, issues_list, gender_mismatch_indices,
-                              excel_gender, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_age_rules(row, index, excel_case_code, excel_person_code, issues_list, age_mismatch_indices,
-                           excel_age, current_year, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_brief_case_details_rules(row, index, excel_case_code, excel_person_code, issues_list, brief_case_details_mismatch_indices,
-                                          excel_brief_case_details, investigated_person, report_text_raw, decision_text_raw, app_config)
-
-        validate_birth_date_rules(row, index, excel_case_code, excel_person_code, issues_list, birth_date_mismatch_indices,
-                                  excel_birth_date, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_education_rules(row, index, excel_case_code, excel_person_code, issues_list, education_mismatch_indices,
-                                 excel_education, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_ethnicity_rules(row, index, excel_case_code, excel_person_code, issues_list, ethnicity_mismatch_indices,
-                                 excel_ethnicity, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_party_member_rules(row, index, excel_case_code, excel_person_code, issues_list, party_member_mismatch_indices,
-                                    excel_party_member, report_text_raw, decision_text_raw, app_config)
-
-        validate_party_joining_date_rules(row, index, excel_case_code, excel_person_code, issues_list, party_joining_date_mismatch_indices,
-                                          excel_party_member, excel_party_joining_date, report_text_raw, app_config)
-
-        validate_name_rules(row, index, excel_case_code, excel_person_code, issues_list, mismatch_indices,
-                            investigated_person, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-
-        validate_case_report_keywords_rules(row, index, excel_case_code, excel_person_code, issues_list, case_report_keyword_mismatch_indices,
-                                            case_report_keywords_to_check, report_text_raw, decision_text_raw, investigation_text_raw, trial_text_raw, app_config)
-        
-        validate_voluntary_confession_rules(row, index, excel_case_code, excel_person_code, issues_list, voluntary_confession_highlight_indices,
-                                            excel_voluntary_confession, trial_text_raw, app_config)
-
-        # 结案时间验证规则
-        excel_closing_time = row.get(app_config['COLUMN_MAPPINGS']["closing_time"])
-        validate_case_closing_time_rules(row, index, excel_case_code, excel_person_code, issues_list, closing_time_mismatch_indices,
-                                        excel_closing_time, decision_text_raw, app_config)
-
-        # 党纪处分验证规则
-        excel_disciplinary_sanction = row.get(app_config['COLUMN_MAPPINGS']["disciplinary_sanction"])
-        validate_disciplinary_sanction_rules(row, index, excel_case_code, excel_person_code, issues_list, disciplinary_sanction_mismatch_indices,
-                                            excel_disciplinary_sanction, decision_text_raw, app_config)
-
-        # 是否属于本应撤销党内职务验证规则
-        excel_no_party_position_warning = row.get(app_config['COLUMN_MAPPINGS']["no_party_position_warning"])
-        validate_no_party_position_warning_rules(row, index, excel_case_code, excel_person_code, issues_list, no_party_position_warning_mismatch_indices,
-                                                 excel_no_party_position_warning, decision_text_raw, app_config)
-
-        # 调用新拆分的函数来处理这些特定验证
-        # highlight_recovery_amount 已被新的追缴失职渎职滥用职权造成的损失金额验证规则替代
-        # validate_trial_acceptance_time_vs_report 已被新的审理受理时间验证规则替代
-        # validate_trial_closing_time_vs_report 已被新的审结时间验证规则替代
-        # validate_trial_authority_vs_reporting_agency 已被新的审理机关验证规则替代
-        validate_disposal_decision_keywords(row, index, excel_case_code, excel_person_code, issues_list, disposal_decision_keyword_mismatch_indices, app_config)
-        validate_trial_report_keywords(row, index, excel_case_code, excel_person_code, issues_list, 
-                                       trial_report_non_representative_mismatch_indices, 
-                                       trial_report_detention_mismatch_indices, 
-                                       compensation_amount_highlight_indices, app_config)
-        
-        # 处分决定验证规则
-        excel_disciplinary_decision = str(row.get(app_config['COLUMN_MAPPINGS']['disciplinary_decision'], '')).strip()
-        disciplinary_decision_mismatch_indices = set()
-        validate_disciplinary_decision_rules(row, index, excel_case_code, excel_person_code, issues_list, disciplinary_decision_mismatch_indices,
-                                            excel_disciplinary_decision, app_config)
-        
-        # 收缴金额验证规则
-        excel_confiscation_amount = str(row.get(app_config['COLUMN_MAPPINGS']['confiscation_amount'], '')).strip()
-        validate_confiscation_amount_rules(row, index, excel_case_code, excel_person_code, issues_list, confiscation_amount_indices,
-                                         excel_confiscation_amount, trial_text_raw, app_config)
-        
-        # 没收金额验证规则
-        excel_confiscation_of_property_amount = str(row.get(app_config['COLUMN_MAPPINGS']['confiscation_of_property_amount'], '')).strip()
-        validate_confiscation_of_property_amount_rules(row, index, excel_case_code, excel_person_code, issues_list, confiscation_of_property_amount_indices,
-                                                      excel_confiscation_of_property_amount, trial_text_raw, app_config)
-        
-        # 责令退赔金额验证规则（已在 validate_trial_report_keywords 中处理，这里不重复调用）
-        
-        # 追缴失职渎职滥用职权造成的损失金额验证规则
-        excel_recovery_amount = row.get(app_config['COLUMN_MAPPINGS']['recovery_amount'])
-        validate_recovery_amount_rules(row, index, excel_case_code, excel_person_code, issues_list, recovery_amount_highlight_indices,
-                                     excel_recovery_amount, app_config)
-        
-        # 审理受理时间验证规则
-        excel_trial_acceptance_time = row.get(app_config['COLUMN_MAPPINGS']['trial_acceptance_time'])
-        validate_trial_acceptance_time_rules(row, index, excel_case_code, excel_person_code, issues_list, trial_acceptance_time_mismatch_indices,
-                                            excel_trial_acceptance_time, trial_text_raw, app_config)
-        
-        # 审理机关验证规则
-        excel_trial_authority = str(row.get(app_config['COLUMN_MAPPINGS']['trial_authority'], '')).strip()
-        excel_reporting_agency = str(row.get(app_config['COLUMN_MAPPINGS']['reporting_agency'], '')).strip()
-        trial_authority_mismatch_indices = set()
-        validate_trial_authority_rules(row, index, excel_case_code, excel_person_code, issues_list, trial_authority_mismatch_indices,
-                                     excel_trial_authority, excel_reporting_agency, sl_authority_agency_mappings, app_config)
-        
-        # 审结时间验证规则
-        excel_trial_closing_time = row.get(app_config['COLUMN_MAPPINGS']['trial_closing_time'])
-        validate_trial_closing_time_rules(row, index, excel_case_code, excel_person_code, issues_list, trial_closing_time_mismatch_indices,
-                                         excel_trial_closing_time, trial_text_raw, app_config)
-        
-        # 审理报告验证规则
-        trial_report_mismatch_indices = set()
-        validate_trial_report_rules(row, index, excel_case_code, excel_person_code, issues_list, trial_report_mismatch_indices,
-                                   trial_text_raw, app_config)
-        
-        # 登记上交金额验证规则
-        validate_registered_handover_amount_single_row(row, index, excel_case_code, excel_person_code, issues_list, registered_handover_amount_indices, app_config)
-        
-        # 政务处分验证规则
-        excel_administrative_sanction = row.get(app_config['COLUMN_MAPPINGS']["administrative_sanction"])
-        validate_administrative_sanction_rules(row, index, excel_case_code, excel_person_code, issues_list, administrative_sanction_mismatch_indices,
-                                              excel_administrative_sanction, decision_text_raw, app_config)
-
-    # 调用立案时间规则验证函数
-    validate_filing_time(df, issues_list, app_config)
-
-    # 调用处分和金额相关规则验证函数
-    validate_disposal_and_amount_rules(df, issues_list, disposal_spirit_mismatch_indices, closing_time_mismatch_indices, app_config)
-
-    # 注意：没收金额验证已移至逐行验证中，使用 validate_confiscation_of_property_amount_rules 函数
-    # 注意：收缴金额验证已移至逐行验证中，使用 validate_confiscation_amount_rules 函数
-    # 注意：登记上交金额验证已移至逐行验证中，使用 validate_registered_handover_amount_single_row 函数
-
-    # 注意：党纪处分验证已移至逐行验证中，使用 validate_disciplinary_sanction_rules 函数
-
-    # 注意：政务处分验证已移至逐行验证中，使用 validate_administrative_sanction_rules 函数
-
-    # 返回所有可能的不一致索引集以及更新后的 issues_list
-    return (mismatch_indices, gender_mismatch_indices, age_mismatch_indices, brief_case_details_mismatch_indices, issues_list,
-            birth_date_mismatch_indices, education_mismatch_indices, ethnicity_mismatch_indices,
-            party_member_mismatch_indices, party_joining_date_mismatch_indices, filing_time_mismatch_indices,
-            disciplinary_committee_filing_time_mismatch_indices, disciplinary_committee_filing_authority_mismatch_indices,
-            supervisory_committee_filing_time_mismatch_indices, supervisory_committee_filing_authority_mismatch_indices,
-            case_report_keyword_mismatch_indices, disposal_spirit_mismatch_indices, voluntary_confession_highlight_indices,
-            closing_time_mismatch_indices, no_party_position_warning_mismatch_indices,
-            recovery_amount_highlight_indices, trial_acceptance_time_mismatch_indices,
-            trial_closing_time_mismatch_indices, trial_authority_agency_mismatch_indices,
-            disposal_decision_keyword_mismatch_indices,
-            trial_report_non_representative_mismatch_indices,
-            trial_report_detention_mismatch_indices,
-            confiscation_amount_indices,
-            confiscation_of_property_amount_indices,
-            compensation_amount_highlight_indices,
-            registered_handover_amount_indices,
-            disciplinary_sanction_mismatch_indices,
-            administrative_sanction_mismatch_indices) # 确保这里返回 administrative_sanction_mismatch_indices
+        return CaseResultMatrix.from_sets(df.index, result_sets), issues_list
+    if missing_headers:
+        # 其他列缺失时只跳过依赖这些列的规则
+        logger.warning(f"缺少部分表头: {missing_headers}，相关规则将被跳过")
+
+    # 生成执行计划：跳过缺列规则、去掉重复检查（如结案时间与处分决定只比对一次）
+    plan = build_case_rule_plan(df.columns, app_config)
+
+    # 从数据库获取机关单位字典数据，与当前年份、关键词等一起供整次上传的规则共享
+    shared = default_shared_data(app_config, get_authority_agency_dict())
+
+    # 表头映射每次上传只计算一次，问题描述中的列字母按实际表头位置生成；
+    # 文书提取在配置的搜索窗口内执行，超过时间预算的提取按行号记录
+    start = len(issues_list)
+    with use_header_map(df.columns, app_config['COLUMN_MAPPINGS'], 'case'), use_extraction_guard(app_config, 'case'):
+        # 一次遍历 DataFrame，逐行执行计划内的全部规则；行数较多且配置了校验进程时分区并行执行
+        if (app_config.get('VALIDATION_WORKER_PROCESSES', 0) > 0
+                and len(df) >= app_config.get('VALIDATION_PARALLEL_MIN_ROWS', 0)):
+            run_case_rule_plan_parallel(df, plan, app_config, issues_list, result_sets, shared)
+        else:
+            run_case_rule_plan(df, plan, app_config, issues_list, result_sets, shared)
+
+        # 调用立案时间规则验证函数
+        validate_filing_time(df, issues_list, app_config)
+
+    # 本次发现的问题按行排列（同一行内保持规则顺序），增量、并行和分块校验的合并结果与此一致
+    sort_issues_by_row(issues_list, start)
+
+    # 注意：处分和金额相关规则（是否违反中央八项规定精神、结案时间与处分决定）已注册为逐行规则，
+    # 其中结案时间与处分决定的比对与 validate_case_closing_time_rules 重复，由执行计划去重
+
+    # 各规则写入的行索引集合一次性打包为命中矩阵
+    return CaseResultMatrix.from_sets(df.index, result_sets), issues_list
@@ -2,6 +2,7 @@ import logging
 import re
 import pandas as pd
 from config import Config
+from validation.date_normalization import parse_date_parts
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -13,25 +14,14 @@ def parse_date(date_str):
         print(msg)
         return None
     date_str = str(date_str).strip()
-    patterns = [
-        r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})',
-        r'(\d{4})[/-](\d{1,2})',
-        r'(\d{4})年(\d{1,2})月'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, date_str)
-        if match:
-            year = match.group(1)
-            month = match.group(2).zfill(2)
-            if len(match.groups()) == 3:
-                day = match.group(3).zfill(2)
-                parsed_date = f"{year}-{month}-{day}"
-            else:
-                parsed_date = f"{year}-{month}"
-            msg = f"解析日期 {date_str} 为 {parsed_date}"
-            logger.info(msg)
-            print(msg)
-            return parsed_date
+    parts = parse_date_parts(date_str)
+    if parts:
+        year, month, day = parts
+        parsed_date = f"{year}-{month:02d}-{day:02d}" if day is not None else f"{year}-{month:02d}"
+        msg = f"解析日期 {date_str} 为 {parsed_date}"
+        logger.info(msg)
+        print(msg)
+        return parsed_date
     msg = f"无法解析日期格式: {date_str}"
     logger.warning(msg)
     print(msg)
@@ -0,0 +1,130 @@
+# disposal_report.py
+"""
+处置情况报告的一次性解析。
+线索校验的每一行只解析一次处置情况报告：姓名、性别、民族、出生年月、入党时间、学历、落款日期
+在构造 DisposalReport 时各提取一次，关键词（收缴、没收、组织措施等）的查找结果按关键词缓存，
+各条线索规则直接读取其字段，不再对同一份报告重复调用提取函数、重复查找关键词或重新分行。
+
+每个字段使用一次预编译的 search（出生年月只在“（一）被反映人基本情况”段落的偏移范围内查找），
+关键词用 in 判断；把所有字段合并为一条逐位置扫描的正则在 CPython 中反而比这些带字面量前缀优化的查找慢。
+"""
+import re
+from validation.date_normalization import parse_chinese_date
+from validation.document_sections import section_span, segment_document
+from validation.regex_guard import watch_extraction
+from validation.document_cache import memoize_document
+
+ETHNICITIES = (
+    "汉族", "壮族", "满族", "回族", "苗族", "维吾尔族", "土家族", "彝族", "蒙古族", "藏族", "布依族", "侗族", "瑶族",
+    "朝鲜族", "白族", "哈尼族", "哈萨克族", "黎族", "傣族", "畲族", "傈僳族", "仡佬族", "东乡族", "拉祜族", "景颇族",
+    "佤族", "水族", "纳西族", "羌族", "土族", "仫佬族", "锡伯族", "柯尔克孜族", "达斡尔族", "京族", "布朗族", "撒拉族",
+    "毛南族", "阿昌族", "普米族", "鄂温克族", "怒族", "基诺族", "德昂族", "保安族", "俄罗斯族", "裕固族",
+    "乌孜别克族", "门巴族", "鄂伦春族", "独龙族", "塔塔尔族", "赫哲族", "珞巴族高山族"
+)
+
+# 学历关键词，按优先级排列（同时出现时取靠前的）
+EDUCATION_KEYWORDS = (
+    "博士研究生", "硕士研究生", "研究生", "大学本科", "本科", "大学专科", "大专",
+    "中专", "高中", "初中", "小学"
+)
+
+SIGNATURE_KEYWORD = "核查组成员签字"
+
+_COMRADE_NAME_PATTERN = re.compile(r'关于(.{1,10})同志')
+_NAME_AT_START_PATTERN = re.compile(r'^\s*([A-Za-z\u4e00-\u9fa5]{2,5})\s*[男女，，\s]')
+_ETHNICITY_PATTERN = re.compile('，(' + '|'.join(ETHNICITIES) + ')，')
+_BIRTH_DATE_PATTERN = re.compile(r'(\d{4}年\d{1,2}月)生')
+_PARTY_JOINING_PATTERN = re.compile(r'(\d{4}年\d{1,2}月)加入中国共产党')
+_SIGNATURE_DATE_PATTERN = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+
+def _year_month(value):
+    return value.replace('年', '/').replace('月', '')
+
+class DisposalReport:
+    """
+    一份处置情况报告的解析结果。字段含义与 extract_*_from_report 函数的返回值一致，未提取到时为 None；
+    关键词是否出现由 mentions 判断，每个关键词在同一份报告上只查找一次。
+    """
+    __slots__ = ('text', 'name', 'gender', 'ethnicity', 'birth_date', 'party_joining_date', 'education',
+                 'signature_date', '_mentions')
+
+    def __init__(self, text):
+        self.text = text
+        self.name = None
+        self.gender = None
+        self.ethnicity = None
+        self.birth_date = None
+        self.party_joining_date = None
+        self.education = None
+        self.signature_date = None
+        self._mentions = {}
+        if text:
+            self._parse()
+
+    def _parse(self):
+        text = self.text
+
+        match = _COMRADE_NAME_PATTERN.search(text) or _NAME_AT_START_PATTERN.match(text)
+        if match:
+            self.name = match.group(1).strip()
+
+        if "，男，" in text or " 男，" in text:
+            self.gender = "男"
+        elif "，女，" in text or " 女，" in text:
+            self.gender = "女"
+
+        match = _ETHNICITY_PATTERN.search(text)
+        if match:
+            self.ethnicity = match.group(1)
+
+        span = section_span(text, '一', '被反映人基本情况', level=2)
+        if span is not None:
+            match = _BIRTH_DATE_PATTERN.search(text, span[0], span[1])
+            if match:
+                self.birth_date = _year_month(match.group(1))
+
+        match = _PARTY_JOINING_PATTERN.search(text)
+        if match:
+            self.party_joining_date = _year_month(match.group(1))
+
+        self.education = self.first_mentioned(EDUCATION_KEYWORDS)
+
+        # 落款日期：“核查组成员签字”所在行的上一行
+        for prev_line in segment_document(text).lines_before(SIGNATURE_KEYWORD):
+            match = _SIGNATURE_DATE_PATTERN.search(prev_line)
+            if match:
+                self.signature_date = parse_chinese_date(match.group(0))
+                if self.signature_date:
+                    break
+
+    def mentions(self, keyword):
+        """
+        报告中是否出现 keyword，与 keyword in text 一致。
+        """
+        found = self._mentions.get(keyword)
+        if found is None:
+            found = self._mentions[keyword] = bool(self.text) and keyword in self.text
+        return found
+
+    def first_mentioned(self, keywords):
+        """
+        按 keywords 的顺序返回第一个在报告中出现的关键词，都未出现时返回 None。
+        """
+        for keyword in keywords:
+            if self.mentions(keyword):
+                return keyword
+        return None
+
+@memoize_document('disposal_report')
+@watch_extraction(bound=False)
+def parse_disposal_report(report_content):
+    """
+    解析处置情况报告。所用正则只含有界量词，直接作用于全文（落款位于文末，不截取搜索窗口）。
+
+    参数:
+        report_content (str): 处置情况报告全文。
+
+    返回:
+        DisposalReport: 解析结果。
+    """
+    return DisposalReport(report_content or '')
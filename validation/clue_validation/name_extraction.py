@@ -2,10 +2,12 @@ import logging
 import re
 import pandas as pd
 from config import Config
+from validation.regex_guard import watch_extraction
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+@watch_extraction
 def extract_name_from_report(report_text):
     if not report_text or pd.isna(report_text):
         msg = f"report_text 为空或无效: {report_text}"
@@ -3,6 +3,7 @@ import pandas as pd
 import re
 from config import Config
 from db_utils import get_db
+from validation.date_normalization import normalize_date_text
 from validation_rules.name_extraction import extract_name_from_report
 
 # 初始化 logger
@@ -27,19 +28,13 @@ def normalize_date(date_str, full_date=False):
     msg = f"标准化日期: 原始 '{date_str}'"
     logger.debug(msg)
     print(msg)
-    # 匹配YYYY/M、YYYY年M月、YYYY年M月D日、YYYY年M月生
-    match = re.match(r'(\d{4})[年/-](\d{1,2})(?:[月/-](\d{1,2})[日]?)?(?:生)?', date_str)
-    if match:
-        year, month, day = match.groups()
-        if full_date and day:  # 办结时间需完整日期
-            normalized = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        else:  # 入党时间和出生年月仅需年月
-            normalized = f"{year}-{month.zfill(2)}"
+    # 匹配YYYY/M、YYYY年M月、YYYY年M月D日、YYYY年M月生，统一由 date_normalization 解析并缓存
+    normalized = normalize_date_text(date_str, full_date=full_date)
+    if normalized != date_str:
         msg = f"标准化结果: {normalized}"
         logger.debug(msg)
         print(msg)
-        return normalized
-    return date_str
+    return normalized
 
 def validate_agency(authority, agency, db_dict):
     if not authority or not agency:
@@ -0,0 +1,201 @@
+# date_normalization.py
+"""
+统一的日期解析与标准化服务。
+立案和线索校验中的 Excel 日期字段、文书中的中文日期（如“2025年3月20日”）都通过这里解析，
+字符串到日期的转换结果使用有界缓存，整列日期在校验前一次性解析。
+"""
+import re
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 字符串日期解析缓存的最大条目数
+DATE_CACHE_SIZE = 8192
+
+# 年、月、日之间允许的分隔符：年/月、-、/、.
+_DATE_PARTS_PATTERN = re.compile(
+    r'(\d{4})\s*[年/\-.]\s*(\d{1,2})(?:\s*[月/\-.]\s*(\d{1,2})(?!\d))?'
+)
+_CHINESE_DATE_PATTERN = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date_parts(text):
+    """
+    从字符串中提取年、月、日。
+
+    参数:
+        text (str): 日期字符串，例如 '2025-03-20'、'2025/3'、'2025年3月20日'、'1966年12月生'。
+
+    返回:
+        tuple: (year, month, day)，day 可能为 None；无法识别时返回 None。
+    """
+    match = _DATE_PARTS_PATTERN.search(text)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    return int(year), int(month), int(day) if day else None
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_string(text):
+    """
+    将字符串解析为 datetime.date。
+    先按年月日正则解析，无法得到完整日期时再交给 pd.to_datetime 兜底，结果均被缓存。
+    """
+    parts = parse_date_parts(text)
+    if parts and parts[2] is not None:
+        try:
+            return date(*parts)
+        except ValueError:
+            return None
+    try:
+        parsed = pd.to_datetime(text)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if pd.isna(parsed):
+        return None
+    return parsed.date()
+
+def parse_date_value(value):
+    """
+    将 Excel 单元格值解析为 datetime.date。
+
+    参数:
+        value: datetime / pd.Timestamp / np.datetime64 / date / str 或其他单元格值。
+
+    返回:
+        datetime.date or None: 解析成功返回日期；空值、非日期类型或无法解析的字符串返回 None。
+    """
+    if isinstance(value, np.datetime64):
+        # datetime64 列经 pd.unique 等取出的值不是 datetime 子类
+        value = pd.Timestamp(value)
+    if isinstance(value, datetime):
+        return None if pd.isna(value) else value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        return _parse_date_string(text) if text else None
+    return None
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_chinese_date(date_str):
+    """
+    解析中文日期字符串（例如 '2025年3月20日'）为 datetime.date 对象。
+
+    参数:
+        date_str (str): 中文日期字符串，日期之后的“，”及其后内容会被忽略。
+
+    返回:
+        datetime.date or None: 解析后的日期对象，如果无法解析则为None。
+    """
+    if not isinstance(date_str, str):
+        return None
+    match = _CHINESE_DATE_PATTERN.match(date_str.split('，')[0].strip())
+    if not match:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+def _value_parts(value):
+    """
+    获取单元格值的 (year, month, day)，datetime 直接取字段，字符串按正则解析。
+    """
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    if isinstance(value, datetime):
+        return None if pd.isna(value) else (value.year, value.month, value.day)
+    if isinstance(value, date):
+        return value.year, value.month, value.day
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return parse_date_parts(str(value).strip())
+
+def format_year_month(value, sep='-'):
+    """
+    标准化为年月字符串，例如 '1990/1'、'1990年1月' 都转换为 '1990-01'。
+
+    参数:
+        value: 单元格值或日期字符串。
+        sep (str): 年与月之间的分隔符。
+
+    返回:
+        str or None: 标准化结果，无法识别时返回 None。
+    """
+    parts = _value_parts(value)
+    if not parts:
+        return None
+    return f"{parts[0]}{sep}{parts[1]:02d}"
+
+def format_full_date(value):
+    """
+    标准化为 'YYYY-MM-DD'，缺少日时返回 None。
+    """
+    parts = _value_parts(value)
+    if not parts or parts[2] is None:
+        return None
+    return f"{parts[0]}-{parts[1]:02d}-{parts[2]:02d}"
+
+def normalize_date_text(value, full_date=False):
+    """
+    标准化日期文本：full_date=True 且包含日时返回 YYYY-MM-DD，否则返回 YYYY-MM。
+    空值返回 None，无法识别的文本原样返回，便于调用方继续做字符串比对。
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if full_date:
+        normalized = format_full_date(value)
+        if normalized:
+            return normalized
+    return format_year_month(value) or str(value).strip()
+
+def parse_date_column(series):
+    """
+    一次性解析整列日期，返回 datetime64 列（无法解析或为空的单元格为 NaT）。
+    每个不同的取值只解析一次，重复的日期直接复用结果；已经是 datetime64 的列直接取日期部分。
+
+    参数:
+        series (pd.Series): 原始日期列。
+
+    返回:
+        pd.Series: 与原列索引一致的 datetime64[ns] 列。
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # 与逐个解析一致只保留日期（datetime 单元格解析为当天 0 点）
+        return pd.to_datetime(series).dt.normalize()
+    non_null = series.dropna()
+    mapping = {}
+    for value in pd.unique(non_null):
+        parsed = parse_date_value(value)
+        mapping[value] = pd.Timestamp(parsed) if parsed else pd.NaT
+    return pd.to_datetime(series.map(mapping), errors='coerce')
+
+def coerce_date_column(series):
+    """
+    将整列日期预先解析为 pd.Timestamp，供逐行校验直接使用。
+    可解析的单元格替换为 Timestamp（属于 datetime），无法解析的字符串和空值保持原值，
+    这样校验规则仍能对原始字符串报告“格式不正确”。
+
+    参数:
+        series (pd.Series): 原始日期列。
+
+    返回:
+        pd.Series: object 类型的列。
+    """
+    parsed = parse_date_column(series)
+    return parsed.astype(object).where(parsed.notna(), series)
+
+def coerce_date_columns(df, columns):
+    """
+    对多列执行 coerce_date_column，跳过不存在的列。
+
+    返回:
+        dict: {列名: 解析后的列}。
+    """
+    return {col: coerce_date_column(df[col]) for col in columns if col in df.columns}
@@ -0,0 +1,137 @@
+# document_cache.py
+"""
+跨行的文书解析结果缓存。
+多人案件中同一份立案决定书、审理报告、处分决定会出现在多行（共同被调查人），重复上传时所有文书也都会再出现一次。
+提取函数通过 memoize_document 登记所属的文书类型，结果按 (文书类型, 文本) 存入有界 LRU：
+每份文书一个条目，条目内保存该文书上各提取函数（及其参数）的结果，同一份文书在一次上传中只解析一次。
+
+键直接使用文本本身：str 的哈希值计算一次后缓存在对象上，读取时经 intern_texts 合并的相同文本是同一个对象，
+查找只需一次哈希比较，不再另外计算摘要。
+"""
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+# 缓存的文书条目数上限
+DOCUMENT_CACHE_SIZE = 1024
+
+# 读取上传文件时参与合并的最短文本长度，短文本（姓名、单位等）合并收益很小
+INTERN_MIN_CHARS = 64
+
+class DocumentCache:
+    """
+    (文书类型, 文本) → {提取函数键: 结果} 的有界 LRU，线程安全。
+    """
+    def __init__(self, maxsize=DOCUMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, doc_type, text, extractor_key):
+        """
+        返回 (是否命中, 结果)。
+        """
+        key = (doc_type, text)
+        with self._lock:
+            results = self._entries.get(key)
+            if results is not None:
+                self._entries.move_to_end(key)
+                if extractor_key in results:
+                    self.hits += 1
+                    return True, results[extractor_key]
+            self.misses += 1
+        return False, None
+
+    def store(self, doc_type, text, extractor_key, value):
+        key = (doc_type, text)
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                results = self._entries[key] = {}
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            results[extractor_key] = value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+document_cache = DocumentCache()
+
+def memoize_document(doc_type):
+    """
+    提取函数的缓存装饰器，第一个位置参数为文书文本，其余参数一并计入键。
+    提取函数的返回值须为不可变对象（字符串、数字、日期、元组或 None）。
+
+    参数:
+        doc_type (str): 文书类型，例如 'case_report'、'decision'、'trial_report'。
+    """
+    def decorator(func):
+        function_key = f"{func.__module__}.{func.__name__}"
+
+        @wraps(func)
+        def wrapper(text, *args, **kwargs):
+            if not isinstance(text, str) or not text:
+                return func(text, *args, **kwargs)
+            extractor_key = (function_key, args, tuple(sorted(kwargs.items())))
+            try:
+                found, value = document_cache.lookup(doc_type, text, extractor_key)
+            except TypeError:  # 参数不可哈希时不缓存
+                return func(text, *args, **kwargs)
+            if found:
+                return value
+            value = func(text, *args, **kwargs)
+            document_cache.store(doc_type, text, extractor_key, value)
+            return value
+        return wrapper
+    return decorator
+
+def clear_document_caches():
+    """
+    清空文书解析缓存和分段缓存（基准测试测量未命中缓存的耗时时使用）。
+    """
+    from validation.document_sections import segment_document
+    document_cache.clear()
+    segment_document.cache_clear()
+
+def intern_texts(df, min_chars=INTERN_MIN_CHARS):
+    """
+    合并 DataFrame 中内容相同的长文本单元格，使其引用同一个字符串对象（原地修改）。
+    同一份文书在多行重复出现时 DataFrame 只保留一份，后续哈希和缓存查找也只计算一次。
+
+    参数:
+        df (pd.DataFrame): 刚读取的上传数据。
+        min_chars (int): 参与合并的最短文本长度。
+
+    返回:
+        int: 被合并的单元格数量。
+    """
+    pool = {}
+    merged = 0
+    for position in range(df.shape[1]):
+        if df.dtypes.iloc[position] != object:
+            continue
+        values = df.iloc[:, position].tolist()
+        changed = False
+        for i, value in enumerate(values):
+            if type(value) is str and len(value) >= min_chars:
+                existing = pool.setdefault(value, value)
+                if existing is not value:
+                    values[i] = existing
+                    changed = True
+                    merged += 1
+        if changed:
+            df.iloc[:, position] = values
+    if merged:
+        logger.info(f"合并重复文本单元格 {merged} 个（共 {len(pool)} 份不同的长文本）")
+    return merged
@@ -0,0 +1,298 @@
+# document_sections.py
+"""
+公文文本的分段（立案报告、审查调查报告、审理报告、处置情况报告等）。
+一次遍历把文本切分为标题行、编号段落（一、二、三、 / （一）（二））和落款块，并记录各部分的字符偏移。
+按段落取值的提取函数和落款日期规则只在对应的片段上查找，
+不再对全文反复执行惰性 DOTALL 正则，也不再整篇 split('\n')。
+
+编号只在行首识别（允许前导空白），避免把正文中的“统一、”等误认为段落编号；
+整段文本没有换行、编号不在行首时，按原正则的语义在全文中线性查找作为兜底。
+"""
+import re
+from bisect import bisect_right
+from functools import lru_cache
+
+# 分段结果缓存的最大条目数（同一份报告会被多个提取函数使用）
+SECTION_CACHE_SIZE = 1024
+
+# 落款块最多包含的行数，以及落款行的最大长度
+SIGNATURE_MAX_LINES = 4
+SIGNATURE_LINE_MAX_LENGTH = 40
+
+_NUMERALS = '一二三四五六七八九十'
+_SECTION_MARKER = re.compile(r'[ \t　]*(?:([一二三四五六七八九十]+)、|（([一二三四五六七八九十]+)）)')
+_DATE_PATTERN = re.compile(r'\d{4}\s*年\s*\d{1,2}\s*月\s*\d{1,2}\s*日')
+
+class Section:
+    """
+    一个编号段落。level 为 1 表示“一、”类段落，2 表示“（一）”类小节。
+    start 为编号起始偏移，marker_end 为编号之后的偏移，heading_end 为标题行结束偏移，
+    end 为段落结束偏移（下一个同级或上级段落的起点、落款块起点或文本末尾）。
+    """
+    __slots__ = ('level', 'number', 'start', 'marker_end', 'heading_end', 'end')
+
+    def __init__(self, level, number, start, marker_end, heading_end):
+        self.level = level
+        self.number = number
+        self.start = start
+        self.marker_end = marker_end
+        self.heading_end = heading_end
+        self.end = heading_end
+
+class DocumentSections:
+    """
+    一份文本的分段结果。
+    """
+    __slots__ = ('text', 'line_starts', 'line_ends', 'title', 'sections', 'signature_start')
+
+    def __init__(self, text):
+        self.text = text
+        self.line_starts = []
+        self.line_ends = []
+        self.title = None
+        self.sections = []
+        self.signature_start = len(text)
+        self._scan()
+
+    def _scan(self):
+        text = self.text
+        position = 0
+        length = len(text)
+        while position <= length:
+            newline = text.find('\n', position)
+            end = length if newline == -1 else newline
+            line_end = end - 1 if end > position and text[end - 1] == '\r' else end
+            self.line_starts.append(position)
+            self.line_ends.append(line_end)
+            match = _SECTION_MARKER.match(text, position, line_end)
+            if match:
+                level = 1 if match.group(1) else 2
+                number = match.group(1) or match.group(2)
+                start = match.end() - len(_marker(number, level))
+                self.sections.append(Section(level, number, start, match.end(), line_end))
+            elif self.title is None and not self.sections and text[position:line_end].strip():
+                self.title = (position, line_end)
+            if newline == -1:
+                break
+            position = newline + 1
+        self._find_signature()
+        self._close_sections()
+
+    def _find_signature(self):
+        """
+        落款块：文本末尾连续的若干短行（不超过 SIGNATURE_MAX_LINES 行），且其中包含日期。
+        以句号结尾的行属于正文，不计入落款块。
+        """
+        count = 0
+        first = None
+        has_date = False
+        last_heading = self.sections[-1].start if self.sections else -1
+        for i in range(len(self.line_starts) - 1, -1, -1):
+            start, end = self.line_starts[i], self.line_ends[i]
+            line = self.text[start:end].strip()
+            if not line:
+                continue
+            if (start <= last_heading or line.endswith('。') or len(line) > SIGNATURE_LINE_MAX_LENGTH
+                    or count >= SIGNATURE_MAX_LINES):
+                break
+            count += 1
+            first = start
+            if _DATE_PATTERN.search(line):
+                has_date = True
+        if first is not None and has_date:
+            self.signature_start = first
+
+    def _close_sections(self):
+        sections = self.sections
+        for i, section in enumerate(sections):
+            end = self.signature_start if self.signature_start > section.start else len(self.text)
+            for following in sections[i + 1:]:
+                if following.level <= section.level:
+                    end = following.start
+                    break
+            section.end = max(end, section.heading_end)
+
+    def find(self, number, keyword=None, level=1):
+        """
+        返回编号为 number（如 '一'）、标题行包含 keyword 的第一个段落，找不到时返回 None。
+        """
+        for section in self.sections:
+            if section.level != level or section.number != number:
+                continue
+            if keyword is None or keyword in self.text[section.start:section.heading_end]:
+                return section
+        return None
+
+    def section_text(self, section):
+        """
+        段落全文（含标题行）。
+        """
+        return self.text[section.start:section.end]
+
+    def heading(self, section):
+        """
+        段落标题行（去掉编号）。
+        """
+        return self.text[section.marker_end:section.heading_end]
+
+    def body(self, section):
+        """
+        段落正文（标题行之后的部分）。
+        """
+        return self.text[section.heading_end:section.end]
+
+    def title_text(self):
+        """
+        标题行（第一个编号段落之前的第一行非空文本），没有时返回 ''。
+        """
+        return self.text[self.title[0]:self.title[1]].strip() if self.title else ''
+
+    def signature_text(self):
+        """
+        落款块文本，没有识别到落款块时返回 ''。
+        """
+        return self.text[self.signature_start:].strip()
+
+    def last_line(self):
+        """
+        最后一行非空文本（去掉首尾空白），与 text.strip().split('\\n')[-1].strip() 一致。
+        """
+        for i in range(len(self.line_starts) - 1, -1, -1):
+            line = self.text[self.line_starts[i]:self.line_ends[i]].strip()
+            if line:
+                return line
+        return ''
+
+    def lines_before(self, keyword):
+        """
+        依次返回包含 keyword 的各行的上一行（去掉首尾空白），例如“核查组成员签字”上一行的落款日期。
+        只对包含 keyword 的位置定位行号，不拆分全文。
+        """
+        first_line = next((i for i in range(len(self.line_starts))
+                           if self.text[self.line_starts[i]:self.line_ends[i]].strip()), None)
+        position = self.text.find(keyword)
+        last_line = -1
+        while position != -1:
+            line = bisect_right(self.line_starts, position) - 1
+            if line != last_line and first_line is not None and line > first_line:
+                yield self.text[self.line_starts[line - 1]:self.line_ends[line - 1]].strip()
+            last_line = line
+            position = self.text.find(keyword, self.line_ends[line] + 1) if self.line_ends[line] < len(self.text) else -1
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def segment_document(text):
+    """
+    对文本分段，结果按文本缓存。
+
+    参数:
+        text (str): 报告全文。
+
+    返回:
+        DocumentSections: 分段结果。
+    """
+    return DocumentSections(text)
+
+def _marker(number, level):
+    return f"{number}、" if level == 1 else f"（{number}）"
+
+def _next_marker(number, level):
+    index = _NUMERALS.find(number)
+    if len(number) != 1 or index == -1 or index + 1 >= len(_NUMERALS):
+        return None
+    return _marker(_NUMERALS[index + 1], level)
+
+def _inline_keyword_span(text, number, keyword, level):
+    """
+    兜底：编号不在行首时，按“编号.+?关键词”的语义线性查找，
+    返回 (关键词之后的偏移, 下一编号的偏移或文本末尾)，找不到时返回 None。
+    """
+    marker = _marker(number, level)
+    start = text.find(marker)
+    if start == -1:
+        return None
+    keyword_pos = text.find(keyword, start + len(marker) + 1)
+    if keyword_pos == -1:
+        return None
+    after = keyword_pos + len(keyword)
+    next_marker = _next_marker(number, level)
+    end = text.find(next_marker, after) if next_marker else -1
+    return after, (len(text) if end == -1 else end)
+
+def find_section(text, number, keyword=None, level=1):
+    """
+    在文本中查找编号段落。
+
+    返回:
+        tuple: (DocumentSections, Section)，找不到时返回 (DocumentSections, None)。
+    """
+    document = segment_document(text)
+    return document, document.find(number, keyword, level)
+
+def text_after_keyword(text, number, keyword, window=None, level=1):
+    """
+    返回编号段落中 keyword 之后到段落结束的文本，可用 window 限制最大长度。
+    例如 text_after_keyword(报告, '一', '同志基本情况', 300) 返回“一、XXX同志基本情况”之后的基本情况段落。
+
+    参数:
+        text (str): 报告全文。
+        number (str): 段落编号，如 '一'。
+        keyword (str): 标题中的关键词。
+        window (int): 返回文本的最大长度，None 表示不限制。
+        level (int): 1 表示“一、”类段落，2 表示“（一）”类小节。
+
+    返回:
+        str or None: 找不到段落时返回 None。
+    """
+    document, section = find_section(text, number, keyword, level)
+    keyword_pos = -1
+    if section is not None:
+        # 编号与关键词之间至少有一个字符（姓名等），与 “一、.+?关键词” 一致
+        keyword_pos = text.find(keyword, section.marker_end + 1, section.end)
+    if keyword_pos != -1:
+        after, end = keyword_pos + len(keyword), section.end
+    else:
+        span = _inline_keyword_span(text, number, keyword, level)
+        if span is None:
+            return None
+        after, end = span
+    if window is not None:
+        end = min(end, after + window)
+    return text[after:end]
+
+def heading_before_keyword(text, number, keyword, level=1):
+    """
+    返回段落标题中编号与 keyword 之间的文本，例如“一、王某某同志基本情况”中的“王某某”。
+    只在标题行内查找，与 r"一、(.+?)同志基本情况" 的语义一致。
+
+    返回:
+        str or None: 找不到时返回 None。
+    """
+    document, section = find_section(text, number, keyword, level)
+    if section is not None:
+        keyword_pos = text.find(keyword, section.marker_end + 1, section.heading_end)
+        if keyword_pos != -1:
+            return text[section.marker_end:keyword_pos]
+    match = re.search(f"{re.escape(_marker(number, level))}(.+?){re.escape(keyword)}", text)
+    return match.group(1) if match else None
+
+def section_span(text, number, keyword, level=1):
+    """
+    返回编号段落（含标题行）的 (起始偏移, 结束偏移)，段落截止到下一个同级编号；找不到时返回 None。
+    """
+    document, section = find_section(text, number, keyword, level)
+    if section is not None:
+        return section.start, section.end
+    heading = _marker(number, level) + keyword
+    start = text.find(heading)
+    if start == -1:
+        return None
+    next_marker = _next_marker(number, level)
+    end = text.find(next_marker, start + len(heading)) if next_marker else -1
+    return start, (len(text) if end == -1 else end)
+
+def section_text(text, number, keyword, level=1):
+    """
+    返回编号段落全文（含标题行），段落截止到下一个同级编号；找不到时返回 None。
+    """
+    span = section_span(text, number, keyword, level)
+    return text[span[0]:span[1]] if span is not None else None
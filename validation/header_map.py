@@ -0,0 +1,185 @@
+# header_map.py
+"""
+上传表头的列位置解析。
+每次上传根据实际表头计算一次 “逻辑字段 → 列位置 → Excel 列字母” 的映射，
+问题描述中的列字母（如 BN、CU、CY）和副本高亮的目标列都从这里获取，
+区县模板调整列顺序后问题描述仍能指向正确的列。
+
+校验和格式化入口通过 use_header_map 激活当前上传的映射，规则代码中用 case_col / clue_col 取列字母；
+未激活映射或上传表中缺少该列时，退回到标准模板中的列字母。
+"""
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+# 标准立案登记表模板中各字段的列字母
+DEFAULT_CASE_LETTERS = {
+    'reporting_agency': 'A',
+    'investigated_person': 'C',
+    'gender': 'M',
+    'age': 'N',
+    'birth_date': 'O',
+    'education': 'P',
+    'ethnicity': 'Q',
+    'party_member': 'T',
+    'party_joining_date': 'AC',
+    'filing_time': 'AR',
+    'disciplinary_committee_filing_authority': 'AV',
+    'disciplinary_committee_filing_time': 'AW',
+    'supervisory_committee_filing_authority': 'AY',
+    'supervisory_committee_filing_time': 'AZ',
+    'brief_case_details': 'BE',
+    'case_report': 'BF',
+    'filing_decision_doc': 'BG',
+    'central_eight_provisions': 'BI',
+    'voluntary_confession': 'BK',
+    'closing_time': 'BN',
+    'disciplinary_sanction': 'BO',
+    'no_party_position_warning': 'BP',
+    'administrative_sanction': 'BR',
+    'confiscation_amount': 'CF',
+    'confiscation_of_property_amount': 'CG',
+    'registered_handover_amount': 'CG',
+    'compensation_amount': 'CH',
+    'recovery_amount': 'CJ',
+    'trial_acceptance_time': 'CP',
+    'trial_authority': 'CR',
+    'trial_closing_time': 'CS',
+    'disciplinary_decision': 'CU',
+    'investigation_report': 'CX',
+    'trial_report': 'CY'
+}
+
+# 标准线索登记表模板中各字段的列字母
+DEFAULT_CLUE_LETTERS = {
+    'reporting_agency': 'C',
+    'mentioned_person': 'E',
+    'authority': 'H',
+    'confiscation_amount': 'Q',
+    'confiscation_of_property_amount': 'R',
+    'compensation_amount': 'S',
+    'registered_handover_amount': 'T',
+    'recovery_amount': 'U',
+    'ethnicity': 'W',
+    'birth_date': 'X',
+    'disposal_report': 'AB',
+    'party_joining_date': 'AC',
+    'acceptance_time': 'AF',
+    'disposal_method_1': 'AK',
+    'completion_time': 'BT',
+    'organization_measure': 'CC'
+}
+
+DEFAULT_LETTERS = {'case': DEFAULT_CASE_LETTERS, 'clue': DEFAULT_CLUE_LETTERS}
+
+_current_header_map = ContextVar('current_header_map', default=None)
+
+def excel_column_letter(position):
+    """
+    将从 0 开始的列位置转换为 Excel 列字母，例如 0 -> 'A'，27 -> 'AB'。
+    """
+    letters = ''
+    position += 1
+    while position > 0:
+        position, remainder = divmod(position - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+class HeaderMap:
+    """
+    一次上传的表头映射：表头名称 → 列位置 → 列字母，逻辑字段通过 COLUMN_MAPPINGS 解析为表头名称。
+    """
+    __slots__ = ('columns', 'positions', 'letters', 'column_mappings', 'kind')
+
+    def __init__(self, columns, column_mappings, kind='case'):
+        self.columns = columns
+        self.positions = {}
+        for position, column in enumerate(columns):
+            # 重复表头以第一次出现的位置为准
+            self.positions.setdefault(column, position)
+        self.letters = {column: excel_column_letter(position) for column, position in self.positions.items()}
+        self.column_mappings = column_mappings
+        self.kind = kind
+
+    def position(self, column):
+        """
+        返回表头名称对应的列位置（从 0 开始），不存在时返回 None。
+        """
+        return self.positions.get(column)
+
+    def letter(self, field):
+        """
+        返回逻辑字段（COLUMN_MAPPINGS 的键）或表头名称对应的列字母，不存在时返回 None。
+        """
+        column = self.column_mappings.get(field, field)
+        return self.letters.get(column)
+
+    def matches(self, columns):
+        """
+        判断映射是否由这组表头生成。
+        """
+        return columns is self.columns or list(columns) == list(self.columns)
+
+def build_header_map(columns, column_mappings, kind='case'):
+    """
+    根据上传表头生成 HeaderMap。
+
+    参数:
+        columns (iterable): 上传表的列名（df.columns）。
+        column_mappings (dict): 内部字段名到 Excel 列名的映射（Config.COLUMN_MAPPINGS）。
+        kind (str): 'case' 或 'clue'，决定缺列时使用的模板列字母。
+    """
+    return HeaderMap(columns, column_mappings, kind)
+
+@contextmanager
+def use_header_map(columns, column_mappings, kind='case'):
+    """
+    在 with 代码块内激活当前上传的表头映射，退出时恢复之前的映射。
+    同一组表头已激活时直接复用，不重复计算。
+    """
+    header_map = _current_header_map.get()
+    if header_map is None or header_map.kind != kind or not header_map.matches(columns):
+        header_map = build_header_map(columns, column_mappings, kind)
+    token = _current_header_map.set(header_map)
+    try:
+        yield header_map
+    finally:
+        _current_header_map.reset(token)
+
+def current_header_map():
+    """
+    返回当前激活的表头映射，未激活时返回 None。
+    """
+    return _current_header_map.get()
+
+def _column_letter(field, kind):
+    header_map = _current_header_map.get()
+    if header_map is not None:
+        letter = header_map.letter(field)
+        if letter:
+            return letter
+    return DEFAULT_LETTERS[kind].get(field, '')
+
+def case_col(field):
+    """
+    立案登记表字段的列字母，例如 case_col('closing_time') 在标准模板中为 'BN'。
+    """
+    return _column_letter(field, 'case')
+
+def clue_col(field):
+    """
+    线索登记表字段的列字母，例如 clue_col('disposal_report') 在标准模板中为 'AB'。
+    """
+    return _column_letter(field, 'clue')
+
+# 规则描述中的列字母（如 "BN结案时间"、"AF.*受理时间"、"C2被调查人"）
+_RULE_LETTER_PATTERN = re.compile(r'(?<![A-Za-z])[A-Z]{1,3}(?:\d+|\.\*)?(?=[一-鿿（])')
+
+@lru_cache(maxsize=256)
+def letter_agnostic_pattern(rule):
+    """
+    将 VALIDATION_RULES 中带列字母的描述转换为不依赖具体列字母和行号的正则，
+    使问题描述改用实际列字母后仍能匹配对应的高亮规则。
+    """
+    return _RULE_LETTER_PATTERN.sub(r'[A-Z]{1,3}\\d*', rule)
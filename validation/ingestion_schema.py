@@ -0,0 +1,328 @@
+# ingestion_schema.py
+"""
+上传数据的列类型声明与整列转换。
+每个逻辑字段（COLUMN_MAPPINGS 的键）声明一种类型：
+    text      文本，去除首尾空白，空单元格为 ''（不再出现 str(NaN) 得到的 'nan'）；
+    category  取值有限的文本（性别、学历、民族、处分、机关名称等），按文本清洗，存储为 category；
+    document  长文本（立案报告、处分决定、审理报告、处置情况报告等），按文本清洗，安装了 pyarrow 时存储为 Arrow 字符串；
+    int       整数（年龄），pd.to_numeric 整列转换，小数按 int() 截断；
+    amount    金额，整列校验为数字后转换为 Decimal；
+    flag      是/否，按字段声明的可接受写法整列映射为 True/False，存储为 category；
+              规则通过 TypedTable.flag_text 读取标准写法 '是' / '否'。
+每次上传只在读取后整列转换一次，规则逐行直接读取转换结果，不再逐个单元格 int()/str().strip()/判断 'nan'。
+无法转换的单元格集中记录在 failures 中，由调用方一次性生成问题。
+日期列由 date_normalization.coerce_date_columns 整列解析，不在此声明。
+
+读取上传文件后 optimize_dtypes 按声明调整列的存储类型：重复取值多的列只保存一份取值和整数编码，
+长文本不再是一个个 Python 对象，整表内存占用明显下降；清洗和机关单位对应表的比对也按不同取值整列进行。
+"""
+import logging
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+logger = logging.getLogger(__name__)
+
+TEXT = 'text'
+CATEGORY = 'category'
+DOCUMENT = 'document'
+INT = 'int'
+AMOUNT = 'amount'
+FLAG = 'flag'
+
+# 不同取值数不超过行数的该比例时才转换为 category，取值几乎各不相同的列转换后反而更占内存
+CATEGORY_MAX_RATIO = 0.5
+
+# 是/否字段可接受的写法
+YES_NO_VALUES = {'是': True, '否': False}
+
+# 是否中共党员另外接受的政治面貌写法，只用于 party_member 字段
+PARTY_MEMBER_VALUES = {
+    **YES_NO_VALUES,
+    '中共党员': True, '党员': True, '是（中共党员）': True,
+    '非中共党员': False, '非党员': False, '群众': False
+}
+
+TYPE_LABELS = {INT: '整数', AMOUNT: '金额', FLAG: '是/否'}
+
+# 转换失败时问题描述中字段名之后的说明
+FAILURE_SUFFIXES = {
+    INT: '字段格式不正确',
+    AMOUNT: '字段不是有效金额',
+    FLAG: '字段应填写“是”或“否”'
+}
+
+def _field(kind, result=None, risk='中', values=None):
+    """
+    声明一个字段。
+
+    参数:
+        kind (str): 字段类型。
+        result (str): 转换失败的行写入的结果索引集合名称（立案登记表用于副本高亮）。
+        risk (str): 转换失败问题的风险等级。
+        values (dict): flag 字段可接受的写法到 True/False 的映射，默认只接受“是”“否”。
+    """
+    if kind == FLAG and values is None:
+        values = YES_NO_VALUES
+    return {'type': kind, 'result': result, 'risk': risk, 'values': values}
+
+# 立案登记表
+CASE_SCHEMA = {
+    'case_code': _field(TEXT),
+    'person_code': _field(TEXT),
+    'investigated_person': _field(TEXT),
+    'gender': _field(CATEGORY),
+    'age': _field(INT, 'age_mismatch_indices', '高'),
+    'birth_date': _field(TEXT),
+    'education': _field(CATEGORY),
+    'ethnicity': _field(CATEGORY),
+    'party_member': _field(FLAG, 'party_member_mismatch_indices', values=PARTY_MEMBER_VALUES),
+    'party_joining_date': _field(TEXT),
+    'brief_case_details': _field(TEXT),
+    'reporting_agency': _field(CATEGORY),
+    'trial_authority': _field(CATEGORY),
+    'disciplinary_sanction': _field(CATEGORY),
+    'administrative_sanction': _field(CATEGORY),
+    'case_report': _field(DOCUMENT),
+    'filing_decision_doc': _field(DOCUMENT),
+    'disciplinary_decision': _field(DOCUMENT),
+    'investigation_report': _field(DOCUMENT),
+    'trial_report': _field(DOCUMENT),
+    'central_eight_provisions': _field(FLAG, 'disposal_spirit_mismatch_indices'),
+    'voluntary_confession': _field(FLAG, 'voluntary_confession_highlight_indices'),
+    'no_party_position_warning': _field(FLAG, 'no_party_position_warning_mismatch_indices'),
+    'confiscation_amount': _field(AMOUNT, 'confiscation_amount_indices'),
+    'confiscation_of_property_amount': _field(AMOUNT, 'confiscation_of_property_amount_indices'),
+    'compensation_amount': _field(AMOUNT, 'compensation_amount_highlight_indices'),
+    'recovery_amount': _field(AMOUNT, 'recovery_amount_highlight_indices'),
+    'registered_handover_amount': _field(AMOUNT, 'registered_handover_amount_indices')
+}
+
+# 线索登记表
+CLUE_SCHEMA = {
+    'accepted_clue_code': _field(TEXT),
+    'accepted_personnel_code': _field(TEXT),
+    'mentioned_person': _field(TEXT),
+    'disposal_report': _field(DOCUMENT),
+    'reporting_agency': _field(CATEGORY),
+    'authority': _field(CATEGORY),
+    'ethnicity': _field(CATEGORY),
+    'birth_date': _field(TEXT),
+    'party_joining_date': _field(TEXT),
+    'organization_measure': _field(CATEGORY),
+    'disposal_method_1': _field(CATEGORY),
+    'confiscation_amount': _field(AMOUNT),
+    'confiscation_of_property_amount': _field(AMOUNT),
+    'compensation_amount': _field(AMOUNT),
+    'registered_handover_amount': _field(AMOUNT),
+    'recovery_amount': _field(AMOUNT)
+}
+
+def clean_text(series):
+    """
+    整列转换为去除首尾空白的字符串，空单元格为 ''。
+    非空单元格的结果与 str(value).strip() 相同；category 列只清洗各个不同取值，再按编码展开。
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories.astype(str).str.strip().to_numpy(dtype=object)
+        codes = series.cat.codes.to_numpy()
+        cleaned = np.where(codes >= 0, categories[codes] if len(categories) else '', '')
+        return pd.Series(cleaned, index=series.index, dtype=object)
+    return series.astype(str).str.strip().where(series.notna(), '')
+
+def _coerce(series, text, spec):
+    """
+    按字段声明的类型整列转换。
+
+    返回:
+        tuple: (values, failed)，values 为与行对应的 Python 对象列表（空单元格为 None），
+               failed 为转换失败的布尔数组。
+    """
+    kind = spec['type']
+    blank = (text == '').to_numpy()
+    if kind == FLAG:
+        mapped = text.map(spec['values'])
+        failed = ~blank & mapped.isna().to_numpy()
+        return [None if value != value else bool(value) for value in mapped.tolist()], failed
+
+    source = series if pd.api.types.is_numeric_dtype(series) else text.mask(text == '')
+    numeric = pd.to_numeric(source, errors='coerce')
+    failed = ~blank & (numeric.isna().to_numpy() | np.isinf(numeric.to_numpy(dtype=float, na_value=np.nan)))
+    valid = ~(blank | failed)
+    values = [None] * len(text)
+    if kind == INT:
+        for position, value in zip(np.flatnonzero(valid), numeric.to_numpy()[valid]):
+            values[position] = int(value)
+    else:
+        for position, value in zip(np.flatnonzero(valid), text.to_numpy()[valid]):
+            values[position] = Decimal(value)
+    return values, failed
+
+class TypedTable:
+    """
+    一次上传按字段转换后的数据。text(field) / value(field) 返回按行位置排列的列表，
+    上传表中没有该列时返回 None。
+    """
+    __slots__ = ('df', 'column_mappings', 'schema', 'texts', 'values', 'failures', 'matches')
+
+    def __init__(self, df, column_mappings, schema):
+        self.df = df
+        self.column_mappings = column_mappings
+        self.schema = schema
+        self.texts = {}
+        self.values = {}
+        self.failures = {}
+        self.matches = {}
+
+    def column(self, field):
+        """
+        返回字段对应的列（Series），表中没有该列时返回 None。重复表头取第一列。
+        """
+        column = self.column_mappings.get(field, field)
+        if column not in self.df.columns:
+            return None
+        return self.df.iloc[:, list(self.df.columns).index(column)]
+
+    def text(self, field):
+        """
+        字段的清洗后文本列表。未在 schema 中声明的字段首次使用时按文本整列清洗。
+        """
+        if field not in self.texts:
+            series = self.column(field)
+            self.texts[field] = None if series is None else clean_text(series).tolist()
+        return self.texts[field]
+
+    def cell_text(self, field, position):
+        """
+        某一行的清洗后文本，表中没有该列时返回 ''（与 str(row.get(列名, '')).strip() 的缺列结果一致）。
+        """
+        texts = self.text(field)
+        return texts[position] if texts is not None else ''
+
+    def value(self, field):
+        """
+        字段按声明类型转换后的值列表（text / category 字段与 text() 相同）。
+        """
+        if field not in self.values:
+            self._convert(field)
+        return self.values[field]
+
+    def flag_text(self, field, position):
+        """
+        是/否字段某一行的标准写法：转换为 True / False 的单元格为 '是' / '否'（如“中共党员”为 '是'），
+        空单元格和无法识别的写法为 ''（后者已作为类型转换问题记录），表中没有该列时同样返回 ''。
+        """
+        values = self.value(field)
+        value = values[position] if values is not None else None
+        if value is None:
+            return ''
+        return '是' if value else '否'
+
+    def pairs_in(self, first, second, pairs):
+        """
+        整列判断 (first 字段, second 字段) 的清洗后取值是否在 pairs 中，例如 (审理机关, 填报单位名称) 是否在机关单位对应表中。
+
+        参数:
+            first (str): 第一个字段。
+            second (str): 第二个字段。
+            pairs (frozenset): 允许的 (取值, 取值) 组合。
+
+        返回:
+            list: 按行位置排列的布尔值，任一列缺失时均为 False。
+        """
+        key = (first, second, pairs)
+        if key not in self.matches:
+            first_texts, second_texts = self.text(first), self.text(second)
+            if first_texts is None or second_texts is None or not pairs:
+                self.matches[key] = [False] * len(self.df)
+            else:
+                self.matches[key] = pd.MultiIndex.from_arrays([first_texts, second_texts]).isin(list(pairs)).tolist()
+        return self.matches[key]
+
+    def _convert(self, field):
+        spec = self.schema.get(field)
+        series = self.column(field)
+        if series is None or spec is None or spec['type'] in (TEXT, CATEGORY, DOCUMENT):
+            self.values[field] = self.text(field)
+            return
+        text = clean_text(series)
+        self.texts.setdefault(field, text.tolist())
+        values, failed = _coerce(series, text, spec)
+        self.values[field] = values
+        if failed.any():
+            self.failures[field] = np.flatnonzero(failed).tolist()
+
+def build_typed_table(df, column_mappings, schema):
+    """
+    按 schema 整列转换上传数据。
+
+    参数:
+        df (pd.DataFrame): 上传数据。
+        column_mappings (dict): 内部字段名到 Excel 列名的映射。
+        schema (dict): CASE_SCHEMA 或 CLUE_SCHEMA。
+
+    返回:
+        TypedTable: 转换结果，failures 为 {字段: [转换失败的行位置]}。
+    """
+    typed = TypedTable(df, column_mappings, schema)
+    for field in schema:
+        typed.value(field)
+    for field, positions in typed.failures.items():
+        logger.warning(f"<数据类型> - '{column_mappings.get(field, field)}' 有 {len(positions)} 个单元格"
+                       f"无法转换为{TYPE_LABELS[schema[field]['type']]}")
+    return typed
+
+def optimize_dtypes(df, column_mappings, schema):
+    """
+    按 schema 调整上传数据的存储类型（原地修改）：category / flag 字段转换为 category，
+    document 字段在安装了 pyarrow 时转换为 Arrow 字符串。只处理 object 类型的列，单元格取值不变。
+    应在 intern_texts 之后调用（Arrow 字符串不再是独立的 Python 对象）。
+
+    参数:
+        df (pd.DataFrame): 刚读取的上传数据。
+        column_mappings (dict): 内部字段名到 Excel 列名的映射。
+        schema (dict): CASE_SCHEMA 或 CLUE_SCHEMA。
+
+    返回:
+        int: 转换的列数。
+    """
+    columns = {column_mappings.get(field, field): spec['type'] for field, spec in schema.items()}
+    before = df.memory_usage(deep=True).sum()
+    converted = 0
+    for position, column in enumerate(df.columns):
+        kind = columns.get(column)
+        series = df.iloc[:, position]
+        if kind is None or series.dtype != object:
+            continue
+        if kind in (CATEGORY, FLAG):
+            if series.nunique() > len(series) * CATEGORY_MAX_RATIO:
+                continue
+            df.isetitem(position, series.astype('category'))
+        elif kind == DOCUMENT and ARROW_STRING_DTYPE:
+            df.isetitem(position, series.astype(ARROW_STRING_DTYPE))
+        else:
+            continue
+        converted += 1
+    if converted:
+        after = df.memory_usage(deep=True).sum()
+        logger.info(f"<数据类型> - 转换 {converted} 列的存储类型，内存占用 {before / 1048576:.1f}MB -> {after / 1048576:.1f}MB")
+    return converted
+
+def failure_description(spec, column, row_number, column_letter):
+    """
+    转换失败问题的描述，例如 “N5年龄字段格式不正确”。
+
+    参数:
+        spec (dict): 字段声明。
+        column (str): Excel 列名。
+        row_number (int): Excel 行号。
+        column_letter (str): 列字母。
+    """
+    return f"{column_letter}{row_number}{column}{FAILURE_SUFFIXES[spec['type']]}"
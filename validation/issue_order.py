@@ -0,0 +1,34 @@
+# issue_order.py
+"""
+问题列表的统一顺序：按行排列，同一行内保持规则执行的顺序（类型转换问题、逐行规则、立案时间规则），
+无法归属到具体行的问题（如缺少表头）放在最后。
+整表校验、增量校验（复用行 + 重新校验行）、分区并行和分块流式校验都按行合并结果，
+因此同一个文件无论走哪条路径，问题列表和序号都相同。
+"""
+import numbers
+
+def issue_row_index(issue):
+    """
+    获取问题所属的 DataFrame 行索引：元组问题的第一个元素为行索引，字典问题的行号为索引 + 2。
+    无法归属到具体行的问题返回 None。
+    """
+    if isinstance(issue, tuple) and issue and isinstance(issue[0], numbers.Integral):
+        return int(issue[0])
+    if isinstance(issue, dict):
+        row_number = issue.get('行号')
+        if isinstance(row_number, numbers.Integral):
+            return int(row_number) - 2
+    return None
+
+def sort_issues_by_row(issues_list, start=0):
+    """
+    将 issues_list[start:] 原地按行稳定排序，同一行内的先后顺序不变，无法归属到行的问题排在最后。
+
+    参数:
+        issues_list (list): 问题列表。
+        start (int): 从该位置开始排序，之前的问题（调用方已有的内容）保持不动。
+    """
+    def _key(issue):
+        index = issue_row_index(issue)
+        return (1, 0) if index is None else (0, index)
+    issues_list[start:] = sorted(issues_list[start:], key=_key)
@@ -0,0 +1,133 @@
+# regex_guard.py
+"""
+文书提取正则的防护。
+- 搜索窗口：提取函数中的正则只在文本开头的有限窗口内执行（EXTRACTION_WINDOW_CHARS），
+  人名等占位部分使用有上限的量词（NAME_MAX_CHARS），避免惰性量词在超长或格式异常的文本上超线性回溯。
+- 看门狗：每次提取都计时，超过时间预算（EXTRACTION_TIME_BUDGET_MS）的提取连同行号和函数名记录到日志，
+  并汇总到当前上传的记录列表中，便于定位导致上传变慢的单元格。
+
+Python 的 re 模块无法中途打断匹配，看门狗负责发现和记录；真正的防护来自搜索窗口和有界量词，
+两者都能通过 Config 调整。离线扫描工具见 benchmarks/scan_regex.py。
+"""
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+# 默认值，可在 Config 中通过同名配置项覆盖
+DEFAULT_EXTRACTION_WINDOW_CHARS = 20000
+DEFAULT_EXTRACTION_TIME_BUDGET_MS = 200
+
+# 姓名等占位部分允许的最大长度，用于构造 “关于给予(.{1,30}?)同志” 这类有界模式
+NAME_MAX_CHARS = 30
+# 段落标题中可变部分的最大长度，例如 “二、涉嫌违反工作纪律的问题” 中的 “工作纪律”
+HEADING_MAX_CHARS = 60
+
+class ExtractionGuard:
+    """
+    一次上传的提取防护设置和超时记录。
+    """
+    __slots__ = ('window', 'budget', 'kind', 'slow_extractions')
+
+    def __init__(self, window=DEFAULT_EXTRACTION_WINDOW_CHARS, budget_ms=DEFAULT_EXTRACTION_TIME_BUDGET_MS, kind=None):
+        self.window = window
+        self.budget = budget_ms / 1000.0
+        self.kind = kind
+        self.slow_extractions = []
+
+_default_guard = ExtractionGuard()
+_current_guard = ContextVar('current_extraction_guard', default=None)
+_current_row = ContextVar('current_extraction_row', default=None)
+
+def _guard():
+    return _current_guard.get() or _default_guard
+
+@contextmanager
+def use_extraction_guard(app_config, kind=None):
+    """
+    在 with 代码块内使用 app_config 中的窗口和时间预算，退出时恢复。
+
+    参数:
+        app_config (dict): Flask 应用的配置字典，可包含 EXTRACTION_WINDOW_CHARS、EXTRACTION_TIME_BUDGET_MS。
+        kind (str): 'case' 或 'clue'，仅用于日志。
+
+    返回:
+        ExtractionGuard: 可在代码块结束后读取 slow_extractions。
+    """
+    guard = ExtractionGuard(app_config.get('EXTRACTION_WINDOW_CHARS', DEFAULT_EXTRACTION_WINDOW_CHARS),
+                            app_config.get('EXTRACTION_TIME_BUDGET_MS', DEFAULT_EXTRACTION_TIME_BUDGET_MS),
+                            kind)
+    token = _current_guard.set(guard)
+    try:
+        yield guard
+    finally:
+        _current_guard.reset(token)
+        if guard.slow_extractions:
+            logger.warning(f"本次{kind or ''}上传共有 {len(guard.slow_extractions)} 次提取超过时间预算")
+
+def set_current_row(index):
+    """
+    记录当前正在校验的行（DataFrame 索引），看门狗日志中的行号由此得到。
+    """
+    _current_row.set(index)
+
+def bounded(text, window=None):
+    """
+    将文本截取到搜索窗口内。
+    """
+    window = window if window is not None else _guard().window
+    if window and len(text) > window:
+        return text[:window]
+    return text
+
+def _record(name, elapsed):
+    guard = _guard()
+    row = _current_row.get()
+    row_label = row + 2 if isinstance(row, int) else row
+    guard.slow_extractions.append({'行号': row_label, '提取函数': name, '耗时毫秒': round(elapsed * 1000, 1)})
+    logger.warning(f"<提取超时> - 行 {row_label} - {name} 耗时 {elapsed * 1000:.1f}ms，超过预算 {guard.budget * 1000:.0f}ms")
+
+def guarded_search(pattern, text, flags=0, window=None):
+    """
+    在搜索窗口内执行 re.search，并按时间预算计时。
+
+    参数:
+        pattern (str): 正则表达式。
+        text (str): 待搜索文本。
+        flags (int): re 标志。
+        window (int): 搜索窗口，None 时使用当前配置。
+
+    返回:
+        re.Match or None: 与 re.search 相同（偏移相对于原文本，窗口从文本开头截取）。
+    """
+    started = time.perf_counter()
+    match = re.search(pattern, bounded(text, window), flags)
+    elapsed = time.perf_counter() - started
+    if elapsed > _guard().budget:
+        _record(f"re.search({pattern[:40]!r})", elapsed)
+    return match
+
+def watch_extraction(func=None, *, bound=True):
+    """
+    提取函数的看门狗装饰器：文本参数截取到搜索窗口内，耗时超过预算时记录行号和函数名。
+    第一个位置参数为待提取的文本。需要读取全文（例如文末落款）且正则均为线性的函数可用
+    @watch_extraction(bound=False) 只计时、不截取。
+    """
+    if func is None:
+        return lambda f: watch_extraction(f, bound=bound)
+
+    @wraps(func)
+    def wrapper(text, *args, **kwargs):
+        if bound and isinstance(text, str):
+            text = bounded(text)
+        started = time.perf_counter()
+        result = func(text, *args, **kwargs)
+        elapsed = time.perf_counter() - started
+        if elapsed > _guard().budget:
+            _record(func.__name__, elapsed)
+        return result
+    return wrapper
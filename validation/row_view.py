@@ -0,0 +1,90 @@
+# row_view.py
+"""
+轻量级行视图，替代校验规则中的 df.iterrows()。
+iterrows() 每行都要构造一个新的 pd.Series 并统一行内数据类型，而校验规则对每行要调用几十次 row.get(...)。
+这里在每次上传时把各列预先取出为对象数组、列名到列位置的映射只计算一次，
+每行只创建一个带 __slots__ 的小对象，按列名读取时直接索引对应的数组。
+RowView 支持规则代码中用到的 row.get(列名, 默认值)、row[列名]、列名 in row.index 和 row.name。
+"""
+
+def _object_array(series):
+    """
+    将一列取出为对象数组。category 和 Arrow 字符串列的空值统一为 NaN（Arrow 字符串默认为 pd.NA），
+    规则代码中的 pd.notna / str(...) 判断与 object 列一致。
+    """
+    if series.dtype != object and series.dtype.kind == 'O':
+        return series.to_numpy(dtype=object, na_value=float('nan'))
+    return series.to_numpy(dtype=object)
+
+class RowTable:
+    """
+    一次上传共用的列数据：列名到列位置的映射以及各列的对象数组。
+    """
+    __slots__ = ('columns', 'positions', 'arrays', 'labels')
+
+    def __init__(self, df):
+        self.columns = df.columns
+        self.positions = {column: position for position, column in enumerate(df.columns)}
+        # 保持各列原有的取值类型（日期列为 Timestamp，空值为 NaN/NaT），不像 iterrows 那样按行统一类型
+        self.arrays = [_object_array(df.iloc[:, position]) for position in range(len(df.columns))]
+        self.labels = df.index.tolist()
+
+    def __len__(self):
+        return len(self.labels)
+
+    def column(self, name):
+        """
+        返回某一列的对象数组，列不存在时返回 None。
+        """
+        position = self.positions.get(name)
+        return None if position is None else self.arrays[position]
+
+
+class RowView:
+    """
+    表中某一行的只读视图，接口与规则代码中使用的 pd.Series 子集一致。
+    """
+    __slots__ = ('_table', '_position', 'name')
+
+    def __init__(self, table, position):
+        self._table = table
+        self._position = position
+        self.name = table.labels[position]
+
+    def get(self, key, default=None):
+        """
+        按列名读取单元格，列不存在时返回 default（与 pd.Series.get 一致，空单元格仍返回 NaN）。
+        """
+        position = self._table.positions.get(key)
+        if position is None:
+            return default
+        return self._table.arrays[position][self._position]
+
+    def __getitem__(self, key):
+        position = self._table.positions.get(key)
+        if position is None:
+            raise KeyError(key)
+        return self._table.arrays[position][self._position]
+
+    def __contains__(self, key):
+        return key in self._table.positions
+
+    @property
+    def index(self):
+        """
+        与 pd.Series.index 一致，返回列名，便于 `列名 in row.index` 判断。
+        """
+        return self._table.columns
+
+
+def iter_rows(df, table=None):
+    """
+    逐行遍历 DataFrame，返回 (行索引, RowView)，用法与 df.iterrows() 相同。
+
+    参数:
+        df (pd.DataFrame): 待遍历的数据。
+        table (RowTable): 可选，已构建的列数据，同一 DataFrame 多次遍历时可复用。
+    """
+    table = table if table is not None else RowTable(df)
+    for position, label in enumerate(table.labels):
+        yield label, RowView(table, position)
@@ -0,0 +1,142 @@
+# shared_text.py
+"""
+长文本列的共享内存传输。
+
+多进程校验时，若按任务 pickle 数据块，立案报告、审理报告等数 KB 的文书会在每个任务中序列化一次。
+pack_text_columns 在父进程中把需要的文本列一次性写入一块 multiprocessing.shared_memory，
+布局与 Arrow 的字符串数组相同：
+    data      各单元格 UTF-8 编码首尾相接；
+    offsets   int64，长度为行数 + 1，第 i 行为 data[offsets[i]:offsets[i + 1]]；
+    valid     uint8，第 i 行为 0 表示空单元格（NaN）。
+子进程 attach 后直接在共享内存上建立 numpy 视图（零拷贝），只解码自己负责的行。
+"""
+import logging
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 各段在共享内存中的对齐字节数（int64 视图要求 8 字节对齐）
+_ALIGN = 8
+
+def _aligned(size):
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def packable_text_columns(df, columns):
+    """
+    返回 columns 中可以打包的列：存在于 df 中，且非空单元格全部为字符串。
+    """
+    packable = []
+    for column in columns:
+        if column not in df.columns or column in packable:
+            continue
+        series = df[column]
+        if all(type(value) is str for value in series[series.notna()]):
+            packable.append(column)
+    return packable
+
+class SharedTextColumns:
+    """
+    父进程持有的共享内存文本列。descriptor 可 pickle，传给子进程的 attach_text_columns。
+    使用完毕后须调用 close()（也可作为上下文管理器使用），共享内存在此时释放。
+    """
+    def __init__(self, shm, descriptor):
+        self.shm = shm
+        self.descriptor = descriptor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+def pack_text_columns(df, columns):
+    """
+    将 df 的文本列按行位置打包到共享内存。
+
+    参数:
+        df (pd.DataFrame): 上传数据。
+        columns (list): 需要打包的列，非空单元格须全部为字符串（见 packable_text_columns）。
+
+    返回:
+        SharedTextColumns: 共享内存及其布局描述。
+    """
+    rows = len(df)
+    layout = {}
+    segments = []
+    size = 0
+    for column in columns:
+        series = df[column]
+        valid = series.notna().to_numpy()
+        # 同一文本（intern_texts 合并后的重复文书）只编码一次
+        encoded = {}
+        chunks = [encoded.setdefault(value, value.encode('utf-8')) if ok else b''
+                  for value, ok in zip(series.tolist(), valid)]
+        offsets = np.zeros(rows + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        data = b''.join(chunks)
+        entry = {'dtype': str(series.dtype)}
+        for part, payload in (('offsets', offsets.tobytes()), ('valid', valid.astype(np.uint8).tobytes()),
+                              ('data', data)):
+            entry[part] = (size, len(payload))
+            segments.append((size, payload))
+            size = _aligned(size + len(payload))
+        layout[column] = entry
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for start, payload in segments:
+        shm.buf[start:start + len(payload)] = payload
+    logger.info(f"共享内存文本列: {len(columns)} 列 {rows} 行，共 {size / 1024 / 1024:.1f} MB")
+    return SharedTextColumns(shm, {'name': shm.name, 'rows': rows, 'columns': layout})
+
+class SharedTextView:
+    """
+    子进程中的共享内存文本列视图。column(name, start, stop) 解码 [start, stop) 行，
+    得到与打包前 dtype 相同的 Series。numpy 视图只在解码期间存在，进程退出时共享内存可以正常关闭。
+    """
+    def __init__(self, shm, descriptor):
+        self.shm = shm
+        self.rows = descriptor['rows']
+        self.layout = descriptor['columns']
+        self.dtypes = {column: entry['dtype'] for column, entry in self.layout.items()}
+
+    def values(self, column, start, stop):
+        """
+        解码 [start, stop) 行的文本，空单元格为 NaN。
+        """
+        entry = self.layout[column]
+        offsets = np.frombuffer(self.shm.buf, dtype=np.int64, count=self.rows + 1, offset=entry['offsets'][0])
+        valid = np.frombuffer(self.shm.buf, dtype=np.uint8, count=self.rows, offset=entry['valid'][0])
+        data_start = entry['data'][0]
+        bounds = (offsets[start:stop + 1] + data_start).tolist()
+        flags = valid[start:stop].tolist()
+        buf = self.shm.buf
+        values = [str(buf[bounds[i]:bounds[i + 1]], 'utf-8') if flags[i] else np.nan for i in range(stop - start)]
+        del offsets, valid, buf
+        return values
+
+    def column(self, column, start, stop, index=None):
+        return pd.Series(self.values(column, start, stop), index=index, name=column, dtype=self.dtypes[column])
+
+    def close(self):
+        self.shm.close()
+
+def attach_text_columns(descriptor):
+    """
+    在子进程中按 pack_text_columns 返回的 descriptor 连接共享内存。
+    子进程只读取，共享内存由父进程负责释放。进程池的子进程与父进程共用同一个 resource_tracker，
+    连接时的重复登记不会导致共享内存在子进程退出时被提前释放。
+
+    返回:
+        SharedTextView: 零拷贝的文本列视图。
+    """
+    shm = shared_memory.SharedMemory(name=descriptor['name'])
+    return SharedTextView(shm, descriptor)
@@ -0,0 +1,278 @@
+# validation_api.py
+"""
+不依赖 Flask 请求的校验接口。
+
+validate_case_workbook / validate_clue_workbook 接收工作簿的字节内容、文件对象或路径，
+直接在内存中解析（字节内容不落盘），返回结构化的 ValidationResult；需要时同时生成副本和编号表的字节内容。
+上传路由、批处理、测试和基准测试都通过这两个函数校验，路由只负责保存文件、缓存和 flash 消息。
+
+    from validation_api import validate_case_workbook
+    result = validate_case_workbook(open('立案登记表.xlsx', 'rb').read(), Config, outputs=True)
+    if result.ok:
+        for issue in result.issues: ...
+        copy_name, copy_bytes = result.outputs['copy']
+"""
+import io
+import os
+import logging
+import tempfile
+from collections.abc import Mapping
+
+import pandas as pd
+
+from config import Config
+from db_utils import get_authority_agency_dict
+from validation.document_cache import intern_texts
+from validation.ingestion_schema import optimize_dtypes, CASE_SCHEMA, CLUE_SCHEMA
+from validation.case_validation.case_validators import validate_case_relationships
+from validation.clue_validation.clue_validation import validate_clue_data
+from file_upload.upload_utils import unique_case_issues
+from file_upload.incremental_validation import validate_case_incrementally, validate_clue_incrementally
+from file_upload.output_stage import write_case_outputs, write_clue_outputs
+
+logger = logging.getLogger(__name__)
+
+class ValidationResult:
+    """
+    一次校验的结果。
+
+    属性:
+        kind (str): 'case' 或 'clue'。
+        filename (str): 工作簿文件名，用于生成输出文件名。
+        errors (list): 无法校验的原因（读取失败、缺少表头、处置情况报告整列为空），为空时 ok 为 True。
+        df (pd.DataFrame): 读取并调整存储类型后的数据，读取失败时为 None。
+        issues (list): 问题字典列表（立案已去重），列见 CASE_ISSUE_COLUMNS / CLUE_ISSUE_COLUMNS。
+        results (CaseResultMatrix): 立案的 行 × 规则 命中矩阵，线索为 None。
+        error_count (int): 线索校验返回的错误数，立案为 0。
+        outputs (dict): {输出名称: (文件名, 字节内容)}，'copy' 为副本，'number_table' 为编号表；
+                        未要求生成输出或没有对应文件（线索无问题时的编号文件）时不含该项。
+    """
+    __slots__ = ('kind', 'filename', 'errors', 'df', 'issues', 'results', 'error_count', 'outputs')
+
+    def __init__(self, kind, filename):
+        self.kind = kind
+        self.filename = filename
+        self.errors = []
+        self.df = None
+        self.issues = []
+        self.results = None
+        self.error_count = 0
+        self.outputs = {}
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    @property
+    def rows(self):
+        return 0 if self.df is None else len(self.df)
+
+    def __repr__(self):
+        return (f"ValidationResult(kind={self.kind!r}, filename={self.filename!r}, rows={self.rows}, "
+                f"issues={len(self.issues)}, errors={self.errors!r}, outputs={list(self.outputs)})")
+
+def config_dict(config=None):
+    """
+    将配置统一为字典：接受 Flask 的 app.config、普通字典或 Config 类（实例），默认为 Config。
+    """
+    if isinstance(config, Mapping):
+        return config
+    source = config if config is not None else Config
+    return {name: getattr(source, name) for name in dir(source) if name.isupper()}
+
+def _source_path(source):
+    """
+    source 为文件路径时返回路径字符串，否则返回 None。
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return None
+
+def read_workbook(source, app_config, schema):
+    """
+    读取工作簿的第一个工作表，合并重复长文本并按 schema 调整存储类型。
+
+    参数:
+        source (bytes | file-like | str | os.PathLike): 工作簿内容、已打开的文件对象或路径。
+        app_config (dict): 配置字典。
+        schema (dict): CASE_SCHEMA 或 CLUE_SCHEMA。
+
+    返回:
+        pd.DataFrame: 上传数据。
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    df = pd.read_excel(source)
+    intern_texts(df)
+    optimize_dtypes(df, app_config['COLUMN_MAPPINGS'], schema)
+    return df
+
+def case_header_errors(columns, app_config):
+    """
+    检查立案登记表的必要表头（含党纪处分和政务处分）。
+
+    参数:
+        columns (pd.Index): 上传文件的表头。
+        app_config (dict): 配置字典。
+
+    返回:
+        list: 错误消息，表头齐全时为空列表。
+    """
+    required_headers = list(app_config['CASE_REQUIRED_HEADERS'])
+
+    # 确保党纪处分和政务处分字段也在必填头中
+    disciplinary_sanction_col = app_config['COLUMN_MAPPINGS'].get("disciplinary_sanction")
+    if disciplinary_sanction_col and disciplinary_sanction_col not in required_headers:
+        required_headers.append(disciplinary_sanction_col)
+
+    administrative_sanction_col = app_config['COLUMN_MAPPINGS'].get("administrative_sanction")
+    if administrative_sanction_col and administrative_sanction_col not in required_headers:
+        required_headers.append(administrative_sanction_col)
+
+    missing_headers = [header for header in required_headers if header not in columns]
+    if missing_headers:
+        logger.error(f"立案登记表缺少必要表头: {missing_headers}")
+        return [f'Excel文件缺少必要的表头: {", ".join(missing_headers)}']
+    return []
+
+def clue_header_errors(columns, app_config):
+    """
+    检查线索登记表的必要表头（含组织措施、受理时间和处置情况报告）。
+
+    参数:
+        columns (pd.Index): 上传文件的表头。
+        app_config (dict): 配置字典。
+
+    返回:
+        list: 错误消息，表头齐全时为空列表。
+    """
+    required_headers = list(app_config['CLUE_REQUIRED_HEADERS']) + [
+        app_config['COLUMN_MAPPINGS']["organization_measure"],
+        app_config['COLUMN_MAPPINGS']["acceptance_time"]
+    ]
+
+    missing_headers = [header for header in required_headers if header not in columns]
+    if missing_headers:
+        logger.error(f"缺少必要表头: {missing_headers}")
+        return [f'Excel文件缺少必要的表头: {", ".join(missing_headers)}']
+
+    disposal_report_column = app_config['COLUMN_MAPPINGS'].get("disposal_report", "处置情况报告")
+    if disposal_report_column not in columns:
+        logger.error(f"Excel文件缺少必要表头: {disposal_report_column}")
+        return [f'Excel文件缺少必要的表头"{disposal_report_column}"']
+    return []
+
+def empty_disposal_report_error(app_config):
+    """
+    处置情况报告整列为空时的错误消息。
+    """
+    disposal_report_column = app_config['COLUMN_MAPPINGS'].get("disposal_report", "处置情况报告")
+    logger.error(f'线索登记表"{disposal_report_column}"字段为空')
+    return f'线索登记表"{disposal_report_column}"字段为空'
+
+def _load(result, source, app_config, schema, header_errors):
+    """
+    读取工作簿并检查表头，失败原因记录在 result.errors 中。
+
+    返回:
+        bool: 可以继续校验时为 True。
+    """
+    try:
+        result.df = read_workbook(source, app_config, schema)
+    except Exception as e:
+        logger.error(f"读取工作簿失败: {result.filename} - {e}", exc_info=True)
+        result.errors.append(f'读取文件内容失败，请确保它是有效的Excel文件: {str(e)}')
+        return False
+    result.errors.extend(header_errors(result.df.columns, app_config))
+    return result.ok
+
+def _render_outputs(write_outputs):
+    """
+    在临时目录中生成输出文件，返回 {输出名称: (文件名, 字节内容)}。
+    write_outputs(output_dir) 返回 (副本路径, 编号表路径)。
+    """
+    with tempfile.TemporaryDirectory(prefix='validation-api-') as output_dir:
+        paths = dict(zip(('copy', 'number_table'), write_outputs(output_dir)))
+        outputs = {}
+        for name, path in paths.items():
+            if path:
+                with open(path, 'rb') as f:
+                    outputs[name] = (os.path.basename(path), f.read())
+        return outputs
+
+def validate_case_workbook(source, config=None, filename=None, outputs=False, incremental=False):
+    """
+    校验立案登记表。
+
+    参数:
+        source (bytes | file-like | str | os.PathLike): 工作簿内容、已打开的文件对象或路径。
+        config: 配置（app.config、字典或 Config），默认为 Config。
+        filename (str): 工作簿文件名，用于输出文件名；source 为路径时默认取其文件名。
+        outputs (bool): 是否同时生成副本和被调查人立案编号表的字节内容。
+        incremental (bool): 是否按行指纹只校验变化的行（需开启 INCREMENTAL_VALIDATION_ENABLED）。
+
+    返回:
+        ValidationResult: 校验结果。
+    """
+    app_config = config_dict(config)
+    source_path = _source_path(source)
+    result = ValidationResult('case', filename or (os.path.basename(source_path) if source_path else '立案登记表.xlsx'))
+    if not _load(result, source, app_config, CASE_SCHEMA, case_header_errors):
+        return result
+
+    # 接收行 × 规则的命中矩阵和问题列表
+    validate = validate_case_incrementally if incremental else validate_case_relationships
+    result.results, issues_list = validate(result.df, app_config, [])
+    hit_counts = {rule_id: count for rule_id, count in result.results.counts().items() if count}
+    logger.info(f"立案登记表校验完成: {len(result.results.flagged_rows())} 行存在问题，各规则命中行数: {hit_counts}")
+
+    # 确保 issues_list 包含字典，并进行去重
+    result.issues = unique_case_issues(issues_list)
+
+    if outputs:
+        result.outputs = _render_outputs(
+            lambda output_dir: write_case_outputs(result.df, result.filename, output_dir, result.results,
+                                                  result.issues, source_path, app_config)
+        )
+    return result
+
+def validate_clue_workbook(source, config=None, filename=None, outputs=False, incremental=False,
+                           agency_mapping_db=None):
+    """
+    校验线索登记表。
+
+    参数:
+        source (bytes | file-like | str | os.PathLike): 工作簿内容、已打开的文件对象或路径。
+        config: 配置（app.config、字典或 Config），默认为 Config。
+        filename (str): 工作簿文件名，用于输出文件名；source 为路径时默认取其文件名。
+        outputs (bool): 是否同时生成副本和线索编号文件的字节内容。
+        incremental (bool): 是否按行指纹只校验变化的行（需开启 INCREMENTAL_VALIDATION_ENABLED）。
+        agency_mapping_db (list): NSL 类别的机关单位映射，默认从数据库读取。
+
+    返回:
+        ValidationResult: 校验结果。
+    """
+    app_config = config_dict(config)
+    source_path = _source_path(source)
+    result = ValidationResult('clue', filename or (os.path.basename(source_path) if source_path else '线索登记表.xlsx'))
+    if not _load(result, source, app_config, CLUE_SCHEMA, clue_header_errors):
+        return result
+
+    disposal_report_column = app_config['COLUMN_MAPPINGS'].get("disposal_report", "处置情况报告")
+    if result.df[disposal_report_column].isnull().all():
+        result.errors.append(empty_disposal_report_error(app_config))
+        return result
+
+    if agency_mapping_db is None:
+        agency_mapping_db = get_authority_agency_dict(category='NSL')
+
+    validate = validate_clue_incrementally if incremental else validate_clue_data
+    result.issues, result.error_count = validate(result.df, app_config, agency_mapping_db)
+    logger.info(f"validate_clue_data 返回了 {len(result.issues)} 个问题和 {result.error_count} 个错误。")
+
+    if outputs:
+        result.outputs = _render_outputs(
+            lambda output_dir: write_clue_outputs(result.df, result.filename, output_dir, result.issues,
+                                                  source_path, app_config)
+        )
+    return result
@@ -0,0 +1,158 @@
+# wsgi_server.py
+"""
+多用户部署时的 WSGI 服务（python app.py serve）。
+
+桌面模式（直接运行 app.py 或打包的 .exe）使用 Flask 自带的开发服务器并自动打开浏览器，只适合单机使用。
+serve 模式改用纯 Python 的 waitress（pip install waitress，可选依赖，只有 serve 模式需要）：
+    线程数          SERVE_THREADS 个请求同时处理，校验中 CPU 密集的部分由校验 / 输出进程池承担；
+    连接数上限      超过 SERVE_CONNECTION_LIMIT 的连接在内核队列中等待，不会无限制地创建；
+    请求大小上限    请求体超过 SERVE_MAX_REQUEST_BODY_SIZE 时直接返回 413，不读入内存或临时文件；
+    优雅停止        Ctrl+C / SIGTERM 后新请求返回 503，等待正在处理的上传完成（最多 SERVE_SHUTDOWN_TIMEOUT 秒）
+                    再退出；再次按 Ctrl+C 立即退出。
+
+用法示例（在项目根目录执行）:
+    python app.py serve
+    python app.py serve --port 8080 --threads 16
+"""
+import time
+import signal
+import logging
+import argparse
+import threading
+import _thread
+
+from werkzeug.wsgi import ClosingIterator
+
+from config import Config
+
+try:
+    from waitress import create_server
+except ImportError:
+    create_server = None
+
+logger = logging.getLogger(__name__)
+
+# 正在处理的请求全部结束后，留给服务器把最后的响应写出到网络的时间（秒）
+FLUSH_GRACE_SECONDS = 1
+
+# 停止期间新请求收到的响应内容
+DRAINING_MESSAGE = '服务正在停止，请稍后重试'
+
+class DrainingMiddleware:
+    """
+    记录正在处理的请求数的 WSGI 中间件。drain() 之后新请求直接返回 503，
+    请求的响应内容全部写出（app_iter.close()）后才视为结束。
+    """
+    def __init__(self, app):
+        self.app = app
+        self.active = 0
+        self.draining = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def __call__(self, environ, start_response):
+        with self._lock:
+            if self.draining:
+                start_response('503 Service Unavailable', [('Content-Type', 'text/plain; charset=utf-8'),
+                                                           ('Retry-After', '30')])
+                return [DRAINING_MESSAGE.encode('utf-8')]
+            self.active += 1
+        try:
+            return ClosingIterator(self.app(environ, start_response), self._finished)
+        except BaseException:
+            self._finished()
+            raise
+
+    def _finished(self):
+        with self._lock:
+            self.active -= 1
+            if self.active == 0:
+                self._idle.notify_all()
+
+    def drain(self, timeout):
+        """
+        停止接收新请求并等待正在处理的请求结束。
+
+        返回:
+            bool: 超时前全部结束时为 True。
+        """
+        with self._lock:
+            self.draining = True
+            return self._idle.wait_for(lambda: self.active == 0, timeout)
+
+def server_options(app_config, host=None, port=None, threads=None):
+    """
+    由配置生成 waitress.create_server 的参数，命令行参数优先。
+    """
+    return {
+        'host': host or app_config['SERVE_HOST'],
+        'port': port or app_config['SERVE_PORT'],
+        'threads': threads or app_config['SERVE_THREADS'],
+        'connection_limit': app_config['SERVE_CONNECTION_LIMIT'],
+        'max_request_body_size': app_config['SERVE_MAX_REQUEST_BODY_SIZE'],
+        'channel_timeout': app_config['SERVE_CHANNEL_TIMEOUT'],
+        'ident': 'case-management',
+    }
+
+def serve(app, host=None, port=None, threads=None):
+    """
+    在 waitress 中运行 Flask 应用，直到收到 Ctrl+C / SIGTERM 并完成优雅停止。
+
+    参数:
+        app (flask.Flask): 已完成配置的应用（见 app.build_app）。
+        host / port / threads: 覆盖 SERVE_HOST / SERVE_PORT / SERVE_THREADS。
+
+    返回:
+        int: 进程退出码，未安装 waitress 时为 1。
+    """
+    if create_server is None:
+        logger.error("serve 模式需要 waitress，请先执行: pip install waitress")
+        print("serve 模式需要 waitress，请先执行: pip install waitress")
+        return 1
+
+    options = server_options(app.config, host, port, threads)
+    # Flask 同样检查请求大小，直接调用 WSGI 应用（测试等）时也有上限
+    app.config['MAX_CONTENT_LENGTH'] = options['max_request_body_size']
+    middleware = DrainingMiddleware(app.wsgi_app)
+    app.wsgi_app = middleware
+    server = create_server(app, **options)
+
+    shutdown_timeout = app.config['SERVE_SHUTDOWN_TIMEOUT']
+    stopping = threading.Event()
+    stopped = threading.Event()
+
+    def _drain():
+        logger.info(f"正在停止：等待 {middleware.active} 个处理中的请求完成（最多 {shutdown_timeout} 秒）")
+        if not middleware.drain(shutdown_timeout):
+            logger.warning(f"等待超时，{middleware.active} 个请求未完成")
+        time.sleep(FLUSH_GRACE_SECONDS)
+        stopped.set()
+        # 在主线程中引发 KeyboardInterrupt，waitress 收到后关闭工作线程并返回
+        _thread.interrupt_main()
+
+    def _on_signal(signum, frame):
+        if stopped.is_set() or stopping.is_set():
+            raise KeyboardInterrupt
+        stopping.set()
+        threading.Thread(target=_drain, name='serve-drain', daemon=True).start()
+
+    signal.signal(signal.SIGINT, _on_signal)
+    signal.signal(signal.SIGTERM, _on_signal)
+    if hasattr(signal, 'SIGBREAK'):
+        # Windows 控制台的 Ctrl+Break
+        signal.signal(signal.SIGBREAK, _on_signal)
+
+    logger.info(f"waitress 服务已启动: http://{options['host']}:{options['port']}，{options['threads']} 个线程，"
+                f"最多 {options['connection_limit']} 个连接，请求大小上限 "
+                f"{options['max_request_body_size'] // (1024 * 1024)} MB")
+    print(f"服务已启动: http://{options['host']}:{options['port']}（按 Ctrl+C 停止）")
+    server.run()
+    logger.info("waitress 服务已停止")
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="以 waitress 运行案管系统（多用户部署）")
+    parser.add_argument('--host', help=f"监听地址，默认为 Config.SERVE_HOST（{Config.SERVE_HOST}）")
+    parser.add_argument('--port', type=int, help=f"监听端口，默认为 Config.SERVE_PORT（{Config.SERVE_PORT}）")
+    parser.add_argument('--threads', type=int, help=f"处理请求的线程数，默认为 Config.SERVE_THREADS（{Config.SERVE_THREADS}）")
+    return parser.parse_args(argv)
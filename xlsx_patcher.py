@@ -0,0 +1,536 @@
+# xlsx_patcher.py
+"""
+在原上传工作簿上直接标色的副本输出引擎（Config.COPY_OUTPUT_ENGINE = 'patch'）。
+
+format_case_excel / format_clue_excel 默认按 DataFrame 重新生成整个工作簿，原文件的列宽、字体、合并单元格等格式全部丢失，
+且每个单元格都要重新序列化。patch 引擎逐个复制原 xlsx 压缩包中的条目，只修改三处：
+    第一个工作表   逐行流式扫描 XML，只改写需要标色的单元格的 s= 样式属性（原来没有单元格元素时插入空单元格），
+                  其余行原样复制；
+    styles.xml    追加标色用的填充和由原样式派生的单元格样式（原样式 + 填充），以及问题列表表头的粗体样式；
+    问题列表       作为新的工作表部件加入（同时登记到 workbook.xml、关系文件和 [Content_Types].xml），单元格使用内联字符串。
+需要标色的单元格与 rebuild 引擎一致：用 HighlightRecorder 代替 xlsxwriter 工作表执行同一套 apply_*_table_formats。
+"""
+import os
+import re
+import codecs
+import logging
+import posixpath
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from config import Config
+from excel_utils import apply_case_table_formats, apply_clue_table_formats, CASE_ISSUE_COLUMNS, CLUE_ISSUE_COLUMNS
+from validation.header_map import use_header_map
+
+logger = logging.getLogger(__name__)
+
+# 流式扫描工作表 XML 时每次读取的字节数
+READ_BLOCK_SIZE = 1024 * 1024
+
+ISSUES_SHEET_NAME = '问题列表'
+
+RELATIONSHIPS_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+WORKSHEET_REL_TYPE = RELATIONSHIPS_NS + '/worksheet'
+WORKSHEET_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+
+# XML 1.0 不允许出现的控制字符
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_CELL_REF = re.compile(r'([A-Z]+)(\d+)')
+
+class HighlightRecorder:
+    """
+    代替 xlsxwriter 工作表传给 apply_*_table_formats，只记录写入的位置和格式。
+    cells 为 {(行, 列): 颜色}，行列从 0 开始（第 0 行为表头），同一单元格以最后一次写入为准。
+    """
+    def __init__(self):
+        self.cells = {}
+
+    def write(self, row, col, value, cell_format=None):
+        if cell_format is not None and col is not None:
+            self.cells[(row, col)] = cell_format
+
+def column_letters(col):
+    """
+    0 起始的列位置转换为列字母（0 -> A，26 -> AA）。
+    """
+    letters = ''
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def column_index(letters):
+    """
+    列字母转换为 0 起始的列位置。
+    """
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+def _attr(tag, name):
+    match = re.search(r'\s' + name + r'="([^"]*)"', tag)
+    return match.group(1) if match else None
+
+def _set_attr(tag, name, value):
+    """
+    设置开始标签中的属性，tag 为 '<c ...>' 或 '<c .../>'。
+    """
+    pattern = re.compile(r'(\s' + name + r'=")[^"]*(")')
+    if pattern.search(tag):
+        return pattern.sub(lambda m: m.group(1) + str(value) + m.group(2), tag, count=1)
+    end = len(tag) - (2 if tag.endswith('/>') else 1)
+    return f'{tag[:end]} {name}="{value}"{tag[end:]}'
+
+def _remove_attr(tag, name):
+    return re.sub(r'\s' + name + r'="[^"]*"', '', tag, count=1)
+
+def _element_blocks(xml, prefix, tag):
+    """
+    返回 xml 中 <tag>...</tag> 或 <tag/> 元素的 (开始, 结束) 位置列表（不处理嵌套的同名元素）。
+    """
+    return [m.span() for m in re.finditer(
+        rf'<{prefix}{tag}\b[^>]*?(?:/>|>.*?</{prefix}{tag}>)', xml, re.S)]
+
+def _xml_prefix(xml, root):
+    match = re.search(rf'<(\w+:)?{root}\b', xml)
+    return (match.group(1) or '') if match else ''
+
+class _Styles:
+    """
+    styles.xml 的追加式修改：按需追加填充、派生单元格样式和粗体表头样式，原有样式编号不变。
+    """
+    def __init__(self, xml):
+        self.xml = xml
+        self.prefix = _xml_prefix(xml, 'styleSheet')
+        self.xfs = self._children('cellXfs', 'xf')
+        self.fill_count = len(self._children('fills', 'fill'))
+        self.font_count = len(self._children('fonts', 'font'))
+        self.new_fills = []
+        self.new_fonts = []
+        self.new_xfs = []
+        self._fill_ids = {}
+        self._derived = {}
+
+    def _section(self, name, xml=None):
+        xml = self.xml if xml is None else xml
+        match = re.search(rf'<{self.prefix}{name}\b[^>]*?(?:/>|>(.*?)</{self.prefix}{name}>)', xml, re.S)
+        if match is None:
+            raise ValueError(f"styles.xml 中没有 {name}")
+        return match
+
+    def _children(self, section, tag):
+        body = self._section(section).group(1) or ''
+        return [body[start:end] for start, end in _element_blocks(body, self.prefix, tag)]
+
+    def _fill_id(self, color):
+        if color not in self._fill_ids:
+            rgb = 'FF' + color.lstrip('#').upper()
+            p = self.prefix
+            self.new_fills.append(
+                f'<{p}fill><{p}patternFill patternType="solid"><{p}fgColor rgb="{rgb}"/>'
+                f'<{p}bgColor indexed="64"/></{p}patternFill></{p}fill>')
+            self._fill_ids[color] = self.fill_count + len(self.new_fills) - 1
+        return self._fill_ids[color]
+
+    def _add_xf(self, xf):
+        self.new_xfs.append(xf)
+        return len(self.xfs) + len(self.new_xfs) - 1
+
+    def _base_xf(self, base):
+        if 0 <= base < len(self.xfs):
+            return self.xfs[base]
+        return f'<{self.prefix}xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+
+    def highlighted(self, base, color):
+        """
+        返回“原样式 base + color 填充”的样式编号，同一组合只追加一次。
+        """
+        key = (base, color)
+        if key not in self._derived:
+            xf = self._base_xf(base)
+            head_end = xf.index('>') + 1
+            head = xf[:head_end]
+            head = _set_attr(head, 'fillId', self._fill_id(color))
+            head = _set_attr(head, 'applyFill', 1)
+            self._derived[key] = self._add_xf(head + xf[head_end:])
+        return self._derived[key]
+
+    def bold(self):
+        """
+        返回粗体表头样式（默认字体加粗）的编号。
+        """
+        if 'bold' not in self._derived:
+            p = self.prefix
+            fonts = self._children('fonts', 'font')
+            font = fonts[0] if fonts else f'<{p}font/>'
+            if font.endswith('/>'):
+                font = f'{font[:-2]}><{p}b/></{p}font>'
+            elif f'<{p}b/>' not in font:
+                head_end = font.index('>') + 1
+                font = f'{font[:head_end]}<{p}b/>{font[head_end:]}'
+            self.new_fonts.append(font)
+            font_id = self.font_count + len(self.new_fonts) - 1
+            head = _set_attr(f'<{p}xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>', 'fontId', font_id)
+            self._derived['bold'] = self._add_xf(_set_attr(head, 'applyFont', 1))
+        return self._derived['bold']
+
+    def _append(self, xml, section, items, total):
+        if not items:
+            return xml
+        match = self._section(section, xml)
+        start_tag = xml[match.start():xml.index('>', match.start()) + 1]
+        new_start = _set_attr(start_tag.replace('/>', '>') if start_tag.endswith('/>') else start_tag, 'count', total)
+        body = match.group(1) or ''
+        element = f'{new_start}{body}{"".join(items)}</{self.prefix}{section}>'
+        return xml[:match.start()] + element + xml[match.end():]
+
+    def to_xml(self):
+        xml = self._append(self.xml, 'fills', self.new_fills, self.fill_count + len(self.new_fills))
+        xml = self._append(xml, 'fonts', self.new_fonts, self.font_count + len(self.new_fonts))
+        return self._append(xml, 'cellXfs', self.new_xfs, len(self.xfs) + len(self.new_xfs))
+
+def _resolve_target(base_dir, target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+def _first_sheet(workbook_xml, rels_xml):
+    """
+    返回第一个工作表（pd.read_excel 默认读取的工作表）在压缩包中的路径。
+    """
+    sheet = re.search(r'<(?:\w+:)?sheet\b[^>]*>', workbook_xml)
+    rel_id = re.search(r'\s\w+:id="([^"]*)"', sheet.group(0)).group(1)
+    for rel in re.finditer(r'<(?:\w+:)?Relationship\b[^>]*>', rels_xml):
+        if _attr(rel.group(0), 'Id') == rel_id:
+            return _resolve_target('xl', _attr(rel.group(0), 'Target'))
+    raise ValueError(f"workbook.xml.rels 中没有关系 {rel_id}")
+
+def _cell_xml(ref, value, style=None):
+    style_attr = f' s="{style}"' if style is not None else ''
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t{space}>{text}</t></is></c>'
+
+def _write_issue_sheet(out, headers, rows, header_style):
+    """
+    逐行写出问题列表工作表的 XML。
+    """
+    out.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+              f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{RELATIONSHIPS_NS}"><sheetData>'.encode('utf-8'))
+    row_number = 1
+    cells = ''.join(_cell_xml(f'{column_letters(col)}1', name, header_style) for col, name in enumerate(headers))
+    out.write(f'<row r="1">{cells}</row>'.encode('utf-8'))
+    for values in rows:
+        row_number += 1
+        cells = ''.join(_cell_xml(f'{column_letters(col)}{row_number}', value) for col, value in enumerate(values))
+        out.write(f'<row r="{row_number}">{cells}</row>'.encode('utf-8'))
+    out.write(b'</sheetData></worksheet>')
+
+class _SheetPatcher:
+    """
+    流式改写工作表 XML：targets 为 {行号(从 1 开始): {列位置: 颜色}}。
+    """
+    def __init__(self, targets, styles):
+        self.targets = targets
+        self.pending = sorted(targets)
+        self.styles = styles
+        self.prefix = ''
+        self.patched_cells = 0
+
+    def _new_cells(self, row_number, columns, base_style):
+        cells = []
+        for col in columns:
+            style = self.styles.highlighted(base_style, self.targets[row_number][col])
+            cells.append((col, f'<{self.prefix}c r="{column_letters(col)}{row_number}" s="{style}"/>'))
+            self.patched_cells += 1
+        return cells
+
+    def _missing_rows(self, before=None):
+        """
+        生成原 XML 中不存在、但需要标色的行（行号小于 before 的全部待处理行）。
+        """
+        parts = []
+        while self.pending and (before is None or self.pending[0] < before):
+            row_number = self.pending.pop(0)
+            cells = self._new_cells(row_number, sorted(self.targets[row_number]), 0)
+            parts.append(f'<{self.prefix}row r="{row_number}">{"".join(xml for _, xml in cells)}</{self.prefix}row>')
+        return ''.join(parts)
+
+    def _patch_row(self, row_xml, row_number):
+        p = self.prefix
+        head_end = row_xml.index('>') + 1
+        head = row_xml[:head_end]
+        if head.endswith('/>'):
+            body = ''
+            head = head[:-2] + '>'
+        else:
+            body = row_xml[head_end:row_xml.rindex(f'</{p}row>')]
+        # spans 只是提示，插入单元格后可能不准确，直接去掉
+        head = _remove_attr(head, 'spans')
+        row_style = int(_attr(head, 's') or 0) if _attr(head, 'customFormat') in ('1', 'true') else 0
+
+        wanted = dict(self.targets[row_number])
+        cells = []
+        col = -1
+        for match in re.finditer(rf'<{p}c\b[^>]*?(?:/>|>.*?</{p}c>)', body, re.S):
+            cell = match.group(0)
+            cell_head_end = cell.index('>') + 1
+            cell_head = cell[:cell_head_end]
+            ref = _attr(cell_head, 'r')
+            ref_match = _CELL_REF.match(ref) if ref else None
+            col = column_index(ref_match.group(1)) if ref_match else col + 1
+            color = wanted.pop(col, None)
+            if color is not None:
+                base = int(_attr(cell_head, 's') or row_style)
+                cell = _set_attr(cell_head, 's', self.styles.highlighted(base, color)) + cell[cell_head_end:]
+                self.patched_cells += 1
+            cells.append((col, cell))
+        if wanted:
+            cells.extend(self._new_cells(row_number, sorted(wanted), row_style))
+            cells.sort(key=lambda item: item[0])
+        return f'{head}{"".join(xml for _, xml in cells)}</{p}row>'
+
+    def patch(self, source, out):
+        """
+        从 source（二进制流）读取工作表 XML，改写后写入 out。
+        所有待标色的行处理完后，其余内容不再解析，按块直接复制。
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        state = {'buffer': '', 'eof': False}
+
+        def fill():
+            block = source.read(READ_BLOCK_SIZE)
+            state['eof'] = not block
+            state['buffer'] += decoder.decode(block, final=state['eof'])
+
+        def emit(text):
+            if text:
+                out.write(text.encode('utf-8'))
+
+        fill()
+        self.prefix = p = _xml_prefix(state['buffer'], 'worksheet')
+        row_start = re.compile(rf'<{p}row[\s>/]')
+        sheet_end = re.compile(rf'</{p}sheetData>|<{p}sheetData\s*/>')
+        row_close = f'</{p}row>'
+        row_number = 0
+        pos = 0
+
+        while self.pending:
+            buffer = state['buffer']
+            match = row_start.search(buffer, pos)
+            if match is None:
+                end = sheet_end.search(buffer, pos)
+                if end is not None:
+                    emit(buffer[pos:end.start()])
+                    missing = self._missing_rows()
+                    if end.group(0).endswith('/>'):
+                        emit(f'<{p}sheetData>{missing}</{p}sheetData>')
+                    else:
+                        emit(missing + end.group(0))
+                    pos = end.end()
+                    break
+                if state['eof']:
+                    raise ValueError("工作表 XML 中没有 sheetData 结束标签")
+                # 保留末尾一段，防止标签被读取块截断
+                keep = max(pos, len(buffer) - 64)
+                emit(buffer[pos:keep])
+                state['buffer'] = buffer[keep:]
+                pos = 0
+                fill()
+                continue
+
+            head_end = buffer.find('>', match.start())
+            if head_end >= 0 and buffer[head_end - 1] == '/':
+                row_end = head_end + 1
+            else:
+                close = buffer.find(row_close, head_end) if head_end >= 0 else -1
+                row_end = close + len(row_close) if close >= 0 else -1
+            if row_end < 0:
+                if state['eof']:
+                    raise ValueError("工作表 XML 不完整")
+                emit(buffer[pos:match.start()])
+                state['buffer'] = buffer[match.start():]
+                pos = 0
+                fill()
+                continue
+
+            emit(buffer[pos:match.start()])
+            row_xml = buffer[match.start():row_end]
+            pos = row_end
+            number = _attr(row_xml[:row_xml.index('>') + 1], 'r')
+            row_number = int(number) if number else row_number + 1
+            emit(self._missing_rows(before=row_number))
+            if row_number in self.targets:
+                if self.pending and self.pending[0] == row_number:
+                    self.pending.pop(0)
+                row_xml = self._patch_row(row_xml, row_number)
+            emit(row_xml)
+
+        emit(state['buffer'][pos:])
+        while not state['eof']:
+            state['buffer'] = ''
+            fill()
+            emit(state['buffer'])
+
+def _targets(cells, formats):
+    """
+    将 HighlightRecorder 记录的 {(行, 列): 格式} 转换为 {Excel 行号: {列位置: 颜色}}。
+    """
+    targets = {}
+    for (row, col), cell_format in cells.items():
+        targets.setdefault(row + 1, {})[col] = formats[cell_format]
+    return targets
+
+def patch_workbook(source_path, output_path, cells, issue_headers, issue_rows):
+    """
+    复制 source_path 的 xlsx 压缩包到 output_path，只为 cells 中的单元格追加填充色，并加入问题列表工作表。
+
+    参数:
+        source_path (str): 上传的原始 .xlsx 文件。
+        output_path (str): 副本路径。
+        cells (dict): {(行, 列): 'red' 或 'yellow'}，行列从 0 开始（第 0 行为表头）。
+        issue_headers (list): 问题列表的表头，为 None 时不加入问题列表。
+        issue_rows (iterable): 问题列表的各行取值。
+
+    返回:
+        int: 标色的单元格数量。
+    """
+    colors = {'red': Config.FORMATS["red"], 'yellow': Config.FORMATS["yellow"]}
+    targets = _targets(cells, colors)
+
+    with zipfile.ZipFile(source_path) as source:
+        names = source.namelist()
+        workbook_xml = source.read('xl/workbook.xml').decode('utf-8')
+        rels_path = 'xl/_rels/workbook.xml.rels'
+        rels_xml = source.read(rels_path).decode('utf-8')
+        sheet_path = _first_sheet(workbook_xml, rels_xml)
+        styles = _Styles(source.read('xl/styles.xml').decode('utf-8'))
+        header_style = styles.bold() if issue_headers else None
+
+        patcher = _SheetPatcher(targets, styles)
+        try:
+            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as out:
+                for info in source.infolist():
+                    if info.filename in (sheet_path, 'xl/styles.xml', 'xl/workbook.xml', rels_path, '[Content_Types].xml'):
+                        continue
+                    with source.open(info) as src, out.open(_copy_info(info), 'w') as dst:
+                        while True:
+                            block = src.read(READ_BLOCK_SIZE)
+                            if not block:
+                                break
+                            dst.write(block)
+
+                with source.open(sheet_path) as src, out.open(_copy_info(source.getinfo(sheet_path)), 'w') as dst:
+                    patcher.patch(src, dst)
+
+                content_types = source.read('[Content_Types].xml').decode('utf-8')
+                if issue_headers is not None:
+                    issue_path, workbook_xml, rels_xml, content_types = _register_sheet(
+                        names, workbook_xml, rels_xml, content_types)
+                    with out.open(issue_path, 'w') as dst:
+                        _write_issue_sheet(dst, issue_headers, issue_rows, header_style)
+
+                out.writestr(_copy_info(source.getinfo('xl/styles.xml')), styles.to_xml().encode('utf-8'))
+                out.writestr(_copy_info(source.getinfo('xl/workbook.xml')), workbook_xml.encode('utf-8'))
+                out.writestr(_copy_info(source.getinfo(rels_path)), rels_xml.encode('utf-8'))
+                out.writestr(_copy_info(source.getinfo('[Content_Types].xml')), content_types.encode('utf-8'))
+        except Exception:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+    return patcher.patched_cells
+
+def _copy_info(info):
+    copied = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    copied.compress_type = zipfile.ZIP_DEFLATED
+    copied.external_attr = info.external_attr
+    return copied
+
+def _register_sheet(names, workbook_xml, rels_xml, content_types):
+    """
+    在 workbook.xml、关系文件和 [Content_Types].xml 中登记新的问题列表工作表。
+    返回 (部件路径, workbook_xml, rels_xml, content_types)。
+    """
+    number = 1
+    while f'xl/worksheets/sheet{number}.xml' in names:
+        number += 1
+    part = f'xl/worksheets/sheet{number}.xml'
+
+    rel_numbers = [int(n) for n in re.findall(r'\sId="rId(\d+)"', rels_xml)]
+    rel_id = f'rId{max(rel_numbers, default=0) + 1}'
+    rels_xml = rels_xml.replace(
+        '</Relationships>',
+        f'<Relationship Id="{rel_id}" Type="{WORKSHEET_REL_TYPE}" Target="worksheets/sheet{number}.xml"/></Relationships>')
+
+    prefix = _xml_prefix(workbook_xml, 'workbook')
+    sheet_tags = re.findall(rf'<{prefix}sheet\b[^>]*>', workbook_xml)
+    sheet_ids = [int(_attr(tag, 'sheetId') or 0) for tag in sheet_tags]
+    sheet_names = {_attr(tag, 'name') for tag in sheet_tags}
+    name = ISSUES_SHEET_NAME
+    suffix = 1
+    while escape(name) in sheet_names:
+        suffix += 1
+        name = f'{ISSUES_SHEET_NAME}{suffix}'
+    r_prefix = re.search(rf'xmlns:(\w+)="{re.escape(RELATIONSHIPS_NS)}"', workbook_xml)
+    rel_attr = f'{r_prefix.group(1)}:id="{rel_id}"' if r_prefix else f'xmlns:r="{RELATIONSHIPS_NS}" r:id="{rel_id}"'
+    workbook_xml = workbook_xml.replace(
+        f'</{prefix}sheets>',
+        f'<{prefix}sheet name="{escape(name)}" sheetId="{max(sheet_ids, default=0) + 1}" {rel_attr}/></{prefix}sheets>')
+
+    content_types = content_types.replace(
+        '</Types>', f'<Override PartName="/{part}" ContentType="{WORKSHEET_CONTENT_TYPE}"/></Types>')
+    return part, workbook_xml, rels_xml, content_types
+
+def _issue_rows(issues_list, columns):
+    for serial, issue in enumerate(issues_list, start=1):
+        yield [serial] + [issue.get(name) for name in columns]
+
+def _issue_headers(columns):
+    return ['序号'] + ['问题' if name == '问题描述' else name for name in columns]
+
+def patch_case_excel(source_path, df, results, output_path, issues_list):
+    """
+    在原上传文件上为立案登记表标色并加入问题列表，参数同 format_case_excel，另加原文件路径。
+    issues_list 须为字典列表（case_upload 已统一转换）；没有问题时问题列表只有一行提示，与 create_case_issues_sheet 一致。
+
+    返回:
+        bool: 成功时为 True。
+    """
+    recorder = HighlightRecorder()
+    with use_header_map(df.columns, Config.COLUMN_MAPPINGS, 'case'):
+        for idx in np.flatnonzero(results.flagged()).tolist():
+            apply_case_table_formats(recorder, df, df.iloc[idx], idx, results, issues_list, True, 'yellow', 'red')
+    if issues_list:
+        headers, rows = _issue_headers(CASE_ISSUE_COLUMNS), _issue_rows(issues_list, CASE_ISSUE_COLUMNS)
+    else:
+        headers, rows = ['提示'], [['未发现任何问题。']]
+    patched = patch_workbook(source_path, output_path, recorder.cells, headers, rows)
+    logger.info(f"Case Excel file patched in place ({patched} cells highlighted): {output_path}")
+    return True
+
+def patch_clue_excel(source_path, df, output_path, issues_list):
+    """
+    在原上传文件上为线索登记表标色并加入问题列表，参数同 format_clue_excel，另加原文件路径。
+    没有问题时不加入问题列表，与 create_clue_issues_sheet 一致。
+
+    返回:
+        bool: 成功时为 True。
+    """
+    recorder = HighlightRecorder()
+    with use_header_map(df.columns, Config.COLUMN_MAPPINGS, 'clue'):
+        for idx in range(len(df)):
+            apply_clue_table_formats(recorder, df, df.iloc[idx], idx, issues_list, False, 'yellow', 'red')
+    headers = _issue_headers(CLUE_ISSUE_COLUMNS) if issues_list else None
+    patched = patch_workbook(source_path, output_path, recorder.cells, headers,
+                             _issue_rows(issues_list, CLUE_ISSUE_COLUMNS))
+    logger.info(f"Clue Excel file patched in place ({patched} cells highlighted): {output_path}")
+    return True